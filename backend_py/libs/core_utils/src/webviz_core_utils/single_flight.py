@@ -0,0 +1,63 @@
+import asyncio
+from collections.abc import Hashable
+from typing import Awaitable, Callable, Generic, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class SingleFlight(Generic[KeyT, ValueT]):
+    """
+    Coalesces concurrent computations for the same key, so that at most one computation per key is in progress.
+
+    Callers asking for a key while a computation for it is in progress share that computation instead of starting
+    their own. The key is released as soon as the computation finishes, so results are not kept, use TtlCache if the
+    result should also be cached.
+
+    The computations run in their own tasks, which are kept alive until they finish. Exceptions are propagated to
+    anyone awaiting the task, and are otherwise marked as retrieved, so computations that need their failures
+    reported, e.g. ones running in the background, must log them themselves.
+
+    Note that this class is not thread-safe, it is meant to be used from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[KeyT, asyncio.Task[ValueT]] = {}
+
+    def start(self, key: KeyT, compute_async: Callable[[], Awaitable[ValueT]]) -> asyncio.Task[ValueT]:
+        """
+        Get the task of the computation in progress for key, starting compute_async() in a new task if there is none.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(_await_async(compute_async))
+            self._tasks[key] = task
+            task.add_done_callback(lambda done_task: self._on_done(key, done_task))
+
+        return task
+
+    async def run_async(self, key: KeyT, compute_async: Callable[[], Awaitable[ValueT]]) -> ValueT:
+        """
+        Run compute_async(), or wait for the computation already in progress for key, and return its result.
+
+        The shared computation is shielded so that cancellation of one caller does not cancel it for the others.
+        """
+        return await asyncio.shield(self.start(key, compute_async))
+
+    def is_in_flight(self, key: KeyT) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def _on_done(self, key: KeyT, task: asyncio.Task[ValueT]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        # Mark any exception as retrieved, it has already been propagated to the waiters (if any)
+        if not task.cancelled():
+            task.exception()
+
+
+async def _await_async(compute_async: Callable[[], Awaitable[ValueT]]) -> ValueT:
+    return await compute_async()
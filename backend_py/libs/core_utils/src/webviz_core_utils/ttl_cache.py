@@ -0,0 +1,144 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from .single_flight import SingleFlight
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class TtlCache(Generic[KeyT, ValueT]):
+    """
+    Simple in-process LRU cache where entries expire after a time-to-live.
+
+    The number of entries is bounded by max_entries, with the least recently used entries being evicted first.
+    Optionally, the total size of the entries can also be bounded by max_size_bytes, in which case get_size_bytes must
+    be given to estimate the size of each value. Values larger than max_size_bytes on their own are not stored.
+    Expired entries are removed lazily on access.
+
+    The get_or_compute_async() method provides single-flight semantics, meaning that concurrent callers asking for the
+    same missing key will share one computation instead of each doing their own, see SingleFlight.
+
+    Note that None cannot be used as a cached value since it is used to signal a cache miss.
+    Also note that the cache is not thread-safe, it is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_s: float,
+        max_size_bytes: int | None = None,
+        get_size_bytes: Callable[[ValueT], int] | None = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be > 0")
+        if max_size_bytes is not None and max_size_bytes <= 0:
+            raise ValueError("max_size_bytes must be > 0")
+        if (max_size_bytes is None) != (get_size_bytes is None):
+            raise ValueError("max_size_bytes and get_size_bytes must be given together")
+
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._max_size_bytes = max_size_bytes
+        self._get_size_bytes = get_size_bytes
+        self._total_size_bytes = 0
+        # Entries as (expires_at_s, value, size_bytes), where size_bytes is 0 if the size is not bounded
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT, int]] = OrderedDict()
+        self._in_flight: SingleFlight[KeyT, ValueT] = SingleFlight()
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """
+        Get value for key, returns None if the key is not in the cache or the entry has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at_s, value, _size_bytes = entry
+        if time.monotonic() >= expires_at_s:
+            self.invalidate(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: KeyT, value: ValueT, ttl_s: float | None = None) -> None:
+        """
+        Set value for key, optionally overriding the cache's default time-to-live for this entry.
+        """
+        self.invalidate(key)
+
+        size_bytes = self._get_size_bytes(value) if self._get_size_bytes is not None else 0
+        if self._max_size_bytes is not None and size_bytes > self._max_size_bytes:
+            return
+
+        expires_at_s = time.monotonic() + (ttl_s if ttl_s is not None else self._ttl_s)
+        self._entries[key] = (expires_at_s, value, size_bytes)
+        self._total_size_bytes += size_bytes
+
+        while len(self._entries) > self._max_entries or (
+            self._max_size_bytes is not None and self._total_size_bytes > self._max_size_bytes
+        ):
+            _evicted_key, (_expires_at_s, _value, evicted_size_bytes) = self._entries.popitem(last=False)
+            self._total_size_bytes -= evicted_size_bytes
+
+    def invalidate(self, key: KeyT) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size_bytes -= entry[2]
+
+    def invalidate_matching(self, predicate: Callable[[KeyT], bool]) -> None:
+        for key in [key for key in self._entries if predicate(key)]:
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_size_bytes(self) -> int:
+        """
+        Estimated total size of the entries, always 0 if the cache is not bounded by size.
+        """
+        return self._total_size_bytes
+
+    async def get_or_compute_async(
+        self,
+        key: KeyT,
+        compute_async: Callable[[], Awaitable[ValueT]],
+        get_ttl_s: Callable[[ValueT], float | None] | None = None,
+    ) -> ValueT:
+        """
+        Get value for key, computing and storing it using compute_async() if it is not in the cache.
+
+        If get_ttl_s is given, it is called with the computed value to get the time-to-live of the stored entry,
+        returning None means the cache's default time-to-live is used.
+
+        If a computation for the key is already in progress, the result of that computation will be awaited instead
+        of starting a new one. Exceptions raised by the computation are propagated to all waiters and nothing is
+        stored in the cache.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        return await self._in_flight.run_async(
+            key, lambda: self._compute_and_store_async(key, compute_async, get_ttl_s)
+        )
+
+    async def _compute_and_store_async(
+        self,
+        key: KeyT,
+        compute_async: Callable[[], Awaitable[ValueT]],
+        get_ttl_s: Callable[[ValueT], float | None] | None,
+    ) -> ValueT:
+        value = await compute_async()
+        self.set(key, value, get_ttl_s(value) if get_ttl_s is not None else None)
+        return value
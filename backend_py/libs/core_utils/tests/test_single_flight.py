@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from webviz_core_utils.single_flight import SingleFlight
+
+
+def test_concurrent_runs_share_one_computation() -> None:
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    num_calls = 0
+
+    async def compute_async() -> int:
+        nonlocal num_calls
+        num_calls += 1
+        await asyncio.sleep(0.01)
+        return num_calls
+
+    async def run_async() -> tuple[list[int], int]:
+        results = await asyncio.gather(*[single_flight.run_async("k", compute_async) for _ in range(5)])
+        assert not single_flight.is_in_flight("k")
+
+        # The result is not kept, so a new run computes again
+        return results, await single_flight.run_async("k", compute_async)
+
+    results, next_result = asyncio.run(run_async())
+    assert results == [1] * 5
+    assert next_result == 2
+
+
+def test_different_keys_do_not_share_computations() -> None:
+    single_flight: SingleFlight[str, str] = SingleFlight()
+
+    async def run_async() -> list[str]:
+        async def compute_async(value: str) -> str:
+            await asyncio.sleep(0.01)
+            return value
+
+        return await asyncio.gather(
+            single_flight.run_async("a", lambda: compute_async("a")),
+            single_flight.run_async("b", lambda: compute_async("b")),
+        )
+
+    assert asyncio.run(run_async()) == ["a", "b"]
+
+
+def test_exceptions_are_propagated_to_all_waiters_and_release_the_key() -> None:
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def failing_compute_async() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("Failed")
+
+    async def run_async() -> list[int | BaseException]:
+        coros = [single_flight.run_async("k", failing_compute_async) for _ in range(3)]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        assert len(single_flight) == 0
+        return results
+
+    results = asyncio.run(run_async())
+    assert all(isinstance(res, ValueError) for res in results)
+
+
+def test_cancelled_waiter_does_not_cancel_computation_for_others() -> None:
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def compute_async() -> int:
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def run_async() -> int:
+        first = asyncio.create_task(single_flight.run_async("k", compute_async))
+        second = asyncio.create_task(single_flight.run_async("k", compute_async))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        return await second
+
+    assert asyncio.run(run_async()) == 42
+
+
+def test_started_computation_runs_without_waiters() -> None:
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    done = False
+
+    async def compute_async() -> int:
+        nonlocal done
+        await asyncio.sleep(0.01)
+        done = True
+        return 1
+
+    async def run_async() -> None:
+        task = single_flight.start("k", compute_async)
+        assert single_flight.start("k", compute_async) is task
+        assert single_flight.is_in_flight("k")
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run_async())
+    assert done
@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+import pytest
+
+from webviz_core_utils.ttl_cache import TtlCache
+
+
+def test_get_set_and_expiry() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=10, ttl_s=0.05)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_s=10)
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_lru_eviction() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, ttl_s=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch a so that b becomes the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_size_bound_eviction() -> None:
+    cache: TtlCache[str, bytes] = TtlCache(max_entries=10, ttl_s=10, max_size_bytes=10, get_size_bytes=len)
+
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    assert cache.total_size_bytes == 8
+
+    # Touch a so that b becomes the least recently used entry
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.total_size_bytes == 8
+
+    # Replacing an entry accounts for the size of the new value only
+    cache.set("a", b"12")
+    assert cache.total_size_bytes == 6
+
+    # Values larger than the bound are not stored, and do not evict other entries
+    cache.set("d", b"12345678901")
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+    cache.invalidate("a")
+    assert cache.total_size_bytes == 4
+    cache.clear()
+    assert cache.total_size_bytes == 0
+
+
+def test_invalidate() -> None:
+    cache: TtlCache[tuple[str, int], int] = TtlCache(max_entries=10, ttl_s=10)
+    cache.set(("x", 1), 1)
+    cache.set(("x", 2), 2)
+    cache.set(("y", 1), 3)
+
+    cache.invalidate(("y", 1))
+    assert cache.get(("y", 1)) is None
+
+    cache.invalidate_matching(lambda key: key[0] == "x")
+    assert len(cache) == 0
+
+
+def test_get_or_compute_is_single_flight() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=10, ttl_s=10)
+    num_calls = 0
+
+    async def compute_async() -> int:
+        nonlocal num_calls
+        num_calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run_async() -> list[int]:
+        return await asyncio.gather(*[cache.get_or_compute_async("k", compute_async) for _ in range(5)])
+
+    assert asyncio.run(run_async()) == [42] * 5
+    assert num_calls == 1
+    assert cache.get("k") == 42
+
+
+def test_get_or_compute_propagates_exceptions_without_caching() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=10, ttl_s=10)
+
+    async def failing_compute_async() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("Failed")
+
+    async def run_async() -> list[int | BaseException]:
+        coros = [cache.get_or_compute_async("k", failing_compute_async) for _ in range(3)]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    results = asyncio.run(run_async())
+    assert all(isinstance(res, ValueError) for res in results)
+    assert cache.get("k") is None
+
+
+def test_get_or_compute_with_ttl_depending_on_value() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=10, ttl_s=10)
+
+    async def compute_async() -> int:
+        return 0
+
+    async def run_async() -> None:
+        await cache.get_or_compute_async("short", compute_async, get_ttl_s=lambda value: 0.05 if value == 0 else None)
+        await cache.get_or_compute_async("default", compute_async, get_ttl_s=lambda value: None)
+
+    asyncio.run(run_async())
+
+    time.sleep(0.1)
+    assert cache.get("short") is None
+    assert cache.get("default") == 0
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        TtlCache(max_entries=0, ttl_s=10)
+    with pytest.raises(ValueError):
+        TtlCache(max_entries=10, ttl_s=0)
+    with pytest.raises(ValueError):
+        TtlCache(max_entries=10, ttl_s=10, max_size_bytes=0, get_size_bytes=len)
+    with pytest.raises(ValueError):
+        TtlCache(max_entries=10, ttl_s=10, max_size_bytes=10)
@@ -1,11 +1,44 @@
+import asyncio
 import base64
-from typing import Mapping
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Mapping, TypeVar
 from urllib.parse import urljoin
 
 import httpx
 
+from webviz_core_utils.ttl_cache import TtlCache
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
 
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Graph accepts at most 20 requests in one JSON batch
+_MAX_BATCH_REQUESTS = 20
+
+
+@dataclass(frozen=True)
+class _CachedLookup(Generic[T]):
+    # None if Graph reported that the user or photo does not exist
+    value: T | None
+
+
+class _UncachableResponseError(Exception):
+    """Graph responded with something other than success or not found, e.g. throttling, which must not be cached"""
+
+
+# User info and photos are visible to all users in the tenant, so the caches are shared between users.
+# Lookups of "me" depend on the access token and are never cached.
+# Users and photos that do not exist are cached for a shorter time, since they might be added.
+_USER_INFO_CACHE: TtlCache[str, _CachedLookup[Mapping[str, Any]]] = TtlCache(max_entries=2000, ttl_s=60 * 60)
+_USER_PHOTO_CACHE: TtlCache[str, _CachedLookup[str]] = TtlCache(max_entries=500, ttl_s=60 * 60)
+_NOT_FOUND_TTL_S = 15 * 60
+
+
+def _get_lookup_ttl_s(lookup: _CachedLookup) -> float | None:
+    return _NOT_FOUND_TTL_S if lookup.value is None else None
+
 
 class GraphApiAccess:
     def __init__(self, access_token: str):
@@ -24,24 +57,127 @@ class GraphApiAccess:
         return response
 
     async def get_user_profile_photo_async(self, user_id_or_email: str) -> str | None:
-        request_url = urljoin(
-            self.base_url,
-            "me/photo/$value" if user_id_or_email == "me" else f"users/{user_id_or_email}/photo/$value",
+        async def fetch_async() -> _CachedLookup[str]:
+            response = await self._request_async(urljoin(self.base_url, _make_user_photo_path(user_id_or_email)))
+            _raise_if_uncachable(response.status_code)
+            if response.status_code == 200:
+                return _CachedLookup(base64.b64encode(response.content).decode("utf-8"))
+            return _CachedLookup(None)
+
+        return await _get_cached_async(_USER_PHOTO_CACHE, user_id_or_email, fetch_async)
+
+    async def get_user_info_async(self, user_id_or_email: str) -> Mapping[str, Any] | None:
+        async def fetch_async() -> _CachedLookup[Mapping[str, Any]]:
+            response = await self._request_async(urljoin(self.base_url, _make_user_info_path(user_id_or_email)))
+            _raise_if_uncachable(response.status_code)
+            if response.status_code == 200:
+                return _CachedLookup(response.json())
+            return _CachedLookup(None)
+
+        return await _get_cached_async(_USER_INFO_CACHE, user_id_or_email, fetch_async)
+
+    async def get_user_profile_photos_async(self, user_ids_or_emails: list[str]) -> dict[str, str | None]:
+        """
+        Get the profile photos (base64 encoded) of several users, looking up the ones that are not cached using
+        Graph JSON batching. Returns a dict keyed by the given user ids and emails.
+        """
+        # Graph returns binary bodies, such as photos, base64 encoded in batch responses
+        return await self._get_many_cached_async(_USER_PHOTO_CACHE, user_ids_or_emails, _make_user_photo_path)
+
+    async def get_user_infos_async(self, user_ids_or_emails: list[str]) -> dict[str, Mapping[str, Any] | None]:
+        """
+        Get info on several users, looking up the ones that are not cached using Graph JSON batching.
+        Returns a dict keyed by the given user ids and emails.
+        """
+        return await self._get_many_cached_async(_USER_INFO_CACHE, user_ids_or_emails, _make_user_info_path)
+
+    async def _get_many_cached_async(
+        self,
+        cache: TtlCache[str, _CachedLookup[T]],
+        user_ids_or_emails: list[str],
+        make_path: Callable[[str], str],
+    ) -> dict[str, T | None]:
+        lookups: dict[str, _CachedLookup[T]] = {}
+        missing_keys: list[str] = []
+        for user_id_or_email in dict.fromkeys(user_ids_or_emails):
+            key = _make_cache_key(user_id_or_email)
+            cached = cache.get(key) if key is not None else None
+            if cached is not None:
+                lookups[user_id_or_email] = cached
+            else:
+                missing_keys.append(user_id_or_email)
+
+        chunks = [missing_keys[i : i + _MAX_BATCH_REQUESTS] for i in range(0, len(missing_keys), _MAX_BATCH_REQUESTS)]
+        responses_per_chunk = await asyncio.gather(
+            *[self._batch_get_async([make_path(user_id_or_email) for user_id_or_email in chunk]) for chunk in chunks]
+        )
+
+        for chunk, responses in zip(chunks, responses_per_chunk):
+            for user_id_or_email, (status_code, body) in zip(chunk, responses):
+                lookup: _CachedLookup[T] = _CachedLookup(body if status_code == 200 else None)
+                lookups[user_id_or_email] = lookup
+
+                key = _make_cache_key(user_id_or_email)
+                if key is not None and status_code in (200, 404):
+                    cache.set(key, lookup, _get_lookup_ttl_s(lookup))
+                elif status_code != 200:
+                    LOGGER.warning(f"Graph lookup of {make_path(user_id_or_email)} in batch failed ({status_code=})")
+
+        return {user_id_or_email: lookups[user_id_or_email].value for user_id_or_email in user_ids_or_emails}
+
+    async def _batch_get_async(self, paths: list[str]) -> list[tuple[int, Any]]:
+        """Do GET requests for the given paths in one Graph JSON batch, returning status code and body per path"""
+        batch_body = {
+            "requests": [{"id": str(index), "method": "GET", "url": f"/{path}"} for index, path in enumerate(paths)]
+        }
+
+        response = await HTTPX_ASYNC_CLIENT_WRAPPER.client.post(
+            urljoin(self.base_url, "$batch"),
+            headers=self._make_headers(),
+            json=batch_body,
         )
+        response.raise_for_status()
 
-        response = await self._request_async(request_url)
+        results: list[tuple[int, Any]] = [(500, None)] * len(paths)
+        for item_response in response.json().get("responses", []):
+            results[int(item_response["id"])] = (int(item_response["status"]), item_response.get("body"))
 
-        if response.status_code == 200:
-            return base64.b64encode(response.content).decode("utf-8")
+        return results
 
+
+async def _get_cached_async(
+    cache: TtlCache[str, _CachedLookup[T]],
+    user_id_or_email: str,
+    fetch_async: Callable[[], Awaitable[_CachedLookup[T]]],
+) -> T | None:
+    key = _make_cache_key(user_id_or_email)
+
+    try:
+        if key is None:
+            return (await fetch_async()).value
+
+        lookup = await cache.get_or_compute_async(key, fetch_async, get_ttl_s=_get_lookup_ttl_s)
+        return lookup.value
+    except _UncachableResponseError:
         return None
 
-    async def get_user_info_async(self, user_id_or_email: str) -> Mapping[str, str] | None:
-        request_url = urljoin(self.base_url, "me" if user_id_or_email == "me" else f"users/{user_id_or_email}")
 
-        response = await self._request_async(request_url)
+def _raise_if_uncachable(status_code: int) -> None:
+    if status_code not in (200, 404):
+        raise _UncachableResponseError(f"Unexpected status code from Graph: {status_code}")
 
-        if response.status_code == 200:
-            return response.json()
 
+def _make_cache_key(user_id_or_email: str) -> str | None:
+    if user_id_or_email == "me":
         return None
+
+    # Both graph ids and emails are case-insensitive
+    return user_id_or_email.lower()
+
+
+def _make_user_info_path(user_id_or_email: str) -> str:
+    return "me" if user_id_or_email == "me" else f"users/{user_id_or_email}"
+
+
+def _make_user_photo_path(user_id_or_email: str) -> str:
+    return "me/photo/$value" if user_id_or_email == "me" else f"users/{user_id_or_email}/photo/$value"
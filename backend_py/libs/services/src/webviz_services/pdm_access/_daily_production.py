@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import polars as pl
+
+from .types import WellProductionData
+from ._internal_types import _PRODCOLUMNS
+
+_VOLUME_COLUMNS = [_PRODCOLUMNS.WB_OIL_VOL_SM3, _PRODCOLUMNS.WB_GAS_VOL_SM3, _PRODCOLUMNS.WB_WATER_VOL_M3]
+
+_DAILY_PRODUCTION_SCHEMA = pl.Schema(
+    [
+        (_PRODCOLUMNS.WB_UUID, pl.String),
+        (_PRODCOLUMNS.WB_UWBI, pl.String),
+        (_PRODCOLUMNS.PROD_DAY, pl.Date),
+        *[(column, pl.Float64) for column in _VOLUME_COLUMNS],
+    ]
+)
+
+
+def _cum_column(column: str) -> str:
+    return f"{column}_CUM"
+
+
+@dataclass(frozen=True)
+class DailyProductionTable:
+    """
+    Daily production per wellbore for a field, covering all days from first_day to last_day (inclusive).
+    fetched_at_s is the time.monotonic() time when the earliest of the covered days were fetched.
+
+    The frame is sorted on wellbore and day, and holds the cumulative volumes per wellbore in addition to the daily
+    volumes. The total for any interval within the covered days is then the difference of two cumulative values.
+    """
+
+    first_day: date
+    last_day: date
+    fetched_at_s: float
+    daily_df: pl.DataFrame
+
+    def estimated_size_bytes(self) -> int:
+        return int(self.daily_df.estimated_size())
+
+
+def create_daily_production_df(api_results: list[dict]) -> pl.DataFrame:
+    """Create a typed frame of daily production from PDM results, without cumulative volumes"""
+    if not api_results:
+        return pl.DataFrame(schema=_DAILY_PRODUCTION_SCHEMA)
+
+    return (
+        pl.DataFrame(api_results, infer_schema_length=None)
+        .with_columns(pl.col(_PRODCOLUMNS.PROD_DAY).cast(pl.String).str.slice(0, 10).str.to_date("%Y-%m-%d"))
+        .select(list(_DAILY_PRODUCTION_SCHEMA))
+        .cast(_DAILY_PRODUCTION_SCHEMA)
+    )
+
+
+def _overlaps_or_adjoins(table: DailyProductionTable, first_day: date, last_day: date) -> bool:
+    return first_day <= table.last_day + timedelta(days=1) and last_day >= table.first_day - timedelta(days=1)
+
+
+def get_missing_day_ranges(
+    table: DailyProductionTable | None, first_day: date, last_day: date
+) -> list[tuple[date, date]]:
+    """
+    Get the day ranges that must be fetched to cover first_day to last_day, while keeping the covered days contiguous.
+
+    If the days neither overlap nor adjoin the table, all of them are fetched and replace the table, since bridging
+    the gap could mean fetching years of daily production that was never asked for.
+    """
+    if table is None or not _overlaps_or_adjoins(table, first_day, last_day):
+        return [(first_day, last_day)]
+
+    missing_ranges: list[tuple[date, date]] = []
+    if first_day < table.first_day:
+        missing_ranges.append((first_day, table.first_day - timedelta(days=1)))
+    if last_day > table.last_day:
+        missing_ranges.append((table.last_day + timedelta(days=1), last_day))
+    return missing_ranges
+
+
+def merge_daily_production(
+    table: DailyProductionTable | None,
+    fetched_dfs: list[pl.DataFrame],
+    first_day: date,
+    last_day: date,
+    fetched_at_s: float,
+) -> DailyProductionTable:
+    """
+    Merge the fetched days into a table, recomputing the cumulative volumes.
+
+    The fetched frames must hold the missing days from first_day to last_day, see get_missing_day_ranges(). A merged
+    table keeps the fetch time of the original table, so that the days fetched first are not kept beyond their TTL.
+    """
+    dfs = list(fetched_dfs)
+    if table is not None and _overlaps_or_adjoins(table, first_day, last_day):
+        first_day, last_day = min(first_day, table.first_day), max(last_day, table.last_day)
+        fetched_at_s = table.fetched_at_s
+        dfs.insert(0, table.daily_df.select(list(_DAILY_PRODUCTION_SCHEMA)))
+
+    daily_df = (
+        pl.concat(dfs)
+        .unique(subset=[_PRODCOLUMNS.WB_UUID, _PRODCOLUMNS.PROD_DAY], keep="last", maintain_order=True)
+        .sort([_PRODCOLUMNS.WB_UUID, _PRODCOLUMNS.PROD_DAY])
+        .with_columns(
+            pl.col(column).fill_null(0.0).cum_sum().over(_PRODCOLUMNS.WB_UUID).alias(_cum_column(column))
+            for column in _VOLUME_COLUMNS
+        )
+    )
+    return DailyProductionTable(first_day=first_day, last_day=last_day, fetched_at_s=fetched_at_s, daily_df=daily_df)
+
+
+def calculate_total_production_in_range(
+    table: DailyProductionTable, first_day: date, last_day: date, start_date: str, end_date: str
+) -> list[WellProductionData]:
+    """
+    Calculate total production per wellbore from first_day to last_day (inclusive), as the difference between the
+    cumulative volumes at the end of the range and the day before it. Wellbores without production are left out.
+    """
+    is_before_range = pl.col(_PRODCOLUMNS.PROD_DAY) < first_day
+    is_in_or_before_range = pl.col(_PRODCOLUMNS.PROD_DAY) <= last_day
+
+    totals_df = (
+        table.daily_df.group_by(_PRODCOLUMNS.WB_UUID)
+        .agg(
+            pl.col(_PRODCOLUMNS.WB_UWBI).first(),
+            *[
+                (
+                    pl.col(_cum_column(column)).filter(is_in_or_before_range).last().fill_null(0.0)
+                    - pl.col(_cum_column(column)).filter(is_before_range).last().fill_null(0.0)
+                ).alias(column)
+                for column in _VOLUME_COLUMNS
+            ],
+        )
+        .filter(pl.any_horizontal(pl.col(column) != 0.0 for column in _VOLUME_COLUMNS))
+        .sort(_PRODCOLUMNS.WB_UWBI)
+    )
+
+    return [
+        WellProductionData(
+            wellbore_uuid=wellbore_uuid,
+            wellbore_uwbi=wellbore_uwbi,
+            start_date=start_date,
+            end_date=end_date,
+            oil_production_sm3=oil,
+            gas_production_sm3=gas,
+            water_production_m3=water,
+        )
+        for wellbore_uuid, wellbore_uwbi, oil, gas, water in zip(
+            totals_df[_PRODCOLUMNS.WB_UUID].to_list(),
+            totals_df[_PRODCOLUMNS.WB_UWBI].to_list(),
+            totals_df[_PRODCOLUMNS.WB_OIL_VOL_SM3].to_list(),
+            totals_df[_PRODCOLUMNS.WB_GAS_VOL_SM3].to_list(),
+            totals_df[_PRODCOLUMNS.WB_WATER_VOL_M3].to_list(),
+        )
+    ]
@@ -1,17 +1,42 @@
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+import weakref
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from webviz_core_utils.ttl_cache import TtlCache
 
 from .types import WellProductionData, WellInjectionData
 from ._internal_types import _PDMEndpoints, _PRODCOLUMNS, _INJCOLUMNS
 
 from ._pdm_get_request import pdm_get_request_async
-from ._calculate_totals_from_daily import (
-    calculate_total_production_from_daily,
-    calculate_total_injection_from_daily,
+from ._calculate_totals_from_daily import calculate_total_injection_from_daily
+from ._daily_production import (
+    DailyProductionTable,
+    calculate_total_production_in_range,
+    create_daily_production_df,
+    get_missing_day_ranges,
+    merge_daily_production,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+# Daily production per (user id, field identifier). Keyed per user since access to production data may differ between
+# users. The TTL bounds how long allocation updates in PDM can go unnoticed. A table covers every producing wellbore
+# and day of a field, so the cache is bounded by the estimated size of the tables, not just the number of entries.
+_DAILY_PRODUCTION_TTL_S = 60 * 60
+_DAILY_PRODUCTION_CACHE: TtlCache[tuple[str, str], DailyProductionTable] = TtlCache(
+    max_entries=8,
+    ttl_s=_DAILY_PRODUCTION_TTL_S,
+    max_size_bytes=256 * 1024 * 1024,
+    get_size_bytes=DailyProductionTable.estimated_size_bytes,
+)
+
+# Serializes updates of each cache entry, so that overlapping requests do not fetch the same days twice
+_DAILY_PRODUCTION_LOCKS: weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock] = weakref.WeakValueDictionary()
+
 
 def _get_query_date_range(
     start_date: str, end_date: str, start_date_inclusive: bool, end_date_inclusive: bool
@@ -28,19 +53,27 @@ def _get_query_date_range(
     query_end_date = end_date[:10]
 
     if not start_date_inclusive:
-        date = datetime.strptime(query_start_date, "%Y-%m-%d")
-        query_start_date = (date + timedelta(days=1)).strftime("%Y-%m-%d")
+        parsed_date = datetime.strptime(query_start_date, "%Y-%m-%d")
+        query_start_date = (parsed_date + timedelta(days=1)).strftime("%Y-%m-%d")
 
     if not end_date_inclusive:
-        date = datetime.strptime(query_end_date, "%Y-%m-%d")
-        query_end_date = (date - timedelta(days=1)).strftime("%Y-%m-%d")
+        parsed_date = datetime.strptime(query_end_date, "%Y-%m-%d")
+        query_end_date = (parsed_date - timedelta(days=1)).strftime("%Y-%m-%d")
 
     return query_start_date, query_end_date
 
 
 class PDMAccess:
-    def __init__(self, access_token: str):
+    """
+    Access to PDM.
+
+    If a user id is given, the daily production for a field is cached per user, so that totals for new time intervals
+    only fetch the days not already fetched.
+    """
+
+    def __init__(self, access_token: str, user_id: str | None = None):
         self._pdm_token = access_token
+        self._user_id = user_id
 
     async def get_per_well_total_production_in_time_interval_async(
         self,
@@ -65,20 +98,63 @@ class PDMAccess:
         query_start_date, query_end_date = _get_query_date_range(
             start_date, end_date, start_date_inclusive, end_date_inclusive
         )
+        first_day = date.fromisoformat(query_start_date)
+        last_day = date.fromisoformat(query_end_date)
+        if first_day > last_day:
+            return []
+
+        if self._user_id is None:
+            table = await self._fetch_daily_production_async(field_identifier, None, first_day, last_day)
+        else:
+            table = await self._get_cached_daily_production_async(field_identifier, first_day, last_day)
+
+        return calculate_total_production_in_range(table, first_day, last_day, start_date=start_date, end_date=end_date)
+
+    async def _get_cached_daily_production_async(
+        self, field_identifier: str, first_day: date, last_day: date
+    ) -> DailyProductionTable:
+        cache_key = (str(self._user_id), field_identifier)
+        lock = _DAILY_PRODUCTION_LOCKS.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            table = _DAILY_PRODUCTION_CACHE.get(cache_key)
+            if table is None or get_missing_day_ranges(table, first_day, last_day):
+                table = await self._fetch_daily_production_async(field_identifier, table, first_day, last_day)
+
+                # An extended table expires when its earliest fetched days do, not a full TTL after the extension
+                remaining_ttl_s = _DAILY_PRODUCTION_TTL_S - (time.monotonic() - table.fetched_at_s)
+                _DAILY_PRODUCTION_CACHE.set(cache_key, table, ttl_s=remaining_ttl_s)
+
+        return table
+
+    async def _fetch_daily_production_async(
+        self, field_identifier: str, table: DailyProductionTable | None, first_day: date, last_day: date
+    ) -> DailyProductionTable:
+        """Fetch the days from first_day to last_day that are missing in the table, and merge them into it"""
+        missing_day_ranges = get_missing_day_ranges(table, first_day, last_day)
+        fetched_at_s = time.monotonic()
+        fetched_dfs = await asyncio.gather(
+            *[
+                self._fetch_daily_production_df_async(field_identifier, range_first_day, range_last_day)
+                for range_first_day, range_last_day in missing_day_ranges
+            ]
+        )
+        LOGGER.debug(f"Fetched daily production for {field_identifier} in day ranges {missing_day_ranges}")
+
+        return merge_daily_production(table, fetched_dfs, first_day, last_day, fetched_at_s)
+
+    async def _fetch_daily_production_df_async(
+        self, field_identifier: str, first_day: date, last_day: date
+    ) -> pl.DataFrame:
         params = {
             "GOV_FIELD_NAME": field_identifier,
-            "PROD_DAY": f"RANGE({query_start_date} | {query_end_date})",
+            "PROD_DAY": f"RANGE({first_day.isoformat()} | {last_day.isoformat()})",
             "TOP": "ALL",
             "COLUMNS": ",".join(_PRODCOLUMNS),
         }
-
         results = await pdm_get_request_async(
             access_token=self._pdm_token, endpoint=_PDMEndpoints.WELL_PROD_DAY, params=params
         )
-        if not results:
-            return []
-
-        return calculate_total_production_from_daily(results, start_date=start_date, end_date=end_date)
+        return create_daily_production_df(results)
 
     async def get_per_well_total_injection_in_time_interval_async(
         self,
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import math
 from typing import List
 
 from webviz_core_utils.perf_timer import PerfTimer
@@ -9,6 +11,10 @@ from webviz_services.service_exceptions import ServiceRequestError, NoDataError,
 
 LOGGER = logging.getLogger(__name__)
 
+# Number of results per page, and the max number of page requests in flight per request when paging concurrently
+SMDA_PAGE_SIZE = 10000
+MAX_CONCURRENT_PAGE_REQUESTS = 4
+
 
 def _make_headers(access_token: str) -> dict:
     services_config = get_services_config()
@@ -20,53 +26,117 @@ def _make_headers(access_token: str) -> dict:
     }
 
 
-async def smda_get_request_async(access_token: str, endpoint: str, params: dict) -> List[dict]:
+async def smda_get_request_async(
+    access_token: str, endpoint: str, params: dict, max_concurrent_page_requests: int = MAX_CONCURRENT_PAGE_REQUESTS
+) -> List[dict]:
     """
     Generic GET request to SMDA API.
-    Uses `next` pagination to get all results.
+
+    The first page tells the total number of results. For sorted requests spanning multiple pages, the remaining
+    pages are then fetched concurrently by page number, with at most `max_concurrent_page_requests` requests in
+    flight. Unsorted requests, and requests where concurrent paging fails, use the sequential `next` cursor.
     https://smda.equinor.com/learn/develop/smda-rest-api/#_next
     """
     urlstring = f"https://api.gateway.equinor.com/smda/v2.0/smda-api/{endpoint}?"
-    params = params if params else {}
-    params.update({"_items": 10000})
+    params = dict(params) if params else {}
+    params.update({"_items": SMDA_PAGE_SIZE})
     headers = _make_headers(access_token)
 
     timer = PerfTimer()
-    single_lap_timer = PerfTimer()
 
-    results: List[dict] = []
-    page: int = 1
-    while True:
-        response = await HTTPX_ASYNC_CLIENT_WRAPPER.client.get(urlstring, params=params, headers=headers, timeout=60)
-        LOGGER.debug(f"TIME SMDA fetch '{endpoint}', page {page}, took {single_lap_timer.lap_s():.2f} seconds")
-        page += 1
-        if response.status_code == 200:
-            result = response.json()["data"]["results"]
-            if not result:
-                raise NoDataError(f"No data found for endpoint: '{endpoint}'", Service.SMDA)
-
-            results.extend(result)
-
-            next_request = response.json()["data"]["next"]
-            if next_request is None:
-                break
-            params["_next"] = next_request
-        elif response.status_code == 404:
-            LOGGER.error(f"{str(response.status_code) } {endpoint} either does not exists or can not be found")
-            raise ServiceRequestError(
-                f"[{str(response.status_code)}] '{endpoint}' either does not exists or can not be found",
-                Service.SMDA,
-            )
-        else:
-            raise ServiceRequestError(
-                f"[{str(response.status_code)}] Cannot fetch data from endpoint: '{endpoint}'", Service.SMDA
+    first_page_data = await _get_page_data_async(urlstring, params, headers, endpoint)
+    results: List[dict] = first_page_data["results"]
+    if not results:
+        raise NoDataError(f"No data found for endpoint: '{endpoint}'", Service.SMDA)
+    LOGGER.debug(f"TIME SMDA fetch '{endpoint}', page 1, took {timer.lap_s():.2f} seconds")
+
+    next_request = first_page_data.get("next")
+    if next_request is None:
+        return results
+
+    total_count = first_page_data.get("total")
+    if "_sort" in params and isinstance(total_count, int):
+        try:
+            remaining_results = await _get_remaining_pages_concurrently_async(
+                urlstring, params, headers, endpoint, total_count, max_concurrent_page_requests
             )
+            if len(results) + len(remaining_results) == total_count:
+                LOGGER.debug(f"TIME SMDA fetch '{endpoint}' took {timer.lap_s():.2f} seconds")
+                return results + remaining_results
+
+            LOGGER.warning(f"SMDA '{endpoint}' changed while fetching pages concurrently, refetching sequentially")
+        except ServiceRequestError as exc:
+            LOGGER.warning(f"Concurrent paging of SMDA '{endpoint}' failed, falling back to sequential paging: {exc}")
+
+    page: int = 2
+    while next_request is not None:
+        params["_next"] = next_request
+        page_data = await _get_page_data_async(urlstring, params, headers, endpoint)
+        LOGGER.debug(f"TIME SMDA fetch '{endpoint}', page {page}, took {timer.lap_s():.2f} seconds")
+        page += 1
+
+        if not page_data["results"]:
+            break
+        results.extend(page_data["results"])
+        next_request = page_data.get("next")
 
     LOGGER.debug(f"TIME SMDA fetch '{endpoint}' took {timer.lap_s():.2f} seconds")
 
     return results
 
 
+async def smda_get_count_request_async(access_token: str, endpoint: str, params: dict) -> int:
+    """
+    Returns the number of results a GET request to the SMDA API would give, without fetching any of them.
+    """
+    urlstring = f"https://api.gateway.equinor.com/smda/v2.0/smda-api/{endpoint}?"
+    params = dict(params) if params else {}
+    params.update({"_items": 0})
+    params.pop("_projection", None)
+
+    page_data = await _get_page_data_async(urlstring, params, _make_headers(access_token), endpoint)
+    return int(page_data["total"])
+
+
+async def _get_remaining_pages_concurrently_async(
+    urlstring: str, params: dict, headers: dict, endpoint: str, total_count: int, max_concurrent_page_requests: int
+) -> List[dict]:
+    """Fetches page 2 and onwards by page number, returning the concatenated results in page order"""
+    num_pages = math.ceil(total_count / params["_items"])
+    semaphore = asyncio.Semaphore(max_concurrent_page_requests)
+
+    async def _get_page_results_async(page: int) -> List[dict]:
+        async with semaphore:
+            page_data = await _get_page_data_async(urlstring, {**params, "_page": page}, headers, endpoint)
+            return page_data["results"]
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            page_tasks = [task_group.create_task(_get_page_results_async(page)) for page in range(2, num_pages + 1)]
+    except ExceptionGroup as exc_group:
+        # Raise the first failure as is, the other page requests have been cancelled
+        raise exc_group.exceptions[0] from exc_group
+
+    return [result for page_task in page_tasks for result in page_task.result()]
+
+
+async def _get_page_data_async(urlstring: str, params: dict, headers: dict, endpoint: str) -> dict:
+    response = await HTTPX_ASYNC_CLIENT_WRAPPER.client.get(urlstring, params=params, headers=headers, timeout=60)
+
+    if response.status_code == 200:
+        return response.json()["data"]
+    if response.status_code == 404:
+        LOGGER.error(f"{str(response.status_code) } {endpoint} either does not exists or can not be found")
+        raise ServiceRequestError(
+            f"[{str(response.status_code)}] '{endpoint}' either does not exists or can not be found",
+            Service.SMDA,
+        )
+
+    raise ServiceRequestError(
+        f"[{str(response.status_code)}] Cannot fetch data from endpoint: '{endpoint}'", Service.SMDA
+    )
+
+
 async def smda_get_aggregation_request_async(access_token: str, endpoint: str, params: dict) -> dict:
     """
     Alternative getter; runs an aggregation (i.e. a count of occurences) request on the SMDA API, and returns the aggregated buckets for each aggregated value.
@@ -7,8 +7,15 @@ from ..types import (
     StratigraphicUnit,
     StratigraphicSurface,
     StratigraphicColumn,
+    WellboreTrajectoriesColumnar,
+    BoundingBox2D,
 )
 from ..stratigraphy_utils import sort_stratigraphic_names_by_hierarchy
+from ..trajectory_utils import (
+    create_survey_samples_df_from_trajectories,
+    create_wellbore_trajectories_columnar,
+    filter_survey_samples_df,
+)
 
 from ._drogon_strat_units import get_drogon_strat_units
 from ._drogon_well_data import (
@@ -49,6 +56,17 @@ class SmdaAccess:
             return [traj for traj in all_well_trajs if traj.wellbore_uuid in wellbore_uuids]
         return all_well_trajs
 
+    async def get_wellbore_trajectories_columnar_async(
+        self,
+        field_identifier: str,
+        wellbore_uuids: Optional[List[str]] = None,
+        bbox: Optional[BoundingBox2D] = None,
+    ) -> WellboreTrajectoriesColumnar:
+        """Get Drogon trajectories as concatenated sample arrays"""
+        samples_df = create_survey_samples_df_from_trajectories(get_drogon_well_trajectories())
+        samples_df = filter_survey_samples_df(samples_df, wellbore_uuids=wellbore_uuids, bbox=bbox)
+        return create_wellbore_trajectories_columnar(samples_df)
+
     # pylint: disable=unused-argument
     async def get_wellbore_picks_for_wellbore_async(
         self, wellbore_uuid: str, obs_no: Optional[int] = None
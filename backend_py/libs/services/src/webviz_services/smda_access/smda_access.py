@@ -1,7 +1,10 @@
+import asyncio
+import io
 import logging
 from typing import List, Optional
 
 import polars as pl
+from pydantic import TypeAdapter
 
 from webviz_services.service_exceptions import (
     Service,
@@ -18,10 +21,22 @@ from .types import (
     WellboreStratigraphicUnit,
     WellboreSurveyHeader,
     WellboreSurveySample,
+    WellboreTrajectoriesColumnar,
+    BoundingBox2D,
 )
 from .utils.queries import data_model_to_projection_param
 from .stratigraphy_utils import sort_stratigraphic_names_by_hierarchy
-from ._smda_get_request import smda_get_request_async, smda_get_aggregation_request_async
+from ._smda_get_request import (
+    smda_get_request_async,
+    smda_get_aggregation_request_async,
+    smda_get_count_request_async,
+)
+from .smda_field_cache import FetchedPayload, SmdaFieldCache
+from .trajectory_utils import (
+    SURVEY_SAMPLES_SCHEMA,
+    create_wellbore_trajectories_columnar,
+    filter_survey_samples_df,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,13 +52,30 @@ class SmdaEndpoints:
     WELLBORE_PICKS_STRAT_COLUM = "wellbore-picks-columns"
 
 
+_WELLBORE_HEADERS_ADAPTER = TypeAdapter(list[WellboreHeader])
+_WELLBORE_PICKS_ADAPTER = TypeAdapter(list[WellborePick])
+
+_TRAJECTORY_SAMPLE_COLUMNS = ["tvd_msl", "md", "easting", "northing"]
+
+
 class SmdaAccess:
-    def __init__(self, access_token: str):
+    """
+    Access to SMDA.
+
+    If a field cache is given, field wide wellbore headers, trajectories and picks are served through it, see
+    SmdaFieldCache.
+    """
+
+    def __init__(self, access_token: str, field_cache: SmdaFieldCache | None = None):
         self._smda_token = access_token
+        self._field_cache = field_cache
 
     async def _smda_get_request_async(self, endpoint: str, params: dict) -> List[dict]:
         return await smda_get_request_async(access_token=self._smda_token, endpoint=endpoint, params=params)
 
+    async def _smda_get_count_request_async(self, endpoint: str, params: dict) -> int:
+        return await smda_get_count_request_async(access_token=self._smda_token, endpoint=endpoint, params=params)
+
     async def _smda_get_aggregation_request_async(self, endpoint: str, params: dict) -> dict:
         return await smda_get_aggregation_request_async(access_token=self._smda_token, endpoint=endpoint, params=params)
 
@@ -165,35 +197,25 @@ class SmdaAccess:
         We need the wellbores with actual survey data, so we must use the wellbore-survey-headers endpoint.
         Additionally, we need the wellbore purpose and status, which we only get from the wellheaders endpoint.
         """
-        projection = [
-            "wellbore_uuid",
-            "unique_wellbore_identifier",
-            "well_uuid",
-            "unique_well_identifier",
-            "well_easting",
-            "well_northing",
-            "depth_reference_point",
-            "depth_reference_elevation",
-            "tvd_min",
-            "tvd_max",
-            "tvd_unit",
-            "md_min",
-            "md_max",
-            "md_unit",
-        ]
-        params = {
-            "_projection": ",".join(projection),
-            "_sort": "unique_wellbore_identifier",
-            "field_identifier": field_identifier,
-        }
-
-        survey_header_results = await self._smda_get_request_async(
-            endpoint=SmdaEndpoints.WELLBORE_SURVEY_HEADERS, params=params
+        if self._field_cache is None:
+            wellbore_headers, _ = await self._fetch_wellbore_headers_async(field_identifier)
+            return wellbore_headers
+
+        async def _fetch_payload_async() -> FetchedPayload:
+            wellbore_headers, record_count = await self._fetch_wellbore_headers_async(field_identifier)
+            return FetchedPayload(_WELLBORE_HEADERS_ADAPTER.dump_json(wellbore_headers), record_count)
+
+        payload = await self._field_cache.get_async(
+            key=f"field:{field_identifier}:wellbore_headers",
+            count_async=lambda: self._smda_get_count_request_async(
+                SmdaEndpoints.WELLBORE_SURVEY_HEADERS, _make_survey_headers_params(field_identifier)
+            ),
+            fetch_async=_fetch_payload_async,
         )
+        return _WELLBORE_HEADERS_ADAPTER.validate_json(payload) if payload else []
 
-        if not survey_header_results:
-            raise NoDataError(f"No wellbore headers found for {field_identifier=}.", Service.SMDA)
-
+    async def _fetch_wellbore_headers_async(self, field_identifier: str) -> tuple[List[WellboreHeader], int]:
+        """Returns the wellbore headers, and the number of survey headers they were made from"""
         projection = [
             "unique_wellbore_identifier",
             "wellbore_purpose",
@@ -202,14 +224,27 @@ class SmdaAccess:
             "kickoff_depth_tvd",
             "parent_wellbore",
         ]
-
-        params = {
+        wellheaders_params = {
             "_projection": ",".join(projection),
             "_sort": "unique_wellbore_identifier",
             "field_identifier": field_identifier,
         }
 
-        wellbore_headers_results = await self._smda_get_request_async(endpoint=SmdaEndpoints.WELLHEADERS, params=params)
+        # The two requests are independent, so run them concurrently
+        async with asyncio.TaskGroup() as task_group:
+            survey_headers_task = task_group.create_task(
+                self._smda_get_request_async(
+                    endpoint=SmdaEndpoints.WELLBORE_SURVEY_HEADERS, params=_make_survey_headers_params(field_identifier)
+                )
+            )
+            wellbore_headers_task = task_group.create_task(
+                self._smda_get_request_async(endpoint=SmdaEndpoints.WELLHEADERS, params=wellheaders_params)
+            )
+        survey_header_results = survey_headers_task.result()
+        wellbore_headers_results = wellbore_headers_task.result()
+
+        if not survey_header_results:
+            raise NoDataError(f"No wellbore headers found for {field_identifier=}.", Service.SMDA)
 
         # Create a dictionary to map unique wellbore identifiers to wellbore headers for faster lookup
         wellbore_headers_dict = {
@@ -229,7 +264,7 @@ class SmdaAccess:
                 survey_header["kickoff_depth_tvd"] = wellbore_header.get("kickoff_depth_tvd")
                 survey_header["parent_wellbore"] = wellbore_header.get("parent_wellbore")
 
-        return [WellboreHeader(**result) for result in survey_header_results]
+        return [WellboreHeader(**result) for result in survey_header_results], len(survey_header_results)
 
     async def get_wellbore_trajectories_async(
         self, field_identifier: str, wellbore_uuids: Optional[List[str]] = None
@@ -237,14 +272,70 @@ class SmdaAccess:
         """
         Get wellbore trajectories (survey samples) for all wells in a field, optionally with a subset of wellbores.
         """
-        params = {
-            "_projection": "wellbore_uuid, unique_wellbore_identifier,easting,northing,tvd_msl,md",
-            "_sort": "unique_wellbore_identifier,md",
-            "field_identifier": field_identifier,
-        }
+        samples_df = await self.get_wellbore_survey_samples_df_async(field_identifier, wellbore_uuids)
+        return _create_wellbore_trajectories(samples_df)
+
+    async def get_wellbore_trajectories_columnar_async(
+        self,
+        field_identifier: str,
+        wellbore_uuids: Optional[List[str]] = None,
+        bbox: Optional[BoundingBox2D] = None,
+    ) -> WellboreTrajectoriesColumnar:
+        """
+        Get wellbore trajectories for all wells in a field as concatenated sample arrays, optionally limited to a subset
+        of wellbores and/or the wellbores passing through a bounding box.
+        """
+        samples_df = await self.get_wellbore_survey_samples_df_async(field_identifier, wellbore_uuids)
+        samples_df = filter_survey_samples_df(samples_df, bbox=bbox)
+        return create_wellbore_trajectories_columnar(samples_df)
+
+    async def get_wellbore_survey_samples_df_async(
+        self, field_identifier: str, wellbore_uuids: Optional[List[str]] = None
+    ) -> pl.DataFrame:
+        """
+        Get the trajectory survey samples for all wells in a field, optionally with a subset of wellbores, as one row
+        per sample sorted on wellbore and md. Samples with missing values are dropped.
+
+        With a field cache, the samples for the whole field are cached and subsets are filtered from them. If the
+        field is not cached yet, a subset is fetched directly while the whole field is fetched in the background.
+        """
+        if self._field_cache is None:
+            samples_df, _ = await self._fetch_survey_samples_df_async(field_identifier, wellbore_uuids)
+            return samples_df
+
+        async def _fetch_field_payload_async() -> FetchedPayload:
+            samples_df, record_count = await self._fetch_survey_samples_df_async(field_identifier, None)
+            buffer = io.BytesIO()
+            samples_df.write_ipc(buffer, compression="zstd")
+            return FetchedPayload(buffer.getvalue(), record_count)
+
+        payload = await self._field_cache.get_async(
+            key=f"field:{field_identifier}:wellbore_survey_samples",
+            count_async=lambda: self._smda_get_count_request_async(
+                SmdaEndpoints.WELLBORE_SURVEY_SAMPLES, _make_survey_samples_params(field_identifier, None)
+            ),
+            fetch_async=_fetch_field_payload_async,
+            fetch_on_miss=not wellbore_uuids,
+        )
+        if payload is None:
+            samples_df, _ = await self._fetch_survey_samples_df_async(field_identifier, wellbore_uuids)
+            return samples_df
+
+        samples_df = pl.read_ipc(payload)
         if wellbore_uuids:
-            params["wellbore_uuid"] = ", ".join(wellbore_uuids)
+            samples_df = samples_df.filter(pl.col("wellbore_uuid").is_in(wellbore_uuids))
+            if samples_df.is_empty():
+                raise NoDataError(
+                    f"No wellbore surveys found for {field_identifier=}, {wellbore_uuids=}.", Service.SMDA
+                )
+
+        return samples_df
 
+    async def _fetch_survey_samples_df_async(
+        self, field_identifier: str, wellbore_uuids: Optional[List[str]]
+    ) -> tuple[pl.DataFrame, int]:
+        """Returns the valid survey samples, and the number of samples returned by SMDA"""
+        params = _make_survey_samples_params(field_identifier, wellbore_uuids)
         result = await self._smda_get_request_async(endpoint=SmdaEndpoints.WELLBORE_SURVEY_SAMPLES, params=params)
 
         if not result:
@@ -253,12 +344,9 @@ class SmdaAccess:
         # Convert the result to polars for processing
         resultdf = pl.DataFrame(result)
 
-        # Identify wellbores with any null values in survey columns
-        columns_to_check = ["tvd_msl", "md", "easting", "northing"]
-
         # Warn of any wellbores with null values in survey columns
         wellbores_with_nulls = (
-            resultdf.filter(pl.any_horizontal(pl.col(columns_to_check).is_null()))
+            resultdf.filter(pl.any_horizontal(pl.col(_TRAJECTORY_SAMPLE_COLUMNS).is_null()))
             .get_column("unique_wellbore_identifier")
             .unique()
             .sort()
@@ -270,31 +358,12 @@ class SmdaAccess:
                 LOGGER.warning(f"Invalid survey samples found for wellbore: {wellbore}. These will be ignored.")
 
         # Filter out any samples with null values
-        filtered_df = resultdf.filter(pl.all_horizontal(pl.col(columns_to_check).is_not_null()))
-
-        # Group per wellbore, maintaining order
-        wellbore_data = filtered_df.group_by("unique_wellbore_identifier", maintain_order=True).agg(
-            [
-                pl.col("wellbore_uuid").first().alias("wellbore_uuid"),
-                pl.col("tvd_msl").alias("tvd_msl_arr"),
-                pl.col("md").alias("md_arr"),
-                pl.col("easting").alias("easting_arr"),
-                pl.col("northing").alias("northing_arr"),
-            ]
+        filtered_df = (
+            resultdf.filter(pl.all_horizontal(pl.col(_TRAJECTORY_SAMPLE_COLUMNS).is_not_null()))
+            .select(list(SURVEY_SAMPLES_SCHEMA))
+            .cast(SURVEY_SAMPLES_SCHEMA)
         )
-
-        wellbore_trajectories: List[WellboreTrajectory] = [
-            WellboreTrajectory(
-                wellbore_uuid=row["wellbore_uuid"],
-                unique_wellbore_identifier=row["unique_wellbore_identifier"],
-                tvd_msl_arr=row["tvd_msl_arr"],
-                md_arr=row["md_arr"],
-                easting_arr=row["easting_arr"],
-                northing_arr=row["northing_arr"],
-            )
-            for row in wellbore_data.iter_rows(named=True)
-        ]
-        return wellbore_trajectories
+        return filtered_df, len(result)
 
     async def get_wellbore_picks_for_wellbore_async(
         self, wellbore_uuid: str, obs_no: Optional[int] = None
@@ -347,22 +416,39 @@ class SmdaAccess:
         if obs_no:
             params["obs_no"] = str(obs_no)
 
-        results = await self._smda_get_request_async(endpoint=SmdaEndpoints.WELLBORE_PICKS, params=params)
-        if not results:
-            raise NoDataError(
-                f"No wellbore picks found for {field_identifier=}, {pick_identifier=}, {interpreter=}, {obs_no=}.",
-                Service.SMDA,
-            )
-        picks: List[WellborePick] = []
-        for result in results:
-            # Drop any picks with missing data
-            if all(result.get(key) for key in ["northing", "easting", "tvd", "tvd_msl"]):
-                picks.append(WellborePick(**result))
-            else:
-                LOGGER.warning(
-                    f"Invalid pick found for {pick_identifier=}, {result.get('unique_wellbore_identifier')}. This will be ignored."
+        async def _fetch_picks_async() -> tuple[List[WellborePick], int]:
+            results = await self._smda_get_request_async(endpoint=SmdaEndpoints.WELLBORE_PICKS, params=params)
+            if not results:
+                raise NoDataError(
+                    f"No wellbore picks found for {field_identifier=}, {pick_identifier=}, {interpreter=}, {obs_no=}.",
+                    Service.SMDA,
                 )
-        return picks
+
+            picks: List[WellborePick] = []
+            for result in results:
+                # Drop any picks with missing data
+                if all(result.get(key) for key in ["northing", "easting", "tvd", "tvd_msl"]):
+                    picks.append(WellborePick(**result))
+                else:
+                    LOGGER.warning(
+                        f"Invalid pick found for {pick_identifier=}, {result.get('unique_wellbore_identifier')}. This will be ignored."
+                    )
+            return picks, len(results)
+
+        if self._field_cache is None:
+            picks, _ = await _fetch_picks_async()
+            return picks
+
+        async def _fetch_payload_async() -> FetchedPayload:
+            picks, record_count = await _fetch_picks_async()
+            return FetchedPayload(_WELLBORE_PICKS_ADAPTER.dump_json(picks), record_count)
+
+        payload = await self._field_cache.get_async(
+            key=f"field:{field_identifier}:wellbore_picks:{pick_identifier}:{interpreter}:{obs_no}",
+            count_async=lambda: self._smda_get_count_request_async(SmdaEndpoints.WELLBORE_PICKS, params),
+            fetch_async=_fetch_payload_async,
+        )
+        return _WELLBORE_PICKS_ADAPTER.validate_json(payload) if payload else []
 
     async def get_wellbore_picks_in_stratigraphic_column_async(
         self,
@@ -398,3 +484,63 @@ class SmdaAccess:
         units = await self.get_stratigraphic_units_async(strat_column_identifier)
         sorted_surfaces = sort_stratigraphic_names_by_hierarchy(units, only_include_top_and_base=True)
         return sorted_surfaces
+
+
+def _make_survey_headers_params(field_identifier: str) -> dict:
+    projection = [
+        "wellbore_uuid",
+        "unique_wellbore_identifier",
+        "well_uuid",
+        "unique_well_identifier",
+        "well_easting",
+        "well_northing",
+        "depth_reference_point",
+        "depth_reference_elevation",
+        "tvd_min",
+        "tvd_max",
+        "tvd_unit",
+        "md_min",
+        "md_max",
+        "md_unit",
+    ]
+    return {
+        "_projection": ",".join(projection),
+        "_sort": "unique_wellbore_identifier",
+        "field_identifier": field_identifier,
+    }
+
+
+def _make_survey_samples_params(field_identifier: str, wellbore_uuids: Optional[List[str]]) -> dict:
+    params = {
+        "_projection": "wellbore_uuid, unique_wellbore_identifier,easting,northing,tvd_msl,md",
+        "_sort": "unique_wellbore_identifier,md",
+        "field_identifier": field_identifier,
+    }
+    if wellbore_uuids:
+        params["wellbore_uuid"] = ", ".join(wellbore_uuids)
+    return params
+
+
+def _create_wellbore_trajectories(samples_df: pl.DataFrame) -> List[WellboreTrajectory]:
+    # Group per wellbore, maintaining order
+    wellbore_data = samples_df.group_by("unique_wellbore_identifier", maintain_order=True).agg(
+        [
+            pl.col("wellbore_uuid").first().alias("wellbore_uuid"),
+            pl.col("tvd_msl").alias("tvd_msl_arr"),
+            pl.col("md").alias("md_arr"),
+            pl.col("easting").alias("easting_arr"),
+            pl.col("northing").alias("northing_arr"),
+        ]
+    )
+
+    return [
+        WellboreTrajectory(
+            wellbore_uuid=row["wellbore_uuid"],
+            unique_wellbore_identifier=row["unique_wellbore_identifier"],
+            tvd_msl_arr=row["tvd_msl_arr"],
+            md_arr=row["md_arr"],
+            easting_arr=row["easting_arr"],
+            northing_arr=row["northing_arr"],
+        )
+        for row in wellbore_data.iter_rows(named=True)
+    ]
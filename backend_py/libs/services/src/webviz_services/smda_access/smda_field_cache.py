@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import redis.asyncio as redis
+from webviz_core_utils.single_flight import SingleFlight
+
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+_REDIS_KEY_PREFIX = "smda_field_cache"
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FetchedPayload:
+    # Serialized data to cache
+    payload: bytes
+    # Number of SMDA records the payload was built from, as reported by the corresponding count request
+    record_count: int
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    payload: bytes
+    record_count: int
+    fetched_at_s: float
+
+
+class SmdaFieldCacheFactory:
+    _instance = None
+
+    def __init__(self, redis_client: redis.Redis):
+        self._redis_client: redis.Redis = redis_client
+        # Fetches that are in progress in this process, keyed by redis key
+        self._in_flight_fetches: SingleFlight[str, FetchedPayload] = SingleFlight()
+
+    @classmethod
+    def initialize(cls, redis_url: str) -> None:
+        if cls._instance is not None:
+            raise RuntimeError("SmdaFieldCacheFactory is already initialized")
+
+        # Payloads are binary, so responses must not be decoded
+        redis_client = redis.Redis.from_url(redis_url, decode_responses=False)
+        cls._instance = cls(redis_client)
+
+    @classmethod
+    def get_instance(cls) -> "SmdaFieldCacheFactory":
+        if cls._instance is None:
+            raise RuntimeError("SmdaFieldCacheFactory is not initialized, call initialize() first")
+        return cls._instance
+
+    def get_field_cache_for_user(self, authenticated_user: AuthenticatedUser) -> "SmdaFieldCache":
+        if not authenticated_user:
+            raise ValueError("An authenticated user must be specified")
+
+        return SmdaFieldCache(
+            user_id=authenticated_user.get_user_id(),
+            redis_client=self._redis_client,
+            in_flight_fetches=self._in_flight_fetches,
+        )
+
+
+class SmdaFieldCache:
+    """
+    Per user Redis cache for field wide SMDA data such as wellbore headers, trajectories and picks.
+
+    Fetching this data for a large field means paging through hundreds of thousands of records, while checking how
+    many records a request would return is a single cheap request. An entry is therefore only served after the
+    record count has been checked, so that changes in SMDA that alter the number of records are picked up
+    immediately.
+
+    Entries are stored per user since the wellbores a user is allowed to see in SMDA depend on the user's access
+    rights, and a matching record count does not prove that two users see the same records.
+
+    Entries that are older than `refresh_after_s` are still served, but refreshed in the background.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        redis_client: redis.Redis,
+        in_flight_fetches: SingleFlight[str, FetchedPayload] | None = None,
+        ttl_s: int = 24 * 60 * 60,
+        refresh_after_s: float = 60 * 60,
+    ):
+        if not user_id:
+            raise ValueError("A user_id must be specified")
+
+        self._user_id = user_id
+        self._redis_client: redis.Redis = redis_client
+        self._in_flight_fetches = in_flight_fetches if in_flight_fetches is not None else SingleFlight()
+        self._ttl_s = ttl_s
+        self._refresh_after_s = refresh_after_s
+
+    async def get_async(
+        self,
+        key: str,
+        count_async: Callable[[], Awaitable[int]],
+        fetch_async: Callable[[], Awaitable[FetchedPayload]],
+        fetch_on_miss: bool = True,
+    ) -> bytes | None:
+        """
+        Get the cached payload for the key, fetching and storing it if there is no valid entry.
+
+        If `fetch_on_miss` is False, the entry is fetched in the background on a miss and None is returned. This is
+        useful when the caller can serve a narrower request directly while the cache is being filled.
+        """
+        redis_key = f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:{key}"
+        entry, record_count = await asyncio.gather(self._read_entry_async(redis_key), count_async())
+
+        if entry is not None and entry.record_count == record_count:
+            if time.time() - entry.fetched_at_s > self._refresh_after_s:
+                LOGGER.debug(f"Refreshing stale SMDA cache entry in the background: {redis_key}")
+                self._get_or_start_fetch_task(redis_key, fetch_async)
+            return entry.payload
+
+        fetch_task = self._get_or_start_fetch_task(redis_key, fetch_async)
+        if not fetch_on_miss:
+            return None
+
+        fetched = await asyncio.shield(fetch_task)
+        return fetched.payload
+
+    def _get_or_start_fetch_task(
+        self, redis_key: str, fetch_async: Callable[[], Awaitable[FetchedPayload]]
+    ) -> asyncio.Task[FetchedPayload]:
+        # Single-flight per entry, since the redis key includes the user id, fetches are never shared between users
+        return self._in_flight_fetches.start(redis_key, lambda: self._fetch_and_store_async(redis_key, fetch_async))
+
+    async def _fetch_and_store_async(
+        self, redis_key: str, fetch_async: Callable[[], Awaitable[FetchedPayload]]
+    ) -> FetchedPayload:
+        start_s = time.perf_counter()
+        try:
+            fetched = await fetch_async()
+        except Exception as exc:
+            # Log here since nobody is waiting for the result of background refreshes
+            LOGGER.warning(f"Fetching SMDA data for {redis_key} failed: {exc}")
+            raise
+        fetch_time_s = time.perf_counter() - start_s
+
+        mapping: dict[str, bytes | int | float] = {
+            "payload": fetched.payload,
+            "record_count": fetched.record_count,
+            "fetched_at_s": time.time(),
+        }
+        pipe = self._redis_client.pipeline(transaction=True)
+        pipe.hset(redis_key, mapping=mapping)  # type: ignore[arg-type]
+        pipe.expire(redis_key, self._ttl_s)
+        await pipe.execute()
+
+        LOGGER.debug(
+            f"Fetched SMDA data for {redis_key} in {fetch_time_s:.2f}s "
+            f"({fetched.record_count} records, {len(fetched.payload) / 1024:.0f} KiB)"
+        )
+        return fetched
+
+    async def _read_entry_async(self, redis_key: str) -> _CacheEntry | None:
+        values = await self._redis_client.hmget(redis_key, ["payload", "record_count", "fetched_at_s"])
+        payload, record_count, fetched_at_s = values
+        if payload is None or record_count is None or fetched_at_s is None:
+            return None
+
+        return _CacheEntry(payload=payload, record_count=int(record_count), fetched_at_s=float(fetched_at_s))
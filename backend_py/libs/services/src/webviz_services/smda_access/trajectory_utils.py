@@ -0,0 +1,75 @@
+from typing import List, Optional
+
+import numpy as np
+import polars as pl
+
+from .types import BoundingBox2D, WellboreTrajectoriesColumnar, WellboreTrajectory
+
+# Columns of the survey samples frame, one row per sample, sorted on wellbore and md
+SURVEY_SAMPLES_SCHEMA = pl.Schema(
+    {
+        "wellbore_uuid": pl.String,
+        "unique_wellbore_identifier": pl.String,
+        "tvd_msl": pl.Float64,
+        "md": pl.Float64,
+        "easting": pl.Float64,
+        "northing": pl.Float64,
+    }
+)
+
+
+def filter_survey_samples_df(
+    samples_df: pl.DataFrame, wellbore_uuids: Optional[List[str]] = None, bbox: Optional[BoundingBox2D] = None
+) -> pl.DataFrame:
+    """
+    Filter survey samples on wellbore uuids and/or a bounding box.
+
+    A wellbore passes the bounding box filter if any of its samples are inside the box, in which case all of its
+    samples are kept.
+    """
+    filter_exprs: list[pl.Expr] = []
+    if wellbore_uuids:
+        filter_exprs.append(pl.col("wellbore_uuid").is_in(wellbore_uuids))
+    if bbox is not None:
+        is_inside_bbox = pl.col("easting").is_between(bbox.min_x, bbox.max_x) & pl.col("northing").is_between(
+            bbox.min_y, bbox.max_y
+        )
+        filter_exprs.append(is_inside_bbox.any().over("wellbore_uuid"))
+
+    if not filter_exprs:
+        return samples_df
+    return samples_df.filter(filter_exprs)
+
+
+def create_wellbore_trajectories_columnar(samples_df: pl.DataFrame) -> WellboreTrajectoriesColumnar:
+    """Create columnar trajectories from survey samples, without creating per wellbore objects"""
+    wellbores_df = samples_df.select("wellbore_uuid", "unique_wellbore_identifier").with_row_index("start_index")
+    wellbores_df = wellbores_df.filter(pl.col("wellbore_uuid").ne_missing(pl.col("wellbore_uuid").shift(1)))
+
+    return WellboreTrajectoriesColumnar(
+        wellbore_uuids=wellbores_df["wellbore_uuid"].to_list(),
+        unique_wellbore_identifiers=wellbores_df["unique_wellbore_identifier"].to_list(),
+        start_indices=wellbores_df["start_index"].to_numpy().astype(np.uint32),
+        tvd_msl_arr=samples_df["tvd_msl"].to_numpy(),
+        md_arr=samples_df["md"].to_numpy(),
+        easting_arr=samples_df["easting"].to_numpy(),
+        northing_arr=samples_df["northing"].to_numpy(),
+    )
+
+
+def create_survey_samples_df_from_trajectories(trajectories: List[WellboreTrajectory]) -> pl.DataFrame:
+    """Create a survey samples frame from per wellbore trajectories"""
+    num_samples_arr = [len(trajectory.md_arr) for trajectory in trajectories]
+    return pl.DataFrame(
+        {
+            "wellbore_uuid": np.repeat([trajectory.wellbore_uuid for trajectory in trajectories], num_samples_arr),
+            "unique_wellbore_identifier": np.repeat(
+                [trajectory.unique_wellbore_identifier for trajectory in trajectories], num_samples_arr
+            ),
+            "tvd_msl": np.concatenate([trajectory.tvd_msl_arr for trajectory in trajectories] or [[]]),
+            "md": np.concatenate([trajectory.md_arr for trajectory in trajectories] or [[]]),
+            "easting": np.concatenate([trajectory.easting_arr for trajectory in trajectories] or [[]]),
+            "northing": np.concatenate([trajectory.northing_arr for trajectory in trajectories] or [[]]),
+        },
+        schema=SURVEY_SAMPLES_SCHEMA,
+    )
@@ -1,6 +1,9 @@
 from enum import Enum
 from typing import List, Optional, Literal
-from pydantic import BaseModel
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict
 
 
 class WellborePick(BaseModel):
@@ -35,6 +38,32 @@ class WellboreTrajectory(BaseModel):
     northing_arr: List[float]
 
 
+class WellboreTrajectoriesColumnar(BaseModel):
+    """
+    Trajectories for multiple wellbores as concatenated sample arrays.
+
+    The samples of trajectory i are found in the range [start_indices[i], start_indices[i + 1]), with the last
+    trajectory running to the end of the arrays. The samples of each trajectory are sorted on md.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    wellbore_uuids: List[str]
+    unique_wellbore_identifiers: List[str]
+    start_indices: NDArray[np.uint32]
+    tvd_msl_arr: NDArray[np.float64]
+    md_arr: NDArray[np.float64]
+    easting_arr: NDArray[np.float64]
+    northing_arr: NDArray[np.float64]
+
+
+class BoundingBox2D(BaseModel):
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+
+
 class WellboreSurveyHeader(BaseModel):
     survey_identifier: str
     well_uuid: str
@@ -0,0 +1,95 @@
+import logging
+from typing import Awaitable, Callable
+
+import redis.asyncio as redis
+
+from webviz_core_utils.perf_timer import PerfTimer
+from webviz_core_utils.single_flight import SingleFlight
+
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+_REDIS_KEY_PREFIX = "ssdl_field_cache"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SsdlFieldCacheFactory:
+    _instance = None
+
+    def __init__(self, redis_client: redis.Redis):
+        self._redis_client: redis.Redis = redis_client
+        # Fetches that are in progress in this process, keyed by redis key
+        self._in_flight_fetches: SingleFlight[str, bytes] = SingleFlight()
+
+    @classmethod
+    def initialize(cls, redis_url: str) -> None:
+        if cls._instance is not None:
+            raise RuntimeError("SsdlFieldCacheFactory is already initialized")
+
+        # Payloads are stored as serialized bytes, so responses must not be decoded
+        redis_client = redis.Redis.from_url(redis_url, decode_responses=False)
+        cls._instance = cls(redis_client)
+
+    @classmethod
+    def get_instance(cls) -> "SsdlFieldCacheFactory":
+        if cls._instance is None:
+            raise RuntimeError("SsdlFieldCacheFactory is not initialized, call initialize() first")
+        return cls._instance
+
+    def get_field_cache_for_user(self, authenticated_user: AuthenticatedUser) -> "SsdlFieldCache":
+        if not authenticated_user:
+            raise ValueError("An authenticated user must be specified")
+
+        return SsdlFieldCache(
+            user_id=authenticated_user.get_user_id(),
+            redis_client=self._redis_client,
+            in_flight_fetches=self._in_flight_fetches,
+        )
+
+
+class SsdlFieldCache:
+    """
+    Per user Redis cache for large per field SSDL responses, such as perforations and screens, keyed by field uuid.
+
+    Entries are stored per user since SSDL gives no guarantee that the data returned for a field is the same for all
+    users.
+
+    Entries expire after `ttl_s`, after which the next request refetches them. Concurrent misses for the same entry
+    within this process share one fetch.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        redis_client: redis.Redis,
+        in_flight_fetches: SingleFlight[str, bytes] | None = None,
+        ttl_s: int = 60 * 60,
+    ):
+        if not user_id:
+            raise ValueError("A user_id must be specified")
+
+        self._user_id = user_id
+        self._redis_client: redis.Redis = redis_client
+        self._in_flight_fetches = in_flight_fetches if in_flight_fetches is not None else SingleFlight()
+        self._ttl_s = ttl_s
+
+    async def get_async(self, key: str, fetch_async: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Get the cached payload for the key, fetching and storing it if it is not in the cache.
+        """
+        redis_key = f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:{key}"
+        payload = await self._redis_client.get(redis_key)
+        if payload is not None:
+            return payload
+
+        return await self._in_flight_fetches.run_async(
+            redis_key, lambda: self._fetch_and_store_async(redis_key, fetch_async)
+        )
+
+    async def _fetch_and_store_async(self, redis_key: str, fetch_async: Callable[[], Awaitable[bytes]]) -> bytes:
+        timer = PerfTimer()
+        payload = await fetch_async()
+        await self._redis_client.set(redis_key, payload, ex=self._ttl_s)
+
+        LOGGER.debug(f"Fetched SSDL data for {redis_key} in {timer.elapsed_s():.2f}s ({len(payload) / 1024:.0f} KiB)")
+        return payload
@@ -1,20 +1,36 @@
-from typing import List, Optional, TypeVar, Type
-from pydantic import ValidationError, BaseModel
+from typing import Awaitable, Callable, List, Optional, TypeVar, Type
+from pydantic import ValidationError, BaseModel, TypeAdapter
+
+from webviz_core_utils.ttl_cache import TtlCache
 
 from webviz_services.service_exceptions import (
     Service,
     InvalidDataError,
 )
 from ._ssdl_get_request import ssdl_get_request_async
+from .ssdl_field_cache import SsdlFieldCache
 
 from . import types
 
 T = TypeVar("T", bound=BaseModel)
 
+# Field uuid per field identifier. The field list rarely changes, so it is kept in process and shared across users.
+# The directory only translates field identifiers to uuids, and all requests for data in a field are still made with
+# the requesting user's own token, so sharing it does not give anyone access to data they could not fetch themselves.
+_FIELD_UUID_DIRECTORY_CACHE: TtlCache[str, dict[str, str]] = TtlCache(max_entries=1, ttl_s=60 * 60)
+_FIELD_UUID_DIRECTORY_KEY = "fields"
+
 
 class WellAccess:
-    def __init__(self, access_token: str):
+    """
+    Access to SSDL.
+
+    If a field cache is given, the field wide perforations and screens are served through it, see SsdlFieldCache.
+    """
+
+    def __init__(self, access_token: str, field_cache: SsdlFieldCache | None = None):
         self._ssdl_token = access_token
+        self._field_cache = field_cache
 
     async def get_fields_async(self) -> List[types.FieldInfo]:
         """Get list of fields"""
@@ -22,21 +38,41 @@ class WellAccess:
             endpoint="Field", model_type=types.FieldInfo, error_context="field"
         )
 
+    async def get_field_uuid_async(self, field_identifier: str) -> str | None:
+        """Get the uuid of a field from its identifier, returns None if the field is not found"""
+
+        async def _fetch_field_uuid_directory_async() -> dict[str, str]:
+            fields = await self.get_fields_async()
+            return {field.field_identifier: field.field_uuid for field in fields}
+
+        field_uuid_directory = await _FIELD_UUID_DIRECTORY_CACHE.get_or_compute_async(
+            _FIELD_UUID_DIRECTORY_KEY, _fetch_field_uuid_directory_async
+        )
+        return field_uuid_directory.get(field_identifier)
+
     async def get_field_perforations_async(self, field_uuid: str) -> List[types.WellborePerforation]:
-        return await self._fetch_and_validate_list_async(
-            endpoint=f"Field/{field_uuid}/perforations",
-            model_type=types.WellborePerforation,
-            params={"normalized_data": True},
-            error_context=f"perforation data for field {field_uuid}",
+        return await self._get_field_list_async(
+            cache_key=f"field:{field_uuid}:perforations",
+            fetch_async=lambda: self._fetch_and_validate_list_async(
+                endpoint=f"Field/{field_uuid}/perforations",
+                model_type=types.WellborePerforation,
+                params={"normalized_data": True},
+                error_context=f"perforation data for field {field_uuid}",
+            ),
+            list_adapter=TypeAdapter(List[types.WellborePerforation]),
         )
 
     async def get_field_screens_async(self, field_uuid: str) -> List[types.WellboreCompletion]:
-        return await self._fetch_and_validate_list_async(
-            endpoint=f"Field/{field_uuid}/completions",
-            model_type=types.WellboreCompletion,
-            params={"normalized_data": True, "filter": "Screen"},
-            error_context=f"completion data for field {field_uuid}",
-            handle_dict_values=True,
+        return await self._get_field_list_async(
+            cache_key=f"field:{field_uuid}:screens",
+            fetch_async=lambda: self._fetch_and_validate_list_async(
+                endpoint=f"Field/{field_uuid}/completions",
+                model_type=types.WellboreCompletion,
+                params={"normalized_data": True, "filter": "Screen"},
+                error_context=f"completion data for field {field_uuid}",
+                handle_dict_values=True,
+            ),
+            list_adapter=TypeAdapter(List[types.WellboreCompletion]),
         )
 
     async def get_completions_for_wellbore_async(self, wellbore_uuid: str) -> List[types.WellboreCompletion]:
@@ -95,6 +131,18 @@ class WellAccess:
             ) from error
         return result
 
+    async def _get_field_list_async(
+        self, cache_key: str, fetch_async: Callable[[], Awaitable[List[T]]], list_adapter: TypeAdapter[List[T]]
+    ) -> List[T]:
+        if self._field_cache is None:
+            return await fetch_async()
+
+        async def _fetch_payload_async() -> bytes:
+            return list_adapter.dump_json(await fetch_async())
+
+        payload = await self._field_cache.get_async(cache_key, _fetch_payload_async)
+        return list_adapter.validate_json(payload)
+
     async def _fetch_and_validate_list_async(
         self,
         endpoint: str,
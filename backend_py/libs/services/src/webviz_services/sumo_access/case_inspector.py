@@ -24,11 +24,18 @@ class EnsembleInfo(BaseModel):
     realization_count: int
 
 
+class CaseSummary(BaseModel):
+    name: str
+    asset_name: str
+    field_identifiers: list[str]
+    stratigraphic_column_identifier: str
+
+
 class CaseInspector:
     def __init__(self, sumo_client: SumoClient, case_uuid: str):
         self._sumo_client = sumo_client
         self._case_uuid = case_uuid
-        self._cached_case_context: Case | None = None
+        self._case_context_task: asyncio.Task[Case] | None = None
 
     @classmethod
     def from_case_uuid(cls, access_token: str, case_uuid: str) -> "CaseInspector":
@@ -36,18 +43,51 @@ class CaseInspector:
         return CaseInspector(sumo_client=sumo_client, case_uuid=case_uuid)
 
     async def _get_or_create_case_context_async(self) -> Case:
-        if self._cached_case_context is None:
-            self._cached_case_context = await create_sumo_case_async(
-                client=self._sumo_client, case_uuid=self._case_uuid
+        # Store the task rather than the result so that concurrent callers share a single fetch of the case
+        if self._case_context_task is None:
+            self._case_context_task = asyncio.create_task(
+                create_sumo_case_async(client=self._sumo_client, case_uuid=self._case_uuid)
             )
 
-        return self._cached_case_context
+        return await asyncio.shield(self._case_context_task)
 
     async def get_case_name_async(self) -> str:
         """Get name of the case"""
         case = await self._get_or_create_case_context_async()
         return case.name
 
+    async def get_case_summary_async(self) -> CaseSummary:
+        """
+        Get summary of the case, with name, asset, field identifiers and stratigraphic column identifier
+
+        The values are taken from the case metadata document itself, falling back to aggregations over the
+        case's objects only if a value is missing from the document.
+        """
+        case = await self._get_or_create_case_context_async()
+
+        asset_name: str | None = case.get_property("access.asset.name")
+        if not asset_name:
+            asset_name = await self.get_asset_name_async()
+
+        field_identifiers: list[str] = [
+            field["identifier"]
+            for field in case.get_property("masterdata.smda.field") or []
+            if isinstance(field, dict) and field.get("identifier")
+        ]
+        if not field_identifiers:
+            field_identifiers = await self.get_field_identifiers_async()
+
+        strat_identifier: str | None = case.get_property("masterdata.smda.stratigraphic_column.identifier")
+        if not strat_identifier:
+            strat_identifier = await self.get_stratigraphic_column_identifier_async()
+
+        return CaseSummary(
+            name=case.name,
+            asset_name=asset_name,
+            field_identifiers=field_identifiers,
+            stratigraphic_column_identifier=strat_identifier,
+        )
+
     async def _get_ensemble_info_async(self, ensemble_uuid: str) -> EnsembleInfo:
         search_context = SearchContext(self._sumo_client)
         ensemble_obj = await search_context.get_ensemble_by_uuid_async(ensemble_uuid)
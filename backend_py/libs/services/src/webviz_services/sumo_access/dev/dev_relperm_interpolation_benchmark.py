@@ -0,0 +1,168 @@
+"""
+Benchmark of the relperm realization data shaping in relperm_access.create_relperm_realization_data().
+
+Compares the vectorized implementation against the previous pure-Python implementation (kept below as a reference)
+on a synthetic table, and verifies that both produce identical output.
+
+Run with:
+    python -m webviz_services.sumo_access.dev.dev_relperm_interpolation_benchmark [num_reals] [num_satnums]
+"""
+
+import sys
+import math
+import time
+from bisect import bisect_left
+from typing import Callable, Sequence
+
+import numpy as np
+import polars as pl
+
+from webviz_services.sumo_access.relperm_access import create_relperm_realization_data
+from webviz_services.sumo_access.relperm_types import RelpermCurveData, RelpermRealizationData
+
+CURVE_NAMES = ["KRW", "KROW", "PCOW", "KRG", "KROG", "PCOG"]
+
+
+def make_synthetic_relperm_table(num_reals: int, num_satnums: int, num_samples: int, seed: int = 0) -> pl.DataFrame:
+    """
+    Create relperm table where each realization has its own saturation sampling, drawn from a 0.01 step grid
+    as is typical for generated relperm tables
+    """
+    rng = np.random.default_rng(seed)
+
+    real_arr = []
+    satnum_arr = []
+    sw_arr = []
+    for real in range(num_reals):
+        for satnum in range(1, num_satnums + 1):
+            inner_sw = rng.choice(np.arange(10, 91), size=num_samples - 2, replace=False) / 100
+            end_sw = rng.choice(np.arange(0, 6), size=1)[0] / 100, rng.choice(np.arange(95, 101), size=1)[0] / 100
+            real_arr.append(np.full(num_samples, real))
+            satnum_arr.append(np.full(num_samples, satnum))
+            sw_arr.append(np.concatenate([[end_sw[0]], inner_sw, [end_sw[1]]]))
+
+    num_rows = num_reals * num_satnums * num_samples
+    columns: dict[str, np.ndarray] = {
+        "REAL": np.concatenate(real_arr),
+        "SATNUM": np.concatenate(satnum_arr),
+        "SW": np.concatenate(sw_arr),
+    }
+    for curve_name in CURVE_NAMES:
+        columns[curve_name] = rng.uniform(0.0, 1.0, num_rows)
+
+    # Shuffle the rows, the shaping is expected to handle unsorted input
+    return pl.DataFrame(columns).sample(fraction=1.0, shuffle=True, seed=seed)
+
+
+def reference_create_relperm_realization_data(
+    dataframe: pl.DataFrame, saturation_axis_name: str, curve_names: Sequence[str], satnums: Sequence[int]
+) -> list[RelpermRealizationData]:
+    """The previous implementation, interpolating one value at a time in Python (validation omitted)"""
+    required_columns = ["REAL", "SATNUM", saturation_axis_name, *curve_names]
+    filtered_dataframe = (
+        dataframe.select(required_columns)
+        .filter(pl.col("SATNUM").cast(pl.Int64).is_in(sorted(set(satnums))))
+        .drop_nulls(subset=[saturation_axis_name, *curve_names])
+        .sort(["REAL", "SATNUM", saturation_axis_name])
+    )
+    partitions = filtered_dataframe.partition_by(["REAL", "SATNUM"], maintain_order=True)
+
+    saturation_values_by_satnum: dict[int, list[list[float]]] = {}
+    for partition in partitions:
+        satnum = int(partition["SATNUM"][0])
+        saturation_values_by_satnum.setdefault(satnum, []).append(partition[saturation_axis_name].to_list())
+
+    shared_saturation_values_by_satnum: dict[int, list[float]] = {}
+    for satnum, saturation_values_arr in saturation_values_by_satnum.items():
+        min_common = max(min(values) for values in saturation_values_arr)
+        max_common = min(max(values) for values in saturation_values_arr)
+        shared_saturation_values_by_satnum[satnum] = sorted(
+            {value for values in saturation_values_arr for value in values if min_common <= value <= max_common}
+        )
+
+    ret_arr: list[RelpermRealizationData] = []
+    for partition in partitions:
+        satnum = int(partition["SATNUM"][0])
+        source_saturation_values = partition[saturation_axis_name].to_list()
+        target_saturation_values = shared_saturation_values_by_satnum[satnum]
+        curve_data = [
+            RelpermCurveData(
+                curve_name=curve_name,
+                curve_values=[
+                    _reference_interpolate_single_value(source_saturation_values, partition[curve_name].to_list(), x)
+                    for x in target_saturation_values
+                ],
+            )
+            for curve_name in curve_names
+        ]
+        ret_arr.append(
+            RelpermRealizationData(
+                realization=int(partition["REAL"][0]),
+                satnum=satnum,
+                saturation_name=saturation_axis_name,
+                saturation_values=target_saturation_values,
+                curve_data=curve_data,
+            )
+        )
+
+    return ret_arr
+
+
+def _reference_interpolate_single_value(xs: Sequence[float], ys: Sequence[float], x: float) -> float:
+    i = bisect_left(xs, x)
+    if i < len(xs) and xs[i] == x:
+        return float(ys[i])
+    if i == 0:
+        return float(ys[0])
+    if i >= len(xs):
+        return float(ys[-1])
+    fraction = (x - xs[i - 1]) / (xs[i] - xs[i - 1])
+    return float(ys[i - 1] + fraction * (ys[i] - ys[i - 1]))
+
+
+def _assert_identical(actual: list[RelpermRealizationData], expected: list[RelpermRealizationData]) -> None:
+    assert len(actual) == len(expected)
+    for actual_data, expected_data in zip(actual, expected, strict=True):
+        assert (actual_data.realization, actual_data.satnum) == (expected_data.realization, expected_data.satnum)
+        assert actual_data.saturation_values == expected_data.saturation_values
+        for actual_curve, expected_curve in zip(actual_data.curve_data, expected_data.curve_data, strict=True):
+            assert actual_curve.curve_name == expected_curve.curve_name
+            # Exact comparison, the values must be identical and not just approximately equal
+            assert actual_curve.curve_values == expected_curve.curve_values
+
+
+def _time_it_s(func: Callable[[], object], num_runs: int) -> float:
+    best_time_s = math.inf
+    for _ in range(num_runs):
+        start_s = time.perf_counter()
+        func()
+        best_time_s = min(best_time_s, time.perf_counter() - start_s)
+    return best_time_s
+
+
+def main() -> None:
+    num_reals = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_satnums = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    num_samples = 20
+
+    dataframe = make_synthetic_relperm_table(num_reals, num_satnums, num_samples)
+    satnums = list(range(1, num_satnums + 1))
+    print(
+        f"Synthetic table: {num_reals=} {num_satnums=} {num_samples=} curves={len(CURVE_NAMES)} rows={len(dataframe)}"
+    )
+
+    actual = create_relperm_realization_data(dataframe, "SW", CURVE_NAMES, satnums)
+    expected = reference_create_relperm_realization_data(dataframe, "SW", CURVE_NAMES, satnums)
+    _assert_identical(actual, expected)
+    print("Output is identical to the reference implementation")
+
+    vectorized_s = _time_it_s(lambda: create_relperm_realization_data(dataframe, "SW", CURVE_NAMES, satnums), 5)
+    reference_s = _time_it_s(
+        lambda: reference_create_relperm_realization_data(dataframe, "SW", CURVE_NAMES, satnums), 1
+    )
+    print(f"Reference (pure Python): {reference_s * 1000:9.1f} ms")
+    print(f"Vectorized:              {vectorized_s * 1000:9.1f} ms  ({reference_s / vectorized_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
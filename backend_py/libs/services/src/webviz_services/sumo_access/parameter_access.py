@@ -1,5 +1,8 @@
 import logging
 from dataclasses import dataclass
+from typing import cast
+
+import numpy as np
 import polars as pl
 import pyarrow as pa
 from fmu.datamodels.standard_results.enums import StandardResultName
@@ -7,6 +10,7 @@ from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 from fmu.sumo.explorer.objects import Table
 from fmu.datamodels import ErtDistribution
 from webviz_core_utils.perf_metrics import PerfMetrics
+from webviz_core_utils.ttl_cache import TtlCache
 from webviz_services.service_exceptions import (
     NoDataError,
     InvalidDataError,
@@ -18,6 +22,7 @@ from webviz_services.service_exceptions import (
 from .sumo_client_factory import create_sumo_client
 from .parameter_types import (
     EnsembleParameter,
+    EnsembleParametersColumnar,
     EnsembleSensitivity,
     EnsembleSensitivityCase,
     SensitivityType,
@@ -46,6 +51,39 @@ class ParametersAndSensitivities:
     non_standard_parameters_warning: str | None = None
 
 
+@dataclass
+class ParametersAndSensitivitiesColumnar:
+    """Parameters in columnar form and sensitivities for an ensemble, with an optional non-fatal warning."""
+
+    parameters: EnsembleParametersColumnar
+    sensitivities: list[EnsembleSensitivity]
+    non_standard_parameters_warning: str | None = None
+
+
+# Rough size of an item in the parameter value and realization lists, a pointer plus a boxed float or int
+_ESTIMATED_BYTES_PER_LIST_ITEM = 32
+
+
+def _estimate_size_bytes(parameters_and_sensitivities: ParametersAndSensitivities) -> int:
+    return sum(
+        (len(parameter.values) + len(parameter.realizations)) * _ESTIMATED_BYTES_PER_LIST_ITEM + 256
+        for parameter in parameters_and_sensitivities.parameters
+    )
+
+
+# Parameters and sensitivities keyed by (case_uuid, ensemble_name, ensemble_fingerprint).
+# Shared between users through the fingerprint in the key, see SumoFingerprinter.
+# Ensembles with thousands of parameters take tens of MB each, so the cache is bounded by the estimated size.
+# Only the per-parameter form is cached, since the columnar form holds the values as float32 and the per-parameter form
+# can therefore not be derived from it. The cached objects are shared between requests and must not be modified.
+_PARAMETERS_AND_SENSITIVITIES_CACHE: TtlCache[tuple[str, str, str], ParametersAndSensitivities] = TtlCache(
+    max_entries=64,
+    ttl_s=30 * 60,
+    max_size_bytes=256 * 1024 * 1024,
+    get_size_bytes=_estimate_size_bytes,
+)
+
+
 class ParameterAccess:
     """Access class for retrieving parameters and sensitivities from SUMO.
 
@@ -53,22 +91,38 @@ class ParameterAccess:
     supporting both standard and legacy result formats.
     """
 
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str) -> None:
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> None:
         self._sumo_client: SumoClient = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
         self._ensemble_context = SearchContext(sumo=self._sumo_client).filter(
             uuid=self._case_uuid, ensemble=self._ensemble_name
         )
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "ParameterAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "ParameterAccess":
+        """
+        If the ensemble fingerprint is specified, the parameters and sensitivities will be cached in-process per
+        fingerprint
+        """
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     async def get_parameters_and_sensitivities_async(self) -> ParametersAndSensitivities:
         """Retrieve parameters and sensitivities for an ensemble.
 
+        The result is cached if the access was created with an ensemble fingerprint, and must not be modified.
+
         Returns:
             A ParametersAndSensitivities object containing:
             - List of ensemble parameters with metadata and values
@@ -82,7 +136,32 @@ class ParameterAccess:
             ServiceRequestError: If parameter aggregation fails
             InvalidDataError: If data format is unexpected
         """
+        if self._ensemble_fingerprint is None:
+            return await self._load_parameters_and_sensitivities_async()
+
+        cache_key = (self._case_uuid, self._ensemble_name, self._ensemble_fingerprint)
+        return await _PARAMETERS_AND_SENSITIVITIES_CACHE.get_or_compute_async(
+            cache_key, self._load_parameters_and_sensitivities_async
+        )
+
+    async def get_parameters_and_sensitivities_columnar_async(self) -> ParametersAndSensitivitiesColumnar:
+        """Retrieve parameters and sensitivities for an ensemble, with the parameters in columnar form.
+
+        The columnar form is created from the result of get_parameters_and_sensitivities_async(), see that method
+        for caching and the errors raised.
+
+        Raises:
+            InvalidDataError: If the parameters do not all have values for the same realizations
+        """
+        parameters_and_sensitivities = await self.get_parameters_and_sensitivities_async()
+
+        return ParametersAndSensitivitiesColumnar(
+            parameters=ensemble_parameters_to_columnar(parameters_and_sensitivities.parameters),
+            sensitivities=parameters_and_sensitivities.sensitivities,
+            non_standard_parameters_warning=parameters_and_sensitivities.non_standard_parameters_warning,
+        )
 
+    async def _load_parameters_and_sensitivities_async(self) -> ParametersAndSensitivities:
         parameter_context = self._ensemble_context.filter(standard_result=StandardResultName.parameters)
         table_count = await parameter_context.length_async()
         if table_count > 1:
@@ -316,6 +395,50 @@ def _find_sensitivity_type_from_case_names(sens_case_names: list[str]) -> Sensit
     return SensitivityType.SCENARIO
 
 
+def ensemble_parameters_to_columnar(ensemble_parameters: list[EnsembleParameter]) -> EnsembleParametersColumnar:
+    """Convert ensemble parameters to columnar form.
+
+    The values of the numerical parameters are collected in one float32 matrix, with one row per numerical
+    parameter and one column per realization.
+
+    Args:
+        ensemble_parameters: List of ensemble parameters, which must all have values for the same realizations
+
+    Returns:
+        The parameters in columnar form, in the same order as given
+
+    Raises:
+        InvalidDataError: If the parameters do not all have values for the same realizations
+    """
+    realizations = ensemble_parameters[0].realizations if ensemble_parameters else []
+
+    numerical_values: list[list[float] | list[int]] = []
+    non_numerical_values: list[list[str]] = []
+    for parameter in ensemble_parameters:
+        if parameter.realizations != realizations:
+            raise InvalidDataError(
+                f"Parameter {parameter.name} does not have values for the same realizations as the other parameters",
+                Service.SUMO,
+            )
+        if parameter.is_numerical:
+            numerical_values.append(cast(list[float] | list[int], parameter.values))
+        else:
+            non_numerical_values.append(cast(list[str], parameter.values))
+
+    return EnsembleParametersColumnar(
+        realizations=realizations,
+        names=[parameter.name for parameter in ensemble_parameters],
+        group_names=[parameter.group_name for parameter in ensemble_parameters],
+        descriptive_names=[parameter.descriptive_name for parameter in ensemble_parameters],
+        is_logarithmic=[parameter.is_logarithmic for parameter in ensemble_parameters],
+        is_discrete=[parameter.is_discrete for parameter in ensemble_parameters],
+        is_constant=[parameter.is_constant for parameter in ensemble_parameters],
+        is_numerical=[parameter.is_numerical for parameter in ensemble_parameters],
+        numerical_values=np.array(numerical_values, dtype=np.float32).reshape(len(numerical_values), len(realizations)),
+        non_numerical_values=non_numerical_values,
+    )
+
+
 def _validate_parameter_table(parameter_table: pa.Table) -> None:
     """Validate that parameter table contains required REAL column.
 
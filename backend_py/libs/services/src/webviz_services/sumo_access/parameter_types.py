@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from enum import StrEnum
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass
 class EnsembleParameter:
@@ -18,6 +21,28 @@ class EnsembleParameter:
     descriptive_name: str | None = None
 
 
+@dataclass
+class EnsembleParametersColumnar:
+    """Description/data for all parameters in an ensemble, in columnar form
+
+    The per-parameter lists are all in the same parameter order. The values of the numerical parameters are stored
+    in one matrix with one row per numerical parameter and one column per realization, and the values of the other
+    parameters in one list per parameter. Both are in the same order as the parameters.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    realizations: list[int]
+    names: list[str]
+    group_names: list[str | None]
+    descriptive_names: list[str | None]
+    is_logarithmic: list[bool]
+    is_discrete: list[bool]
+    is_constant: list[bool]
+    is_numerical: list[bool]
+    numerical_values: NDArray[np.float32]
+    non_numerical_values: list[list[str]]
+
+
 class SensitivityType(StrEnum):
     MONTECARLO = "montecarlo"
     SCENARIO = "scenario"
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Optional
 
+import numpy as np
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 from fmu.sumo.explorer.objects import Polygons
 
@@ -103,9 +104,9 @@ class PolygonsAccess:
             name = pol_dframe["NAME"].iloc[0] if has_name else "NO_NAME_IN_METADATA"
             polydata.append(
                 PolygonData(
-                    x_arr=pol_dframe["X_UTME"].tolist(),
-                    y_arr=pol_dframe["Y_UTMN"].tolist(),
-                    z_arr=pol_dframe["Z_TVDSS"].tolist(),
+                    x_arr=pol_dframe["X_UTME"].to_numpy(dtype=np.float64),
+                    y_arr=pol_dframe["Y_UTMN"].to_numpy(dtype=np.float64),
+                    z_arr=pol_dframe["Z_TVDSS"].to_numpy(dtype=np.float64),
                     poly_id=poly_id,
                     name=name,
                 )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict
 
 from .generic_types import SumoContent
 
@@ -13,8 +15,10 @@ class PolygonsMeta(BaseModel):
 
 
 class PolygonData(BaseModel):
-    x_arr: list[float]
-    y_arr: list[float]
-    z_arr: list[float]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    x_arr: NDArray[np.float64]
+    y_arr: NDArray[np.float64]
+    z_arr: NDArray[np.float64]
     poly_id: int | str
     name: str
@@ -1,9 +1,8 @@
 import logging
-import math
-from bisect import bisect_left
 from enum import Enum
 from typing import Sequence, cast
 
+import numpy as np
 import polars as pl
 import pyarrow as pa
 import pyarrow.compute as pc
@@ -17,6 +16,7 @@ from ._arrow_table_loader import ArrowTableLoader
 from .relperm_types import (
     RelpermCurveData,
     RelpermRealizationData,
+    RelpermSatnumCurveArrays,
     RelpermSaturationAxis,
     RelpermTableDefinition,
 )
@@ -90,6 +90,47 @@ class RelpermAccess:
         realizations: Sequence[int] | None,
     ) -> list[RelpermRealizationData]:
         timer = PerfMetrics()
+        dataframe = await self._load_realization_dataframe_async(
+            table_name, saturation_axis_name, curve_names, satnums, realizations, timer
+        )
+        ret_arr = create_relperm_realization_data(dataframe, saturation_axis_name, curve_names, satnums)
+        timer.record_lap("shape-realization-data")
+
+        LOGGER.debug(
+            f"get_realization_data_async took: {timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {table_name=}, {saturation_axis_name=}, {curve_names=}, {satnums=}, {realizations=}"
+        )
+        return ret_arr
+
+    async def get_realization_curve_arrays_async(
+        self,
+        table_name: str,
+        saturation_axis_name: str,
+        curve_names: Sequence[str],
+        satnums: Sequence[int],
+        realizations: Sequence[int] | None,
+    ) -> list[RelpermSatnumCurveArrays]:
+        """Same data as get_realization_data_async(), but returned as one block of numpy arrays per SATNUM"""
+        timer = PerfMetrics()
+        dataframe = await self._load_realization_dataframe_async(
+            table_name, saturation_axis_name, curve_names, satnums, realizations, timer
+        )
+        ret_arr = create_relperm_curve_arrays(dataframe, saturation_axis_name, curve_names, satnums)
+        timer.record_lap("shape-curve-arrays")
+
+        LOGGER.debug(
+            f"get_realization_curve_arrays_async took: {timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {table_name=}, {saturation_axis_name=}, {curve_names=}, {satnums=}, {realizations=}"
+        )
+        return ret_arr
+
+    async def _load_realization_dataframe_async(
+        self,
+        table_name: str,
+        saturation_axis_name: str,
+        curve_names: Sequence[str],
+        satnums: Sequence[int],
+        realizations: Sequence[int] | None,
+        timer: PerfMetrics,
+    ) -> pl.DataFrame:
         if len(curve_names) == 0:
             raise InvalidDataError("At least one relperm curve name must be requested", Service.SUMO)
         if len(satnums) == 0:
@@ -124,14 +165,7 @@ class RelpermAccess:
         timer.record_lap("load-aggregated-table")
 
         arrow_table = _filter_arrow_table_on_realizations(arrow_table, requested_realizations)
-        dataframe = normalize_relperm_table(cast(pl.DataFrame, pl.from_arrow(arrow_table)))
-        ret_arr = create_relperm_realization_data(dataframe, saturation_axis_name, curve_names, satnums)
-        timer.record_lap("shape-realization-data")
-
-        LOGGER.debug(
-            f"get_realization_data_async took: {timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {table_name=}, {saturation_axis_name=}, {curve_names=}, {satnums=}, {requested_realizations=}"
-        )
-        return ret_arr
+        return normalize_relperm_table(cast(pl.DataFrame, pl.from_arrow(arrow_table)))
 
     async def _get_column_names_async(self, table_name: str) -> list[str]:
         table_context = self._ensemble_context.tables.filter(
@@ -287,6 +321,44 @@ def create_relperm_realization_data(
     the union of samples inside the common saturation interval for each SATNUM, making fancharts and data channels
     compare realization values at the same saturation points.
     """
+    curve_arrays_by_satnum = create_relperm_curve_arrays(dataframe, saturation_axis_name, curve_names, satnums)
+
+    ret_arr: list[RelpermRealizationData] = []
+    for curve_arrays in curve_arrays_by_satnum:
+        saturation_values = curve_arrays.saturation_values.tolist()
+        # One list per (curve, realization) pair, indexed as [curve_index][realization_index]
+        curve_value_lists = curve_arrays.curve_values.tolist()
+        for realization_index, realization in enumerate(curve_arrays.realizations.tolist()):
+            curve_data = [
+                RelpermCurveData(curve_name=curve_name, curve_values=curve_value_lists[curve_index][realization_index])
+                for curve_index, curve_name in enumerate(curve_arrays.curve_names)
+            ]
+            ret_arr.append(
+                RelpermRealizationData(
+                    realization=realization,
+                    satnum=curve_arrays.satnum,
+                    saturation_name=curve_arrays.saturation_name,
+                    saturation_values=saturation_values,
+                    curve_data=curve_data,
+                )
+            )
+
+    ret_arr.sort(key=lambda realization_data: (realization_data.realization, realization_data.satnum))
+    return ret_arr
+
+
+# pylint: disable-next=too-many-locals
+def create_relperm_curve_arrays(
+    dataframe: pl.DataFrame,
+    saturation_axis_name: str,
+    curve_names: Sequence[str],
+    satnums: Sequence[int],
+) -> list[RelpermSatnumCurveArrays]:
+    """Columnar variant of create_relperm_realization_data(), returning one block of numpy arrays per SATNUM.
+
+    The blocks are sorted on SATNUM and the realizations within each block are sorted ascending. No per-value Python
+    objects are created, which makes this the preferred input when encoding the response as binary arrays.
+    """
     saturation_axis_name = saturation_axis_name.upper()
     curve_names = unique_preserve_order([curve_name.upper() for curve_name in curve_names])
     selected_satnums = sorted(set(satnums))
@@ -305,33 +377,50 @@ def create_relperm_realization_data(
     if filtered_dataframe.is_empty():
         raise NoDataError(f"No relperm data found for SATNUMs {selected_satnums}", Service.SUMO)
 
-    partitions = filtered_dataframe.partition_by(["REAL", "SATNUM"], maintain_order=True)
-    shared_saturation_values_by_satnum = create_shared_saturation_values_by_satnum(partitions, saturation_axis_name)
-
-    ret_arr: list[RelpermRealizationData] = []
-    for partition in partitions:
-        realization = int(partition["REAL"][0])
-        satnum = int(partition["SATNUM"][0])
-        source_saturation_values = partition[saturation_axis_name].to_list()
-        target_saturation_values = shared_saturation_values_by_satnum[satnum]
-        curve_data = [
-            RelpermCurveData(
-                curve_name=curve_name,
-                curve_values=interpolate_curve_values(
-                    source_saturation_values,
-                    get_valid_curve_values(partition, curve_name, realization, satnum),
-                    target_saturation_values,
-                ),
-            )
-            for curve_name in curve_names
-        ]
+    # The dataframe is sorted on (REAL, SATNUM), so each (REAL, SATNUM) partition is a contiguous range of rows
+    real_values = filtered_dataframe["REAL"].to_numpy()
+    satnum_values = filtered_dataframe["SATNUM"].to_numpy()
+    saturation_values = filtered_dataframe[saturation_axis_name].to_numpy()
+    curve_values = filtered_dataframe.select(curve_names).to_numpy().astype(np.float64, copy=False)
+
+    is_partition_start = np.ones(len(filtered_dataframe), dtype=bool)
+    is_partition_start[1:] = (real_values[1:] != real_values[:-1]) | (satnum_values[1:] != satnum_values[:-1])
+    partition_starts = np.flatnonzero(is_partition_start)
+    partition_ends = np.append(partition_starts[1:], len(filtered_dataframe))
+    partition_reals = real_values[partition_starts]
+    partition_satnums = satnum_values[partition_starts]
+
+    validate_saturation_values(
+        saturation_values, partition_starts, partition_reals, partition_satnums, saturation_axis_name
+    )
+    shared_saturation_values_by_satnum = create_shared_saturation_values_by_satnum(
+        saturation_values, satnum_values, partition_starts, partition_ends, partition_satnums
+    )
+    validate_curve_values(curve_values, curve_names, partition_starts, partition_reals, partition_satnums)
+
+    # Interpolate all curves of all realizations sharing a SATNUM in one go
+    source_saturation_values = saturation_values.astype(np.float64, copy=False)
+    ret_arr: list[RelpermSatnumCurveArrays] = []
+    for satnum in sorted(shared_saturation_values_by_satnum):
+        target_saturation_values = shared_saturation_values_by_satnum[satnum].astype(np.float64, copy=False)
+        # Partitions are ordered on REAL, so the realizations of the SATNUM come out sorted
+        partition_indices = np.flatnonzero(partition_satnums == satnum)
+        interpolated_values = interpolate_curve_values(
+            source_saturation_values,
+            curve_values,
+            partition_starts[partition_indices],
+            partition_ends[partition_indices],
+            target_saturation_values,
+        )
         ret_arr.append(
-            RelpermRealizationData(
-                realization=realization,
-                satnum=satnum,
+            RelpermSatnumCurveArrays(
+                satnum=int(satnum),
                 saturation_name=saturation_axis_name,
                 saturation_values=target_saturation_values,
-                curve_data=curve_data,
+                realizations=partition_reals[partition_indices].astype(np.int64, copy=False),
+                curve_names=curve_names,
+                # (realization, sample, curve) -> (curve, realization, sample)
+                curve_values=np.ascontiguousarray(interpolated_values.transpose(2, 0, 1)),
             )
         )
 
@@ -339,114 +428,162 @@ def create_relperm_realization_data(
 
 
 def validate_saturation_values(
-    saturation_values: Sequence[float], realization: int, satnum: int, saturation_axis_name: str
+    saturation_values: np.ndarray,
+    partition_starts: np.ndarray,
+    partition_reals: np.ndarray,
+    partition_satnums: np.ndarray,
+    saturation_axis_name: str,
 ) -> None:
-    """Reject saturation axes that would make interpolation ambiguous or numerically invalid."""
-    if any(not math.isfinite(float(value)) for value in saturation_values):
+    """Reject saturation axes that would make interpolation ambiguous or numerically invalid.
+
+    Expects the saturation values to be sorted within each partition, so that duplicates are adjacent.
+    """
+    is_non_finite = ~np.isfinite(saturation_values)
+    is_duplicate = np.zeros(len(saturation_values), dtype=bool)
+    is_duplicate[1:] = saturation_values[1:] == saturation_values[:-1]
+    is_duplicate[partition_starts] = False
+
+    partition_has_non_finite = np.logical_or.reduceat(is_non_finite, partition_starts)
+    partition_has_duplicate = np.logical_or.reduceat(is_duplicate, partition_starts)
+    invalid_partition_indices = np.flatnonzero(partition_has_non_finite | partition_has_duplicate)
+    if len(invalid_partition_indices) == 0:
+        return
+
+    # Report the first invalid partition, with non-finite values taking precedence over duplicates
+    partition_index = invalid_partition_indices[0]
+    realization = int(partition_reals[partition_index])
+    satnum = int(partition_satnums[partition_index])
+    if partition_has_non_finite[partition_index]:
         raise InvalidDataError(
             f"Non-finite saturation values found for realization={realization}, SATNUM={satnum}, saturation_axis={saturation_axis_name}",
             Service.SUMO,
         )
 
-    if len(set(saturation_values)) != len(saturation_values):
-        raise InvalidDataError(
-            f"Duplicate saturation values found for realization={realization}, SATNUM={satnum}, saturation_axis={saturation_axis_name}",
-            Service.SUMO,
-        )
+    raise InvalidDataError(
+        f"Duplicate saturation values found for realization={realization}, SATNUM={satnum}, saturation_axis={saturation_axis_name}",
+        Service.SUMO,
+    )
 
 
-def get_valid_curve_values(partition: pl.DataFrame, curve_name: str, realization: int, satnum: int) -> list[float]:
-    """Return curve values for one realization/SATNUM partition after rejecting non-finite values."""
-    curve_values = partition[curve_name].to_list()
-    if any(not math.isfinite(float(value)) for value in curve_values):
-        raise InvalidDataError(
-            f"Non-finite curve values found for realization={realization}, SATNUM={satnum}, curve={curve_name}",
-            Service.SUMO,
-        )
-    return curve_values
+def validate_curve_values(
+    curve_values: np.ndarray,
+    curve_names: Sequence[str],
+    partition_starts: np.ndarray,
+    partition_reals: np.ndarray,
+    partition_satnums: np.ndarray,
+) -> None:
+    """Reject curves with non-finite values, curve_values holds one column per curve."""
+    partition_curve_has_non_finite = np.logical_or.reduceat(~np.isfinite(curve_values), partition_starts, axis=0)
+    invalid_partition_indices, invalid_curve_indices = np.nonzero(partition_curve_has_non_finite)
+    if len(invalid_partition_indices) == 0:
+        return
+
+    realization = int(partition_reals[invalid_partition_indices[0]])
+    satnum = int(partition_satnums[invalid_partition_indices[0]])
+    curve_name = curve_names[invalid_curve_indices[0]]
+    raise InvalidDataError(
+        f"Non-finite curve values found for realization={realization}, SATNUM={satnum}, curve={curve_name}",
+        Service.SUMO,
+    )
 
 
 def create_shared_saturation_values_by_satnum(
-    partitions: Sequence[pl.DataFrame], saturation_axis_name: str
-) -> dict[int, list[float]]:
+    saturation_values: np.ndarray,
+    satnum_values: np.ndarray,
+    partition_starts: np.ndarray,
+    partition_ends: np.ndarray,
+    partition_satnums: np.ndarray,
+) -> dict[int, np.ndarray]:
     """Build a common interpolation target grid for each SATNUM.
 
     The grid uses all observed saturation samples that fall inside the overlap between selected realizations. Values
     outside the overlap are intentionally excluded to avoid extrapolating curves beyond their sampled range.
+    Expects the saturation values to be sorted within each partition.
     """
-    saturation_values_by_satnum: dict[int, list[list[float]]] = {}
-
-    for partition in partitions:
-        satnum = int(partition["SATNUM"][0])
-        realization = int(partition["REAL"][0])
-        saturation_values = partition[saturation_axis_name].to_list()
-        validate_saturation_values(saturation_values, realization, satnum, saturation_axis_name)
-        saturation_values_by_satnum.setdefault(satnum, []).append(saturation_values)
-
-    shared_saturation_values_by_satnum: dict[int, list[float]] = {}
-    for satnum, saturation_values_arr in saturation_values_by_satnum.items():
-        min_common_saturation = max(min(saturation_values) for saturation_values in saturation_values_arr)
-        max_common_saturation = min(max(saturation_values) for saturation_values in saturation_values_arr)
+    partition_min_saturations = saturation_values[partition_starts]
+    partition_max_saturations = saturation_values[partition_ends - 1]
+
+    # Iterate the SATNUMs in order of first appearance
+    _unique_satnums, first_partition_indices = np.unique(partition_satnums, return_index=True)
+    ordered_satnums = partition_satnums[np.sort(first_partition_indices)]
+
+    shared_saturation_values_by_satnum: dict[int, np.ndarray] = {}
+    for satnum in ordered_satnums:
+        satnum_partition_mask = partition_satnums == satnum
+        min_common_saturation = partition_min_saturations[satnum_partition_mask].max()
+        max_common_saturation = partition_max_saturations[satnum_partition_mask].min()
         if min_common_saturation > max_common_saturation:
-            raise NoDataError(f"Realizations have no overlapping saturation range for SATNUM {satnum}", Service.SUMO)
-        shared_saturation_values = sorted(
-            {
-                value
-                for saturation_values in saturation_values_arr
-                for value in saturation_values
-                if min_common_saturation <= value <= max_common_saturation
-            }
+            raise NoDataError(
+                f"Realizations have no overlapping saturation range for SATNUM {int(satnum)}", Service.SUMO
+            )
+
+        row_mask = (
+            (satnum_values == satnum)
+            & (saturation_values >= min_common_saturation)
+            & (saturation_values <= max_common_saturation)
         )
-        if not shared_saturation_values:
-            raise NoDataError(f"No common saturation interval found for SATNUM {satnum}", Service.SUMO)
-        shared_saturation_values_by_satnum[satnum] = shared_saturation_values
+        shared_saturation_values = np.unique(saturation_values[row_mask])
+        if len(shared_saturation_values) == 0:
+            raise NoDataError(f"No common saturation interval found for SATNUM {int(satnum)}", Service.SUMO)
+        shared_saturation_values_by_satnum[int(satnum)] = shared_saturation_values
 
     return shared_saturation_values_by_satnum
 
 
+# pylint: disable-next=too-many-locals
 def interpolate_curve_values(
-    source_saturation_values: Sequence[float],
-    source_curve_values: Sequence[float],
-    target_saturation_values: Sequence[float],
-) -> list[float]:
-    """Interpolate one curve onto the target saturation grid using sorted source samples."""
-    source_points = sorted(zip(source_saturation_values, source_curve_values, strict=True))
-    source_saturation_values = [point[0] for point in source_points]
-    source_curve_values = [point[1] for point in source_points]
+    source_saturation_values: np.ndarray,
+    source_curve_values: np.ndarray,
+    segment_starts: np.ndarray,
+    segment_ends: np.ndarray,
+    target_saturation_values: np.ndarray,
+) -> np.ndarray:
+    """Linearly interpolate multiple curves for multiple segments onto one shared target saturation grid.
+
+    The source arrays hold the concatenated, sorted samples of all segments, with one column per curve in
+    source_curve_values. Each segment is given by the row range [segment_starts[i], segment_ends[i]).
+    Returns an array of shape (num_segments, num_target_values, num_curves).
+
+    Exact matches return the source sample, and targets outside a segment's range are clamped to the end values. In
+    between, the interpolation is done with the same arithmetic as the scalar formula, lower + fraction * (upper -
+    lower), which makes the result bit-for-bit reproducible (np.interp uses a different order of operations).
+    """
+    num_segments = len(segment_starts)
+    num_targets = len(target_saturation_values)
+
+    insertion_indices = np.empty((num_segments, num_targets), dtype=np.int64)
+    for i in range(num_segments):
+        segment_saturation_values = source_saturation_values[segment_starts[i] : segment_ends[i]]
+        insertion_indices[i] = np.searchsorted(segment_saturation_values, target_saturation_values, side="left")
+
+    starts = segment_starts[:, np.newaxis]
+    lasts = segment_ends[:, np.newaxis] - 1
+    upper_rows = np.minimum(starts + insertion_indices, lasts)
+    lower_rows = np.maximum(upper_rows - 1, starts)
+
+    lower_saturation_values = source_saturation_values[lower_rows]
+    upper_saturation_values = source_saturation_values[upper_rows]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        interpolation_fractions = (target_saturation_values - lower_saturation_values) / (
+            upper_saturation_values - lower_saturation_values
+        )
 
-    return [
-        interpolate_single_value(source_saturation_values, source_curve_values, target_saturation_value)
-        for target_saturation_value in target_saturation_values
-    ]
+    lower_curve_values = source_curve_values[lower_rows]
+    upper_curve_values = source_curve_values[upper_rows]
+    with np.errstate(invalid="ignore"):
+        interpolated_values = lower_curve_values + interpolation_fractions[..., np.newaxis] * (
+            upper_curve_values - lower_curve_values
+        )
 
+    # Exact matches and targets outside the segment's range all take the value of the upper row, which is the first
+    # row for targets below the range and the last row for targets above the range
+    is_exact_match = (starts + insertion_indices <= lasts) & (upper_saturation_values == target_saturation_values)
+    is_outside_range = (insertion_indices == 0) | (starts + insertion_indices > lasts)
+    use_upper_value = (is_exact_match | is_outside_range)[..., np.newaxis]
 
-def interpolate_single_value(
-    source_saturation_values: Sequence[float],
-    source_curve_values: Sequence[float],
-    target_saturation_value: float,
-) -> float:
-    """Linearly interpolate one curve value, clamping only for defensive out-of-range calls."""
-    insertion_index = bisect_left(source_saturation_values, target_saturation_value)
-    if (
-        insertion_index < len(source_saturation_values)
-        and source_saturation_values[insertion_index] == target_saturation_value
-    ):
-        return float(source_curve_values[insertion_index])
-
-    if insertion_index == 0:
-        return float(source_curve_values[0])
-    if insertion_index >= len(source_saturation_values):
-        return float(source_curve_values[-1])
-
-    lower_saturation_value = source_saturation_values[insertion_index - 1]
-    upper_saturation_value = source_saturation_values[insertion_index]
-    lower_curve_value = source_curve_values[insertion_index - 1]
-    upper_curve_value = source_curve_values[insertion_index]
-    interpolation_fraction = (target_saturation_value - lower_saturation_value) / (
-        upper_saturation_value - lower_saturation_value
-    )
+    interpolated_values = np.where(use_upper_value, upper_curve_values, interpolated_values)
 
-    return float(lower_curve_value + interpolation_fraction * (upper_curve_value - lower_curve_value))
+    return interpolated_values
 
 
 def _make_saturation_axis_if_present(
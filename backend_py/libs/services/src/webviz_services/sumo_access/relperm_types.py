@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass(frozen=True)
 class RelpermSaturationAxis:
@@ -29,3 +32,18 @@ class RelpermRealizationData:
     saturation_name: str
     saturation_values: list[float]
     curve_data: list[RelpermCurveData]
+
+
+@dataclass(frozen=True)
+class RelpermSatnumCurveArrays:
+    """Columnar curve data for all realizations of one SATNUM, sampled on a shared saturation axis.
+
+    curve_values has shape (len(curve_names), len(realizations), len(saturation_values))
+    """
+
+    satnum: int
+    saturation_name: str
+    saturation_values: NDArray[np.float64]
+    realizations: NDArray[np.int64]
+    curve_names: list[str]
+    curve_values: NDArray[np.float64]
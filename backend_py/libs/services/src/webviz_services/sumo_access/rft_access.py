@@ -1,11 +1,15 @@
 import logging
 from typing import List, Optional, Sequence, cast
 
+import numpy as np
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
 from fmu.datamodels.standard_results.enums import StandardResultName
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 
 from webviz_core_utils.perf_metrics import PerfMetrics
+from webviz_core_utils.ttl_cache import TtlCache
 from webviz_services.service_exceptions import (
     Service,
     NoDataError,
@@ -22,19 +26,49 @@ LOGGER = logging.getLogger(__name__)
 ALLOWED_RFT_RESPONSE_NAMES = ["PRESSURE", "SGAS", "SWAT", "SOIL"]
 
 
+def _get_size_bytes(table_per_well: dict[str, pa.Table]) -> int:
+    # The per-well tables are slices of one sorted table, so together they hold about the size of that table
+    return sum(table.nbytes for table in table_per_well.values())
+
+
+# Aggregated RFT tables partitioned by well name, keyed by (case_uuid, ensemble_name, ensemble_fingerprint, response_name).
+# Shared between users through the fingerprint in the key, see SumoFingerprinter.
+# The partitioned tables are immutable Arrow slices. A table holds all realizations of the ensemble, so the cache is
+# bounded by the size of the tables, not just the number of entries.
+_WELL_PARTITIONED_TABLE_CACHE: TtlCache[tuple[str, str, str, str], dict[str, pa.Table]] = TtlCache(
+    max_entries=32,
+    ttl_s=30 * 60,
+    max_size_bytes=256 * 1024 * 1024,
+    get_size_bytes=_get_size_bytes,
+)
+
+
 class RftAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
         self._ensemble_context = SearchContext(sumo=self._sumo_client).filter(
             uuid=self._case_uuid, ensemble=self._ensemble_name
         )
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "RftAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "RftAccess":
+        """
+        If the ensemble fingerprint is specified, the aggregated RFT tables will be cached in-process per fingerprint
+        """
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     async def get_rft_info_async(self) -> RftTableDefinition:
         """Get a collection of rft tables for a case and ensemble"""
@@ -89,34 +123,52 @@ class RftAccess:
         timestamps_utc_ms: Optional[Sequence[int]],
         realizations: Optional[Sequence[int]],
     ) -> List[RftRealizationData]:
+        ret_dict = await self.get_rft_wells_realization_data_async(
+            well_names=[well_name],
+            response_name=response_name,
+            timestamps_utc_ms=timestamps_utc_ms,
+            realizations=realizations,
+        )
+        return ret_dict[well_name]
 
+    async def get_rft_wells_realization_data_async(
+        self,
+        well_names: Sequence[str],
+        response_name: str,
+        timestamps_utc_ms: Optional[Sequence[int]],
+        realizations: Optional[Sequence[int]],
+    ) -> dict[str, List[RftRealizationData]]:
+        """
+        Get RFT data per realization for multiple wells, returned as a dict keyed by well name.
+        Wells without any data will have an empty list.
+        """
         timer = PerfMetrics()
-        column_names = [response_name, "DEPTH"]
 
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
-        table_loader.require_standard_result(StandardResultName.rft)
+        table_per_well = await self._get_or_load_well_partitioned_table_async(response_name)
+        timer.record_lap("get_well_partitioned_table")
 
-        table = await table_loader.get_aggregated_multiple_columns_async(column_names)
-
-        timer.record_lap("load_aggregated_arrow_table")
+        unique_well_names = list(dict.fromkeys(well_names))
+        well_tables = [table_per_well[well_name] for well_name in unique_well_names if well_name in table_per_well]
+        ret_dict: dict[str, List[RftRealizationData]] = {well_name: [] for well_name in unique_well_names}
+        if not well_tables:
+            return ret_dict
 
-        pl_table = cast(pl.DataFrame, pl.from_arrow(table)).lazy()
+        # The well tables are slices of one sorted table, so they share schema and can be concatenated without copying
+        pl_table = cast(pl.DataFrame, pl.from_arrow(pa.concat_tables(well_tables))).lazy()
 
         if realizations is not None:
             pl_table = pl_table.filter(pl.col("REAL").is_in(realizations))
 
-        pl_table = pl_table.filter(pl.col("WELL") == well_name)
-
         if timestamps_utc_ms is not None:
             pl_table = pl_table.filter(pl.col("DATE").dt.timestamp("ms").is_in(list(timestamps_utc_ms)))
 
         timer.record_lap("filter_table")
         result_table = (
-            pl_table.group_by(["REAL", "DATE"])
+            pl_table.group_by(["WELL", "REAL", "DATE"])
             .agg([pl.col("DEPTH").alias("depth_arr"), pl.col(response_name).alias("value_arr")])
             .select(
                 [
-                    pl.lit(well_name).alias("well_name"),
+                    pl.col("WELL").alias("well_name"),
                     pl.col("REAL").alias("realization"),
                     pl.col("DATE").dt.timestamp("ms").alias("timestamp_utc_ms"),
                     "depth_arr",
@@ -126,7 +178,59 @@ class RftAccess:
             .collect()
         )
         timer.record_lap("process_table_in_polars")
-        ret_arr_rows = result_table.iter_rows(named=True)
-        ret_arr = [RftRealizationData(**row) for row in ret_arr_rows]
-        LOGGER.debug(f"{timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {well_name=}, {response_name=}")
-        return ret_arr
+
+        for row in result_table.iter_rows(named=True):
+            ret_dict[row["well_name"]].append(RftRealizationData(**row))
+
+        LOGGER.debug(
+            f"{timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {unique_well_names=}, {response_name=}"
+        )
+        return ret_dict
+
+    async def _get_or_load_well_partitioned_table_async(self, response_name: str) -> dict[str, pa.Table]:
+        if self._ensemble_fingerprint is None:
+            return await self._load_well_partitioned_table_async(response_name)
+
+        cache_key = (self._case_uuid, self._ensemble_name, self._ensemble_fingerprint, response_name)
+        return await _WELL_PARTITIONED_TABLE_CACHE.get_or_compute_async(
+            cache_key, lambda: self._load_well_partitioned_table_async(response_name)
+        )
+
+    async def _load_well_partitioned_table_async(self, response_name: str) -> dict[str, pa.Table]:
+        timer = PerfMetrics()
+
+        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader.require_standard_result(StandardResultName.rft)
+
+        table = await table_loader.get_aggregated_multiple_columns_async([response_name, "DEPTH"])
+        timer.record_lap("load_aggregated_arrow_table")
+
+        table_per_well = partition_table_by_well(table)
+        timer.record_lap("partition_by_well")
+
+        LOGGER.debug(
+            f"Loaded RFT table partitioned into {len(table_per_well)} wells in: {timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {response_name=}"
+        )
+        return table_per_well
+
+
+def partition_table_by_well(table: pa.Table) -> dict[str, pa.Table]:
+    """
+    Partition table by the WELL column, returning a dict of tables keyed by well name.
+
+    The table is sorted on well name once (the sort is stable, preserving the row order within each well), after which
+    the per-well tables are zero-copy slices of the sorted table.
+    """
+    if table.num_rows == 0:
+        return {}
+
+    sorted_table = table.take(pc.sort_indices(table, sort_keys=[("WELL", "ascending")]))
+
+    well_names = sorted_table["WELL"].to_numpy(zero_copy_only=False)
+    run_starts = np.flatnonzero(np.concatenate([[True], well_names[1:] != well_names[:-1]]))
+    run_ends = np.append(run_starts[1:], len(well_names))
+
+    return {
+        str(well_names[start]): sorted_table.slice(start, end - start)
+        for start, end in zip(run_starts.tolist(), run_ends.tolist(), strict=True)
+    }
@@ -0,0 +1,297 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Protocol
+
+import redis.asyncio as redis
+from pydantic import BaseModel
+from webviz_core_utils.perf_metrics import PerfMetrics
+from webviz_core_utils.single_flight import SingleFlight
+
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+from .sumo_inspector import CaseInfo, SumoInspector
+
+_REDIS_KEY_PREFIX = "sumo_case_index"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CaseSource(Protocol):
+    """
+    The subset of SumoInspector's interface that is needed to build and update the case index
+    """
+
+    async def get_cases_async(self, asset_name: str, case_uuids: list[str] | None = None) -> list[CaseInfo]: ...
+
+    async def get_latest_cases_async(self, asset_name: str, max_case_count: int) -> list[CaseInfo]: ...
+
+    async def get_case_uuids_updated_since_async(self, asset_name: str, since_utc_ms: int) -> list[str]: ...
+
+
+@dataclass(frozen=True, kw_only=True)
+class CaseFilter:
+    """
+    Filter for case listings, all specified criteria must match.
+    The search text is matched case-insensitively against case name, description, user and model name.
+    """
+
+    search_text: str | None = None
+    user: str | None = None
+    status: str | None = None
+
+    def is_empty(self) -> bool:
+        return not self.search_text and not self.user and not self.status
+
+    def matches(self, case_info: CaseInfo) -> bool:
+        if self.user and case_info.user != self.user:
+            return False
+        if self.status and case_info.status != self.status:
+            return False
+        if self.search_text:
+            text = self.search_text.lower()
+            fields_to_search = [case_info.name, case_info.description, case_info.user, case_info.model_name or ""]
+            if not any(text in field.lower() for field in fields_to_search):
+                return False
+
+        return True
+
+
+class CasePage(BaseModel):
+    cases: list[CaseInfo]
+    # Total number of cases matching the filter, None if the page was served before the full index was available
+    total_count: int | None
+
+
+class _IndexMeta(BaseModel):
+    last_seen_utc_ms: int
+    full_build_time_s: float
+    refresh_time_s: float
+
+
+class SumoCaseIndexFactory:
+    _instance = None
+
+    def __init__(self, redis_client: redis.Redis):
+        self._redis_client: redis.Redis = redis_client
+        # Builds and refreshes that are in progress in this process, keyed by the index' redis key
+        self._in_flight_updates: SingleFlight[str, None] = SingleFlight()
+
+    @classmethod
+    def initialize(cls, redis_url: str) -> None:
+        if cls._instance is not None:
+            raise RuntimeError("SumoCaseIndexFactory is already initialized")
+
+        redis_client = redis.Redis.from_url(redis_url, decode_responses=True)
+        cls._instance = cls(redis_client)
+
+    @classmethod
+    def get_instance(cls) -> "SumoCaseIndexFactory":
+        if cls._instance is None:
+            raise RuntimeError("SumoCaseIndexFactory is not initialized, call initialize() first")
+        return cls._instance
+
+    def get_case_index_for_user(self, authenticated_user: AuthenticatedUser) -> "SumoCaseIndex":
+        if not authenticated_user:
+            raise ValueError("An authenticated user must be specified")
+
+        case_source = SumoInspector(authenticated_user.get_sumo_access_token())
+        return SumoCaseIndex(
+            user_id=authenticated_user.get_user_id(),
+            redis_client=self._redis_client,
+            case_source=case_source,
+            in_flight_updates=self._in_flight_updates,
+        )
+
+
+class SumoCaseIndex:
+    """
+    Per user and asset index of Sumo cases, stored in Redis.
+
+    The index is built once using the full case aggregation, and subsequently kept up to date incrementally by only
+    re-aggregating the cases that have documents with a timestamp newer than the latest one seen in the index.
+    Since the incremental update is unable to detect deleted cases, the index is rebuilt from scratch at regular
+    intervals.
+
+    Cases are indexed per user since the visibility of cases in Sumo depends on the user's access rights.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        redis_client: redis.Redis,
+        case_source: CaseSource,
+        in_flight_updates: SingleFlight[str, None] | None = None,
+        min_refresh_interval_s: float = 30,
+        full_rebuild_interval_s: float = 30 * 60,
+        index_ttl_s: int = 24 * 60 * 60,
+        timestamp_overlap_ms: int = 60 * 1000,
+    ) -> None:
+        self._user_id = user_id
+        self._redis_client = redis_client
+        self._case_source = case_source
+        self._in_flight_updates = in_flight_updates if in_flight_updates is not None else SingleFlight()
+        self._min_refresh_interval_s = min_refresh_interval_s
+        self._full_rebuild_interval_s = full_rebuild_interval_s
+        self._index_ttl_s = index_ttl_s
+        # Documents are not necessarily searchable in the same order as their timestamps, so we look back a little
+        # further than the latest timestamp we have seen to avoid missing updates
+        self._timestamp_overlap_ms = timestamp_overlap_ms
+
+    async def get_cases_async(self, asset_name: str, case_filter: CaseFilter | None = None) -> list[CaseInfo]:
+        """
+        Get all cases for the asset that match the filter, sorted with the most recently updated case first.
+        """
+        await self._ensure_index_is_up_to_date_async(asset_name)
+
+        case_info_arr = await self._read_indexed_cases_async(asset_name)
+        if case_filter is not None and not case_filter.is_empty():
+            case_info_arr = [case_info for case_info in case_info_arr if case_filter.matches(case_info)]
+
+        return case_info_arr
+
+    async def get_cases_page_async(
+        self, asset_name: str, offset: int, limit: int, case_filter: CaseFilter | None = None
+    ) -> CasePage:
+        """
+        Get a page of the cases for the asset that match the filter, sorted with the most recently updated case first.
+
+        If the index has not been built yet and no filter is specified, the page is served directly from a
+        bounded aggregation of the latest cases while the full index is built in the background. In this case the
+        total count of cases is unknown and will be returned as None.
+        """
+        perf_metrics = PerfMetrics()
+
+        no_filter = case_filter is None or case_filter.is_empty()
+        if no_filter and not await self._redis_client.exists(self._make_meta_redis_key(asset_name)):
+            # Start building the index, the task is kept alive by the in-flight registry until it completes
+            self._get_or_start_update_task(asset_name)
+            latest_cases = await self._case_source.get_latest_cases_async(asset_name, offset + limit)
+            perf_metrics.record_lap("get-latest-cases")
+
+            LOGGER.debug(f"Served first page of cases for {asset_name} without index in: {perf_metrics.to_string()}")
+            return CasePage(cases=_sort_latest_first(latest_cases)[offset : offset + limit], total_count=None)
+
+        matching_cases = await self.get_cases_async(asset_name, case_filter)
+        perf_metrics.record_lap("get-indexed-cases")
+
+        LOGGER.debug(f"Served page of cases for {asset_name} from index in: {perf_metrics.to_string()}")
+        return CasePage(cases=matching_cases[offset : offset + limit], total_count=len(matching_cases))
+
+    async def _ensure_index_is_up_to_date_async(self, asset_name: str) -> None:
+        meta = await self._read_meta_async(asset_name)
+        if meta is not None and time.time() - meta.refresh_time_s < self._min_refresh_interval_s:
+            return
+
+        await asyncio.shield(self._get_or_start_update_task(asset_name))
+
+    def _get_or_start_update_task(self, asset_name: str) -> asyncio.Task[None]:
+        # Single-flight per index so that concurrent requests do not all hit Sumo with the same query
+        redis_key = self._make_cases_redis_key(asset_name)
+        return self._in_flight_updates.start(redis_key, lambda: self._update_index_and_log_failure_async(asset_name))
+
+    async def _update_index_and_log_failure_async(self, asset_name: str) -> None:
+        try:
+            await self._update_index_async(asset_name)
+        except Exception as exc:
+            # Log here since nobody is waiting for updates started in the background
+            LOGGER.warning(f"Failed to update case index {self._make_cases_redis_key(asset_name)}: {exc}")
+            raise
+
+    async def _update_index_async(self, asset_name: str) -> None:
+        meta = await self._read_meta_async(asset_name)
+
+        now_s = time.time()
+        if meta is None or now_s - meta.full_build_time_s >= self._full_rebuild_interval_s:
+            await self._build_full_index_async(asset_name, now_s)
+        else:
+            await self._refresh_index_incrementally_async(asset_name, meta, now_s)
+
+    async def _build_full_index_async(self, asset_name: str, now_s: float) -> None:
+        perf_metrics = PerfMetrics()
+
+        case_info_arr = await self._case_source.get_cases_async(asset_name)
+        perf_metrics.record_lap("get-all-cases")
+
+        meta = _IndexMeta(
+            last_seen_utc_ms=_find_last_seen_utc_ms(case_info_arr, 0),
+            full_build_time_s=now_s,
+            refresh_time_s=now_s,
+        )
+
+        cases_key = self._make_cases_redis_key(asset_name)
+        pipe = self._redis_client.pipeline(transaction=True)
+        pipe.delete(cases_key)
+        if case_info_arr:
+            pipe.hset(cases_key, mapping={case_info.uuid: case_info.model_dump_json() for case_info in case_info_arr})
+            pipe.expire(cases_key, self._index_ttl_s)
+        pipe.set(self._make_meta_redis_key(asset_name), meta.model_dump_json(), ex=self._index_ttl_s)
+        await pipe.execute()
+        perf_metrics.record_lap("write-index")
+
+        LOGGER.debug(
+            f"Built case index for {asset_name} with {len(case_info_arr)} cases in: {perf_metrics.to_string()}"
+        )
+
+    async def _refresh_index_incrementally_async(self, asset_name: str, meta: _IndexMeta, now_s: float) -> None:
+        perf_metrics = PerfMetrics()
+
+        since_utc_ms = max(0, meta.last_seen_utc_ms - self._timestamp_overlap_ms)
+        updated_case_uuids = await self._case_source.get_case_uuids_updated_since_async(asset_name, since_utc_ms)
+        perf_metrics.record_lap("get-updated-uuids")
+
+        updated_case_info_arr = await self._case_source.get_cases_async(asset_name, updated_case_uuids)
+        perf_metrics.record_lap("get-updated-cases")
+
+        new_meta = _IndexMeta(
+            last_seen_utc_ms=_find_last_seen_utc_ms(updated_case_info_arr, meta.last_seen_utc_ms),
+            full_build_time_s=meta.full_build_time_s,
+            refresh_time_s=now_s,
+        )
+
+        cases_key = self._make_cases_redis_key(asset_name)
+        pipe = self._redis_client.pipeline(transaction=True)
+        if updated_case_info_arr:
+            pipe.hset(
+                cases_key, mapping={case_info.uuid: case_info.model_dump_json() for case_info in updated_case_info_arr}
+            )
+        pipe.expire(cases_key, self._index_ttl_s)
+        pipe.set(self._make_meta_redis_key(asset_name), new_meta.model_dump_json(), ex=self._index_ttl_s)
+        await pipe.execute()
+        perf_metrics.record_lap("write-index")
+
+        LOGGER.debug(
+            f"Refreshed case index for {asset_name} with {len(updated_case_info_arr)} updated cases in: {perf_metrics.to_string()}"
+        )
+
+    async def _read_meta_async(self, asset_name: str) -> _IndexMeta | None:
+        meta_json = await self._redis_client.get(self._make_meta_redis_key(asset_name))
+        if meta_json is None:
+            return None
+
+        return _IndexMeta.model_validate_json(meta_json)
+
+    async def _read_indexed_cases_async(self, asset_name: str) -> list[CaseInfo]:
+        case_json_dict: dict[str, str] = await self._redis_client.hgetall(self._make_cases_redis_key(asset_name))
+        case_info_arr = [CaseInfo.model_validate_json(case_json) for case_json in case_json_dict.values()]
+        return _sort_latest_first(case_info_arr)
+
+    def _make_cases_redis_key(self, asset_name: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:asset:{asset_name}:cases"
+
+    def _make_meta_redis_key(self, asset_name: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:asset:{asset_name}:meta"
+
+
+def get_sumo_case_index_for_user(authenticated_user: AuthenticatedUser) -> SumoCaseIndex:
+    factory = SumoCaseIndexFactory.get_instance()
+    return factory.get_case_index_for_user(authenticated_user)
+
+
+def _find_last_seen_utc_ms(case_info_arr: list[CaseInfo], current_last_seen_utc_ms: int) -> int:
+    return max([current_last_seen_utc_ms, *[case_info.updated_at_utc_ms for case_info in case_info_arr]])
+
+
+def _sort_latest_first(case_info_arr: list[CaseInfo]) -> list[CaseInfo]:
+    return sorted(case_info_arr, key=lambda case_info: (-case_info.updated_at_utc_ms, case_info.uuid))
@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Coroutine
+
+from webviz_core_utils.background_tasks import run_in_background_task
+from webviz_core_utils.perf_metrics import PerfMetrics
+from webviz_core_utils.single_flight import SingleFlight
+
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+LOGGER = logging.getLogger(__name__)
+
+
+# Callback that will be invoked when a refresh detects that the fingerprint of an ensemble has changed.
+# Arguments are: authenticated_user, case_uuid, ensemble_name, new_fingerprint
+FingerprintChangedCallback = Callable[[AuthenticatedUser, str, str, str], Coroutine[Any, Any, None]]
+
+
+@dataclass(frozen=True)
+class _EnsembleKey:
+    user_id: str
+    case_uuid: str
+    ensemble_name: str
+
+
+@dataclass(kw_only=True)
+class _TrackedEnsemble:
+    authenticated_user: AuthenticatedUser
+    refresh_fp_async: Callable[[], Awaitable[str]]
+    cache_ttl_s: float
+    last_access_s: float
+    expires_at_s: float
+    fingerprint: str | None
+    jitter_s: float
+
+
+class SumoFingerprintWarmer:
+    """
+    Background scheduler that keeps the cached fingerprints of recently accessed ensembles fresh.
+
+    Every access to an ensemble fingerprint is registered with the warmer, see register_access(). As long as an
+    ensemble has been accessed within the activity window, the warmer will recalculate and store its fingerprint
+    shortly before the cached value expires, so that interactive requests almost never have to pay for calculating
+    fingerprints synchronously. Refreshes run with bounded concurrency and a random jitter to spread out the load.
+
+    Note that since fingerprints are cached per user (visibility in Sumo depends on the user's access rights),
+    ensembles are tracked per user as well, and refreshes are done using the user's most recently seen access token.
+    """
+
+    _instance: "SumoFingerprintWarmer | None" = None
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        scan_interval_s: float = 5,
+        activity_window_s: float = 15 * 60,
+        max_tracked_ensembles: int = 2000,
+        refresh_margin_fraction: float = 0.25,
+        max_jitter_s: float = 10,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._scan_interval_s = scan_interval_s
+        self._activity_window_s = activity_window_s
+        self._max_tracked_ensembles = max_tracked_ensembles
+        self._refresh_margin_fraction = refresh_margin_fraction
+        self._max_jitter_s = max_jitter_s
+
+        self._tracked: OrderedDict[_EnsembleKey, _TrackedEnsemble] = OrderedDict()
+        # Refreshes that are in progress, a scan skips ensembles that are still being refreshed
+        self._in_flight_refreshes: SingleFlight[_EnsembleKey, bool] = SingleFlight()
+        self._fp_changed_callbacks: list[FingerprintChangedCallback] = []
+        self._loop_task: asyncio.Task | None = None
+
+    @classmethod
+    def initialize(cls) -> "SumoFingerprintWarmer":
+        if cls._instance is not None:
+            raise RuntimeError("SumoFingerprintWarmer is already initialized")
+
+        cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def get_instance_or_none(cls) -> "SumoFingerprintWarmer | None":
+        return cls._instance
+
+    def start(self) -> None:
+        if self._loop_task is not None:
+            raise RuntimeError("SumoFingerprintWarmer is already started")
+
+        self._loop_task = asyncio.create_task(self._run_scan_loop_async())
+
+    async def stop_async(self) -> None:
+        if self._loop_task is None:
+            return
+
+        self._loop_task.cancel()
+        try:
+            await self._loop_task
+        except asyncio.CancelledError:
+            pass
+
+        self._loop_task = None
+
+    def add_fingerprint_changed_callback(self, callback: FingerprintChangedCallback) -> None:
+        """
+        Register a callback to be invoked when a background refresh detects that an ensemble fingerprint has changed.
+        Typically used to warm caches that depend on the fingerprint.
+        """
+        self._fp_changed_callbacks.append(callback)
+
+    def register_access(
+        self,
+        authenticated_user: AuthenticatedUser,
+        case_uuid: str,
+        ensemble_name: str,
+        fingerprint: str,
+        remaining_ttl_s: float,
+        cache_ttl_s: float,
+        refresh_fp_async: Callable[[], Awaitable[str]],
+    ) -> None:
+        """
+        Register that the fingerprint of an ensemble has been accessed.
+
+        The refresh_fp_async function must calculate and store a new fingerprint for the ensemble, returning the new
+        fingerprint. It will be invoked by the warmer when the cached fingerprint is about to expire.
+        """
+        key = _EnsembleKey(authenticated_user.get_user_id(), case_uuid, ensemble_name)
+        now_s = time.monotonic()
+
+        entry = self._tracked.get(key)
+        if entry is None:
+            entry = _TrackedEnsemble(
+                authenticated_user=authenticated_user,
+                refresh_fp_async=refresh_fp_async,
+                cache_ttl_s=cache_ttl_s,
+                last_access_s=now_s,
+                expires_at_s=now_s + remaining_ttl_s,
+                fingerprint=fingerprint,
+                jitter_s=self._make_jitter_s(),
+            )
+            self._tracked[key] = entry
+        else:
+            # Always pick up the latest user object (and thereby the freshest access token)
+            entry.authenticated_user = authenticated_user
+            entry.refresh_fp_async = refresh_fp_async
+            entry.cache_ttl_s = cache_ttl_s
+            entry.last_access_s = now_s
+            entry.expires_at_s = now_s + remaining_ttl_s
+            entry.fingerprint = fingerprint
+            self._tracked.move_to_end(key)
+
+        while len(self._tracked) > self._max_tracked_ensembles:
+            self._tracked.popitem(last=False)
+
+    def get_tracked_count(self) -> int:
+        return len(self._tracked)
+
+    async def refresh_due_ensembles_async(self) -> int:
+        """
+        Do a single scan over the tracked ensembles, refreshing the fingerprints that are about to expire and
+        dropping ensembles that have not been accessed within the activity window.
+        Returns the number of fingerprints that were successfully refreshed.
+        """
+        now_s = time.monotonic()
+
+        due_keys: list[_EnsembleKey] = []
+        for key, entry in list(self._tracked.items()):
+            if now_s - entry.last_access_s > self._activity_window_s:
+                del self._tracked[key]
+                continue
+
+            if self._in_flight_refreshes.is_in_flight(key):
+                continue
+
+            refresh_margin_s = min(
+                entry.cache_ttl_s * self._refresh_margin_fraction + entry.jitter_s, entry.cache_ttl_s
+            )
+            if entry.expires_at_s - now_s <= refresh_margin_s:
+                due_keys.append(key)
+
+        if not due_keys:
+            return 0
+
+        perf_metrics = PerfMetrics()
+        results = await asyncio.gather(*[self._refresh_one_async(key) for key in due_keys])
+        num_refreshed = sum(1 for res in results if res)
+        LOGGER.debug(
+            f"Refreshed {num_refreshed} of {len(due_keys)} due ensemble fingerprints in: {perf_metrics.to_string()}"
+        )
+
+        return num_refreshed
+
+    async def _refresh_one_async(self, key: _EnsembleKey) -> bool:
+        # Not shielded, so that stopping the warmer also cancels the refreshes in progress
+        return await self._in_flight_refreshes.start(key, lambda: self._do_refresh_one_async(key))
+
+    async def _do_refresh_one_async(self, key: _EnsembleKey) -> bool:
+        try:
+            async with self._semaphore:
+                entry = self._tracked.get(key)
+                if entry is None:
+                    return False
+
+                new_fp = await entry.refresh_fp_async()
+
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Most likely the user's access token has expired. Stop tracking the ensemble, it will be picked up again
+            # on the next interactive access.
+            LOGGER.warning(f"Unable to refresh fingerprint for {key}, no longer tracking it: {exc}")
+            self._tracked.pop(key, None)
+            return False
+
+        old_fp = entry.fingerprint
+        entry.fingerprint = new_fp
+        entry.expires_at_s = time.monotonic() + entry.cache_ttl_s
+        entry.jitter_s = self._make_jitter_s()
+
+        if old_fp is not None and old_fp != new_fp:
+            for callback in self._fp_changed_callbacks:
+                run_in_background_task(callback(entry.authenticated_user, key.case_uuid, key.ensemble_name, new_fp))
+
+        return True
+
+    async def _run_scan_loop_async(self) -> None:
+        while True:
+            try:
+                await self.refresh_due_ensembles_async()
+            except Exception:  # pylint: disable=broad-exception-caught
+                LOGGER.exception("Unexpected error while refreshing ensemble fingerprints")
+
+            await asyncio.sleep(self._scan_interval_s)
+
+    def _make_jitter_s(self) -> float:
+        return random.uniform(0, self._max_jitter_s)  # nosec bandit B311
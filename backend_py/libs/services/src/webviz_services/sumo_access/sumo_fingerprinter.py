@@ -13,6 +13,7 @@ from webviz_services.utils.authenticated_user import AuthenticatedUser
 from .queries.doc_checksum_agg import build_case_level_docs_query_dict, build_ensemble_level_docs_query_dict
 from .queries.doc_checksum_agg import run_query_and_do_checksum_agg_async
 from .sumo_client_factory import create_sumo_client
+from .sumo_fingerprint_warmer import SumoFingerprintWarmer
 
 _REDIS_KEY_PREFIX = "sumo_fingerprinter"
 
@@ -22,16 +23,17 @@ LOGGER = logging.getLogger(__name__)
 class SumoFingerprinterFactory:
     _instance = None
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, warmer: SumoFingerprintWarmer | None):
         self._redis_client: redis.Redis = redis_client
+        self._warmer = warmer
 
     @classmethod
-    def initialize(cls, redis_url: str) -> None:
+    def initialize(cls, redis_url: str, warmer: SumoFingerprintWarmer | None = None) -> None:
         if cls._instance is not None:
             raise RuntimeError("SumoFingerprinterFactory is already initialized")
 
         redis_client = redis.Redis.from_url(redis_url, decode_responses=True)
-        cls._instance = cls(redis_client)
+        cls._instance = cls(redis_client, warmer)
 
     @classmethod
     def get_instance(cls) -> "SumoFingerprinterFactory":
@@ -45,16 +47,34 @@ class SumoFingerprinterFactory:
         if not authenticated_user:
             raise ValueError("An authenticated user must be specified")
 
-        return SumoFingerprinter(authenticated_user, self._redis_client, cache_ttl_s)
+        return SumoFingerprinter(authenticated_user, self._redis_client, cache_ttl_s, self._warmer)
 
 
 class SumoFingerprinter:
-    def __init__(self, authenticated_user: AuthenticatedUser, redis_client: redis.Redis, cache_ttl_s: int):
+    """
+    Calculates and caches ensemble fingerprints for a single user.
+
+    Fingerprints are calculated with the user's own Sumo token and cached in Redis under a per user key, so a user
+    only ever gets a fingerprint for the ensemble contents they are able to read. Since Sumo grants read access per
+    case, a user without access to the case sees no documents, and gets a fingerprint that differs from the one
+    calculated by users with access. This makes the fingerprint usable as a key for in-process caches of ensemble
+    data that are shared between users.
+    """
+
+    def __init__(
+        self,
+        authenticated_user: AuthenticatedUser,
+        redis_client: redis.Redis,
+        cache_ttl_s: int,
+        warmer: SumoFingerprintWarmer | None = None,
+    ):
+        self._authenticated_user = authenticated_user
         self._access_token: str = authenticated_user.get_sumo_access_token()
         self._sumo_client: SumoClient = create_sumo_client(self._access_token)
         self._user_id = authenticated_user.get_user_id()
         self._redis_client = redis_client
         self._cache_ttl_s = cache_ttl_s
+        self._warmer = warmer
 
     async def get_or_calc_ensemble_fp_async(self, case_uuid: str, ensemble_name: str) -> str:
         """
@@ -65,9 +85,15 @@ class SumoFingerprinter:
 
         redis_key = self._make_full_redis_key(case_uuid=case_uuid, ensemble_name=ensemble_name)
 
-        cached_fp = await self._redis_client.get(redis_key)
+        # Get both the value and its remaining TTL in one round trip, the TTL is needed by the warmer
+        pipe = self._redis_client.pipeline(transaction=False)
+        pipe.get(redis_key)
+        pipe.ttl(redis_key)
+        cached_fp, remaining_ttl_s = await pipe.execute()
         perf_metrics.record_lap("redis-get")
         if cached_fp is not None:
+            # A negative TTL means that the key has no expiry or that it expired in between, just treat it as expired
+            self._register_access_with_warmer(case_uuid, ensemble_name, cached_fp, max(0, remaining_ttl_s))
             # LOGGER.debug(f"get_or_calc_ensemble_fp_async() - from cache in: {perf_metrics.to_string()} [{cached_fp=}]")
             return cached_fp
 
@@ -78,10 +104,14 @@ class SumoFingerprinter:
         asyncio.create_task(self._redis_client.set(name=redis_key, value=new_fp, ex=self._cache_ttl_s))
         perf_metrics.record_lap("schedule-redis-set")
 
+        self._register_access_with_warmer(case_uuid, ensemble_name, new_fp, self._cache_ttl_s)
+
         # LOGGER.debug(f"get_or_calc_ensemble_fp_async() - calculated in: {perf_metrics.to_string()} [{new_fp=}]")
         return new_fp
 
-    async def calc_and_store_ensemble_fp_async(self, case_uuid: str, ensemble_name: str) -> str:
+    async def calc_and_store_ensemble_fp_async(
+        self, case_uuid: str, ensemble_name: str, register_access: bool = True
+    ) -> str:
         """
         Calculate and unconditionally store fingerprint string for contents of an ensemble, also returning the result.
         This method does not check the cache first, it will always calculate a new fingerprint and write it to the cache.
@@ -97,9 +127,31 @@ class SumoFingerprinter:
         await self._redis_client.set(name=redis_key, value=new_fp, ex=self._cache_ttl_s)
         perf_metrics.record_lap("redis-set")
 
+        if register_access:
+            self._register_access_with_warmer(case_uuid, ensemble_name, new_fp, self._cache_ttl_s)
+
         # LOGGER.debug(f"calc_and_store_ensemble_fp_async() - calculated in: {perf_metrics.to_string()} [{new_fp=}]")
         return new_fp
 
+    def _register_access_with_warmer(
+        self, case_uuid: str, ensemble_name: str, fingerprint: str, remaining_ttl_s: float
+    ) -> None:
+        if self._warmer is None:
+            return
+
+        async def refresh_fp_async() -> str:
+            return await self.calc_and_store_ensemble_fp_async(case_uuid, ensemble_name, register_access=False)
+
+        self._warmer.register_access(
+            authenticated_user=self._authenticated_user,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            fingerprint=fingerprint,
+            remaining_ttl_s=remaining_ttl_s,
+            cache_ttl_s=self._cache_ttl_s,
+            refresh_fp_async=refresh_fp_async,
+        )
+
     def _make_full_redis_key(self, case_uuid: str, ensemble_name: str) -> str:
         return f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:case:{case_uuid}:ens:{ensemble_name}"
 
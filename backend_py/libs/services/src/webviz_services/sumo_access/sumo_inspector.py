@@ -61,20 +61,47 @@ class SumoInspector:
         LOGGER.debug(timer.to_string())
         return [FieldIdentifier(field_identifier=field_identifier) for field_identifier in field_identifiers_sorted]
 
-    async def get_cases_async(self, asset_name: str) -> list[CaseInfo]:
+    async def get_cases_async(self, asset_name: str, case_uuids: list[str] | None = None) -> list[CaseInfo]:
         """
         Get all cases with available result types from SUMO using aggregations and filters.
+        Optionally restrict the query to the cases with the specified uuids.
 
         - The case timestamp is max timestamp for all documents for given case (including metadata document)
         - Excluding all aggregated documents
         """
+        if case_uuids is not None and len(case_uuids) == 0:
+            return []
 
+        must_clauses: list[dict] = [{"term": {"access.asset.name.keyword": asset_name}}]
+        if case_uuids is not None:
+            must_clauses.append({"terms": {"fmu.case.uuid.keyword": case_uuids}})
+
+        payload = _build_cases_aggregation_payload(must_clauses, max_case_count=65535, order_by_latest=False)
+        return await self._run_cases_aggregation_async(payload)
+
+    async def get_latest_cases_async(self, asset_name: str, max_case_count: int) -> list[CaseInfo]:
+        """
+        Get the most recently updated cases, sorted with the latest first.
+
+        Runs the same aggregation as get_cases_async(), but only returns the top max_case_count case buckets ordered
+        by case timestamp, which is considerably cheaper for assets with many cases.
+        """
+        must_clauses: list[dict] = [{"term": {"access.asset.name.keyword": asset_name}}]
+        payload = _build_cases_aggregation_payload(must_clauses, max_case_count=max_case_count, order_by_latest=True)
+        return await self._run_cases_aggregation_async(payload)
+
+    async def get_case_uuids_updated_since_async(self, asset_name: str, since_utc_ms: int) -> list[str]:
+        """
+        Get uuids of the cases that have at least one document with a timestamp later than since_utc_ms.
+        Note that this only detects new and updated cases, deleted cases will not be reported.
+        """
         payload = {
             "size": 0,
             "query": {
                 "bool": {
                     "must": [
                         {"term": {"access.asset.name.keyword": asset_name}},
+                        {"range": {"_sumo.timestamp": {"gt": since_utc_ms}}},
                     ],
                     "must_not": [{"exists": {"field": "fmu.aggregation"}}],
                 },
@@ -85,64 +112,6 @@ class SumoInspector:
                         "field": "fmu.case.uuid.keyword",
                         "size": 65535,
                     },
-                    "aggs": {
-                        "description": {
-                            "terms": {
-                                "field": "fmu.case.description.keyword",
-                                "size": 65535,
-                            }
-                        },
-                        "timestamp_max": {
-                            "max": {
-                                "field": "_sumo.timestamp",
-                            }
-                        },
-                        "status": {
-                            "terms": {
-                                "field": "_sumo.status.keyword",
-                                "size": 10,
-                            }
-                        },
-                        "user": {
-                            "terms": {
-                                "field": "fmu.case.user.id.keyword",
-                                "size": 10,
-                            }
-                        },
-                        "name": {
-                            "terms": {
-                                "field": "fmu.case.name.keyword",
-                                "size": 100,
-                            }
-                        },
-                        "model_name": {
-                            "terms": {
-                                "field": "fmu.model.name.keyword",
-                                "size": 10,
-                            }
-                        },
-                        "model_revision": {
-                            "terms": {
-                                "field": "fmu.model.revision.keyword",
-                                "size": 10,
-                            }
-                        },
-                        "ensemble_names": {
-                            "terms": {
-                                "field": "fmu.ensemble.name.keyword",
-                                "size": 65535,
-                            },
-                            "aggs": {
-                                "realizations_count": {"cardinality": {"field": "fmu.realization.id"}},
-                                "standard_result": {
-                                    "terms": {
-                                        "field": "data.standard_result.name.keyword",
-                                        "size": 10,
-                                    }
-                                },
-                            },
-                        },
-                    },
                 }
             },
         }
@@ -150,6 +119,13 @@ class SumoInspector:
         response = await self._sumo_client.post_async("/search", json=payload)
         response_dict = response.json()
 
+        case_buckets = response_dict.get("aggregations", {}).get("uuids", {}).get("buckets", [])
+        return [case_bucket["key"] for case_bucket in case_buckets]
+
+    async def _run_cases_aggregation_async(self, payload: dict) -> list[CaseInfo]:
+        response = await self._sumo_client.post_async("/search", json=payload)
+        response_dict = response.json()
+
         aggs = response_dict.get("aggregations", {})
         case_buckets = aggs.get("uuids", {}).get("buckets", [])
 
@@ -162,6 +138,91 @@ class SumoInspector:
         return case_info_arr
 
 
+def _build_cases_aggregation_payload(must_clauses: list[dict], max_case_count: int, order_by_latest: bool) -> dict:
+    """
+    Build the search payload for aggregating case and ensemble info, with one bucket per case.
+    """
+    uuids_terms: dict = {
+        "field": "fmu.case.uuid.keyword",
+        "size": max_case_count,
+    }
+    if order_by_latest:
+        uuids_terms["order"] = {"timestamp_max": "desc"}
+
+    return {
+        "size": 0,
+        "query": {
+            "bool": {
+                "must": must_clauses,
+                "must_not": [{"exists": {"field": "fmu.aggregation"}}],
+            },
+        },
+        "aggs": {
+            "uuids": {
+                "terms": uuids_terms,
+                "aggs": {
+                    "description": {
+                        "terms": {
+                            "field": "fmu.case.description.keyword",
+                            "size": 65535,
+                        }
+                    },
+                    "timestamp_max": {
+                        "max": {
+                            "field": "_sumo.timestamp",
+                        }
+                    },
+                    "status": {
+                        "terms": {
+                            "field": "_sumo.status.keyword",
+                            "size": 10,
+                        }
+                    },
+                    "user": {
+                        "terms": {
+                            "field": "fmu.case.user.id.keyword",
+                            "size": 10,
+                        }
+                    },
+                    "name": {
+                        "terms": {
+                            "field": "fmu.case.name.keyword",
+                            "size": 100,
+                        }
+                    },
+                    "model_name": {
+                        "terms": {
+                            "field": "fmu.model.name.keyword",
+                            "size": 10,
+                        }
+                    },
+                    "model_revision": {
+                        "terms": {
+                            "field": "fmu.model.revision.keyword",
+                            "size": 10,
+                        }
+                    },
+                    "ensemble_names": {
+                        "terms": {
+                            "field": "fmu.ensemble.name.keyword",
+                            "size": 65535,
+                        },
+                        "aggs": {
+                            "realizations_count": {"cardinality": {"field": "fmu.realization.id"}},
+                            "standard_result": {
+                                "terms": {
+                                    "field": "data.standard_result.name.keyword",
+                                    "size": 10,
+                                }
+                            },
+                        },
+                    },
+                },
+            }
+        },
+    }
+
+
 def _create_case_info_from_case_bucket(case_bucket: dict) -> CaseInfo:
     """
     Create CaseInfo object from a case bucket dictionary obtained from SUMO search aggregation response.
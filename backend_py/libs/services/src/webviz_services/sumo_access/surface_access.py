@@ -2,7 +2,7 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Sequence
+from typing import Literal, Sequence
 from urllib.parse import urlparse
 
 import httpx
@@ -475,6 +475,23 @@ class SurfaceAccess:
         LOGGER.debug(f"Polled surface job ({task_state.status=}) took: {perf_metrics.to_string()} ({sumo_task_id=})")
         return InProgress(progress_message=f"{task_state.status}")
 
+    async def poll_statistical_surface_calculation_task_status_async(
+        self, sumo_task_id: str
+    ) -> Literal["succeeded", "failed"] | InProgress:
+        """
+        Do a single, lightweight poll of the status of the specified Sumo task.
+
+        Unlike poll_statistical_surface_calculation_task_async(), this method never downloads the resulting
+        surface, and is intended for status reporting only.
+        """
+        task_state: _SumoTaskState = await _poll_sumo_aggregation_task_state_async(self._sumo_client, sumo_task_id)
+        if task_state.status == "succeeded":
+            return "succeeded"
+        if task_state.status == "failed":
+            return "failed"
+
+        return InProgress(progress_message=f"{task_state.status}")
+
     def _make_real_surf_log_str(self, real_num: int, name: str, attribute: str, date_str: str | None) -> str:
         addr_str = f"N={name}, A={attribute}, R={real_num}, D={date_str}, C={self._case_uuid}, E={self._ensemble_name}"
         return addr_str
@@ -88,8 +88,8 @@ class VfpAccess:
         table_number = int(pa_table.schema.metadata[b"TABLE_NUMBER"].decode("utf-8"))
         datum = float(pa_table.schema.metadata[b"DATUM"].decode("utf-8"))
         tab_type = TabType[pa_table.schema.metadata[b"TAB_TYPE"].decode("utf-8")]
-        thp_values = np.frombuffer(pa_table.schema.metadata[b"THP_VALUES"], dtype=np.float64).tolist()
-        flow_rate_values = np.frombuffer(pa_table.schema.metadata[b"FLOW_VALUES"], dtype=np.float64).tolist()
+        thp_values = _metadata_float_array(pa_table, b"THP_VALUES")
+        flow_rate_values = _metadata_float_array(pa_table, b"FLOW_VALUES")
 
         if vfp_type == VfpType.VFPINJ:
             return VfpInjTable(
@@ -100,7 +100,7 @@ class VfpAccess:
                 tab_type=tab_type,
                 thp_values=thp_values,
                 flow_rate_values=flow_rate_values,
-                bhp_values=[val for sublist in np.array(pa_table.columns).tolist() for val in sublist],
+                bhp_values=_extract_bhp_values(pa_table),
                 flow_rate_unit=VFP_UNITS[unit_type][VfpParam.FLOWRATE][flow_rate_type],
                 thp_unit=VFP_UNITS[unit_type][VfpParam.THP][thp_type],
                 bhp_unit=VFP_UNITS[unit_type][VfpParam.THP][thp_type],
@@ -116,9 +116,9 @@ class VfpAccess:
                 alq_type = ALQ[pa_table.schema.metadata[b"ALQ_TYPE"].decode("utf-8")]
             wfr_type = WFR[pa_table.schema.metadata[b"WFR_TYPE"].decode("utf-8")]
             gfr_type = GFR[pa_table.schema.metadata[b"GFR_TYPE"].decode("utf-8")]
-            wfr_values = np.frombuffer(pa_table.schema.metadata[b"WFR_VALUES"], dtype=np.float64).tolist()
-            gfr_values = np.frombuffer(pa_table.schema.metadata[b"GFR_VALUES"], dtype=np.float64).tolist()
-            alq_values = np.frombuffer(pa_table.schema.metadata[b"ALQ_VALUES"], dtype=np.float64).tolist()
+            wfr_values = _metadata_float_array(pa_table, b"WFR_VALUES")
+            gfr_values = _metadata_float_array(pa_table, b"GFR_VALUES")
+            alq_values = _metadata_float_array(pa_table, b"ALQ_VALUES")
 
             return VfpProdTable(
                 table_number=table_number,
@@ -135,7 +135,7 @@ class VfpAccess:
                 gfr_values=gfr_values,
                 alq_values=alq_values,
                 flow_rate_values=flow_rate_values,
-                bhp_values=[val for sublist in np.array(pa_table.columns).tolist() for val in sublist],
+                bhp_values=_extract_bhp_values(pa_table),
                 flow_rate_unit=VFP_UNITS[unit_type][VfpParam.FLOWRATE][flow_rate_type],
                 thp_unit=VFP_UNITS[unit_type][VfpParam.THP][thp_type],
                 wfr_unit=VFP_UNITS[unit_type][VfpParam.WFR][wfr_type],
@@ -188,3 +188,15 @@ class VfpAccess:
             raise NoDataError(
                 f"Missing required VFP Prod table metadata fields: {', '.join(missing_fields)}", Service.SUMO
             )
+
+
+def _metadata_float_array(pa_table: pa.Table, key: bytes) -> np.ndarray:
+    """Returns a float64 array stored as raw bytes in the table schema metadata, as a zero-copy view"""
+    return np.frombuffer(pa_table.schema.metadata[key], dtype=np.float64)
+
+
+def _extract_bhp_values(pa_table: pa.Table) -> np.ndarray:
+    """Returns the BHP values of all columns concatenated into one flat float64 array, column by column"""
+    if pa_table.num_columns == 0:
+        return np.empty(0, dtype=np.float64)
+    return np.concatenate([column.to_numpy().astype(np.float64, copy=False) for column in pa_table.columns])
@@ -1,7 +1,9 @@
 from enum import Enum
 from typing import Any, Dict
 
-from pydantic import BaseModel
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict
 
 
 # Type of VFP curve
@@ -81,7 +83,10 @@ class TabType(Enum):
 # The length of bhp_values is len(thp_values)*len(wfr_values)*len(gfr_values)*len(alq_values)*len(flow_rate_values)
 # The values are ordered so that the index of flow_rate_values moves fastest, and the index of thp_values moves
 # slowest. The order is: THP, WFR, GFR, ALQ, Flow rates.
+# The values are kept as numpy arrays, so that they can be encoded as binary arrays without creating Python floats.
 class VfpProdTable(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     table_number: int
     datum: float
     thp_type: THP
@@ -91,12 +96,12 @@ class VfpProdTable(BaseModel):
     flow_rate_type: FlowRateType
     unit_type: UnitType
     tab_type: TabType
-    thp_values: list[float]
-    wfr_values: list[float]
-    gfr_values: list[float]
-    alq_values: list[float]
-    flow_rate_values: list[float]
-    bhp_values: list[float]
+    thp_values: NDArray[np.float64]
+    wfr_values: NDArray[np.float64]
+    gfr_values: NDArray[np.float64]
+    alq_values: NDArray[np.float64]
+    flow_rate_values: NDArray[np.float64]
+    bhp_values: NDArray[np.float64]
     flow_rate_unit: str
     thp_unit: str
     wfr_unit: str
@@ -106,14 +111,16 @@ class VfpProdTable(BaseModel):
 
 
 class VfpInjTable(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     table_number: int
     datum: float
     flow_rate_type: FlowRateType
     unit_type: UnitType
     tab_type: TabType
-    thp_values: list[float]
-    flow_rate_values: list[float]
-    bhp_values: list[float]
+    thp_values: NDArray[np.float64]
+    flow_rate_values: NDArray[np.float64]
+    bhp_values: NDArray[np.float64]
     flow_rate_unit: str
     thp_unit: str
     bhp_unit: str
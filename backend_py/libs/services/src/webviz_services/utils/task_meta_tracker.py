@@ -1,4 +1,5 @@
 import time
+import asyncio
 import logging
 from typing import Literal
 from dataclasses import dataclass
@@ -13,11 +14,57 @@ _REDIS_KEY_PREFIX = "task_meta_tracker"
 LOGGER = logging.getLogger(__name__)
 
 
+# Lua script for registering a task (and optionally a fingerprint to task id mapping) in one atomic round trip.
+# Fails, returning 0, if an entry for the task id already exists.
+#   KEYS[1]: task hash name
+#   KEYS[2]: fingerprint key (optional)
+#   ARGV: ttl_s, task_system, start_time_utc_s, expected_store_key, task_id
+_LUA_REGISTER_TASK = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+redis.call("HSET", KEYS[1], "taskSystem", ARGV[2], "startTimeUtcS", ARGV[3], "expectedStoreKey", ARGV[4])
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+if #KEYS > 1 then
+    redis.call("SET", KEYS[2], ARGV[5], "EX", ARGV[1])
+end
+return 1
+"""
+
+# Lua script for atomically deleting both the fingerprint mapping and the task it points to.
+# The mapping is only deleted if it still points to the expected task id, the task hash is always deleted.
+# Returns the number of deleted task hashes (0 or 1)
+#   KEYS[1]: fingerprint key
+#   KEYS[2]: task hash name
+#   ARGV[1]: expected task id
+_LUA_DELETE_TASK_BY_FINGERPRINT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("DEL", KEYS[1])
+end
+return redis.call("DEL", KEYS[2])
+"""
+
+# Lua script for recording the final outcome of a task and notifying any waiters in one atomic round trip.
+# Returns 0 if the task does not exist, otherwise 1
+#   KEYS[1]: task hash name
+#   ARGV[1]: final outcome
+#   ARGV[2]: name of the pub/sub channel to notify
+_LUA_SET_FINAL_OUTCOME_AND_PUBLISH = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("HSET", KEYS[1], "finalOutcome", ARGV[1])
+redis.call("PUBLISH", ARGV[2], ARGV[1])
+return 1
+"""
+
+
 class TaskMetaTrackerFactory:
     _instance = None
 
     def __init__(self, redis_client: redis.Redis):
         self._redis_client: redis.Redis = redis_client
+        self._scripts = _TrackerScripts(redis_client)
 
     @classmethod
     def initialize(cls, redis_url: str) -> None:
@@ -37,7 +84,21 @@ class TaskMetaTrackerFactory:
         if not user_id:
             raise ValueError("A user_id must be specified")
 
-        return TaskMetaTracker(user_id, self._redis_client)
+        return TaskMetaTracker(user_id, self._redis_client, self._scripts)
+
+
+class _TrackerScripts:
+    """
+    The Lua scripts used by the tracker, registered once per Redis client.
+    The script objects take care of loading the scripts into Redis and invoking them via EVALSHA.
+    All keys touched by a script are passed in KEYS, and all keys for a user share the same hash slot (see the
+    key helpers in TaskMetaTracker), so the scripts are also valid against Redis Cluster.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.register_task = redis_client.register_script(_LUA_REGISTER_TASK)
+        self.delete_task_by_fingerprint = redis_client.register_script(_LUA_DELETE_TASK_BY_FINGERPRINT)
+        self.set_final_outcome_and_publish = redis_client.register_script(_LUA_SET_FINAL_OUTCOME_AND_PUBLISH)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -50,12 +111,13 @@ class TaskMeta:
 
 
 class TaskMetaTracker:
-    def __init__(self, user_id: str, redis_client: redis.Redis):
+    def __init__(self, user_id: str, redis_client: redis.Redis, scripts: _TrackerScripts | None = None):
         if not user_id:
             raise ValueError("A user_id must be specified")
 
         self._user_id = user_id
         self._redis_client: redis.Redis = redis_client
+        self._scripts = scripts if scripts is not None else _TrackerScripts(redis_client)
 
     async def register_task_async(
         self,
@@ -65,33 +127,12 @@ class TaskMetaTracker:
         task_start_time_utc_s: float | None,
         expected_store_key: str | None,
     ) -> TaskMeta:
-        redis_hash_name = self._make_full_redis_key_for_task(task_id)
-
-        if task_start_time_utc_s is None:
-            task_start_time_utc_s = time.time()
-
-        # Use hsetnx to provoke an error if an entry for this task id already exists
-        res = await self._redis_client.hsetnx(name=redis_hash_name, key="taskSystem", value=task_system)
-        if res == 0:
-            raise ValueError(f"Task with id {task_id} already exists in the tracker")
-
-        # Set TTL for the hash
-        await self._redis_client.expire(redis_hash_name, ttl_s)
-
-        # Now set the remaining keys/fields in the hash
-        await self._redis_client.hset(
-            name=redis_hash_name,
-            mapping={
-                "startTimeUtcS": task_start_time_utc_s,
-                "expectedStoreKey": expected_store_key if expected_store_key else "",
-            },
-        )
-
-        return TaskMeta(
+        return await self._register_task_and_maybe_fingerprint_async(
             task_system=task_system,
             task_id=task_id,
-            start_time_utc_s=task_start_time_utc_s,
-            final_outcome=None,
+            fingerprint=None,
+            ttl_s=ttl_s,
+            task_start_time_utc_s=task_start_time_utc_s,
             expected_store_key=expected_store_key,
         )
 
@@ -104,52 +145,27 @@ class TaskMetaTracker:
         task_start_time_utc_s: float | None,
         expected_store_key: str | None,
     ) -> TaskMeta:
-        # Register the task itself in the usual way
-        task_meta = await self.register_task_async(
+        # Registers both the task itself and the mapping from task fingerprint to task id in one atomic operation
+        # May want to set a shorter TTL for the fingerprint entry
+        return await self._register_task_and_maybe_fingerprint_async(
             task_system=task_system,
             task_id=task_id,
+            fingerprint=fingerprint,
             ttl_s=ttl_s,
             task_start_time_utc_s=task_start_time_utc_s,
             expected_store_key=expected_store_key,
         )
 
-        # Register the mapping from task fingerprint to task id
-        # May want to set a shorter TTL for this entry
-        fingerprint_redis_key = self._make_full_redis_key_for_fingerprint(fingerprint)
-        _res = await self._redis_client.setex(fingerprint_redis_key, ttl_s, task_id)
-
-        return task_meta
-
     async def get_task_meta_async(self, task_id: str) -> TaskMeta | None:
         redis_hash_name = self._make_full_redis_key_for_task(task_id)
         value_dict: dict[str, str] = await self._redis_client.hgetall(name=redis_hash_name)
         if not value_dict:
             return None
 
-        task_system: str = value_dict.get("taskSystem", "UNKNOWN")
-
-        task_start_time_utc_s: float = _to_float_safe(value_dict.get("startTimeUtcS", None), 0.0)
-
-        expected_store_key: str | None = value_dict.get("expectedStoreKey", None)
-        if expected_store_key == "":
-            expected_store_key = None
-
-        final_outcome: Literal["success", "failure"] | None = None
-        final_outcome_str = value_dict.get("finalOutcome")
-        if final_outcome_str == "success":
-            final_outcome = "success"
-        elif final_outcome_str == "failure":
-            final_outcome = "failure"
-
-        return TaskMeta(
-            task_system=task_system,
-            task_id=task_id,
-            start_time_utc_s=task_start_time_utc_s,
-            final_outcome=final_outcome,
-            expected_store_key=expected_store_key,
-        )
+        return _task_meta_from_hash_dict(task_id, value_dict)
 
     async def get_task_meta_by_fingerprint_async(self, fingerprint: str) -> TaskMeta | None:
+        # The task hash name depends on the task id stored in the fingerprint entry, so we need two round trips here
         task_id = await self.get_task_id_by_fingerprint_async(fingerprint)
         if task_id is None:
             return None
@@ -166,12 +182,19 @@ class TaskMetaTracker:
         return num_deleted == 1
 
     async def delete_task_by_fingerprint_async(self, fingerprint: str) -> bool:
+        """
+        Atomically deletes both the fingerprint to task id mapping and the task itself.
+        Returns True if a task was actually deleted, otherwise False
+        """
         task_id = await self.get_task_id_by_fingerprint_async(fingerprint)
         if task_id is None:
             return False
 
-        await self.delete_fingerprint_to_task_mapping_async(fingerprint)
-        return await self.delete_task_async(task_id)
+        fingerprint_redis_key = self._make_full_redis_key_for_fingerprint(fingerprint)
+        num_deleted = await self._scripts.delete_task_by_fingerprint(
+            keys=[fingerprint_redis_key, self._make_full_redis_key_for_task(task_id)], args=[task_id]
+        )
+        return num_deleted == 1
 
     async def delete_fingerprint_to_task_mapping_async(self, fingerprint: str) -> None:
         fingerprint_redis_key = self._make_full_redis_key_for_fingerprint(fingerprint)
@@ -182,19 +205,138 @@ class TaskMetaTracker:
         task_id = await self._redis_client.get(fingerprint_redis_key)
         return task_id
 
+    async def set_final_outcome_async(self, task_id: str, final_outcome: Literal["success", "failure"]) -> bool:
+        """
+        Records the final outcome of a task and publishes a completion notification to anyone waiting on it,
+        see wait_for_final_outcome_async().
+        Intended to be called by whichever worker first observes that the task has finished.
+        Returns True if the task exists in the tracker, otherwise False
+        """
+        redis_hash_name = self._make_full_redis_key_for_task(task_id)
+        res = await self._scripts.set_final_outcome_and_publish(
+            keys=[redis_hash_name], args=[final_outcome, self._make_channel_name_for_task(task_id)]
+        )
+        return res == 1
+
+    async def wait_for_final_outcome_async(
+        self, task_id: str, timeout_s: float
+    ) -> Literal["success", "failure"] | None:
+        """
+        Wait up to timeout_s seconds for the task to get a final outcome, see set_final_outcome_async().
+        Returns immediately if the task already has a final outcome.
+        Returns None if the timeout expires without a final outcome, or if the task does not exist in the tracker.
+        """
+        async with self._redis_client.pubsub() as pubsub:
+            await pubsub.subscribe(self._make_channel_name_for_task(task_id))
+
+            # Note that we check the stored state after subscribing so that we don't miss a notification that
+            # gets published in between
+            task_meta = await self.get_task_meta_async(task_id)
+            if task_meta is None:
+                return None
+            if task_meta.final_outcome is not None:
+                return task_meta.final_outcome
+
+            deadline_s = time.perf_counter() + timeout_s
+            while (remaining_s := deadline_s - time.perf_counter()) > 0:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining_s)
+                if message is not None and message["type"] == "message":
+                    return _to_final_outcome_or_none(message["data"])
+
+                # Guard against busy looping if get_message() returns early
+                await asyncio.sleep(0)
+
+            return None
+
     async def purge_all_task_meta_async(self) -> None:
         # Purge all existing keys for user by setting their TTL to 1ms
         # Note that this is not atomic, but use it as a first experiment.
         # We should probably go for a solution with versioned namespaces instead.
-        pattern = f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:*"
+        # The expire commands are batched in a (non-transactional) pipeline to avoid one round trip per key.
+        pattern = f"{self._make_redis_key_prefix_for_user()}*"
+        pipe = self._redis_client.pipeline(transaction=False)
         async for key in self._redis_client.scan_iter(match=pattern):
-            await self._redis_client.pexpire(key, 1)
+            pipe.pexpire(key, 1)
+        await pipe.execute()
+
+    async def _register_task_and_maybe_fingerprint_async(
+        self,
+        task_system: str,
+        task_id: str,
+        fingerprint: str | None,
+        ttl_s: int,
+        task_start_time_utc_s: float | None,
+        expected_store_key: str | None,
+    ) -> TaskMeta:
+        if task_start_time_utc_s is None:
+            task_start_time_utc_s = time.time()
+
+        keys = [self._make_full_redis_key_for_task(task_id)]
+        if fingerprint is not None:
+            keys.append(self._make_full_redis_key_for_fingerprint(fingerprint))
+
+        args: list[str | int | float] = [
+            ttl_s,
+            task_system,
+            task_start_time_utc_s,
+            expected_store_key if expected_store_key else "",
+            task_id,
+        ]
+
+        # The script fails (returns 0) if an entry for this task id already exists, in which case nothing is written
+        res = await self._scripts.register_task(keys=keys, args=args)
+        if res == 0:
+            raise ValueError(f"Task with id {task_id} already exists in the tracker")
+
+        return TaskMeta(
+            task_system=task_system,
+            task_id=task_id,
+            start_time_utc_s=task_start_time_utc_s,
+            final_outcome=None,
+            expected_store_key=expected_store_key,
+        )
+
+    def _make_redis_key_prefix_for_user(self) -> str:
+        # The user id is wrapped in a hash tag so that all keys for a user map to the same Redis Cluster hash slot,
+        # which is required for the scripts that touch more than one key
+        return f"{_REDIS_KEY_PREFIX}:user:{{{self._user_id}}}:"
 
     def _make_full_redis_key_for_task(self, task_id: str) -> str:
-        return f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:task:{task_id}"
+        return f"{self._make_redis_key_prefix_for_user()}task:{task_id}"
 
     def _make_full_redis_key_for_fingerprint(self, fingerprint: str) -> str:
-        return f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:fingerprint_to_task_map:{fingerprint}"
+        return f"{self._make_redis_key_prefix_for_user()}fingerprint_to_task_map:{fingerprint}"
+
+    def _make_channel_name_for_task(self, task_id: str) -> str:
+        return f"{self._make_redis_key_prefix_for_user()}task_done:{task_id}"
+
+
+def _task_meta_from_hash_dict(task_id: str, value_dict: dict[str, str]) -> TaskMeta:
+    task_system: str = value_dict.get("taskSystem", "UNKNOWN")
+
+    task_start_time_utc_s: float = _to_float_safe(value_dict.get("startTimeUtcS", None), 0.0)
+
+    expected_store_key: str | None = value_dict.get("expectedStoreKey", None)
+    if expected_store_key == "":
+        expected_store_key = None
+
+    final_outcome = _to_final_outcome_or_none(value_dict.get("finalOutcome"))
+
+    return TaskMeta(
+        task_system=task_system,
+        task_id=task_id,
+        start_time_utc_s=task_start_time_utc_s,
+        final_outcome=final_outcome,
+        expected_store_key=expected_store_key,
+    )
+
+
+def _to_final_outcome_or_none(str_value: str | None) -> Literal["success", "failure"] | None:
+    if str_value == "success":
+        return "success"
+    if str_value == "failure":
+        return "failure"
+    return None
 
 
 def _to_float_safe(str_value: str | None, default: float) -> float:
@@ -0,0 +1,138 @@
+"""
+Benchmark of the well completions aggregation in WellCompletionsAssembler.create_well_completions_data().
+
+Compares the single lazy polars plan against the previous implementation (kept below as a reference), which grouped
+per well and then per (zone, date) in Python loops, and verifies that both produce the same completions.
+
+The synthetic table is shaped like a real completions export: one row per (well, zone, date, realization), where
+each well is completed in a subset of the zones, the completion dates vary per well and a fraction of the
+realizations have the zone shut.
+
+Run with:
+    python -m webviz_services.well_completions_assembler.dev.dev_well_completions_assembler_benchmark [num_wells] [num_zones] [num_reals]
+"""
+
+import asyncio
+import datetime
+import math
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+from webviz_services.sumo_access.well_completions_types import Completions
+from webviz_services.well_completions_assembler.well_completions_assembler import WellCompletionsAssembler
+
+
+def make_synthetic_completions_table(num_wells: int, num_zones: int, num_reals: int, seed: int = 0) -> pa.Table:
+    rng = np.random.default_rng(seed)
+    zone_names = [f"Zone{zone_number:02}" for zone_number in range(1, num_zones + 1)]
+    all_dates = [datetime.datetime(2020, 1, 1) + datetime.timedelta(days=91 * i) for i in range(40)]
+
+    columns: dict[str, list] = {"WELL": [], "DATE": [], "ZONE": [], "REAL": [], "OP/SH": [], "KH": []}
+    for well_number in range(num_wells):
+        well_name = f"A-{well_number}H"
+        well_zones = rng.choice(zone_names, size=rng.integers(1, num_zones + 1), replace=False)
+        well_dates = sorted(rng.choice(len(all_dates), size=rng.integers(1, 6), replace=False))
+        for zone in well_zones:
+            for date_index in well_dates:
+                num_rows = num_reals
+                columns["WELL"].extend([well_name] * num_rows)
+                columns["ZONE"].extend([zone] * num_rows)
+                columns["DATE"].extend([all_dates[date_index]] * num_rows)
+                columns["REAL"].extend(range(num_reals))
+                columns["OP/SH"].extend(np.where(rng.uniform(size=num_rows) < 0.8, "OPEN", "SHUT").tolist())
+                columns["KH"].extend(rng.uniform(0, 5000, size=num_rows).tolist())
+
+    return pa.table(columns)
+
+
+class _TableAccess:
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table
+
+    async def get_well_completions_table_async(self) -> pa.Table:
+        return self._table
+
+
+def create_completions_per_well(table: pa.Table) -> dict[str, dict[str, Completions]]:
+    assembler = WellCompletionsAssembler(_TableAccess(table))  # type: ignore[arg-type]
+    asyncio.run(assembler.fetch_and_initialize_well_completions_table_data_async(realizations=None))
+    data = assembler.create_well_completions_data()
+    return {well.name: well.completions for well in data.wells}
+
+
+def reference_create_completions_per_well(table: pa.Table) -> dict[str, dict[str, Completions]]:
+    """The previous implementation, with nested group_by loops per well and per (zone, date)"""
+    df = pl.DataFrame(table)
+    sorted_unique_dates = sorted(df["DATE"].unique())
+    date_to_index_map = {date: idx for idx, date in enumerate(sorted_unique_dates)}
+    df = df.with_columns(pl.col("DATE").map_elements(date_to_index_map.get, return_dtype=pl.Int64).alias("DATE_INDEX"))
+    num_reals = df["REAL"].n_unique()
+
+    ret: dict[str, dict[str, Completions]] = {}
+    for (well_name,), well_group in df.group_by("WELL"):
+        completions: dict[str, Completions] = {}
+        for (zone, date_index), group_df in well_group.group_by(["ZONE", "DATE_INDEX"]):
+            zone_completions = completions.setdefault(
+                str(zone),
+                Completions(sorted_completion_date_indices=[], open=[], shut=[], kh_mean=[], kh_min=[], kh_max=[]),
+            )
+            kh_series = group_df.get_column("KH")
+            zone_completions.sorted_completion_date_indices.append(int(date_index))  # type: ignore[call-overload]
+            zone_completions.open.append(group_df.filter(pl.col("OP/SH") == "OPEN").height / num_reals)
+            zone_completions.shut.append(group_df.filter(pl.col("OP/SH") == "SHUT").height / num_reals)
+            zone_completions.kh_mean.append(round(float(kh_series.mean()), 2))  # type: ignore[arg-type]
+            zone_completions.kh_min.append(round(float(kh_series.min()), 2))  # type: ignore[arg-type]
+            zone_completions.kh_max.append(round(float(kh_series.max()), 2))  # type: ignore[arg-type]
+        ret[str(well_name)] = completions
+
+    return ret
+
+
+def _assert_same_completions(
+    actual: dict[str, dict[str, Completions]], expected: dict[str, dict[str, Completions]]
+) -> None:
+    assert sorted(actual) == sorted(expected)
+    for well_name, expected_completions in expected.items():
+        assert sorted(actual[well_name]) == sorted(expected_completions)
+        for zone, expected_zone_completions in expected_completions.items():
+            actual_zone_completions = actual[well_name][zone]
+            # The reference emits (zone, date) groups in arbitrary order, so compare on sorted date index
+            order = np.argsort(expected_zone_completions.sorted_completion_date_indices)
+            for field_name in ["sorted_completion_date_indices", "open", "shut", "kh_mean", "kh_min", "kh_max"]:
+                expected_values = np.asarray(getattr(expected_zone_completions, field_name))[order]
+                np.testing.assert_allclose(getattr(actual_zone_completions, field_name), expected_values, atol=1e-9)
+
+
+def _time_it_s(func: Callable[[], object], num_runs: int) -> float:
+    best_time_s = math.inf
+    for _ in range(num_runs):
+        start_s = time.perf_counter()
+        func()
+        best_time_s = min(best_time_s, time.perf_counter() - start_s)
+    return best_time_s
+
+
+def main() -> None:
+    num_wells = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    num_zones = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    num_reals = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    table = make_synthetic_completions_table(num_wells, num_zones, num_reals)
+    print(f"Synthetic table: {num_wells=} {num_zones=} {num_reals=} rows={table.num_rows}")
+
+    _assert_same_completions(create_completions_per_well(table), reference_create_completions_per_well(table))
+    print("Completions match the reference implementation")
+
+    vectorized_s = _time_it_s(lambda: create_completions_per_well(table), 3)
+    reference_s = _time_it_s(lambda: reference_create_completions_per_well(table), 1)
+    print(f"Reference (nested group_by): {reference_s * 1000:9.1f} ms")
+    print(f"Single lazy plan:            {vectorized_s * 1000:9.1f} ms  ({reference_s / vectorized_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import datetime
+
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 import polars as pl
@@ -107,14 +109,10 @@ class WellCompletionsAssembler:
 
         # Create list of unique dates and date index column
         self._sorted_unique_dates: list[datetime.datetime] = sorted(self._well_completions_df["DATE"].unique())
-        date_to_index_map: dict[datetime.datetime, int] = {
-            date: idx for idx, date in enumerate(self._sorted_unique_dates)
-        }
 
-        # Create date index column, for faster access to date index
-        date_index_column_expression = (
-            pl.col("DATE").map_elements(date_to_index_map.get, return_dtype=pl.Int64).alias("DATE_INDEX")
-        )
+        # Create date index column, for faster access to date index. The dense rank of a date equals its position
+        # in the sorted list of unique dates.
+        date_index_column_expression = (pl.col("DATE").rank("dense").cast(pl.Int64) - 1).alias("DATE_INDEX")
         self._well_completions_df = self._well_completions_df.with_columns(date_index_column_expression)
 
     def create_well_completions_data(self) -> WellCompletionsData:
@@ -148,73 +146,19 @@ class WellCompletionsAssembler:
             raise InvalidDataError("Well completions data is not initialized", Service.GENERAL)
         if self._well_attributes is None:
             raise InvalidDataError("Well attributes are not initialized", Service.GENERAL)
+        if self._zone_name_list is None:
+            raise InvalidDataError("Zone name list is not initialized", Service.GENERAL)
 
         # Optional "REAL" column, i.e. no column implies only one realization
         num_reals = 1
         if "REAL" in self._well_completions_df.columns:
             num_reals = self._well_completions_df["REAL"].n_unique()
 
-        well_list = []
-        for group_by_keys, well_group in self._well_completions_df.group_by("WELL"):
-            if len(group_by_keys) != 1:
-                raise InvalidDataError(
-                    f"Expect only one group key when grouping by well: {group_by_keys}", Service.GENERAL
-                )
-            well_name: str = str(group_by_keys[0])
-
-            well_data = self._extract_well(well_group, well_name, num_reals)
-            well_data.attributes = self._well_attributes[well_name] if well_name in self._well_attributes else {}
-            well_list.append(well_data)
-        return well_list
-
-    def _extract_well(
-        self, single_well_completion_df: pl.DataFrame, well_name: str, num_reals: int
-    ) -> WellCompletionsWell:
-        """
-        Extract completions events and kh values for a single well
-
-        The well group df is well completions data for a single well, i.e. original df grouped by "WELL".
-        """
-        well: WellCompletionsWell = WellCompletionsWell(name=well_name, attributes={}, completions={})
-
-        completions: dict[str, Completions] = {}
-        for (zone_key, date_index_key), group_df in single_well_completion_df.group_by(["ZONE", "DATE_INDEX"]):
-            zone = str(zone_key)
-
-            date_index = None
-            if isinstance(date_index_key, int):
-                date_index = date_index_key
-            if date_index is None:
-                raise InvalidDataError(
-                    f"Expected date index to be of type int, got: {type(date_index_key)}", Service.GENERAL
-                )
-
-            if zone not in completions:
-                completions[zone] = Completions(
-                    sorted_completion_date_indices=[], open=[], shut=[], kh_mean=[], kh_min=[], kh_max=[]
-                )
-
-            # Get number of occurrences of "OPEN" and "SHUT" in "OP/SH" column
-            num_open = group_df.filter(pl.col("OP/SH") == "OPEN").height
-            num_shut = group_df.filter(pl.col("OP/SH") == "SHUT").height
-
-            kh_series: pl.Series = group_df.get_column("KH")
-
-            def _safe_float(value: float | None) -> float:
-                return float(value) if value is not None else 0.0
-
-            zone_completions = completions[zone]
-            zone_completions.sorted_completion_date_indices.append(date_index)
-            zone_completions.open.append(float(num_open / num_reals if num_reals > 0 else 0))
-            zone_completions.shut.append(float(num_shut / num_reals if num_reals > 0 else 0))
-
-            # Disable mypy check for mean, min, max - as linting is not correct
-            zone_completions.kh_mean.append(round(_safe_float(kh_series.mean()), 2))  # type: ignore
-            zone_completions.kh_min.append(round(_safe_float(kh_series.min()), 2))  # type: ignore
-            zone_completions.kh_max.append(round(_safe_float(kh_series.max()), 2))  # type: ignore
+        aggregated_df = create_aggregated_completions_lazy_frame(
+            self._well_completions_df.lazy(), self._zone_name_list, num_reals
+        ).collect()
 
-        well.completions = completions
-        return well
+        return create_wells_from_aggregated_completions_df(aggregated_df, self._well_attributes)
 
     def _extract_well_completions_zones(
         self, zones: list[WellCompletionsZone] | None, zone_name_list: list[str]
@@ -267,3 +211,83 @@ class WellCompletionsAssembler:
                 output.append(zone)
 
         return output, remaining_valid_zones
+
+
+def create_aggregated_completions_lazy_frame(
+    well_completions_lf: pl.LazyFrame, zone_name_list: list[str], num_reals: int
+) -> pl.LazyFrame:
+    """
+    Plan for aggregating the completions of all wells, zones and dates at once.
+
+    The input must contain the columns "WELL", "ZONE", "DATE_INDEX", "OP/SH" and "KH". The result has one row per
+    (well, zone, date index), with the fraction of realizations where the zone is open/shut and the kh statistics.
+    Rows are sorted on well name, then zone in the order of zone_name_list, then date index, i.e. the completions
+    of each (well, zone) pair are a contiguous, date sorted range of rows.
+    """
+    zone_index_map = {zone_name: zone_index for zone_index, zone_name in enumerate(zone_name_list)}
+    reals_divisor = num_reals if num_reals > 0 else 1
+
+    return (
+        well_completions_lf.group_by(["WELL", "ZONE", "DATE_INDEX"])
+        .agg(
+            (pl.col("OP/SH") == "OPEN").sum().alias("NUM_OPEN"),
+            (pl.col("OP/SH") == "SHUT").sum().alias("NUM_SHUT"),
+            pl.col("KH").cast(pl.Float64).mean().alias("KH_MEAN"),
+            pl.col("KH").cast(pl.Float64).min().alias("KH_MIN"),
+            pl.col("KH").cast(pl.Float64).max().alias("KH_MAX"),
+        )
+        .select(
+            pl.col("WELL").cast(pl.String),
+            pl.col("ZONE").cast(pl.String),
+            pl.col("ZONE").cast(pl.String).replace_strict(zone_index_map, return_dtype=pl.Int64).alias("ZONE_INDEX"),
+            pl.col("DATE_INDEX"),
+            (pl.col("NUM_OPEN") / reals_divisor).alias("OPEN"),
+            (pl.col("NUM_SHUT") / reals_divisor).alias("SHUT"),
+            pl.col("KH_MEAN", "KH_MIN", "KH_MAX").fill_null(0.0).round(2),
+        )
+        .sort(["WELL", "ZONE_INDEX", "DATE_INDEX"])
+    )
+
+
+def create_wells_from_aggregated_completions_df(
+    aggregated_df: pl.DataFrame, well_attributes: dict[str, dict[str, WellCompletionsAttributeType]]
+) -> list[WellCompletionsWell]:
+    """
+    Convert the output of create_aggregated_completions_lazy_frame() into well objects.
+
+    Each column is converted to a Python list once, and the completions of each (well, zone) pair are slices of
+    those lists.
+    """
+    if aggregated_df.height == 0:
+        return []
+
+    is_well_start = aggregated_df["WELL"].ne_missing(aggregated_df["WELL"].shift(1)).to_numpy()
+    is_zone_start = aggregated_df["ZONE_INDEX"].ne_missing(aggregated_df["ZONE_INDEX"].shift(1)).to_numpy()
+    range_starts = np.flatnonzero(is_well_start | is_zone_start).tolist()
+    range_ends = range_starts[1:] + [aggregated_df.height]
+
+    well_names: list[str] = aggregated_df["WELL"].to_list()
+    zone_names: list[str] = aggregated_df["ZONE"].to_list()
+    date_indices: list[int] = aggregated_df["DATE_INDEX"].to_list()
+    open_values: list[float] = aggregated_df["OPEN"].to_list()
+    shut_values: list[float] = aggregated_df["SHUT"].to_list()
+    kh_mean_values: list[float] = aggregated_df["KH_MEAN"].to_list()
+    kh_min_values: list[float] = aggregated_df["KH_MIN"].to_list()
+    kh_max_values: list[float] = aggregated_df["KH_MAX"].to_list()
+
+    completions_per_well: dict[str, dict[str, Completions]] = {}
+    for start, end in zip(range_starts, range_ends):
+        well_completions = completions_per_well.setdefault(well_names[start], {})
+        well_completions[zone_names[start]] = Completions(
+            sorted_completion_date_indices=date_indices[start:end],
+            open=open_values[start:end],
+            shut=shut_values[start:end],
+            kh_mean=kh_mean_values[start:end],
+            kh_min=kh_min_values[start:end],
+            kh_max=kh_max_values[start:end],
+        )
+
+    return [
+        WellCompletionsWell(name=well_name, attributes=well_attributes.get(well_name, {}), completions=completions)
+        for well_name, completions in completions_per_well.items()
+    ]
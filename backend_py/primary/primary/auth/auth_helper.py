@@ -2,57 +2,30 @@ import base64
 import logging
 import os
 import time
-from typing import Literal, Optional, TypeAlias, get_args
+from typing import Optional, get_args
 
 import jwt
 import msal
 import starsessions
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import RedirectResponse
-from pydantic import BaseModel, ValidationError
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary import config
 
-LOGGER = logging.getLogger(__name__)
-
-# Alias for the literal that lists the resource names we use
-_ResourceName: TypeAlias = Literal["graph", "sumo", "smda", "ssdl", "pdm"]
-
-
-class _TokenEntry(BaseModel):
-    token: str
-    expires_at: int  # Unix timestamp, seconds since epoch UTC
-
-
-class _UserAuthInfo(BaseModel):
-    user_id: str
-    user_name: str
-    user_identity_expires_at: int  # Unix timestamp when the user identity above (extracted from ID token) expires
-    access_tokens: dict[_ResourceName, _TokenEntry]
-    earliest_expiry_time: int  # Earliest expiry time for the user info and of all tokens
-
-    def to_authenticated_user(self) -> AuthenticatedUser:
-        graph_token_entry = self.access_tokens.get("graph")
-        sumo_token_entry = self.access_tokens.get("sumo")
-        smda_token_entry = self.access_tokens.get("smda")
-        ssdl_token_entry = self.access_tokens.get("ssdl")
-        pdm_token_entry = self.access_tokens.get("pdm")
-
-        authenticated_user_obj = AuthenticatedUser(
-            user_id=self.user_id,
-            username=self.user_name,
-            access_tokens={
-                "graph_access_token": graph_token_entry.token if graph_token_entry else None,
-                "sumo_access_token": sumo_token_entry.token if sumo_token_entry else None,
-                "smda_access_token": smda_token_entry.token if smda_token_entry else None,
-                "ssdl_access_token": ssdl_token_entry.token if ssdl_token_entry else None,
-                "pdm_access_token": pdm_token_entry.token if pdm_token_entry else None,
-            },
-        )
+from .user_auth_info import (
+    ResourceName,
+    TokenEntry,
+    UserAuthInfo,
+    get_authenticated_user_from_request_state,
+    load_user_auth_info_from_session,
+    refresh_user_auth_info_async,
+    save_user_auth_info_in_session,
+    store_authenticated_user_in_request_state,
+)
 
-        return authenticated_user_obj
+LOGGER = logging.getLogger(__name__)
 
 
 class AuthHelper:
@@ -126,23 +99,20 @@ class AuthHelper:
         return Response("Login OK")
 
     @staticmethod
-    def get_authenticated_user(request_with_session: Request) -> Optional[AuthenticatedUser]:
-        perf_metrics = PerfMetrics()
+    # pylint: disable-next=async-suffix
+    async def get_authenticated_user(request_with_session: Request) -> Optional[AuthenticatedUser]:
+        # For protected paths the EnforceLoggedInMiddleware has already resolved the user for this request, if so we
+        # can just return it.
+        maybe_authenticated_user_obj = get_authenticated_user_from_request_state(request_with_session)
+        if maybe_authenticated_user_obj is not None:
+            return maybe_authenticated_user_obj
 
-        # We may already have created and stored the AuthenticatedUser object in the request's state
-        # one a previous call to this function. If so, we can just return it.
-        try:
-            maybe_authenticated_user_obj = request_with_session.state.authenticated_user_obj
-            if maybe_authenticated_user_obj and isinstance(maybe_authenticated_user_obj, AuthenticatedUser):
-                LOGGER.debug("get_authenticated_user() found cached AuthenticatedUser object in request's state")
-                return maybe_authenticated_user_obj
-        except:  # nosec # pylint: disable=bare-except
-            pass
+        perf_metrics = PerfMetrics()
 
         if not starsessions.is_loaded(request_with_session):
             raise ValueError("Session data has not been loaded for this request")
 
-        user_auth_info_from_session: _UserAuthInfo | None = _load_user_auth_info_from_session(request_with_session)
+        user_auth_info_from_session: UserAuthInfo | None = load_user_auth_info_from_session(request_with_session)
         perf_metrics.record_lap("load-user-auth-info")
         if user_auth_info_from_session:
             first_item_expires_in = user_auth_info_from_session.earliest_expiry_time - time.time()
@@ -150,7 +120,7 @@ class AuthHelper:
                 authenticated_user = user_auth_info_from_session.to_authenticated_user()
 
                 # Store/cache the AuthenticatedUser object in the request's state
-                request_with_session.state.authenticated_user_obj = authenticated_user
+                store_authenticated_user_in_request_state(request_with_session, authenticated_user)
 
                 LOGGER.debug(
                     f"get_authenticated_user() got user auth info (valid for {first_item_expires_in:.0f}s) from session in: {perf_metrics.to_string()}"
@@ -163,24 +133,24 @@ class AuthHelper:
             return None
         perf_metrics.record_lap("load-token-cache")
 
-        new_user_auth_info: _UserAuthInfo | None = _acquire_refreshed_identity_and_tokens(
-            token_cache, user_auth_info_from_session
+        refresh_result = await refresh_user_auth_info_async(
+            token_cache, user_auth_info_from_session, _acquire_refreshed_identity_and_tokens
         )
-        if not new_user_auth_info:
+        if not refresh_result:
             return None
         perf_metrics.record_lap("refresh-user-auth-info")
 
-        _save_user_auth_info_in_session(request_with_session, new_user_auth_info)
-        perf_metrics.record_lap("save-user-auth-info")
-
-        _save_token_cache_in_session(request_with_session, token_cache)
-        perf_metrics.record_lap("save-token-cache")
+        save_user_auth_info_in_session(request_with_session, refresh_result.user_auth_info)
+        serialized_token_cache = refresh_result.get_serialized_token_cache_for(token_cache)
+        if serialized_token_cache is not None:
+            request_with_session.session["token_cache"] = serialized_token_cache
+        perf_metrics.record_lap("save-session")
 
-        authenticated_user = new_user_auth_info.to_authenticated_user()
+        authenticated_user = refresh_result.user_auth_info.to_authenticated_user()
 
         # Attach the newly created AuthenticatedUser object to the request's state so that we can avoid going to the
         # session store if this function is called multiple times during the processing of a single request.
-        request_with_session.state.authenticated_user_obj = authenticated_user
+        store_authenticated_user_in_request_state(request_with_session, authenticated_user)
 
         LOGGER.debug(f"get_authenticated_user() create/refresh took: {perf_metrics.to_string()}")
 
@@ -188,8 +158,8 @@ class AuthHelper:
 
 
 def _acquire_access_token_for_resource_scopes(
-    cca: msal.ConfidentialClientApplication, resource_name: _ResourceName, account: str
-) -> _TokenEntry | None:
+    cca: msal.ConfidentialClientApplication, resource_name: ResourceName, account: str
+) -> TokenEntry | None:
     scopes_list: list[str] | None = None
     if resource_name == "graph":
         scopes_list = config.GRAPH_SCOPES
@@ -212,12 +182,12 @@ def _acquire_access_token_for_resource_scopes(
         LOGGER.error(f"Error getting expiration time claim (exp) from access token ({resource_name=})")
         return None
 
-    return _TokenEntry(token=access_token, expires_at=expires_at)
+    return TokenEntry(token=access_token, expires_at=expires_at)
 
 
 def _acquire_refreshed_identity_and_tokens(
-    token_cache: msal.TokenCache, curr_auth_info: _UserAuthInfo | None
-) -> _UserAuthInfo | None:
+    token_cache: msal.TokenCache, curr_auth_info: UserAuthInfo | None
+) -> UserAuthInfo | None:
     """
     This function will return up to date information on the user's identity as well as valid access tokens.
 
@@ -279,7 +249,7 @@ def _acquire_refreshed_identity_and_tokens(
     # So we have the identity of an authenticated user
     # This is the minimum requirement for returning info on the user so we can create the new object now.
     # We'll then continue to populate it with access tokens further down.
-    new_auth_info = _UserAuthInfo(
+    new_auth_info = UserAuthInfo(
         user_id=user_id,
         user_name=user_name,
         user_identity_expires_at=id_token_expiry_time,
@@ -288,14 +258,14 @@ def _acquire_refreshed_identity_and_tokens(
     )
 
     # Iterate over the resource names and get the access tokens for each of them
-    resource_name: _ResourceName
-    for resource_name in get_args(_ResourceName):
+    resource_name: ResourceName
+    for resource_name in get_args(ResourceName):
         token_entry = _acquire_access_token_for_resource_scopes(cca, resource_name, account)
         if token_entry:
             new_auth_info.access_tokens[resource_name] = token_entry
 
     # Determine the earliest expiry time of all the tokens and the identity and store it so we can use it to
-    # easily check if any of the items in the _UserAuthInfo object needs to be refreshed/updated
+    # easily check if any of the items in the UserAuthInfo object needs to be refreshed/updated
     earliest_expiry_time = new_auth_info.user_identity_expires_at
     for token_entry in new_auth_info.access_tokens.values():
         earliest_expiry_time = min(earliest_expiry_time, token_entry.expires_at)
@@ -320,23 +290,6 @@ def _create_msal_confidential_client_app(token_cache: msal.TokenCache) -> msal.C
     )
 
 
-def _load_user_auth_info_from_session(request_with_session: Request) -> _UserAuthInfo | None:
-    serialized_user_auth_info = request_with_session.session.get("user_auth_info")
-    if not serialized_user_auth_info:
-        return None
-
-    try:
-        user_auth_info = _UserAuthInfo.model_validate_json(serialized_user_auth_info)
-    except ValidationError as _exc:
-        return None
-
-    return user_auth_info
-
-
-def _save_user_auth_info_in_session(request_with_session: Request, user_auth_info: _UserAuthInfo) -> None:
-    request_with_session.session["user_auth_info"] = user_auth_info.model_dump_json()
-
-
 def _load_token_cache_from_session(request_with_session: Request) -> msal.SerializableTokenCache:
     token_cache = msal.SerializableTokenCache()
 
@@ -57,7 +57,7 @@ class EnforceLoggedInMiddleware:
             await starsessions.load_session(request)
             perf_metrics.record_lap("load-session")
 
-            authenticated_user = AuthHelper.get_authenticated_user(request)
+            authenticated_user = await AuthHelper.get_authenticated_user(request)
             perf_metrics.record_lap("get-auth-user")
 
             is_logged_in = authenticated_user is not None
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Literal, TypeAlias
+
+import msal
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+from webviz_core_utils.single_flight import SingleFlight
+from webviz_core_utils.ttl_cache import TtlCache
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+LOGGER = logging.getLogger(__name__)
+
+# Alias for the literal that lists the resource names we use
+ResourceName: TypeAlias = Literal["graph", "sumo", "smda", "ssdl", "pdm"]
+
+
+class TokenEntry(BaseModel):
+    token: str
+    expires_at: int  # Unix timestamp, seconds since epoch UTC
+
+
+class UserAuthInfo(BaseModel):
+    user_id: str
+    user_name: str
+    user_identity_expires_at: int  # Unix timestamp when the user identity above (extracted from ID token) expires
+    access_tokens: dict[ResourceName, TokenEntry]
+    earliest_expiry_time: int  # Earliest expiry time for the user info and of all tokens
+
+    def to_authenticated_user(self) -> AuthenticatedUser:
+        graph_token_entry = self.access_tokens.get("graph")
+        sumo_token_entry = self.access_tokens.get("sumo")
+        smda_token_entry = self.access_tokens.get("smda")
+        ssdl_token_entry = self.access_tokens.get("ssdl")
+        pdm_token_entry = self.access_tokens.get("pdm")
+
+        authenticated_user_obj = AuthenticatedUser(
+            user_id=self.user_id,
+            username=self.user_name,
+            access_tokens={
+                "graph_access_token": graph_token_entry.token if graph_token_entry else None,
+                "sumo_access_token": sumo_token_entry.token if sumo_token_entry else None,
+                "smda_access_token": smda_token_entry.token if smda_token_entry else None,
+                "ssdl_access_token": ssdl_token_entry.token if ssdl_token_entry else None,
+                "pdm_access_token": pdm_token_entry.token if pdm_token_entry else None,
+            },
+        )
+
+        return authenticated_user_obj
+
+
+@dataclass(frozen=True)
+class RefreshResult:
+    # Key of the account in the token cache that was refreshed, see get_account_key()
+    account_key: str | None
+    user_auth_info: UserAuthInfo
+    # The serialized msal token cache after the refresh, None if the refresh did not change it
+    serialized_token_cache: str | None
+
+    def get_serialized_token_cache_for(self, token_cache: msal.SerializableTokenCache) -> str | None:
+        """
+        Get the serialized token cache to store in place of token_cache, None if there is nothing to store.
+
+        The refresh may have been shared with concurrent requests using other token caches, so the resulting token
+        cache is only returned if it belongs to the same account as token_cache.
+        """
+        if self.serialized_token_cache is None or self.account_key is None:
+            return None
+        if get_account_key(token_cache) != self.account_key:
+            return None
+
+        return self.serialized_token_cache
+
+
+# Blocking function that acquires up to date user auth info using the given token cache and current user auth info
+AcquireUserAuthInfoFunc: TypeAlias = Callable[[msal.SerializableTokenCache, UserAuthInfo | None], UserAuthInfo | None]
+
+# Refreshes of user identity and tokens that are in progress in this process, keyed by the account in the token cache.
+# Concurrent requests for the same account share one refresh instead of each hitting the identity provider.
+_IN_FLIGHT_REFRESHES: SingleFlight[str, RefreshResult | None] = SingleFlight()
+
+# Parsed user auth info, keyed by its serialized form as stored in the session.
+# The serialized user auth info only changes when it is refreshed, so for most requests it can be validated with a
+# lookup in this cache instead of being parsed. The session is encrypted and authenticated by the session store, so
+# the serialized value can be trusted as is.
+_USER_AUTH_INFO_CACHE: TtlCache[str, UserAuthInfo] = TtlCache(max_entries=1000, ttl_s=10 * 60)
+
+
+async def refresh_user_auth_info_async(
+    token_cache: msal.SerializableTokenCache,
+    curr_auth_info: UserAuthInfo | None,
+    acquire_user_auth_info: AcquireUserAuthInfoFunc,
+) -> RefreshResult | None:
+    """
+    Refresh the user's identity and access tokens without blocking the event loop.
+
+    acquire_user_auth_info() does blocking network requests to the identity provider, so it is run in a worker
+    thread. Concurrent refreshes for the same account share the first one's result, see
+    RefreshResult.get_serialized_token_cache_for() for storing the resulting token cache.
+    """
+    account_key = get_account_key(token_cache)
+    if account_key is None:
+        return await asyncio.to_thread(_refresh_user_auth_info, token_cache, curr_auth_info, acquire_user_auth_info)
+
+    if _IN_FLIGHT_REFRESHES.is_in_flight(account_key):
+        LOGGER.debug("Waiting for refresh of user auth info that is already in progress")
+
+    return await _IN_FLIGHT_REFRESHES.run_async(
+        account_key,
+        lambda: asyncio.to_thread(_refresh_user_auth_info, token_cache, curr_auth_info, acquire_user_auth_info),
+    )
+
+
+def _refresh_user_auth_info(
+    token_cache: msal.SerializableTokenCache,
+    curr_auth_info: UserAuthInfo | None,
+    acquire_user_auth_info: AcquireUserAuthInfoFunc,
+) -> RefreshResult | None:
+    new_auth_info = acquire_user_auth_info(token_cache, curr_auth_info)
+    if not new_auth_info:
+        return None
+
+    # Only pass on the token cache if msal actually changed it, so that we don't rewrite it in the session needlessly
+    serialized_token_cache = token_cache.serialize() if token_cache.has_state_changed else None
+    return RefreshResult(
+        account_key=get_account_key(token_cache),
+        user_auth_info=new_auth_info,
+        serialized_token_cache=serialized_token_cache,
+    )
+
+
+def get_account_key(token_cache: msal.SerializableTokenCache) -> str | None:
+    account = next(token_cache.search(msal.TokenCache.CredentialType.ACCOUNT), None)
+    if account is None:
+        return None
+
+    return account.get("home_account_id")
+
+
+def load_user_auth_info_from_session(request_with_session: Request) -> UserAuthInfo | None:
+    serialized_user_auth_info = request_with_session.session.get("user_auth_info")
+    if not serialized_user_auth_info:
+        return None
+
+    user_auth_info = _USER_AUTH_INFO_CACHE.get(serialized_user_auth_info)
+    if user_auth_info is not None:
+        return user_auth_info
+
+    try:
+        user_auth_info = UserAuthInfo.model_validate_json(serialized_user_auth_info)
+    except ValidationError as _exc:
+        return None
+
+    _USER_AUTH_INFO_CACHE.set(serialized_user_auth_info, user_auth_info)
+    return user_auth_info
+
+
+def save_user_auth_info_in_session(request_with_session: Request, user_auth_info: UserAuthInfo) -> None:
+    serialized_user_auth_info = user_auth_info.model_dump_json()
+    request_with_session.session["user_auth_info"] = serialized_user_auth_info
+    _USER_AUTH_INFO_CACHE.set(serialized_user_auth_info, user_auth_info)
+
+
+def get_authenticated_user_from_request_state(request: Request) -> AuthenticatedUser | None:
+    """
+    Get the authenticated user already resolved for this request, see store_authenticated_user_in_request_state().
+    """
+    maybe_authenticated_user_obj = getattr(request.state, "authenticated_user_obj", None)
+    if isinstance(maybe_authenticated_user_obj, AuthenticatedUser):
+        return maybe_authenticated_user_obj
+
+    return None
+
+
+def store_authenticated_user_in_request_state(request: Request, authenticated_user: AuthenticatedUser) -> None:
+    """
+    Store the authenticated user in the request's state. The state lives in the ASGI scope and is therefore shared
+    with the Request objects that FastAPI creates for the endpoint dependencies, so the user is only resolved once
+    per request.
+    """
+    request.state.authenticated_user_obj = authenticated_user
@@ -11,7 +11,11 @@ from starsessions import SessionMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from webviz_services.services_config import ServicesConfig, init_services_config
+from webviz_services.smda_access.smda_field_cache import SmdaFieldCacheFactory
+from webviz_services.ssdl_access.ssdl_field_cache import SsdlFieldCacheFactory
+from webviz_services.sumo_access.sumo_case_index import SumoCaseIndexFactory
 from webviz_services.sumo_access.sumo_fingerprinter import SumoFingerprinterFactory
+from webviz_services.sumo_access.sumo_fingerprint_warmer import SumoFingerprintWarmer
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
 from webviz_services.utils.task_meta_tracker import TaskMetaTrackerFactory
 
@@ -113,11 +117,17 @@ async def lifespan_handler_async(_fastapi_app: FastAPI) -> AsyncIterator[None]:
         )
 
     TaskMetaTrackerFactory.initialize(redis_url=config.REDIS_CACHE_URL)
-    SumoFingerprinterFactory.initialize(redis_url=config.REDIS_CACHE_URL)
+    fingerprint_warmer = SumoFingerprintWarmer.initialize()
+    fingerprint_warmer.start()
+    SumoFingerprinterFactory.initialize(redis_url=config.REDIS_CACHE_URL, warmer=fingerprint_warmer)
+    SumoCaseIndexFactory.initialize(redis_url=config.REDIS_CACHE_URL)
+    SmdaFieldCacheFactory.initialize(redis_url=config.REDIS_CACHE_URL)
+    SsdlFieldCacheFactory.initialize(redis_url=config.REDIS_CACHE_URL)
 
     # This part, after the yield, will be executed after the application has finished.
     yield
 
+    await fingerprint_warmer.stop_async()
     await PersistenceStoresSingleton.shutdown_async()
     if not config.COSMOS_DB_EMULATOR_HOST:
         await azure_services_credential.close()
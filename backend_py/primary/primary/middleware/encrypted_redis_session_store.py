@@ -1,26 +1,52 @@
+import hashlib
+import json
 import logging
 import typing
+from dataclasses import dataclass, replace
 
 from cryptography.fernet import Fernet, InvalidToken
 
 from redis.asyncio.client import Redis
 from starsessions.stores.base import SessionStore
 from starsessions.stores.redis import RedisStore
+from webviz_core_utils.ttl_cache import TtlCache
 
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _CachedSession:
+    # Hash of the encrypted payload as stored in Redis
+    payload_hash: bytes
+    # The decrypted, serialized session
+    data: bytes
+    # The deserialized session without volatile fields, used to detect unchanged sessions on write
+    content: dict | None
+    # Whether the Redis expiry of the session has been set by this process since the entry was cached
+    is_expiry_fresh: bool
+
+
 class EncryptedRedisSessionStore(SessionStore):
     """A Redis-backed SessionStore with Fernet encryption.
 
     This class is a thin wrapper around starsessions.RedisStore that adds encryption.
     New fernet keys can be generated using: Fernet.generate_key()
 
+    Decrypted sessions are cached in-process for a short while, keyed by session id and the hash of the encrypted
+    payload. The payload is still read from Redis on every request, so changes made by other backend instances are
+    always seen, but it is only decrypted when it has changed.
+
+    Writing a session that is unchanged since it was read (apart from the last access time that starsessions updates
+    on every request) is suppressed. Instead of re-encrypting and writing the payload, only the Redis expiry is
+    refreshed, at most once per cache entry.
+
     Args:
         fernet_key: A URL-safe base64-encoded 32-byte Fernet key.
         redis_url: Redis connection URL, e.g. "redis://localhost:6379".
         prefix: Redis key name prefix or callable.
         gc_ttl: TTL (seconds) for sessions with no expiration. Defaults to 30 days.
+        cache_ttl_s: Time-to-live (seconds) of the decrypted sessions in the in-process cache.
+        cache_max_entries: Maximum number of sessions in the in-process cache.
     """
 
     def __init__(
@@ -29,32 +55,102 @@ class EncryptedRedisSessionStore(SessionStore):
         redis_url: str,
         prefix: typing.Callable[[str], str] | str,
         gc_ttl: int = 3600 * 24 * 30,
+        cache_ttl_s: float = 30,
+        cache_max_entries: int = 1000,
     ) -> None:
         if isinstance(fernet_key, str):
             fernet_key = fernet_key.encode()
         self._fernet = Fernet(fernet_key)
 
-        redis_client = Redis.from_url(redis_url)
-        self._store = RedisStore(connection=redis_client, prefix=prefix, gc_ttl=gc_ttl)
+        self._redis_client = Redis.from_url(redis_url)
+        self._store = RedisStore(connection=self._redis_client, prefix=prefix, gc_ttl=gc_ttl)
+
+        self._cache: TtlCache[str, _CachedSession] = TtlCache(max_entries=cache_max_entries, ttl_s=cache_ttl_s)
 
     # pylint: disable-next=async-suffix
     async def read(self, session_id: str, lifetime: int) -> bytes:
         encrypted_payload = await self._store.read(session_id, lifetime)
         if not encrypted_payload:
+            self._cache.invalidate(session_id)
             return b""
 
+        payload_hash = _hash_payload(encrypted_payload)
+        cached = self._cache.get(session_id)
+        if cached is not None and cached.payload_hash == payload_hash:
+            return cached.data
+
         try:
-            return self._fernet.decrypt(encrypted_payload)
+            data = self._fernet.decrypt(encrypted_payload)
         except InvalidToken:
             # Probably either unencrypted session data or key rotation; treat as missing session.
             LOGGER.warning(f"Failed to decrypt data for session_id={session_id[:8]}, treating as missing session.")
+            self._cache.invalidate(session_id)
             return b""
 
+        self._cache.set(
+            session_id,
+            _CachedSession(
+                payload_hash=payload_hash, data=data, content=_get_comparable_content(data), is_expiry_fresh=False
+            ),
+        )
+        return data
+
     # pylint: disable-next=async-suffix
     async def write(self, session_id: str, data: bytes, lifetime: int, ttl: int) -> str:
+        content = _get_comparable_content(data)
+
+        cached = self._cache.get(session_id)
+        if cached is not None and content is not None and cached.content == content:
+            if cached.is_expiry_fresh:
+                return session_id
+
+            # Keep the session alive as a write would have, unless it has been removed in the meantime
+            if await self._redis_client.expire(self._store.prefix(session_id), self._get_redis_ttl(lifetime, ttl)):
+                self._cache.set(session_id, replace(cached, is_expiry_fresh=True))
+                return session_id
+
         encrypted_payload = self._fernet.encrypt(data)
-        return await self._store.write(session_id, encrypted_payload, lifetime, ttl)
+        session_id = await self._store.write(session_id, encrypted_payload, lifetime, ttl)
+
+        self._cache.set(
+            session_id,
+            _CachedSession(
+                payload_hash=_hash_payload(encrypted_payload), data=data, content=content, is_expiry_fresh=True
+            ),
+        )
+        return session_id
 
     # pylint: disable-next=async-suffix
     async def remove(self, session_id: str) -> None:
+        self._cache.invalidate(session_id)
         await self._store.remove(session_id)
+
+    def _get_redis_ttl(self, lifetime: int, ttl: int) -> int:
+        # Same expiry as RedisStore.write() uses
+        if lifetime == 0:
+            ttl = self._store.gc_ttl
+        return max(1, ttl)
+
+
+def _hash_payload(encrypted_payload: bytes) -> bytes:
+    return hashlib.sha256(encrypted_payload).digest()
+
+
+def _get_comparable_content(data: bytes) -> dict | None:
+    """
+    Deserialize a session as written by starsessions' JsonSerializer, leaving out the last access time, which is
+    updated on every request. Returns None if the data cannot be deserialized, in which case it is always written.
+    """
+    try:
+        content = json.loads(data)
+    except ValueError:
+        return None
+
+    if not isinstance(content, dict):
+        return None
+
+    metadata = content.get("__metadata__")
+    if isinstance(metadata, dict):
+        metadata.pop("last_access", None)
+
+    return content
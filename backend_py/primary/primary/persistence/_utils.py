@@ -1,7 +1,11 @@
+import asyncio
+import base64
+import gzip
 import hashlib
 from typing import Any, TypeVar, cast
 
 from azure.core.async_paging import AsyncPageIterator, AsyncItemPaged
+from webviz_services.service_exceptions import Service, ServiceRequestError
 
 T = TypeVar("T")
 
@@ -13,9 +17,58 @@ T = TypeVar("T")
 # It is important that this function returns the same hash as the JavaScript version
 def hash_session_content_string(string: str) -> str:
     data = string.encode("utf-8")  # Matches TextEncoder behavior
-    hash_bytes = hashlib.sha256(data).digest()
-    hash_hex = "".join(f"{b:02x}" for b in hash_bytes)
-    return hash_hex
+    return hashlib.sha256(data).hexdigest()
+
+
+# Session and snapshot content is stored gzip compressed and base64 encoded, prefixed with this marker.
+# Content stored before compression was introduced is plain JSON, and is recognized by the missing marker.
+_COMPRESSED_CONTENT_MARKER = "gzip+b64:"
+
+# CosmosDB has a 2MB document size limit
+# We use 1.5MB for the stored (compressed) content to leave room for metadata and safety margin
+_MAX_CONTENT_SIZE_BYTES = 1.5 * 1024 * 1024  # 1.5MB
+
+# Limit on the uncompressed content, to bound the memory and time spent on compressing it
+_MAX_UNCOMPRESSED_CONTENT_SIZE_BYTES = 32 * 1024 * 1024  # 32MB
+
+
+def compress_content_string(content: str) -> str:
+    compressed_bytes = gzip.compress(content.encode("utf-8"), compresslevel=1, mtime=0)
+    return _COMPRESSED_CONTENT_MARKER + base64.b64encode(compressed_bytes).decode("ascii")
+
+
+def decompress_content_string(stored_content: str) -> str:
+    if not stored_content.startswith(_COMPRESSED_CONTENT_MARKER):
+        return stored_content
+
+    compressed_bytes = base64.b64decode(stored_content[len(_COMPRESSED_CONTENT_MARKER) :])
+    return gzip.decompress(compressed_bytes).decode("utf-8")
+
+
+async def compress_and_validate_content_async(content: str, entity_name: str) -> str:
+    """
+    Compress content for storage, raising an error if it exceeds the size limits.
+
+    The entity name, e.g. "session" or "snapshot", is used in the error messages.
+    """
+    uncompressed_size = len(content.encode("utf-8"))
+    if uncompressed_size > _MAX_UNCOMPRESSED_CONTENT_SIZE_BYTES:
+        raise ServiceRequestError(
+            f"{entity_name.capitalize()} content size ({uncompressed_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_UNCOMPRESSED_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
+            Service.DATABASE,
+        )
+
+    # Compression of large content takes tens of milliseconds, so keep it off the event loop
+    stored_content = await asyncio.to_thread(compress_content_string, content)
+
+    stored_size = len(stored_content)
+    if stored_size > _MAX_CONTENT_SIZE_BYTES:
+        raise ServiceRequestError(
+            f"Compressed {entity_name} content size ({stored_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
+            Service.DATABASE,
+        )
+
+    return stored_content
 
 
 def cast_query_params(params: list[dict[str, Any]]) -> list[dict[str, object]]:
@@ -2,6 +2,7 @@ import logging
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 from azure.cosmos.aio import ContainerProxy
 from azure.cosmos import exceptions
+from azure.core.exceptions import HttpResponseError
 from pydantic import BaseModel, ValidationError
 
 from primary.persistence._utils import query_by_page
@@ -21,6 +22,9 @@ LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Cosmos DB limit on the number of operations in a transactional batch
+MAX_BATCH_OPERATIONS = 100
+
 
 class CosmosContainer(Generic[T]):
     """
@@ -43,7 +47,7 @@ class CosmosContainer(Generic[T]):
         self._container = container
         self._validation_model: Type[T] = validation_model
 
-    def _make_exception(self, op: str, exc: exceptions.CosmosHttpResponseError) -> DatabaseAccessError:
+    def _make_exception(self, op: str, exc: HttpResponseError) -> DatabaseAccessError:
         """Map Cosmos error to a data-access exception with rich context and re-raise."""
         headers = getattr(exc, "headers", {}) or {}
         status = getattr(exc, "status_code", None)
@@ -181,6 +185,66 @@ class CosmosContainer(Generic[T]):
         except exceptions.CosmosHttpResponseError as error:
             raise self._make_exception("patch_item_async", error) from error
 
+    async def patch_and_get_item_async(
+        self,
+        item_id: str,
+        partition_key: str,
+        patch_operations: list[dict],
+        *,
+        filter_predicate: str | None = None,
+    ) -> T:
+        """
+        Patch an item and return it as stored after the patch, without a separate read.
+
+        If a filter predicate is given, the patch is only applied if the item matches it, otherwise
+        DatabaseAccessPreconditionFailedError is raised.
+        """
+        try:
+            item = await self._container.patch_item(
+                item=item_id,
+                partition_key=partition_key,
+                patch_operations=patch_operations,
+                filter_predicate=filter_predicate,
+            )
+            LOGGER.debug("[CosmosContainer] Patched item '%s' in '%s'", item_id, self._container_name)
+            return self._validation_model.model_validate(item)
+        except ValidationError as validation_error:
+            LOGGER.error("[CosmosContainer] Validation error in '%s': %s", self._container_name, validation_error)
+            raise
+        except exceptions.CosmosHttpResponseError as error:
+            raise self._make_exception("patch_and_get_item_async", error) from error
+
+    async def patch_items_in_batch_async(
+        self,
+        partition_key: str,
+        patch_operations_by_item_id: dict[str, list[dict]],
+    ) -> None:
+        """
+        Patch several items sharing the same partition key in a single transactional batch, either all patches are
+        applied or none of them are.
+
+        A batch is limited to MAX_BATCH_OPERATIONS items.
+        """
+        if len(patch_operations_by_item_id) > MAX_BATCH_OPERATIONS:
+            raise ValueError(
+                f"A batch can contain at most {MAX_BATCH_OPERATIONS} operations, got {len(patch_operations_by_item_id)}"
+            )
+
+        batch_operations = [
+            ("patch", (item_id, patch_operations)) for item_id, patch_operations in patch_operations_by_item_id.items()
+        ]
+
+        try:
+            await self._container.execute_item_batch(batch_operations=batch_operations, partition_key=partition_key)
+            LOGGER.debug(
+                "[CosmosContainer] Patched %d items in partition '%s' of '%s'",
+                len(batch_operations),
+                partition_key,
+                self._container_name,
+            )
+        except (exceptions.CosmosBatchOperationError, exceptions.CosmosHttpResponseError) as error:
+            raise self._make_exception("patch_items_in_batch_async", error) from error
+
     async def query_projection_async(
         self,
         query: str,
@@ -198,3 +262,29 @@ class CosmosContainer(Generic[T]):
             return [item async for item in items_iterable]
         except exceptions.CosmosHttpResponseError as error:
             raise self._make_exception("query_projection_async", error) from error
+
+    async def query_projection_by_page_token_async(
+        self,
+        query: str,
+        page_token: str | None,
+        parameters: Optional[List[Dict[str, object]]] = None,
+        page_size: Optional[int] = None,
+    ) -> tuple[List[Dict[str, Any]], str | None]:
+        """
+        Paged version of `query_projection_async`, returning one page of raw dicts and the continuation token for the
+        next page.
+        """
+        try:
+            query_iterable = self._container.query_items(query=query, parameters=parameters, max_item_count=page_size)
+
+            pager = query_by_page(query_iterable, page_token)
+
+            try:
+                page = await anext(pager)
+            except StopAsyncIteration:
+                return ([], None)
+
+            items = [item async for item in page]
+            return (items, pager.continuation_token)
+        except exceptions.CosmosHttpResponseError as error:
+            raise self._make_exception("query_projection_by_page_token_async", error) from error
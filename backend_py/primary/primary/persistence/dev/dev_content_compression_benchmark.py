@@ -0,0 +1,117 @@
+"""
+Benchmark of the compression and hashing of session and snapshot content in primary.persistence._utils.
+
+Runs on synthetic workbench sessions that mimic serialized module state: ensemble and case uuids, realization
+selections, layer settings with random floats and view states. Reports the compression ratio and the time it takes to
+compress and decompress the content, and compares hashing against the previous byte by byte hex encoding.
+
+Run with:
+    python -m primary.persistence.dev.dev_content_compression_benchmark
+"""
+
+import hashlib
+import json
+import math
+import random
+import time
+import uuid
+from typing import Callable
+
+from primary.persistence._utils import compress_content_string, decompress_content_string, hash_session_content_string
+
+MODULE_NAMES = [
+    "MapMatrix",
+    "SubsurfaceMap",
+    "DistributionPlot",
+    "SimulationTimeSeries",
+    "Intersection",
+    "WellLogViewer",
+]
+
+
+def make_synthetic_session_content(num_module_instances: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    case_uuids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(4)]
+
+    def make_ensemble_ident() -> dict:
+        return {"caseUuid": rng.choice(case_uuids), "ensembleName": f"iter-{rng.randint(0, 3)}"}
+
+    def make_layer() -> dict:
+        return {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "type": rng.choice(["ObservedSurface", "RealizationGrid", "DrilledWellTrajectories", "Polygons"]),
+            "visible": rng.random() > 0.2,
+            "settings": {
+                "ensemble": make_ensemble_ident(),
+                "realizations": sorted(rng.sample(range(200), rng.randint(1, 100))),
+                "attribute": rng.choice(["DS_extract_geogrid", "TopVolantis", "BaseVolantis", "FACIES"]),
+                "colorScale": {
+                    "min": rng.uniform(1500, 1700),
+                    "max": rng.uniform(1700, 1900),
+                    "gradient": "Sequential",
+                },
+                "polygon": [
+                    [rng.uniform(456000, 468000), rng.uniform(5926000, 5939000)] for _ in range(rng.randint(0, 80))
+                ],
+            },
+        }
+
+    module_instances = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": rng.choice(MODULE_NAMES),
+            "layout": {"x": rng.random(), "y": rng.random(), "width": rng.random(), "height": rng.random()},
+            "settings": {"layers": [make_layer() for _ in range(rng.randint(1, 12))]},
+            "view": {"camera": {"zoom": rng.uniform(0.5, 10), "target": [rng.uniform(0, 1e6) for _ in range(3)]}},
+        }
+        for _ in range(num_module_instances)
+    ]
+    content = {
+        "activeDashboardId": str(uuid.UUID(int=rng.getrandbits(128))),
+        "dashboards": [{"name": "Dashboard", "moduleInstances": module_instances}],
+        "ensembleSet": [make_ensemble_ident() for _ in range(6)],
+        "settings": {"colorSets": [[f"#{rng.getrandbits(24):06x}" for _ in range(10)] for _ in range(5)]},
+    }
+    return json.dumps(content)
+
+
+def reference_hash_session_content_string(string: str) -> str:
+    """The previous implementation, hex encoding the digest one byte at a time"""
+    hash_bytes = hashlib.sha256(string.encode("utf-8")).digest()
+    return "".join(f"{b:02x}" for b in hash_bytes)
+
+
+def _time_it_ms(func: Callable[[], object], num_runs: int = 5) -> float:
+    best_time_s = math.inf
+    for _ in range(num_runs):
+        start_s = time.perf_counter()
+        func()
+        best_time_s = min(best_time_s, time.perf_counter() - start_s)
+    return best_time_s * 1000
+
+
+def main() -> None:
+    print(
+        f"{'Content':>10} {'Stored':>10} {'Ratio':>6} {'Compress':>10} {'Decompress':>11} {'Hash':>8} {'Hash (ref)':>11}"
+    )
+
+    for num_module_instances in [5, 25, 100, 400]:
+        content = make_synthetic_session_content(num_module_instances)
+        stored_content = compress_content_string(content)
+        assert decompress_content_string(stored_content) == content
+        assert hash_session_content_string(content) == reference_hash_session_content_string(content)
+
+        # pylint: disable=cell-var-from-loop
+        compress_ms = _time_it_ms(lambda: compress_content_string(content))
+        decompress_ms = _time_it_ms(lambda: decompress_content_string(stored_content))
+        hash_ms = _time_it_ms(lambda: hash_session_content_string(content))
+        reference_hash_ms = _time_it_ms(lambda: reference_hash_session_content_string(content))
+
+        print(
+            f"{len(content) / 1024:8.0f}KB {len(stored_content) / 1024:8.0f}KB {len(content) / len(stored_content):6.2f} "
+            f"{compress_ms:8.1f}ms {decompress_ms:9.1f}ms {hash_ms:6.2f}ms {reference_hash_ms:9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Benchmark of session autosave, comparing the patch based SessionStore.update_async() against the previous
+read-modify-write implementation (kept below as a reference).
+
+Runs against an in-memory container that simulates the network cost of each Cosmos request, as a fixed round trip
+latency plus the time it takes to transfer the request and response bodies.
+
+Run with:
+    python -m primary.persistence.dev.dev_session_autosave_benchmark [content_mb] [num_sessions] [saves_per_session]
+"""
+
+import asyncio
+import copy
+import json
+import sys
+import time
+from datetime import datetime, timezone
+
+from primary.persistence._utils import hash_session_content_string
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.session_store.documents import SessionDocument, SessionMetadata
+from primary.persistence.session_store.session_store import SessionStore
+
+ROUND_TRIP_S = 0.005
+BANDWIDTH_BYTES_PER_S = 50 * 1024 * 1024
+
+
+class SimulatedContainerProxy:
+    def __init__(self) -> None:
+        self.documents: dict[tuple[str, str], dict] = {}
+        self.num_requests = 0
+        self.num_transferred_bytes = 0
+
+    # Mirrors the ContainerProxy method names
+    # pylint: disable=async-suffix
+
+    async def read_item(self, item: str, partition_key: str) -> dict:
+        document = self.documents[(item, partition_key)]
+        await self._simulate_request_async(None, document)
+        return copy.deepcopy(document)
+
+    async def replace_item(self, item: str, body: dict) -> dict:
+        self.documents[(item, body["owner_id"])] = copy.deepcopy(body)
+        await self._simulate_request_async(body, body)
+        return body
+
+    async def patch_item(
+        self, item: str, partition_key: str, patch_operations: list[dict], filter_predicate: str | None = None
+    ) -> dict:
+        # Conditional patches always match here, the predicate only adds to the request size
+        document = self.documents[(item, partition_key)]
+        for operation in patch_operations:
+            *parent_keys, key = operation["path"].strip("/").split("/")
+            parent = document
+            for parent_key in parent_keys:
+                parent = parent[parent_key]
+            parent[key] = parent[key] + operation["value"] if operation["op"] == "incr" else operation["value"]
+
+        await self._simulate_request_async({"operations": patch_operations, "condition": filter_predicate}, document)
+        return copy.deepcopy(document)
+
+    async def _simulate_request_async(self, request_body: dict | None, response_body: dict) -> None:
+        num_bytes = _estimate_json_size(response_body)
+        if request_body is not None:
+            num_bytes += _estimate_json_size(request_body)
+
+        self.num_requests += 1
+        self.num_transferred_bytes += num_bytes
+        await asyncio.sleep(ROUND_TRIP_S + num_bytes / BANDWIDTH_BYTES_PER_S)
+
+
+def _estimate_json_size(value: object) -> int:
+    # Cheaper than serializing, which would otherwise dominate the benchmark
+    if isinstance(value, dict):
+        return sum(_estimate_json_size(key) + _estimate_json_size(item) for key, item in value.items())
+    if isinstance(value, list):
+        return sum(_estimate_json_size(item) for item in value)
+    if isinstance(value, str):
+        return len(value) + 2
+    return len(str(value))
+
+
+async def reference_update_async(
+    container: CosmosContainer[SessionDocument], user_id: str, session_id: str, content: str
+) -> SessionDocument:
+    """The previous implementation: read the full document, modify it and replace it"""
+    existing = await container.get_item_async(item_id=session_id, partition_key=user_id)
+
+    updated_session = existing.model_copy()
+    updated_session.metadata.updated_at = datetime.now(timezone.utc)
+    updated_session.metadata.version = existing.metadata.version + 1
+    updated_session.content = content
+    updated_session.metadata.content_hash = hash_session_content_string(content)
+
+    await container.update_item_async(session_id, updated_session)
+    return updated_session
+
+
+def make_session_content(content_mb: float, revision: int) -> str:
+    # Mimic serialized module state, many small JSON objects
+    num_items = int(content_mb * 1024 * 1024 / 75)
+    items = [
+        {"id": f"item-{i}", "revision": revision, "value": i * 0.5, "label": f"label {i % 97}"}
+        for i in range(num_items)
+    ]
+    return json.dumps({"modules": items})
+
+
+def create_sessions(proxy: SimulatedContainerProxy, num_sessions: int, content: str) -> None:
+    now = datetime.now(timezone.utc)
+    for i in range(num_sessions):
+        metadata = SessionMetadata(
+            title=f"Session {i}",
+            description=None,
+            created_at=now,
+            updated_at=now,
+            content_hash=hash_session_content_string(content),
+            version=1,
+        )
+        document = SessionDocument(id=f"session-{i}", owner_id=f"user-{i}", metadata=metadata, content=content)
+        proxy.documents[(document.id, document.owner_id)] = document.model_dump(by_alias=True, mode="json")
+
+
+async def run_autosaves_async(
+    num_sessions: int, saves_per_session: int, contents: list[str], use_reference: bool
+) -> SimulatedContainerProxy:
+    proxy = SimulatedContainerProxy()
+    create_sessions(proxy, num_sessions, contents[0])
+    container = CosmosContainer("persistence", "sessions", proxy, SessionDocument)  # type: ignore[arg-type]
+
+    async def autosave_session_async(session_index: int) -> None:
+        user_id = f"user-{session_index}"
+        session_id = f"session-{session_index}"
+        store = SessionStore(user_id, container)
+        for save_index in range(saves_per_session):
+            content = contents[(save_index + 1) % len(contents)]
+            if use_reference:
+                await reference_update_async(container, user_id, session_id, content)
+            else:
+                await store.update_async(session_id, content=content, expected_version=save_index + 1)
+
+    await asyncio.gather(*[autosave_session_async(i) for i in range(num_sessions)])
+    return proxy
+
+
+def main() -> None:
+    content_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    num_sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    saves_per_session = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    contents = [make_session_content(content_mb, revision) for revision in range(2)]
+    num_saves = num_sessions * saves_per_session
+    print(
+        f"Autosave of {num_sessions} sessions with {len(contents[0]) / (1024 * 1024):.2f} MB content, {num_saves} saves"
+    )
+    print(
+        f"Simulated network: {ROUND_TRIP_S * 1000:.0f} ms round trip, {BANDWIDTH_BYTES_PER_S / (1024 * 1024):.0f} MB/s"
+    )
+
+    for label, use_reference in [("Read-modify-write (reference)", True), ("Patch", False)]:
+        start_s = time.perf_counter()
+        proxy = asyncio.run(run_autosaves_async(num_sessions, saves_per_session, contents, use_reference))
+        elapsed_s = time.perf_counter() - start_s
+
+        print(
+            f"{label:30} {num_saves / elapsed_s:7.1f} saves/s  "
+            f"{proxy.num_requests / num_saves:.1f} requests/save  "
+            f"{proxy.num_transferred_bytes / num_saves / (1024 * 1024):.2f} MB transferred/save"
+        )
+
+
+if __name__ == "__main__":
+    main()
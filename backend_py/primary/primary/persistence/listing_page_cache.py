@@ -0,0 +1,67 @@
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from webviz_core_utils.ttl_cache import TtlCache
+
+T = TypeVar("T")
+
+# A page of listing results, and the continuation token for the next page
+Page = Tuple[List[T], Optional[str]]
+
+
+class PersistenceListing(str, Enum):
+    SESSIONS = "sessions"
+    SNAPSHOTS = "snapshots"
+    SNAPSHOT_ACCESS_LOGS = "snapshot_access_logs"
+
+
+# (user_id, listing, (listing generation, user generation), query, params, page_size, page_token)
+_PageKey = Tuple[str, PersistenceListing, Tuple[int, int], str, Tuple[Tuple[str, Any], ...], int, Optional[str]]
+
+
+class ListingPageCache:
+    """
+    Short-lived in-process cache of listing query pages, per user and listing.
+
+    Pages are keyed by the query (which holds the filters and sorting), the query parameters, the page size and the
+    continuation token, so paging back and forth and re-opening a listing is served from memory. The stores
+    invalidate the listings of a user whenever they change the documents behind them.
+
+    Each invalidation bumps a generation counter that is part of the key, which ensures that a query that was in
+    flight during the invalidation does not populate the cache with a stale page.
+
+    Changes made by other backend instances are not seen until the entries expire, so the time-to-live is kept short.
+    """
+
+    def __init__(self, max_entries: int = 2000, ttl_s: float = 30) -> None:
+        self._pages: TtlCache[_PageKey, Page[Any]] = TtlCache(max_entries=max_entries, ttl_s=ttl_s)
+        self._listing_generations: Dict[PersistenceListing, int] = {}
+        self._user_generations: Dict[Tuple[str, PersistenceListing], int] = {}
+
+    async def get_or_query_page_async(
+        self,
+        user_id: str,
+        listing: PersistenceListing,
+        query: str,
+        parameters: List[Dict[str, object]],
+        page_size: int,
+        page_token: Optional[str],
+        query_page_async: Callable[[], Awaitable[Page[T]]],
+    ) -> Page[T]:
+        generation = (self._listing_generations.get(listing, 0), self._user_generations.get((user_id, listing), 0))
+        params_key = tuple((str(param["name"]), param["value"]) for param in parameters)
+        key: _PageKey = (user_id, listing, generation, query, params_key, page_size, page_token)
+
+        items, next_page_token = await self._pages.get_or_compute_async(key, query_page_async)
+
+        # Hand out a copy of the list, so that callers cannot modify the cached page
+        return list(items), next_page_token
+
+    def invalidate(self, user_id: str, listing: PersistenceListing) -> None:
+        generation_key = (user_id, listing)
+        self._user_generations[generation_key] = self._user_generations.get(generation_key, 0) + 1
+        self._pages.invalidate_matching(lambda key: key[0] == user_id and key[1] == listing)
+
+    def invalidate_for_all_users(self, listing: PersistenceListing) -> None:
+        self._listing_generations[listing] = self._listing_generations.get(listing, 0) + 1
+        self._pages.invalidate_matching(lambda key: key[1] == listing)
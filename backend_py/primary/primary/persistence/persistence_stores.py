@@ -8,6 +8,7 @@ from azure.cosmos.aio import CosmosClient, ContainerProxy, DatabaseProxy
 from azure.cosmos.exceptions import CosmosHttpResponseError
 
 from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.listing_page_cache import ListingPageCache
 from primary.persistence.session_store import SessionStore, SessionDocument
 from primary.persistence.setup_local_database import maybe_setup_local_database
 from primary.persistence.snapshot_store import (
@@ -15,7 +16,9 @@ from primary.persistence.snapshot_store import (
     SnapshotDocument,
     SnapshotAccessLogStore,
     SnapshotAccessLogDocument,
+    SnapshotVisitBuffer,
 )
+from primary.persistence.snapshot_store.snapshot_visit_buffer import PendingSnapshotVisits
 
 LOGGER = logging.getLogger(__name__)
 
@@ -39,9 +42,25 @@ class PersistenceStores:
         self._container_proxies: Dict[Tuple[str, str], ContainerProxy] = {}
         self._containers: Dict[Tuple[str, str, Type[BaseModel]], CosmosContainer] = {}
 
+        self._listing_page_cache = ListingPageCache()
+
+        self._snapshot_visit_buffer = SnapshotVisitBuffer(apply_visits_async=self._apply_snapshot_visits_async)
+        self._snapshot_visit_buffer.start()
+
     async def _close_async(self) -> None:
+        # Flush buffered visits while the client is still open
+        await self._snapshot_visit_buffer.stop_async()
         await self._client.close()
 
+    async def _apply_snapshot_visits_async(
+        self, visitor_id: str, snapshot_id: str, pending_visits: PendingSnapshotVisits
+    ) -> None:
+        log_store = self.get_snapshot_access_log_store_for_user(visitor_id)
+        await log_store.apply_visits_async(snapshot_id, pending_visits)
+
+    def get_listing_page_cache(self) -> ListingPageCache:
+        return self._listing_page_cache
+
     def _get_database_proxy(self, database_name: str) -> DatabaseProxy:
         if database_name not in self._db_proxies:
             self._db_proxies[database_name] = self._client.get_database_client(database_name)
@@ -63,15 +82,21 @@ class PersistenceStores:
 
     def get_session_store_for_user(self, user_id: str) -> SessionStore:
         container = self.get_container("persistence", "sessions", SessionDocument)
-        return SessionStore(user_id, container)
+        return SessionStore(user_id, container, listing_page_cache=self._listing_page_cache)
 
     def get_snapshot_store_for_user(self, user_id: str) -> SnapshotStore:
         container = self.get_container("persistence", "snapshots", SnapshotDocument)
-        return SnapshotStore(user_id, container)
+        return SnapshotStore(user_id, container, listing_page_cache=self._listing_page_cache)
 
     def get_snapshot_access_log_store_for_user(self, user_id: str) -> SnapshotAccessLogStore:
         container = self.get_container("persistence", "snapshot_access_logs", SnapshotAccessLogDocument)
-        return SnapshotAccessLogStore(user_id, container, snapshot_store_factory=self.get_snapshot_store_for_user)
+        return SnapshotAccessLogStore(
+            user_id,
+            container,
+            snapshot_store_factory=self.get_snapshot_store_for_user,
+            visit_buffer=self._snapshot_visit_buffer,
+            listing_page_cache=self._listing_page_cache,
+        )
 
 
 class PersistenceStoresSingleton:
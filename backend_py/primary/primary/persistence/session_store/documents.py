@@ -34,7 +34,9 @@ class SessionMetadata(BaseModel):
         return self.description.lower()
 
 
-class SessionDocument(BaseModel):
+class SessionMetadataDocument(BaseModel):
+    """Session document without its content, as returned by metadata-only projections"""
+
     model_config = ConfigDict(extra="ignore")
 
     # id of the session document - has to be at top level - also used as partition key
@@ -42,4 +44,7 @@ class SessionDocument(BaseModel):
 
     owner_id: str
     metadata: SessionMetadata
+
+
+class SessionDocument(SessionMetadataDocument):
     content: str
@@ -1,20 +1,26 @@
+import asyncio
 from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 from nanoid import generate
+from pydantic import TypeAdapter
 from webviz_services.service_exceptions import Service, ServiceRequestError
 
-from primary.persistence._utils import hash_session_content_string
+from primary.persistence._utils import (
+    compress_and_validate_content_async,
+    decompress_content_string,
+    hash_session_content_string,
+)
 from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.listing_page_cache import ListingPageCache, PersistenceListing
 from primary.persistence.cosmosdb.query_collation_options import Filter, QueryCollationOptions, SortDirection
 from primary.persistence.session_store.types import SessionSortBy
-from primary.persistence.cosmosdb.exceptions import DatabaseAccessError
+from primary.persistence.cosmosdb.exceptions import DatabaseAccessError, DatabaseAccessPreconditionFailedError
 from primary.persistence.cosmosdb.error_converter import raise_service_error_from_database_access
 
-from .documents import SessionDocument, SessionMetadata
+from .documents import SessionDocument, SessionMetadata, SessionMetadataDocument
 
-# CosmosDB has a 2MB document size limit
-# We use 1.5MB to leave room for metadata and safety margin
-_MAX_CONTENT_SIZE_BYTES = 1.5 * 1024 * 1024  # 1.5MB
+# Listings only return metadata, so the potentially large content is left out of the query
+_METADATA_PROJECTION_QUERY = "SELECT c.id, c.owner_id, c.metadata FROM c"
 
 # Pagination limits
 _MAX_PAGE_SIZE = 100
@@ -27,9 +33,15 @@ class SessionStore:
     Supports pagination, sorting, filtering, and limits.
     """
 
-    def __init__(self, user_id: str, session_container: CosmosContainer[SessionDocument]):
+    def __init__(
+        self,
+        user_id: str,
+        session_container: CosmosContainer[SessionDocument],
+        listing_page_cache: Optional[ListingPageCache] = None,
+    ):
         self._user_id = user_id
         self._session_container = session_container
+        self._listing_page_cache = listing_page_cache
 
     async def create_async(self, title: str, description: Optional[str], content: str) -> str:
         """
@@ -47,13 +59,7 @@ class SessionStore:
             ServiceRequestError: If content size exceeds maximum allowed size
             DatabaseAccessError: If the database operation fails
         """
-        # Validate content size
-        content_size = len(content.encode("utf-8"))
-        if content_size > _MAX_CONTENT_SIZE_BYTES:
-            raise ServiceRequestError(
-                f"Session content size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
-                Service.DATABASE,
-            )
+        stored_content = await compress_and_validate_content_async(content, "session")
 
         try:
             now = datetime.now(timezone.utc)
@@ -72,10 +78,12 @@ class SessionStore:
                     content_hash=hash_session_content_string(content),
                     version=1,
                 ),
-                content=content,
+                content=stored_content,
             )
 
-            return await self._session_container.insert_item_async(session)
+            session_id = await self._session_container.insert_item_async(session)
+            self._invalidate_listing()
+            return session_id
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
 
@@ -103,6 +111,7 @@ class SessionStore:
                     Service.DATABASE,
                 )
 
+            document.content = await asyncio.to_thread(decompress_content_string, document.content)
             return document
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
@@ -115,7 +124,7 @@ class SessionStore:
         sort_direction: Optional[SortDirection] = None,
         sort_lowercase: bool = False,
         filters: Optional[List[Filter]] = None,
-    ) -> Tuple[List[SessionDocument], Optional[str]]:
+    ) -> Tuple[List[SessionMetadataDocument], Optional[str]]:
         """
         Read multiple sessions with support for pagination, sorting, filtering, and limits.
 
@@ -128,7 +137,7 @@ class SessionStore:
             filters: List of filters to apply
 
         Returns:
-            Tuple of (list of session documents, continuation token for next page)
+            Tuple of (list of session metadata documents, continuation token for next page)
 
         Raises:
             DatabaseAccessError: If the database operation fails
@@ -155,18 +164,27 @@ class SessionStore:
                 document_model=SessionDocument,
             )
 
-            query = "SELECT * FROM c"
+            query = _METADATA_PROJECTION_QUERY
             params = collation_options.make_query_params()
             search_options = collation_options.to_sql_query_string()
 
             if search_options:
                 query = f"{query} {search_options}"
 
-            return await self._session_container.query_items_by_page_token_async(
-                query=query,
-                parameters=params,
-                page_size=page_size,
-                page_token=page_token,
+            async def query_page_async() -> Tuple[List[SessionMetadataDocument], Optional[str]]:
+                items, token = await self._session_container.query_projection_by_page_token_async(
+                    query=query,
+                    parameters=params,
+                    page_size=page_size,
+                    page_token=page_token,
+                )
+                return [SessionMetadataDocument.model_validate(item) for item in items], token
+
+            if self._listing_page_cache is None:
+                return await query_page_async()
+
+            return await self._listing_page_cache.get_or_query_page_async(
+                self._user_id, PersistenceListing.SESSIONS, query, params, page_size, page_token, query_page_async
             )
 
         except DatabaseAccessError as err:
@@ -178,65 +196,63 @@ class SessionStore:
         title: Optional[str] = None,
         description: Optional[str] = None,
         content: Optional[str] = None,
+        expected_version: Optional[int] = None,
     ) -> SessionDocument:
         """
         Update an existing session document with partial updates.
 
+        The update is applied as a single patch, so the existing document is never read and concurrent updates of
+        different fields do not overwrite each other. The version is incremented by the database.
+
         Args:
             session_id: The ID of the session to update
             title: The new title for the session
             description: The new description for the session
             content: The new content for the session
+            expected_version: If given, the update is only applied if the stored version still matches
 
         Returns:
             The updated session document
 
         Raises:
-            ServiceRequestError: If the user doesn't own the session or content size exceeds limit
+            ServiceRequestError: If the session is not found for the user, if the stored version does not match
+                `expected_version`, or if content size exceeds limit
             DatabaseAccessError: If the database operation fails
-            ValidationError: If updates contain invalid field names or values
         """
-        # Validate content size if content is being updated
+        stored_content = None
         if content is not None:
-            content_size = len(content.encode("utf-8"))
-            if content_size > _MAX_CONTENT_SIZE_BYTES:
-                raise ServiceRequestError(
-                    f"Session content size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
-                    Service.DATABASE,
-                )
-
-        try:
-            # Verify ownership and get existing document
-            existing = await self.get_async(session_id)
-
-            # Apply partial updates
-            updated_session = existing.model_copy()
-
-            if title is not None:
-                updated_session.metadata.title = title
-
-            if description is not None:
-                updated_session.metadata.description = description
-
-            # Ensure critical fields are preserved
-            updated_session.id = session_id
-            updated_session.owner_id = self._user_id
-
-            # Update managed metadata fields
-            updated_session.metadata.updated_at = datetime.now(timezone.utc)
-            updated_session.metadata.version = existing.metadata.version + 1
+            stored_content = await compress_and_validate_content_async(content, "session")
 
-            # Recompute hash if content changed
-            if content is not None:
-                updated_session.content = content
-                updated_session.metadata.content_hash = hash_session_content_string(content)
+        patch_operations = _make_update_patch_operations(title, description, content, stored_content)
 
-            await self._session_container.update_item_async(session_id, updated_session)
+        # Since the partition key is the owner id, the patch can only ever hit sessions owned by the user
+        filter_predicate = None
+        if expected_version is not None:
+            filter_predicate = f"FROM c WHERE c.metadata.version = {int(expected_version)}"
 
-            return updated_session
+        try:
+            document = await self._session_container.patch_and_get_item_async(
+                item_id=session_id,
+                partition_key=self._user_id,
+                patch_operations=patch_operations,
+                filter_predicate=filter_predicate,
+            )
+        except DatabaseAccessPreconditionFailedError as err:
+            raise ServiceRequestError(
+                f"Session '{session_id}' has been modified since version {expected_version}, reload it and try again.",
+                Service.DATABASE,
+            ) from err
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
 
+        self._invalidate_listing()
+
+        if content is not None:
+            document.content = content
+        else:
+            document.content = await asyncio.to_thread(decompress_content_string, document.content)
+        return document
+
     async def delete_async(self, session_id: str) -> None:
         """
         Delete a session document.
@@ -253,5 +269,41 @@ class SessionStore:
             await self.get_async(session_id)
 
             await self._session_container.delete_item_async(session_id, partition_key=self._user_id)
+            self._invalidate_listing()
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
+
+    def _invalidate_listing(self) -> None:
+        if self._listing_page_cache is not None:
+            self._listing_page_cache.invalidate(self._user_id, PersistenceListing.SESSIONS)
+
+
+def _make_update_patch_operations(
+    title: Optional[str], description: Optional[str], content: Optional[str], stored_content: Optional[str]
+) -> list[dict]:
+    """
+    Make the patch operations for a session update. The computed lowercase fields are stored in the document, so
+    they must be patched along with the fields they are computed from.
+    """
+    updated_at = TypeAdapter(datetime).dump_python(datetime.now(timezone.utc), mode="json")
+
+    operations: list[dict] = [
+        {"op": "set", "path": "/metadata/updated_at", "value": updated_at},
+        {"op": "incr", "path": "/metadata/version", "value": 1},
+    ]
+
+    if title is not None:
+        operations.append({"op": "set", "path": "/metadata/title", "value": title})
+        operations.append({"op": "set", "path": "/metadata/title__lower", "value": title.lower()})
+
+    if description is not None:
+        operations.append({"op": "set", "path": "/metadata/description", "value": description})
+        operations.append({"op": "set", "path": "/metadata/description__lower", "value": description.lower()})
+
+    if content is not None:
+        operations.append({"op": "set", "path": "/content", "value": stored_content})
+        operations.append(
+            {"op": "set", "path": "/metadata/content_hash", "value": hash_session_content_string(content)}
+        )
+
+    return operations
@@ -1,3 +1,4 @@
 from .snapshot_store import SnapshotStore
 from .snapshot_access_log_store import SnapshotAccessLogStore
-from .documents import SnapshotDocument, SnapshotAccessLogDocument
+from .snapshot_visit_buffer import SnapshotVisitBuffer
+from .documents import SnapshotDocument, SnapshotMetadataDocument, SnapshotAccessLogDocument
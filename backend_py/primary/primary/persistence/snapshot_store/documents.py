@@ -28,12 +28,17 @@ class SnapshotMetadata(BaseModel):
         return self.description.lower()
 
 
-class SnapshotDocument(BaseModel):
+class SnapshotMetadataDocument(BaseModel):
+    """Snapshot document without its content, as returned by metadata-only projections"""
+
     model_config = ConfigDict(extra="ignore")
 
     id: str  # id of the snapshot document - has to be at top level - also used as partition key
     owner_id: str
     metadata: SnapshotMetadata
+
+
+class SnapshotDocument(SnapshotMetadataDocument):
     content: str
 
 
@@ -9,13 +9,14 @@ from primary.persistence.cosmosdb.exceptions import (
     DatabaseAccessConflictError,
     DatabaseAccessError,
     DatabaseAccessNotFoundError,
-    DatabaseAccessPreconditionFailedError,
 )
 
 from primary.persistence.cosmosdb.query_collation_options import Filter, QueryCollationOptions, SortDirection
+from primary.persistence.listing_page_cache import ListingPageCache, PersistenceListing
 from .documents import SnapshotAccessLogDocument
 
 from .snapshot_store import SnapshotStore
+from .snapshot_visit_buffer import PendingSnapshotVisits, SnapshotVisitBuffer
 
 # Pagination limits
 _MAX_PAGE_SIZE = 100
@@ -35,10 +36,14 @@ class SnapshotAccessLogStore:
         user_id: str,
         access_log_container: CosmosContainer[SnapshotAccessLogDocument],
         snapshot_store_factory: Callable[[str], SnapshotStore],
+        visit_buffer: SnapshotVisitBuffer,
+        listing_page_cache: Optional[ListingPageCache] = None,
     ):
         self._user_id = user_id
         self._access_log_container = access_log_container
         self._snapshot_store_factory = snapshot_store_factory
+        self._visit_buffer = visit_buffer
+        self._listing_page_cache = listing_page_cache
 
     async def get_for_snapshot_async(self, snapshot_id: str) -> SnapshotAccessLogDocument:
         """
@@ -91,6 +96,9 @@ class SnapshotAccessLogStore:
         elif page_size < 1:
             page_size = 1
 
+        # Write the user's buffered visits first, so that recently opened snapshots are listed with up to date visits
+        await self._visit_buffer.flush_async(visitor_id=self._user_id)
+
         try:
             # Always filter by visitor_id (current user)
             filter_list = [Filter("visitor_id", self._user_id)] + (filters or [])
@@ -111,28 +119,46 @@ class SnapshotAccessLogStore:
             if search_options:
                 query = f"{query} {search_options}"
 
-            return await self._access_log_container.query_items_by_page_token_async(
-                query=query,
-                parameters=params,
-                page_size=page_size,
-                page_token=page_token,
+            async def query_page_async() -> Tuple[List[SnapshotAccessLogDocument], Optional[str]]:
+                return await self._access_log_container.query_items_by_page_token_async(
+                    query=query,
+                    parameters=params,
+                    page_size=page_size,
+                    page_token=page_token,
+                )
+
+            if self._listing_page_cache is None:
+                return await query_page_async()
+
+            return await self._listing_page_cache.get_or_query_page_async(
+                self._user_id,
+                PersistenceListing.SNAPSHOT_ACCESS_LOGS,
+                query,
+                params,
+                page_size,
+                page_token,
+                query_page_async,
             )
 
         except DatabaseAccessError as err:
             raise ServiceRequestError(f"Failed to get access logs: {str(err)}", Service.DATABASE) from err
 
-    async def _create_async(self, snapshot_id: str, snapshot_owner_id: str) -> SnapshotAccessLogDocument:
+    async def _create_async(
+        self, snapshot_id: str, snapshot_owner_id: str, pending_visits: PendingSnapshotVisits
+    ) -> SnapshotAccessLogDocument:
         """
-        Create a new access log entry for a snapshot and persist it to the database.
+        Create a new access log entry for a snapshot, holding the given visits, and persist it to the database.
 
         Args:
             snapshot_id: The ID of the snapshot
             snapshot_owner_id: The owner ID of the snapshot
+            pending_visits: The visits to record in the new log
 
         Returns:
             The created and persisted access log document
 
         Raises:
+            DatabaseAccessConflictError: If the log has been created by someone else in the meantime
             ServiceRequestError: If unable to retrieve snapshot metadata or create log
         """
         try:
@@ -146,6 +172,9 @@ class SnapshotAccessLogStore:
                 visitor_id=self._user_id,
                 snapshot_id=snapshot_id,
                 snapshot_owner_id=snapshot_owner_id,
+                visits=pending_visits.visits,
+                first_visited_at=pending_visits.first_visited_at,
+                last_visited_at=pending_visits.last_visited_at,
                 snapshot_metadata=snapshot.metadata,
             )
 
@@ -153,89 +182,86 @@ class SnapshotAccessLogStore:
             await self._access_log_container.insert_item_async(new_log)
 
             return new_log
+        except DatabaseAccessConflictError:
+            raise
         except DatabaseAccessError as err:
             raise ServiceRequestError(f"Failed to create access log: {str(err)}", Service.DATABASE) from err
 
     async def log_snapshot_visit_async(self, snapshot_id: str, snapshot_owner_id: str) -> None:
         """
-        Log a visit to a snapshot, creating or updating the access log.
+        Log a visit to a snapshot immediately, creating or updating the access log.
 
-        This is the main method for tracking snapshot visits. It:
-        - Retrieves or creates an access log
-        - Increments the visit count
-        - Updates the last visited timestamp
-        - Sets the first visited timestamp if this is the first visit
-        - Persists the changes to the database
+        Use this when the visit must be visible right away, otherwise prefer buffer_snapshot_visit().
 
         Args:
             snapshot_id: The ID of the snapshot being visited
             snapshot_owner_id: The owner ID of the snapshot
 
-        Returns:
-            The updated access log document
-
         Raises:
             ServiceRequestError: If the database operation fails
         """
         timestamp = datetime.now(timezone.utc)
-        item_id = _make_access_log_item_id(snapshot_id, self._user_id)
+        pending_visits = PendingSnapshotVisits(
+            snapshot_owner_id=snapshot_owner_id, visits=1, first_visited_at=timestamp, last_visited_at=timestamp
+        )
+        await self.apply_visits_async(snapshot_id, pending_visits)
 
-        # Patch ops that are ALWAYS safe to apply (atomic counter + last visited)
-        base_ops: list[dict] = [
-            {"op": "incr", "path": "/visits", "value": 1},
-            {"op": "set", "path": "/last_visited_at", "value": timestamp.isoformat()},
-        ]
+    def buffer_snapshot_visit(self, snapshot_id: str, snapshot_owner_id: str) -> None:
+        """
+        Log a visit to a snapshot through the write-behind visit buffer.
 
-        # Patch ops only for the very first visit
-        first_visit_ops: list[dict] = base_ops + [
-            {"op": "set", "path": "/first_visited_at", "value": timestamp.isoformat()},
-        ]
+        The visit is coalesced with other visits by the user to the same snapshot, and written to the access log by
+        the next flush of the buffer.
+
+        Args:
+            snapshot_id: The ID of the snapshot being visited
+            snapshot_owner_id: The owner ID of the snapshot
+        """
+        self._visit_buffer.record_visit(self._user_id, snapshot_id, snapshot_owner_id, datetime.now(timezone.utc))
+
+    async def apply_visits_async(self, snapshot_id: str, pending_visits: PendingSnapshotVisits) -> None:
+        """
+        Add visits to the access log with a single patch, or create the log with the visits if it does not exist.
+
+        Args:
+            snapshot_id: The ID of the snapshot being visited
+            pending_visits: The visits to add
+
+        Raises:
+            ServiceRequestError: If the database operation fails
+        """
+        item_id = _make_access_log_item_id(snapshot_id, self._user_id)
 
-        # Cosmos filter predicate syntax: depends on SDK version; commonly:
-        # "FROM c WHERE NOT IS_DEFINED(c.first_visited_at)"
-        first_visit_filter = "FROM c WHERE NOT IS_DEFINED(c.first_visited_at)"
+        # The first visit time is set when the log is created, so later visits only touch the counter and last visit
+        patch_operations: list[dict] = [
+            {"op": "incr", "path": "/visits", "value": pending_visits.visits},
+            {"op": "set", "path": "/last_visited_at", "value": pending_visits.last_visited_at.isoformat()},
+        ]
 
         try:
-            # 1) Fast path: try "first-visit" patch (only succeeds if first_visited_at is missing)
             try:
                 await self._access_log_container.patch_item_async(
                     item_id=item_id,
                     partition_key=self._user_id,
-                    patch_operations=first_visit_ops,
-                    filter_predicate=first_visit_filter,
+                    patch_operations=patch_operations,
                 )
-            except DatabaseAccessPreconditionFailedError:
-                # 2) Not first visit: apply base patch (always succeeds if item exists)
-                await self._access_log_container.patch_item_async(
-                    item_id=item_id,
-                    partition_key=self._user_id,
-                    patch_operations=base_ops,
-                )
-
-        except DatabaseAccessNotFoundError:
-            # 3) Item doesn't exist yet -> create it, then patch.
-            #    Handle the race where another request created it first.
-            try:
-                await self._create_async(snapshot_id=snapshot_id, snapshot_owner_id=snapshot_owner_id)
-            except DatabaseAccessConflictError:
-                # Someone else created it between our 404 and create attempt -> continue to patch
+                self._invalidate_listing()
+                return
+            except DatabaseAccessNotFoundError:
                 pass
 
-            # Now apply the "first visit" attempt; if it fails, fallback to base patch.
             try:
+                await self._create_async(snapshot_id, pending_visits.snapshot_owner_id, pending_visits)
+            except DatabaseAccessConflictError:
+                # Someone else created it between our 404 and create attempt -> patch it instead
                 await self._access_log_container.patch_item_async(
                     item_id=item_id,
                     partition_key=self._user_id,
-                    patch_operations=first_visit_ops,
-                    filter_predicate=first_visit_filter,
-                )
-            except DatabaseAccessPreconditionFailedError:
-                await self._access_log_container.patch_item_async(
-                    item_id=item_id,
-                    partition_key=self._user_id,
-                    patch_operations=base_ops,
+                    patch_operations=patch_operations,
                 )
 
+            self._invalidate_listing()
+
         except DatabaseAccessError as err:
             raise ServiceRequestError(f"Failed to log snapshot visit: {str(err)}", Service.DATABASE) from err
 
@@ -249,12 +275,20 @@ class SnapshotAccessLogStore:
         Raises:
             ServiceRequestError: If the database operation fails
         """
+        # Pending visits would otherwise recreate the log on the next flush
+        self._visit_buffer.discard(self._user_id, snapshot_id)
+
         item_id = _make_access_log_item_id(snapshot_id, self._user_id)
         try:
             await self._access_log_container.delete_item_async(item_id, partition_key=self._user_id)
+            self._invalidate_listing()
         except DatabaseAccessError as err:
             raise ServiceRequestError(f"Failed to delete access log: {str(err)}", Service.DATABASE) from err
 
+    def _invalidate_listing(self) -> None:
+        if self._listing_page_cache is not None:
+            self._listing_page_cache.invalidate(self._user_id, PersistenceListing.SNAPSHOT_ACCESS_LOGS)
+
 
 def _make_access_log_item_id(snapshot_id: str, visitor_id: str) -> str:
     return f"{snapshot_id}__{visitor_id}"
@@ -1,20 +1,25 @@
+import asyncio
 from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 from nanoid import generate
 from webviz_services.service_exceptions import Service, ServiceRequestError
 
-from primary.persistence._utils import hash_session_content_string
+from primary.persistence._utils import (
+    compress_and_validate_content_async,
+    decompress_content_string,
+    hash_session_content_string,
+)
 from primary.persistence.cosmosdb.query_collation_options import Filter, QueryCollationOptions, SortDirection
 from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.listing_page_cache import ListingPageCache, PersistenceListing
 from primary.persistence.cosmosdb.exceptions import DatabaseAccessError, DatabaseAccessNotFoundError
 from primary.persistence.cosmosdb.error_converter import raise_service_error_from_database_access
 
-from .documents import SnapshotDocument, SnapshotMetadata
+from .documents import SnapshotDocument, SnapshotMetadata, SnapshotMetadataDocument
 from .types import SnapshotSortBy
 
-# CosmosDB has a 2MB document size limit
-# We use 1.5MB to leave room for metadata and safety margin
-_MAX_CONTENT_SIZE_BYTES = 1.5 * 1024 * 1024  # 1.5MB
+# Listings only return metadata, so the potentially large content is left out of the query
+_METADATA_PROJECTION_QUERY = "SELECT c.id, c.owner_id, c.metadata FROM c"
 
 # Pagination limits
 _MAX_PAGE_SIZE = 100
@@ -31,9 +36,11 @@ class SnapshotStore:
         self,
         user_id: str,
         snapshot_container: CosmosContainer[SnapshotDocument],
+        listing_page_cache: Optional[ListingPageCache] = None,
     ):
         self._user_id = user_id
         self._snapshot_container = snapshot_container
+        self._listing_page_cache = listing_page_cache
 
     async def create_async(self, title: str, description: Optional[str], content: str) -> str:
         """
@@ -51,13 +58,7 @@ class SnapshotStore:
             ServiceRequestError: If content size exceeds maximum allowed size
             DatabaseAccessError: If the database operation fails
         """
-        # Validate content size
-        content_size = len(content.encode("utf-8"))
-        if content_size > _MAX_CONTENT_SIZE_BYTES:
-            raise ServiceRequestError(
-                f"Snapshot content size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
-                Service.DATABASE,
-            )
+        stored_content = await compress_and_validate_content_async(content, "snapshot")
 
         try:
             now = datetime.now(timezone.utc)
@@ -75,10 +76,12 @@ class SnapshotStore:
                     created_at=now,
                     content_hash=hash_session_content_string(content),
                 ),
-                content=content,
+                content=stored_content,
             )
 
-            return await self._snapshot_container.insert_item_async(snapshot)
+            snapshot_id = await self._snapshot_container.insert_item_async(snapshot)
+            self._invalidate_listing()
+            return snapshot_id
         except DatabaseAccessError as e:
             raise_service_error_from_database_access(e)
 
@@ -98,6 +101,7 @@ class SnapshotStore:
         """
         try:
             document = await self._snapshot_container.get_item_async(item_id=snapshot_id, partition_key=snapshot_id)
+            document.content = await asyncio.to_thread(decompress_content_string, document.content)
             return document
         except DatabaseAccessNotFoundError as e:
             raise ServiceRequestError(
@@ -115,7 +119,7 @@ class SnapshotStore:
         sort_direction: Optional[SortDirection] = None,
         sort_lowercase: bool = False,
         filters: Optional[List[Filter]] = None,
-    ) -> Tuple[List[SnapshotDocument], Optional[str]]:
+    ) -> Tuple[List[SnapshotMetadataDocument], Optional[str]]:
         """
         Get multiple snapshots with support for pagination, sorting, filtering, and limits.
 
@@ -128,7 +132,7 @@ class SnapshotStore:
             filters: List of filters to apply
 
         Returns:
-            Tuple of (list of snapshot documents, continuation token for next page)
+            Tuple of (list of snapshot metadata documents, continuation token for next page)
 
         Raises:
             DatabaseAccessError: If the database operation fails
@@ -155,18 +159,27 @@ class SnapshotStore:
                 document_model=SnapshotDocument,
             )
 
-            query = "SELECT * FROM c"
+            query = _METADATA_PROJECTION_QUERY
             params = collation_options.make_query_params()
             search_options = collation_options.to_sql_query_string()
 
             if search_options:
                 query = f"{query} {search_options}"
 
-            return await self._snapshot_container.query_items_by_page_token_async(
-                query=query,
-                parameters=params,
-                page_size=page_size,
-                page_token=page_token,
+            async def query_page_async() -> Tuple[List[SnapshotMetadataDocument], Optional[str]]:
+                items, token = await self._snapshot_container.query_projection_by_page_token_async(
+                    query=query,
+                    parameters=params,
+                    page_size=page_size,
+                    page_token=page_token,
+                )
+                return [SnapshotMetadataDocument.model_validate(item) for item in items], token
+
+            if self._listing_page_cache is None:
+                return await query_page_async()
+
+            return await self._listing_page_cache.get_or_query_page_async(
+                self._user_id, PersistenceListing.SNAPSHOTS, query, params, page_size, page_token, query_page_async
             )
 
         except DatabaseAccessError as e:
@@ -193,5 +206,10 @@ class SnapshotStore:
                 )
 
             await self._snapshot_container.delete_item_async(snapshot_id, partition_key=snapshot_id)
+            self._invalidate_listing()
         except DatabaseAccessError as e:
             raise_service_error_from_database_access(e)
+
+    def _invalidate_listing(self) -> None:
+        if self._listing_page_cache is not None:
+            self._listing_page_cache.invalidate(self._user_id, PersistenceListing.SNAPSHOTS)
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingSnapshotVisits:
+    snapshot_owner_id: str
+    visits: int
+    first_visited_at: datetime
+    last_visited_at: datetime
+
+
+@dataclass(frozen=True)
+class _VisitKey:
+    visitor_id: str
+    snapshot_id: str
+
+
+# Applies the pending visits of one visitor to one snapshot to the database.
+# Arguments are: visitor_id, snapshot_id, pending_visits
+ApplyVisitsCallback = Callable[[str, str, PendingSnapshotVisits], Awaitable[None]]
+
+
+class SnapshotVisitBuffer:
+    """
+    Write-behind buffer for snapshot visits.
+
+    Visits are coalesced in memory per visitor and snapshot, and flushed periodically so that each access log document
+    receives a single write per flush interval, regardless of how many times the snapshot was opened. Pending visits
+    are flushed when the buffer is stopped, which happens on application shutdown.
+
+    Visits that fail to flush are put back into the buffer and retried on the next flush, up to `max_flush_attempts`.
+    """
+
+    def __init__(
+        self,
+        apply_visits_async: ApplyVisitsCallback,
+        flush_interval_s: float = 5,
+        max_pending: int = 5000,
+        max_concurrency: int = 8,
+        max_flush_attempts: int = 3,
+    ) -> None:
+        self._apply_visits_async = apply_visits_async
+        self._flush_interval_s = flush_interval_s
+        self._max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_flush_attempts = max_flush_attempts
+
+        self._pending: dict[_VisitKey, PendingSnapshotVisits] = {}
+        self._failed_attempts: dict[_VisitKey, int] = {}
+        self._flush_requested = asyncio.Event()
+        self._loop_task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._loop_task is not None:
+            raise RuntimeError("SnapshotVisitBuffer is already started")
+
+        self._loop_task = asyncio.create_task(self._run_flush_loop_async())
+
+    async def stop_async(self) -> None:
+        """Stop the periodic flushing, and flush all pending visits"""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+
+            self._loop_task = None
+
+        num_flushed = await self.flush_async()
+        LOGGER.info(f"Flushed {num_flushed} pending snapshot visits on shutdown")
+
+    def record_visit(self, visitor_id: str, snapshot_id: str, snapshot_owner_id: str, visited_at: datetime) -> None:
+        key = _VisitKey(visitor_id, snapshot_id)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = PendingSnapshotVisits(
+                snapshot_owner_id=snapshot_owner_id,
+                visits=1,
+                first_visited_at=visited_at,
+                last_visited_at=visited_at,
+            )
+        else:
+            pending.visits += 1
+            pending.last_visited_at = max(pending.last_visited_at, visited_at)
+
+        if len(self._pending) >= self._max_pending:
+            self._flush_requested.set()
+
+    def discard(self, visitor_id: str, snapshot_id: str) -> None:
+        """Drop pending visits, e.g. when the access log they would be written to is deleted"""
+        key = _VisitKey(visitor_id, snapshot_id)
+        self._pending.pop(key, None)
+        self._failed_attempts.pop(key, None)
+
+    def get_pending_count(self) -> int:
+        return len(self._pending)
+
+    async def flush_async(self, visitor_id: str | None = None) -> int:
+        """
+        Write pending visits to the database, either all or only those of the given visitor.
+        Returns the number of access logs that were successfully written.
+        """
+        keys = [key for key in self._pending if visitor_id is None or key.visitor_id == visitor_id]
+        if not keys:
+            return 0
+
+        # Take the entries out of the buffer before writing, visits recorded during the flush start new entries
+        entries = [(key, self._pending.pop(key)) for key in keys]
+        results = await asyncio.gather(*[self._flush_one_async(key, pending) for key, pending in entries])
+        return sum(1 for res in results if res)
+
+    async def _flush_one_async(self, key: _VisitKey, pending: PendingSnapshotVisits) -> bool:
+        try:
+            async with self._semaphore:
+                await self._apply_visits_async(key.visitor_id, key.snapshot_id, pending)
+
+        except asyncio.CancelledError:
+            # Stopped in the middle of a periodic flush, keep the visits for the final flush
+            self._requeue(key, pending)
+            raise
+
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            num_attempts = self._failed_attempts.get(key, 0) + 1
+            if num_attempts >= self._max_flush_attempts:
+                LOGGER.warning(
+                    f"Dropping {pending.visits} visits for {key} after {num_attempts} failed attempts: {exc}"
+                )
+                self._failed_attempts.pop(key, None)
+                return False
+
+            LOGGER.warning(f"Unable to flush {pending.visits} visits for {key}, will retry: {exc}")
+            self._failed_attempts[key] = num_attempts
+            self._requeue(key, pending)
+            return False
+
+        self._failed_attempts.pop(key, None)
+        return True
+
+    def _requeue(self, key: _VisitKey, pending: PendingSnapshotVisits) -> None:
+        newer = self._pending.get(key)
+        if newer is not None:
+            pending.visits += newer.visits
+            pending.last_visited_at = max(pending.last_visited_at, newer.last_visited_at)
+
+        self._pending[key] = pending
+
+    async def _run_flush_loop_async(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval_s)
+            except TimeoutError:
+                pass
+
+            self._flush_requested.clear()
+
+            try:
+                await self.flush_async()
+            except Exception:  # pylint: disable=broad-exception-caught
+                LOGGER.exception("Unexpected error while flushing snapshot visits")
@@ -1,12 +1,14 @@
 import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
 from typing import Any, Dict, List
 
-from webviz_services.service_exceptions import ServiceRequestError
-
 from primary.persistence.persistence_stores import PersistenceStoresSingleton
-from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.cosmosdb.cosmos_container import MAX_BATCH_OPERATIONS, CosmosContainer
+from primary.persistence.cosmosdb.exceptions import DatabaseAccessError
+from primary.persistence.listing_page_cache import PersistenceListing
 from primary.persistence.snapshot_store.documents import SnapshotAccessLogDocument
 
 LOGGER = logging.getLogger(__name__)
@@ -14,113 +16,147 @@ LOGGER = logging.getLogger(__name__)
 _DATABASE_NAME = "persistence"
 _CONTAINER_NAME = "snapshot_access_logs"
 
-# To avoid overwhelming the database with too many concurrent PATCH operations
+# Logs that are already marked are left out, so re-running the query after a partial run (or after an interrupted
+# task) only returns the logs that remain. The marks in the database are the progress checkpoint.
+_UNMARKED_LOGS_QUERY = (
+    "SELECT c.id, c.visitor_id "
+    "FROM c "
+    "WHERE c.snapshot_id = @sid "
+    "AND (NOT IS_DEFINED(c.snapshot_deleted) OR c.snapshot_deleted != true)"
+)
+
+# To avoid overwhelming the database with too many concurrent batches
 # (which can lead to throttling or Request Unit (RU) spikes), we limit concurrency.
-_MAX_CONCURRENT_PATCH_OPS = 32
+_MAX_CONCURRENT_BATCHES = 32
+
+_MAX_ROUNDS = 4
+_INITIAL_BACKOFF_S = 1.0
+
+
+@dataclass
+class MarkLogsDeletedProgress:
+    num_marked: int = 0
+    num_remaining: int = 0
+    num_rounds: int = 0
 
 
-async def mark_logs_deleted_task(snapshot_id: str, retry_count: int = 0, max_retries: int = 3) -> None:
+# The name is kept, it is scheduled as a background task by the snapshot router
+# pylint: disable-next=async-suffix
+async def mark_logs_deleted_task(snapshot_id: str) -> None:
     """
     Marks all access-log docs for the given snapshot_id as deleted (PATCH /snapshot_deleted = true).
-    Runs with bounded concurrency and is idempotent/safe to re-run.
+    Idempotent and safe to re-run, a re-run picks up the logs that were not marked by an earlier run.
 
     Args:
         snapshot_id: The ID of the snapshot whose logs should be marked as deleted
-        retry_count: Current retry attempt (for internal use)
-        max_retries: Maximum number of retry attempts
     """
     persistence_stores = PersistenceStoresSingleton.get_instance()
     container: CosmosContainer[SnapshotAccessLogDocument] = persistence_stores.get_container(
         _DATABASE_NAME, _CONTAINER_NAME, SnapshotAccessLogDocument
     )
 
-    try:
-        query = (
-            "SELECT c.id, c.visitor_id "
-            "FROM c "
-            "WHERE c.snapshot_id = @sid "
-            "AND (NOT IS_DEFINED(c.snapshot_deleted) OR c.snapshot_deleted != true)"
-        )
-        params = [{"name": "@sid", "value": snapshot_id}]
-
-        rows: List[Dict[str, Any]] = await container.query_projection_async(query, params)
-
-        if not rows:
-            LOGGER.info("No snapshot_access_logs to update for snapshot '%s'.", snapshot_id)
-            return
-
-        deleted_at = datetime.now(timezone.utc).isoformat()
-
-        operations: List[dict] = [
-            {"op": "set", "path": "/snapshot_deleted", "value": True},
-            {"op": "set", "path": "/snapshot_deleted_at", "value": deleted_at},
-        ]
-
-        # Limit concurrency to avoid RU spikes/throttling
-        sem = asyncio.Semaphore(_MAX_CONCURRENT_PATCH_OPS)
-
-        async def _patch_one(rec: Dict[str, Any]) -> bool:
-            async with sem:
-                try:
-                    await container.patch_item_async(
-                        item_id=rec["id"],
-                        partition_key=rec["visitor_id"],  # /visitor_id is the PK
-                        patch_operations=operations,
-                    )
-                    return True
-                except asyncio.CancelledError:
-                    # always re-raise cancellation so shutdowns are graceful
-                    raise
-                except ServiceRequestError as e:
-                    LOGGER.warning("PATCH failed for log id=%s pk=%s: %s", rec.get("id"), rec.get("visitor_id"), e)
-                    # Do not re-raise - we want to continue with other items
-                    return False
-
-        results = await asyncio.gather(*(_patch_one(r) for r in rows))
-        success = sum(1 for ok in results if ok)
-        fail = len(rows) - success
-
-        LOGGER.info(
-            "Marked %d/%d access-log docs deleted for snapshot '%s' (failures=%d).",
-            success,
-            len(rows),
-            snapshot_id,
-            fail,
-        )
-
-        # If there were failures and we haven't exceeded max retries, schedule a retry
-        if fail > 0 and retry_count < max_retries:
-            retry_delay = 2**retry_count  # Exponential backoff: 1s, 2s, 4s
-            LOGGER.warning(
-                "Scheduling retry %d/%d for snapshot '%s' in %d seconds (%d failures).",
-                retry_count + 1,
-                max_retries,
-                snapshot_id,
-                retry_delay,
-                fail,
-            )
-            await asyncio.sleep(retry_delay)
-            await mark_logs_deleted_task(snapshot_id, retry_count + 1, max_retries)
-        elif fail > 0:
-            LOGGER.error(
-                "Failed to mark all logs deleted for snapshot '%s' after %d retries. %d logs remain unmarked.",
-                snapshot_id,
-                max_retries,
-                fail,
-            )
+    progress = await mark_logs_deleted_async(container, snapshot_id)
+
+    # The marked logs belong to other users, whose cached access log listings would otherwise show them as not deleted
+    if progress.num_marked > 0:
+        persistence_stores.get_listing_page_cache().invalidate_for_all_users(PersistenceListing.SNAPSHOT_ACCESS_LOGS)
 
-    except Exception as e:
-        LOGGER.error("Unexpected error in mark_logs_deleted_task for snapshot '%s': %s", snapshot_id, e)
-        # If this is a recoverable error and we haven't exceeded retries, try again
-        if retry_count < max_retries:
-            retry_delay = 2**retry_count  # Exponential backoff: 1s, 2s, 4s
-            LOGGER.warning("Retrying mark_logs_deleted_task for snapshot '%s' in %d seconds.", snapshot_id, retry_delay)
-            await asyncio.sleep(retry_delay)
-            await mark_logs_deleted_task(snapshot_id, retry_count + 1, max_retries)
+
+async def mark_logs_deleted_async(
+    container: CosmosContainer[SnapshotAccessLogDocument],
+    snapshot_id: str,
+    max_rounds: int = _MAX_ROUNDS,
+    initial_backoff_s: float = _INITIAL_BACKOFF_S,
+) -> MarkLogsDeletedProgress:
+    """
+    Marks the access logs of a snapshot as deleted in rounds. Each round queries the logs that are not yet marked,
+    and patches them using one transactional batch per partition key (visitor) and chunk of logs. Rounds are repeated
+    with exponential backoff until all logs are marked, or `max_rounds` is reached.
+
+    Returns the progress after the last round.
+    """
+    params = [{"name": "@sid", "value": snapshot_id}]
+    deleted_at = datetime.now(timezone.utc).isoformat()
+    operations: List[dict] = [
+        {"op": "set", "path": "/snapshot_deleted", "value": True},
+        {"op": "set", "path": "/snapshot_deleted_at", "value": deleted_at},
+    ]
+
+    progress = MarkLogsDeletedProgress()
+
+    for round_number in range(1, max_rounds + 1):
+        progress.num_rounds = round_number
+
+        try:
+            rows: List[Dict[str, Any]] = await container.query_projection_async(_UNMARKED_LOGS_QUERY, params)
+        except DatabaseAccessError as e:
+            LOGGER.warning("Querying access logs for snapshot '%s' failed (round %d): %s", snapshot_id, round_number, e)
         else:
-            LOGGER.error(
-                "Failed to complete mark_logs_deleted_task for snapshot '%s' after %d retries.",
+            if not rows:
+                progress.num_remaining = 0
+                LOGGER.info(
+                    "All access logs marked deleted for snapshot '%s' (marked=%d).", snapshot_id, progress.num_marked
+                )
+                return progress
+
+            progress.num_remaining = await _mark_rows_deleted_async(container, rows, operations, progress)
+
+            LOGGER.info(
+                "Checkpoint for snapshot '%s' after round %d: marked=%d, remaining=%d.",
                 snapshot_id,
-                max_retries,
+                round_number,
+                progress.num_marked,
+                progress.num_remaining,
             )
-            raise
+            if progress.num_remaining == 0:
+                return progress
+
+        if round_number < max_rounds:
+            await asyncio.sleep(initial_backoff_s * 2 ** (round_number - 1))
+
+    LOGGER.error(
+        "Failed to mark all access logs deleted for snapshot '%s' after %d rounds. %d logs remain unmarked.",
+        snapshot_id,
+        max_rounds,
+        progress.num_remaining,
+    )
+    return progress
+
+
+async def _mark_rows_deleted_async(
+    container: CosmosContainer[SnapshotAccessLogDocument],
+    rows: List[Dict[str, Any]],
+    operations: List[dict],
+    progress: MarkLogsDeletedProgress,
+) -> int:
+    """Patch the given rows in batches, and return the number of rows that failed"""
+    item_ids_by_visitor: Dict[str, List[str]] = defaultdict(list)
+    for row in rows:
+        item_ids_by_visitor[row["visitor_id"]].append(row["id"])  # /visitor_id is the PK
+
+    batches = [
+        (visitor_id, item_ids[i : i + MAX_BATCH_OPERATIONS])
+        for visitor_id, item_ids in item_ids_by_visitor.items()
+        for i in range(0, len(item_ids), MAX_BATCH_OPERATIONS)
+    ]
+
+    # Limit concurrency to avoid RU spikes/throttling
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_BATCHES)
+
+    async def _patch_batch_async(visitor_id: str, item_ids: List[str]) -> int:
+        async with sem:
+            try:
+                await container.patch_items_in_batch_async(
+                    partition_key=visitor_id,
+                    patch_operations_by_item_id={item_id: operations for item_id in item_ids},
+                )
+            except DatabaseAccessError as e:
+                LOGGER.warning("Batch PATCH of %d logs failed for pk=%s: %s", len(item_ids), visitor_id, e)
+                # Do not re-raise - we want to continue with other batches
+                return len(item_ids)
+
+        progress.num_marked += len(item_ids)
+        return 0
+
+    results = await asyncio.gather(*(_patch_batch_async(visitor_id, item_ids) for visitor_id, item_ids in batches))
+    return sum(results)
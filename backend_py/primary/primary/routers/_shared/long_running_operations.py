@@ -42,3 +42,10 @@ class LroCommandResp(LroRespBaseModel):
     response_type: Literal["LroCommandResp"] = "LroCommandResp"
     command_ok: bool
     message: str | None = None
+
+
+# This response is used as the terminal event in server-sent event streams of task status, signalling that the task
+# has completed successfully and that the result can now be fetched by re-issuing the original (hybrid) request.
+class LroCompletedResp(LroRespBaseModel):
+    response_type: Literal["LroCompletedResp"] = "LroCompletedResp"
+    task_id: str
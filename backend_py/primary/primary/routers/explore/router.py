@@ -4,8 +4,11 @@ from typing import List, Coroutine, Any
 
 from fastapi import APIRouter, Depends, Path, Query, Body, Response
 
+from webviz_core_utils.ttl_cache import TtlCache
+
 from webviz_services.sumo_access.case_inspector import CaseInspector
-from webviz_services.sumo_access.sumo_inspector import SumoInspector
+from webviz_services.sumo_access.sumo_case_index import CaseFilter, get_sumo_case_index_for_user
+from webviz_services.sumo_access.sumo_inspector import CaseInfo, SumoInspector
 from webviz_services.sumo_access.sumo_fingerprinter import get_sumo_fingerprinter_for_user
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
@@ -19,6 +22,12 @@ LOGGER = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Assembled ensemble details keyed by (case_uuid, ensemble_name, ensemble_fingerprint).
+# Shared between users through the fingerprint in the key, see SumoFingerprinter.
+_ENSEMBLE_DETAILS_CACHE: TtlCache[tuple[str, str, str], schemas.EnsembleDetails] = TtlCache(
+    max_entries=500, ttl_s=15 * 60
+)
+
 
 @router.get("/asset_infos")
 async def get_asset_infos(
@@ -50,69 +59,97 @@ async def get_cases(
     asset_name: str = Query(min_length=1, description="Asset name"),
 ) -> List[schemas.CaseInfo]:
     """Get list of cases for specified asset"""
-    sumo_inspector = SumoInspector(authenticated_user.get_sumo_access_token())
-    case_info_arr = await sumo_inspector.get_cases_async(asset_name=asset_name)
-
-    ret_arr: List[schemas.CaseInfo] = []
-
-    ret_arr = [
-        schemas.CaseInfo(
-            uuid=ci.uuid,
-            name=ci.name,
-            status=ci.status,
-            user=ci.user,
-            updatedAtUtcMs=ci.updated_at_utc_ms,
-            description=ci.description,
-            modelName=ci.model_name,
-            modelRevision=ci.model_revision,
-            ensembles=[
-                schemas.EnsembleInfo(
-                    name=ei.name,
-                    realizationCount=ei.realization_count,
-                    standardResults=ei.standard_results,
-                )
-                for ei in ci.ensembles
-            ],
-        )
-        for ci in case_info_arr
-    ]
+    case_index = get_sumo_case_index_for_user(authenticated_user)
+    case_info_arr = await case_index.get_cases_async(asset_name=asset_name)
 
-    return ret_arr
+    return [_to_api_case_info(ci) for ci in case_info_arr]
+
+
+@router.get("/cases_page")
+async def get_cases_page(
+    # fmt:off
+    response: Response,
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    asset_name: str = Query(min_length=1, description="Asset name"),
+    offset: int = Query(0, ge=0, description="Number of cases to skip"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of cases to return"),
+    search_text: str | None = Query(None, description="Only include cases where name, description, user or model name contains this text (case-insensitive)"),
+    user: str | None = Query(None, description="Only include cases created by this user"),
+    status: str | None = Query(None, description="Only include cases with this status"),
+    # fmt:on
+) -> schemas.CasePage:
+    """Get a page of the cases for specified asset, sorted with the most recently updated case first"""
+    perf_metrics = ResponsePerfMetrics(response)
+
+    case_index = get_sumo_case_index_for_user(authenticated_user)
+    case_filter = CaseFilter(search_text=search_text, user=user, status=status)
+    case_page = await case_index.get_cases_page_async(asset_name, offset, limit, case_filter)
+    perf_metrics.record_lap("get-cases-page")
+
+    LOGGER.debug(f"Got page of {len(case_page.cases)} cases in: {perf_metrics.to_string()}")
+
+    return schemas.CasePage(
+        cases=[_to_api_case_info(ci) for ci in case_page.cases],
+        totalCount=case_page.total_count,
+    )
 
 
 @router.get("/cases/{case_uuid}/ensembles/{ensemble_name}")
 @cache_time(CacheTime.NORMAL)
 async def get_ensemble_details(
+    response: Response,
     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
     case_uuid: str = Path(description="Sumo case uuid"),
     ensemble_name: str = Path(description="Ensemble name"),
 ) -> schemas.EnsembleDetails:
     """Get more detailed information for an ensemble"""
+    perf_metrics = ResponsePerfMetrics(response)
+
+    # The ensemble fingerprint changes whenever the ensemble's content in Sumo changes, so cached details are never stale
+    fingerprinter = get_sumo_fingerprinter_for_user(authenticated_user=authenticated_user, cache_ttl_s=5 * 60)
+    ensemble_fp = await fingerprinter.get_or_calc_ensemble_fp_async(case_uuid, ensemble_name)
+    perf_metrics.record_lap("get-fingerprint")
+
+    cache_key = (case_uuid, ensemble_name, ensemble_fp)
+    ensemble_details = await _ENSEMBLE_DETAILS_CACHE.get_or_compute_async(
+        cache_key,
+        lambda: _assemble_ensemble_details_async(authenticated_user, case_uuid, ensemble_name),
+    )
+    perf_metrics.record_lap("get-details")
+
+    LOGGER.debug(f"Got ensemble details in: {perf_metrics.to_string()}")
+
+    return ensemble_details
 
+
+async def _assemble_ensemble_details_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> schemas.EnsembleDetails:
     case_inspector = CaseInspector.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid)
-    case_name = await case_inspector.get_case_name_async()
-    realizations = await case_inspector.get_realizations_in_ensemble_async(ensemble_name)
-    asset_name = await case_inspector.get_asset_name_async()
-    field_identifiers = await case_inspector.get_field_identifiers_async()
-    stratigraphic_column_identifier = await case_inspector.get_stratigraphic_column_identifier_async()
-    standard_results = await case_inspector.get_standard_results_in_ensemble_async(ensemble_name)
 
-    fip_regions: List[schemas.FipRegion] = []
-    fip_regions_mapping = await case_inspector.get_fip_regions_mapping_async(ensemble_name)
+    async with asyncio.TaskGroup() as tg:
+        case_summary_task = tg.create_task(case_inspector.get_case_summary_async())
+        realizations_task = tg.create_task(case_inspector.get_realizations_in_ensemble_async(ensemble_name))
+        standard_results_task = tg.create_task(case_inspector.get_standard_results_in_ensemble_async(ensemble_name))
+        fip_regions_mapping_task = tg.create_task(case_inspector.get_fip_regions_mapping_async(ensemble_name))
+
+    case_summary = case_summary_task.result()
+    fip_regions_mapping = fip_regions_mapping_task.result()
 
+    fip_regions: List[schemas.FipRegion] = []
     if fip_regions_mapping is not None:
         for mapping in fip_regions_mapping.root:
             fip_regions.append(schemas.FipRegion(fipNumber=mapping.FIPNUM, zone=mapping.ZONE, region=mapping.REGION))
 
     return schemas.EnsembleDetails(
         name=ensemble_name,
-        caseName=case_name,
+        caseName=case_summary.name,
         caseUuid=case_uuid,
-        assetName=asset_name,
-        realizations=realizations,
-        fieldIdentifiers=field_identifiers,
-        stratigraphicColumnIdentifier=stratigraphic_column_identifier,
-        standardResults=standard_results,
+        assetName=case_summary.asset_name,
+        realizations=realizations_task.result(),
+        fieldIdentifiers=case_summary.field_identifiers,
+        stratigraphicColumnIdentifier=case_summary.stratigraphic_column_identifier,
+        standardResults=standard_results_task.result(),
         fipRegions=fip_regions,
     )
 
@@ -152,3 +189,24 @@ async def post_refresh_fingerprints_for_ensembles(
     LOGGER.debug(f"Calculated and refreshed {len(ret_fingerprints)} fingerprints in: {perf_metrics.to_string()}")
 
     return ret_fingerprints
+
+
+def _to_api_case_info(case_info: CaseInfo) -> schemas.CaseInfo:
+    return schemas.CaseInfo(
+        uuid=case_info.uuid,
+        name=case_info.name,
+        status=case_info.status,
+        user=case_info.user,
+        updatedAtUtcMs=case_info.updated_at_utc_ms,
+        description=case_info.description,
+        modelName=case_info.model_name,
+        modelRevision=case_info.model_revision,
+        ensembles=[
+            schemas.EnsembleInfo(
+                name=ei.name,
+                realizationCount=ei.realization_count,
+                standardResults=ei.standard_results,
+            )
+            for ei in case_info.ensembles
+        ],
+    )
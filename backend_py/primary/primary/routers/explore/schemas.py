@@ -34,6 +34,12 @@ class CaseInfo(BaseModel):
     ensembles: Sequence[EnsembleInfo]
 
 
+class CasePage(BaseModel):
+    cases: Sequence[CaseInfo]
+    # Total number of cases matching the filter, null if not yet known
+    totalCount: int | None
+
+
 class EnsembleTimestamps(BaseModel):
     caseUpdatedAtUtcMs: int
     dataUpdatedAtUtcMs: int
@@ -26,7 +26,7 @@ async def get_production_data(
     # fmt:on
 ) -> list[schemas.WellProductionData]:
     """Get allocated production per well in the time interval"""
-    pdm_access = PDMAccess(authenticated_user.get_pdm_access_token())
+    pdm_access = PDMAccess(authenticated_user.get_pdm_access_token(), user_id=authenticated_user.get_user_id())
     prod_data = await pdm_access.get_per_well_total_production_in_time_interval_async(
         field_identifier=field_identifier, start_date=start_date, end_date=end_date
     )
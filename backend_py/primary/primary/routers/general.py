@@ -53,7 +53,7 @@ async def get_logged_in_user(
 ) -> UserInfo:
 
     await starsessions.load_session(request)
-    authenticated_user = AuthHelper.get_authenticated_user(request)
+    authenticated_user = await AuthHelper.get_authenticated_user(request)
 
     if not authenticated_user:
         # What is the most appropriate return code?
@@ -1,11 +1,18 @@
+import asyncio
 import logging
+from typing import Any, Mapping
 
 import httpx
 from fastapi import APIRouter, Depends, Query, Path
 
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.graph_access.graph_access import GraphApiAccess
-from webviz_services.service_exceptions import Service, AuthorizationError, ServiceRequestError
+from webviz_services.service_exceptions import (
+    Service,
+    AuthorizationError,
+    InvalidParameterError,
+    ServiceRequestError,
+)
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
@@ -16,6 +23,8 @@ LOGGER = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_MAX_USERS_PER_LOOKUP = 100
+
 
 @router.get("/user_info/{user_id_or_email}")
 @cache_time(CacheTime.NORMAL)
@@ -34,12 +43,7 @@ async def get_user_info(
         if not user_info:
             return None
 
-        return schemas.GraphUser(
-            id=user_info["id"],
-            display_name=user_info["displayName"],
-            principal_name=user_info["userPrincipalName"],
-            email=user_info["mail"],
-        )
+        return _to_api_graph_user(user_info)
 
     except httpx.HTTPError as exc:
         raise ServiceRequestError(
@@ -78,3 +82,63 @@ async def get_user_photo(
 
     # Return 404 if no user info was found?
     return user_photo
+
+
+@router.get("/users/")
+@cache_time(CacheTime.NORMAL)
+async def get_users(
+    # fmt:off
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    user_ids_or_emails: list[str] = Query(description="User emails or graph-ids, at most 100"),
+    include_photos: bool = Query(False, description="Also get the avatars of the users"),
+    # fmt:on
+) -> list[schemas.GraphUserLookup]:
+    """
+    Get info, and optionally avatars, for several users in one request.
+
+    Users that are not cached are looked up in batches, and each user is only looked up once even if given several
+    times. Users that are not found have no user info or avatar in the result.
+    """
+    if not authenticated_user.has_graph_access_token():
+        raise AuthorizationError("User can't access Graph API", Service.GENERAL)
+
+    if len(user_ids_or_emails) > _MAX_USERS_PER_LOOKUP:
+        raise InvalidParameterError(f"Can't look up more than {_MAX_USERS_PER_LOOKUP} users at once", Service.GENERAL)
+
+    graph_api_access = GraphApiAccess(authenticated_user.get_graph_access_token())
+
+    try:
+        if include_photos:
+            user_infos, photos = await asyncio.gather(
+                graph_api_access.get_user_infos_async(user_ids_or_emails),
+                graph_api_access.get_user_profile_photos_async(user_ids_or_emails),
+            )
+        else:
+            user_infos = await graph_api_access.get_user_infos_async(user_ids_or_emails)
+            photos = {}
+    except httpx.HTTPError as exc:
+        raise ServiceRequestError(
+            "Error while fetching users from Microsoft Graph API (HTTP error)", Service.GENERAL
+        ) from exc
+
+    lookups = []
+    for user_id_or_email in user_ids_or_emails:
+        user_info = user_infos.get(user_id_or_email)
+        lookups.append(
+            schemas.GraphUserLookup(
+                user_id_or_email=user_id_or_email,
+                user=_to_api_graph_user(user_info) if user_info else None,
+                avatar_b64str=photos.get(user_id_or_email),
+            )
+        )
+
+    return lookups
+
+
+def _to_api_graph_user(user_info: Mapping[str, Any]) -> schemas.GraphUser:
+    return schemas.GraphUser(
+        id=user_info["id"],
+        display_name=user_info["displayName"],
+        principal_name=user_info["userPrincipalName"],
+        email=user_info["mail"],
+    )
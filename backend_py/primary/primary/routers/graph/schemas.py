@@ -10,3 +10,9 @@ class GraphUser(BaseModel):
     principal_name: str
     display_name: str
     email: str
+
+
+class GraphUserLookup(BaseModel):
+    user_id_or_email: str
+    user: GraphUser | None = None
+    avatar_b64str: str | None = None
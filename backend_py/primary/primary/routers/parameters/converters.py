@@ -1,4 +1,9 @@
-from webviz_services.sumo_access.parameter_types import EnsembleParameter, EnsembleSensitivity
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+from webviz_services.sumo_access.parameter_types import (
+    EnsembleParameter,
+    EnsembleParametersColumnar,
+    EnsembleSensitivity,
+)
 from . import schemas
 
 
@@ -24,6 +29,24 @@ def to_api_parameters(parameters: list[EnsembleParameter]) -> list[schemas.Ensem
     return api_parameters
 
 
+def to_api_parameters_columnar(parameters: EnsembleParametersColumnar) -> schemas.EnsembleParametersColumnar:
+    """
+    Convert Sumo ensemble parameters in columnar form to API ensemble parameters in columnar form
+    """
+    return schemas.EnsembleParametersColumnar(
+        realizations=parameters.realizations,
+        names=parameters.names,
+        groupNames=parameters.group_names,
+        descriptiveNames=parameters.descriptive_names,
+        isLogarithmic=parameters.is_logarithmic,
+        isDiscrete=parameters.is_discrete,
+        isConstant=parameters.is_constant,
+        isNumerical=parameters.is_numerical,
+        numericalValues_b64arr=b64_encode_float_array_as_float32(parameters.numerical_values),
+        nonNumericalValues=parameters.non_numerical_values,
+    )
+
+
 def to_api_sensitivities(sensitivities: list[EnsembleSensitivity]) -> list[schemas.EnsembleSensitivity]:
     """
     Convert Sumo ensemble sensitivities to API ensemble sensitivities
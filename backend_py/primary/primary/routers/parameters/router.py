@@ -3,6 +3,7 @@ import logging
 from fastapi import APIRouter, Depends, Query
 
 from webviz_services.sumo_access.parameter_access import ParameterAccess
+from webviz_services.sumo_access.sumo_fingerprinter import get_sumo_fingerprinter_for_user
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
@@ -22,7 +23,7 @@ async def get_parameters_and_sensitivities(
     case_uuid: str = Query(description="Sumo case uuid"),
     ensemble_name: str = Query(description="Ensemble name"),
 ) -> schemas.EnsembleParametersAndSensitivities:
-    access = ParameterAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    access = await _create_parameter_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
     parameters_and_sensitivities = await access.get_parameters_and_sensitivities_async()
 
     return schemas.EnsembleParametersAndSensitivities(
@@ -30,3 +31,36 @@ async def get_parameters_and_sensitivities(
         sensitivities=converters.to_api_sensitivities(parameters_and_sensitivities.sensitivities),
         nonStandardParametersWarning=parameters_and_sensitivities.non_standard_parameters_warning,
     )
+
+
+@router.get("/parameters_and_sensitivities_columnar/")
+@cache_time(CacheTime.LONG)
+async def get_parameters_and_sensitivities_columnar(
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    case_uuid: str = Query(description="Sumo case uuid"),
+    ensemble_name: str = Query(description="Ensemble name"),
+) -> schemas.EnsembleParametersAndSensitivitiesColumnar:
+    """
+    Get the same parameters and sensitivities as /parameters_and_sensitivities/, but with the parameters in columnar
+    form, which is considerably smaller and faster to produce for ensembles with many parameters
+    """
+    access = await _create_parameter_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
+    parameters_and_sensitivities = await access.get_parameters_and_sensitivities_columnar_async()
+
+    return schemas.EnsembleParametersAndSensitivitiesColumnar(
+        parameters=converters.to_api_parameters_columnar(parameters_and_sensitivities.parameters),
+        sensitivities=converters.to_api_sensitivities(parameters_and_sensitivities.sensitivities),
+        nonStandardParametersWarning=parameters_and_sensitivities.non_standard_parameters_warning,
+    )
+
+
+async def _create_parameter_access_with_fingerprint_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> ParameterAccess:
+    # The fingerprint enables caching of the parameters, which are requested by most modules when an ensemble is loaded
+    fingerprinter = get_sumo_fingerprinter_for_user(authenticated_user=authenticated_user, cache_ttl_s=5 * 60)
+    ensemble_fp = await fingerprinter.get_or_calc_ensemble_fp_async(case_uuid, ensemble_name)
+
+    return ParameterAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fingerprint=ensemble_fp
+    )
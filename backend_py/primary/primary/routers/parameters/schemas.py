@@ -2,6 +2,8 @@ from enum import Enum
 
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray
+
 
 class EnsembleParameter(BaseModel):
     """Description/data for a single parameter in an ensemble"""
@@ -17,6 +19,28 @@ class EnsembleParameter(BaseModel):
     values: list[float] | list[int] | list[str]
 
 
+class EnsembleParametersColumnar(BaseModel):
+    """
+    Description/data for all parameters in an ensemble, in columnar form
+
+    The per-parameter arrays are all in the same parameter order. The values of the numerical parameters are given
+    as a base64 encoded float32 matrix, stored row by row with one row per numerical parameter and one column per
+    realization. The values of the other parameters are given as one array per parameter. Both are in the same order
+    as the parameters.
+    """
+
+    realizations: list[int]
+    names: list[str]
+    groupNames: list[str | None]
+    descriptiveNames: list[str | None]
+    isLogarithmic: list[bool]
+    isDiscrete: list[bool]
+    isConstant: list[bool]
+    isNumerical: list[bool]
+    numericalValues_b64arr: B64FloatArray
+    nonNumericalValues: list[list[str]]
+
+
 class SensitivityType(str, Enum):
     MONTECARLO = "montecarlo"
     SCENARIO = "scenario"
@@ -43,3 +67,11 @@ class EnsembleParametersAndSensitivities(BaseModel):
     parameters: list[EnsembleParameter]
     sensitivities: list[EnsembleSensitivity]
     nonStandardParametersWarning: str | None = None
+
+
+class EnsembleParametersAndSensitivitiesColumnar(BaseModel):
+    """Description/data for all parameters, in columnar form, and sensitivities in an ensemble"""
+
+    parameters: EnsembleParametersColumnar
+    sensitivities: list[EnsembleSensitivity]
+    nonStandardParametersWarning: str | None = None
@@ -1,9 +1,13 @@
-from primary.persistence.snapshot_store.documents import SnapshotAccessLogDocument, SnapshotDocument
-from primary.persistence.session_store.documents import SessionDocument
+from primary.persistence.snapshot_store.documents import (
+    SnapshotAccessLogDocument,
+    SnapshotDocument,
+    SnapshotMetadataDocument,
+)
+from primary.persistence.session_store.documents import SessionDocument, SessionMetadataDocument
 from . import schemas
 
 
-def to_api_session_metadata(session: SessionDocument) -> schemas.SessionMetadata:
+def to_api_session_metadata(session: SessionMetadataDocument) -> schemas.SessionMetadata:
     return schemas.SessionMetadata(
         id=session.id,
         ownerId=session.owner_id,
@@ -23,7 +27,7 @@ def to_api_session(document: SessionDocument) -> schemas.Session:
     )
 
 
-def to_api_snapshot_metadata(snapshot: SnapshotDocument) -> schemas.SnapshotMetadata:
+def to_api_snapshot_metadata(snapshot: SnapshotMetadataDocument) -> schemas.SnapshotMetadata:
     return schemas.SnapshotMetadata(
         id=snapshot.id,
         ownerId=snapshot.owner_id,
@@ -163,6 +163,9 @@ async def update_session(
 
     All fields are optional - only provided fields will be updated.
 
+    Set **expectedVersion** to the version the update is based on to have it rejected if the session has been
+    updated by someone else in the meantime.
+
     The system automatically:
     - Updates the `updated_at` timestamp
     - Increments the version number
@@ -181,6 +184,7 @@ async def update_session(
         title=session_update.title,
         description=session_update.description,
         content=session_update.content,
+        expected_version=session_update.expectedVersion,
     )
     return to_api_session(updated_session)
 
@@ -341,6 +345,8 @@ async def get_snapshot(
     - Creates an access log entry if this is your first visit
 
     This allows you to see your viewing history in `/persistence/snapshot_access_logs`.
+    Visits are buffered and written to the access log in the background, repeated visits within a few seconds are
+    written as one update.
 
     Any user with the snapshot ID can access snapshots (they are shareable).
     """
@@ -351,7 +357,7 @@ async def get_snapshot(
     snapshot = await snapshot_store.get_async(snapshot_id)
     # Should we clear the log if a snapshot was not found? This could mean that the snapshot was
     # deleted but deletion of logs has failed
-    await log_store.log_snapshot_visit_async(snapshot_id, snapshot.owner_id)
+    log_store.buffer_snapshot_visit(snapshot_id, snapshot.owner_id)
     return to_api_snapshot(snapshot)
 
 
@@ -63,6 +63,8 @@ class SessionUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     content: Optional[str] = None
+    # If given, the update is rejected if the stored session no longer has this version
+    expectedVersion: Optional[int] = None
 
 
 class NewSnapshot(BaseModel):
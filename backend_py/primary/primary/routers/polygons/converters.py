@@ -1,5 +1,9 @@
 from typing import List
 
+import numpy as np
+
+from webviz_core_utils.b64 import b64_encode_float_array_as_float64, b64_encode_uint_array_as_uint32
+
 from webviz_services.smda_access.types import StratigraphicSurface
 from webviz_services.sumo_access.polygons_types import PolygonsMeta as SumoPolygonsMeta, PolygonData
 
@@ -14,9 +18,9 @@ def to_api_polygons_data(poly_data: list[PolygonData]) -> List[schemas.PolygonDa
     for polygon in poly_data:
         polydata.append(
             schemas.PolygonData(
-                x_arr=polygon.x_arr,
-                y_arr=polygon.y_arr,
-                z_arr=polygon.z_arr,
+                x_arr=polygon.x_arr.tolist(),
+                y_arr=polygon.y_arr.tolist(),
+                z_arr=polygon.z_arr.tolist(),
                 poly_id=polygon.poly_id,
                 name=polygon.name,
             )
@@ -24,6 +28,24 @@ def to_api_polygons_data(poly_data: list[PolygonData]) -> List[schemas.PolygonDa
     return polydata
 
 
+def to_api_polygons_data_b64(poly_data: list[PolygonData]) -> schemas.PolygonsDataB64:
+    """
+    Create a columnar API PolygonsDataB64 object from a list of PolygonData.
+    """
+    poly_lengths = np.fromiter((len(polygon.x_arr) for polygon in poly_data), dtype=np.uint32, count=len(poly_data))
+    poly_start_indices = np.zeros(len(poly_data), dtype=np.uint32)
+    np.cumsum(poly_lengths[:-1], out=poly_start_indices[1:])
+
+    return schemas.PolygonsDataB64(
+        x_b64arr=b64_encode_float_array_as_float64(_concatenate_float_arrays([polygon.x_arr for polygon in poly_data])),
+        y_b64arr=b64_encode_float_array_as_float64(_concatenate_float_arrays([polygon.y_arr for polygon in poly_data])),
+        z_b64arr=b64_encode_float_array_as_float64(_concatenate_float_arrays([polygon.z_arr for polygon in poly_data])),
+        poly_start_indices_b64arr=b64_encode_uint_array_as_uint32(poly_start_indices),
+        poly_ids=[polygon.poly_id for polygon in poly_data],
+        names=[polygon.name for polygon in poly_data],
+    )
+
+
 def to_api_polygons_directory(
     sumo_polygons_dir: List[SumoPolygonsMeta], stratigraphical_names: List[StratigraphicSurface]
 ) -> List[schemas.PolygonsMeta]:
@@ -74,3 +96,7 @@ def _sort_by_stratigraphical_order(
             polygons_metas_with_custom_names.append(polygons_meta)
 
     return polygons_metas_with_official_strat_name + polygons_metas_with_custom_names
+
+
+def _concatenate_float_arrays(arrays: List[np.ndarray]) -> np.ndarray:
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64)
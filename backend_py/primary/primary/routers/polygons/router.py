@@ -1,5 +1,5 @@
 import logging
-from typing import List, Union
+from typing import List, Literal, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -58,7 +58,8 @@ async def get_polygons_data(
     realization_num: int = Query(description="Realization number"),
     name: str = Query(description="Surface name"),
     attribute: str = Query(description="Surface attribute"),
-) -> List[schemas.PolygonData]:
+    data_format: Literal["json", "b64"] = Query("json", description="Encoding of the polygon coordinates"),
+) -> List[schemas.PolygonData] | schemas.PolygonsDataB64:
     timer = PerfTimer()
 
     access = PolygonsAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
@@ -67,7 +68,11 @@ async def get_polygons_data(
     if not xtgeo_poly:
         raise HTTPException(status_code=404, detail="Polygons not found")
 
-    poly_data_response = converters.to_api_polygons_data(xtgeo_poly)
+    poly_data_response: List[schemas.PolygonData] | schemas.PolygonsDataB64
+    if data_format == "b64":
+        poly_data_response = converters.to_api_polygons_data_b64(xtgeo_poly)
+    else:
+        poly_data_response = converters.to_api_polygons_data(xtgeo_poly)
 
     LOGGER.debug(f"Loaded polygons and created response, total time: {timer.elapsed_ms()}ms")
     return poly_data_response
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from enum import Enum
 
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray, B64UintArray
+
 
 class PolygonsAttributeType(str, Enum):
     """
@@ -39,3 +41,21 @@ class PolygonData(BaseModel):
     z_arr: List[float]
     poly_id: int | str
     name: str
+
+
+class PolygonsDataB64(BaseModel):
+    """
+    All polygons in a set as columnar arrays.
+
+    The coordinates of all polygons are concatenated into the x, y and z arrays. The coordinates of polygon i are found
+    in the range [poly_start_indices[i], poly_start_indices[i + 1]), with the last polygon running to the end of the
+    arrays. The coordinates are float64 since float32 lacks the precision needed for UTM coordinates.
+    """
+
+    format: Literal["b64"] = "b64"
+    x_b64arr: B64FloatArray
+    y_b64arr: B64FloatArray
+    z_b64arr: B64FloatArray
+    poly_start_indices_b64arr: B64UintArray
+    poly_ids: list[int | str]
+    names: list[str]
@@ -1,10 +1,12 @@
-from typing import List
+from typing import Any, Iterator, List
 from enum import Enum
 
 import polars as pl
 import pyarrow as pa
 
-from .schemas import PvtData
+from webviz_core_utils.b64 import B64FloatArray, b64_encode_float_array_as_float32
+
+from .schemas import PvtData, PvtDataB64
 
 OIL_KEYWORDS = {"PVTO": "Oil (PVTO)", "PVDO": "Dry Oil (PVDO)", "PVCDO": "Dry Oil (PVCDO)"}
 
@@ -24,6 +26,47 @@ class PHASES(str, Enum):
 
 def pvt_dataframe_to_api_data(pvt_table_pa: pa.Table) -> List[PvtData]:
     """Converts the PVT table from Sumo/Ecl2Df to a list of PvtData objects"""
+    list_of_pvtdata: List[PvtData] = []
+    for name, phase, pvtnum, df_grouped_on_pvtnum in _iterate_pvt_groups(_prepare_pvt_dataframe(pvt_table_pa)):
+        list_of_pvtdata.append(
+            PvtData(
+                pvtnum=pvtnum,
+                name=name,
+                phase=phase,
+                ratio=df_grouped_on_pvtnum["RATIO"].to_numpy().tolist(),
+                pressure=df_grouped_on_pvtnum["PRESSURE"].to_numpy().tolist(),
+                volumefactor=df_grouped_on_pvtnum["VOLUMEFACTOR"].to_numpy().tolist(),
+                viscosity=df_grouped_on_pvtnum["VISCOSITY"].to_numpy().tolist(),
+                density=df_grouped_on_pvtnum["DENSITY"].to_numpy().tolist(),
+                **_get_units(df_grouped_on_pvtnum),
+            )
+        )
+
+    return list_of_pvtdata
+
+
+def pvt_dataframe_to_api_data_b64(pvt_table_pa: pa.Table) -> List[PvtDataB64]:
+    """Converts the PVT table from Sumo/Ecl2Df to a list of PvtDataB64 objects, with the values as base64 arrays"""
+    list_of_pvtdata: List[PvtDataB64] = []
+    for name, phase, pvtnum, df_grouped_on_pvtnum in _iterate_pvt_groups(_prepare_pvt_dataframe(pvt_table_pa)):
+        list_of_pvtdata.append(
+            PvtDataB64(
+                pvtnum=pvtnum,
+                name=name,
+                phase=phase,
+                ratio_b64arr=_column_as_b64_float_array(df_grouped_on_pvtnum, "RATIO"),
+                pressure_b64arr=_column_as_b64_float_array(df_grouped_on_pvtnum, "PRESSURE"),
+                volumefactor_b64arr=_column_as_b64_float_array(df_grouped_on_pvtnum, "VOLUMEFACTOR"),
+                viscosity_b64arr=_column_as_b64_float_array(df_grouped_on_pvtnum, "VISCOSITY"),
+                density_b64arr=_column_as_b64_float_array(df_grouped_on_pvtnum, "DENSITY"),
+                **_get_units(df_grouped_on_pvtnum),
+            )
+        )
+
+    return list_of_pvtdata
+
+
+def _prepare_pvt_dataframe(pvt_table_pa: pa.Table) -> pl.DataFrame:
     # Dataframe manipulation is copied from webviz-subsurface
     dataframe = pl.DataFrame(pvt_table_pa)
 
@@ -63,7 +106,11 @@ def pvt_dataframe_to_api_data(pvt_table_pa: pa.Table) -> List[PvtData]:
     if "RATIO" not in dataframe.columns:
         raise ValueError("The dataframe must contain a column for the ratio (OGR, GOR, R, RV, RS).")
 
-    list_of_pvtdata: List[PvtData] = []
+    return dataframe
+
+
+def _iterate_pvt_groups(dataframe: pl.DataFrame) -> Iterator[tuple[str, str, int, pl.DataFrame]]:
+    """Yields (name, phase, pvtnum, dataframe) for each supported keyword and PVTNUM combination"""
     for group_by_columns, df_grouped_on_keyword in dataframe.group_by("KEYWORD", maintain_order=True):
         keyword = group_by_columns[0]
         if keyword in OIL_KEYWORDS:
@@ -79,43 +126,34 @@ def pvt_dataframe_to_api_data(pvt_table_pa: pa.Table) -> List[PvtData]:
             continue
 
         for group_by_columns, df_grouped_on_pvtnum in df_grouped_on_keyword.group_by("PVTNUM", maintain_order=True):
-            pvtnum = group_by_columns[0]
-            pvt_data = PvtData(
-                pvtnum=pvtnum,
-                name=name,
-                phase=phase,
-                ratio=df_grouped_on_pvtnum["RATIO"].to_numpy().tolist(),
-                pressure=df_grouped_on_pvtnum["PRESSURE"].to_numpy().tolist(),
-                volumefactor=df_grouped_on_pvtnum["VOLUMEFACTOR"].to_numpy().tolist(),
-                viscosity=df_grouped_on_pvtnum["VISCOSITY"].to_numpy().tolist(),
-                density=df_grouped_on_pvtnum["DENSITY"].to_numpy().tolist(),
-                pressure_unit=(
-                    df_grouped_on_pvtnum["PRESSURE_UNIT"][0]
-                    if "PRESSURE_UNIT" in df_grouped_on_pvtnum.columns
-                    else "bar"
-                ),
-                volumefactor_unit=(
-                    df_grouped_on_pvtnum["VOLUMEFACTOR_UNIT"][0]
-                    if "VOLUMEFACTOR_UNIT" in df_grouped_on_pvtnum.columns
-                    else "Rm³/Sm³"
-                ),
-                viscosity_unit=(
-                    df_grouped_on_pvtnum["VISCOSITY_UNIT"][0]
-                    if "VISCOSITY_UNIT" in df_grouped_on_pvtnum.columns
-                    else "cP"
-                ),
-                density_unit=(
-                    df_grouped_on_pvtnum["DENSITY_UNIT"][0]
-                    if "DENSITY_UNIT" in df_grouped_on_pvtnum.columns
-                    else "kg/m³"
-                ),
-                ratio_unit=(
-                    df_grouped_on_pvtnum["RATIO_UNIT"][0] if "RATIO_UNIT" in df_grouped_on_pvtnum.columns else "Sm³/Sm³"
-                ),
-            )
-            list_of_pvtdata.append(pvt_data)
+            yield name, phase, group_by_columns[0], df_grouped_on_pvtnum
+
+
+def _get_units(df_grouped_on_pvtnum: pl.DataFrame) -> dict[str, Any]:
+    return {
+        "pressure_unit": (
+            df_grouped_on_pvtnum["PRESSURE_UNIT"][0] if "PRESSURE_UNIT" in df_grouped_on_pvtnum.columns else "bar"
+        ),
+        "volumefactor_unit": (
+            df_grouped_on_pvtnum["VOLUMEFACTOR_UNIT"][0]
+            if "VOLUMEFACTOR_UNIT" in df_grouped_on_pvtnum.columns
+            else "Rm³/Sm³"
+        ),
+        "viscosity_unit": (
+            df_grouped_on_pvtnum["VISCOSITY_UNIT"][0] if "VISCOSITY_UNIT" in df_grouped_on_pvtnum.columns else "cP"
+        ),
+        "density_unit": (
+            df_grouped_on_pvtnum["DENSITY_UNIT"][0] if "DENSITY_UNIT" in df_grouped_on_pvtnum.columns else "kg/m³"
+        ),
+        "ratio_unit": (
+            df_grouped_on_pvtnum["RATIO_UNIT"][0] if "RATIO_UNIT" in df_grouped_on_pvtnum.columns else "Sm³/Sm³"
+        ),
+    }
 
-    return list_of_pvtdata
+
+def _column_as_b64_float_array(dataframe: pl.DataFrame, column_name: str) -> B64FloatArray:
+    # The nulls have been filled, so for float64 columns to_numpy() is a zero-copy view of the polars buffer
+    return b64_encode_float_array_as_float32(dataframe[column_name].to_numpy())
 
 
 def calculate_densities(data_frame: pl.DataFrame) -> pl.DataFrame:
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -9,8 +9,8 @@ from webviz_services.utils.authenticated_user import AuthenticatedUser
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
 
-from .converters import pvt_dataframe_to_api_data
-from .schemas import PvtData
+from .converters import pvt_dataframe_to_api_data, pvt_dataframe_to_api_data_b64
+from .schemas import PvtData, PvtDataB64
 
 LOGGER = logging.getLogger(__name__)
 
@@ -25,8 +25,9 @@ async def get_pvt_table_data(
     case_uuid: str = Query(description="Sumo case uuid"),
     ensemble_name: str = Query(description="Ensemble name"),
     realization: int = Query(description="Realization number"),
+    data_format: Literal["json", "b64"] = Query("json", description="Encoding of the numeric arrays in the response"),
     # fmt:on
-) -> List[PvtData]:
+) -> List[PvtData] | List[PvtDataB64]:
     """Get pvt table data for a given Sumo ensemble and realization"""
 
     access = TableAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
@@ -43,6 +44,7 @@ async def get_pvt_table_data(
         raise HTTPException(status_code=404, detail="PVT table not found")
 
     sumo_table_data = await access.get_realization_table_async(table_schema, realization=realization)
-    pvt_data = pvt_dataframe_to_api_data(sumo_table_data)
+    if data_format == "b64":
+        return pvt_dataframe_to_api_data_b64(sumo_table_data)
 
-    return pvt_data
+    return pvt_dataframe_to_api_data(sumo_table_data)
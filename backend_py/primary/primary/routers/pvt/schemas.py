@@ -1,7 +1,9 @@
-from typing import List
+from typing import List, Literal
 
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray
+
 
 class PvtData(BaseModel):
     name: str
@@ -17,3 +19,20 @@ class PvtData(BaseModel):
     viscosity_unit: str
     density_unit: str
     ratio_unit: str
+
+
+class PvtDataB64(BaseModel):
+    format: Literal["b64"] = "b64"
+    name: str
+    phase: str
+    pvtnum: int
+    ratio_b64arr: B64FloatArray
+    pressure_b64arr: B64FloatArray
+    volumefactor_b64arr: B64FloatArray
+    viscosity_b64arr: B64FloatArray
+    density_b64arr: B64FloatArray
+    pressure_unit: str
+    volumefactor_unit: str
+    viscosity_unit: str
+    density_unit: str
+    ratio_unit: str
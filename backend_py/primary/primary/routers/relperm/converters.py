@@ -1,4 +1,11 @@
-from webviz_services.sumo_access.relperm_types import RelpermRealizationData, RelpermTableDefinition
+import numpy as np
+
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_uint_array_as_smallest_size
+from webviz_services.sumo_access.relperm_types import (
+    RelpermRealizationData,
+    RelpermSatnumCurveArrays,
+    RelpermTableDefinition,
+)
 
 from . import schemas
 
@@ -48,3 +55,28 @@ def to_api_realization_data_response(
         ],
         realization_data=[to_api_realization_data(item) for item in realization_data_arr],
     )
+
+
+def to_api_realization_data_response_b64(
+    curve_arrays_by_satnum: list[RelpermSatnumCurveArrays],
+) -> schemas.RelpermRealizationDataResponseB64:
+    saturation_name = curve_arrays_by_satnum[0].saturation_name if curve_arrays_by_satnum else ""
+
+    return schemas.RelpermRealizationDataResponseB64(
+        saturation_name=saturation_name,
+        satnum_data=[
+            schemas.RelpermSatnumDataB64(
+                satnum=curve_arrays.satnum,
+                saturation_values_b64arr=b64_encode_float_array_as_float32(curve_arrays.saturation_values),
+                realizations_b64arr=b64_encode_uint_array_as_smallest_size(curve_arrays.realizations.astype(np.uint32)),
+                curve_values=[
+                    schemas.RelpermCurveValuesB64(
+                        curve_name=curve_name,
+                        values_b64arr=b64_encode_float_array_as_float32(curve_arrays.curve_values[curve_index]),
+                    )
+                    for curve_index, curve_name in enumerate(curve_arrays.curve_names)
+                ],
+            )
+            for curve_arrays in curve_arrays_by_satnum
+        ],
+    )
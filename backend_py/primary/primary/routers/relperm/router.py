@@ -1,13 +1,14 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from webviz_services.sumo_access.relperm_access import RelpermAccess
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import CacheTime, cache_time
+from primary.utils.response_perf_metrics import ResponsePerfMetrics
 from primary.utils.query_string_utils import decode_uint_list_str
 
 from . import converters, schemas
@@ -43,7 +44,9 @@ async def get_relperm_table_definition(
 
 @router.get("/realization_data")
 @cache_time(CacheTime.LONG)
+# pylint: disable-next=too-many-arguments
 async def get_relperm_realization_data(
+    response: Response,
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
     case_uuid: Annotated[str, Query(description="Sumo case uuid")],
     ensemble_name: Annotated[str, Query(description="Ensemble name")],
@@ -57,18 +60,41 @@ async def get_relperm_realization_data(
             description="Optional list of realizations encoded as string to include. If not specified, all realizations will be included."
         ),
     ] = None,
-) -> schemas.RelpermRealizationDataResponse:
+    data_format: Annotated[
+        Literal["json", "b64"], Query(description="Encoding of the numeric arrays in the response")
+    ] = "json",
+) -> schemas.RelpermRealizationDataResponse | schemas.RelpermRealizationDataResponseB64:
+    perf_metrics = ResponsePerfMetrics(response)
+
     realizations: list[int] | None = None
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
     access = RelpermAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
-    realization_data = await access.get_realization_data_async(
-        table_name=table_name,
-        saturation_axis_name=saturation_axis_name,
-        curve_names=curve_names,
-        satnums=satnums,
-        realizations=realizations,
-    )
-
-    return converters.to_api_realization_data_response(realization_data)
+
+    ret_response: schemas.RelpermRealizationDataResponse | schemas.RelpermRealizationDataResponseB64
+    if data_format == "b64":
+        curve_arrays_by_satnum = await access.get_realization_curve_arrays_async(
+            table_name=table_name,
+            saturation_axis_name=saturation_axis_name,
+            curve_names=curve_names,
+            satnums=satnums,
+            realizations=realizations,
+        )
+        perf_metrics.record_lap("get-data")
+        ret_response = converters.to_api_realization_data_response_b64(curve_arrays_by_satnum)
+    else:
+        realization_data = await access.get_realization_data_async(
+            table_name=table_name,
+            saturation_axis_name=saturation_axis_name,
+            curve_names=curve_names,
+            satnums=satnums,
+            realizations=realizations,
+        )
+        perf_metrics.record_lap("get-data")
+        ret_response = converters.to_api_realization_data_response(realization_data)
+
+    perf_metrics.record_lap("convert")
+    LOGGER.debug(f"Relperm realization data ({data_format=}) took: {perf_metrics.to_string()}")
+
+    return ret_response
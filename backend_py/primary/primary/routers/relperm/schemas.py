@@ -1,5 +1,9 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray, B64UintArray
+
 
 class RelpermSaturationAxis(BaseModel):
     saturation_name: str
@@ -34,3 +38,26 @@ class RelpermRealizationDataResponse(BaseModel):
     saturation_name: str
     saturation_values_by_satnum: list[RelpermSaturationValues]
     realization_data: list[RelpermRealizationData]
+
+
+class RelpermCurveValuesB64(BaseModel):
+    """
+    Values of one curve for all realizations of a SATNUM, as a row-major matrix with one row per realization
+    and one column per saturation value.
+    """
+
+    curve_name: str
+    values_b64arr: B64FloatArray
+
+
+class RelpermSatnumDataB64(BaseModel):
+    satnum: int
+    saturation_values_b64arr: B64FloatArray
+    realizations_b64arr: B64UintArray
+    curve_values: list[RelpermCurveValuesB64]
+
+
+class RelpermRealizationDataResponseB64(BaseModel):
+    format: Literal["b64"] = "b64"
+    saturation_name: str
+    satnum_data: list[RelpermSatnumDataB64]
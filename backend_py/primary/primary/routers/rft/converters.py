@@ -1,4 +1,4 @@
-from webviz_services.sumo_access.rft_types import RftTableDefinition
+from webviz_services.sumo_access.rft_types import RftTableDefinition, RftRealizationData
 from webviz_services.sumo_access.observation_types import RftObservations
 
 from . import schemas
@@ -20,6 +20,22 @@ def to_api_table_definition(
     )
 
 
+def to_api_realization_data(
+    realization_data: list[RftRealizationData],
+) -> list[schemas.RftRealizationData]:
+    """Converts RFT realization data from the sumo service to the API format"""
+    return [
+        schemas.RftRealizationData(
+            well_name=item.well_name,
+            realization=item.realization,
+            timestamp_utc_ms=item.timestamp_utc_ms,
+            depth_arr=item.depth_arr,
+            value_arr=item.value_arr,
+        )
+        for item in realization_data
+    ]
+
+
 def to_api_rft_observations(
     observations: list[RftObservations],
 ) -> list[schemas.RftObservations]:
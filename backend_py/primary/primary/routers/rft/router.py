@@ -1,15 +1,17 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from webviz_services.sumo_access.rft_access import RftAccess
 from webviz_services.sumo_access.observation_access import ObservationAccess
+from webviz_services.sumo_access.sumo_fingerprinter import get_sumo_fingerprinter_for_user
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
 from primary.utils.query_string_utils import decode_uint_list_str
+from primary.utils.response_perf_metrics import ResponsePerfMetrics
 
 from . import schemas
 from . import converters
@@ -54,7 +56,7 @@ async def get_rft_realization_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = RftAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    access = await _create_rft_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
     data = await access.get_rft_well_realization_data_async(
         well_name=well_name,
         response_name=response_name,
@@ -62,17 +64,50 @@ async def get_rft_realization_data(
         realizations=realizations,
     )
 
+    return converters.to_api_realization_data(data)
+
+
+@router.get("/rft_realization_data_for_wells")
+@cache_time(CacheTime.LONG)
+async def get_rft_realization_data_for_wells(
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    well_names: Annotated[list[str], Query(description="Well names")],
+    response_name: Annotated[str, Query(description="Response name")],
+    timestamps_utc_ms: Annotated[list[int] | None, Query(description="Timestamps utc ms")] = None,
+    realizations_encoded_as_uint_list_str: Annotated[
+        str | None,
+        Query(
+            description="Optional list of realizations encoded as string to include. If not specified, all realizations will be included."
+        ),
+    ] = None,
+) -> list[schemas.RftRealizationData]:
+    """Get a list of RFT data per realization, for multiple wells and a given response."""
+    perf_metrics = ResponsePerfMetrics(response)
+
+    realizations: list[int] | None = None
+    if realizations_encoded_as_uint_list_str:
+        realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
+
+    access = await _create_rft_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
+    perf_metrics.record_lap("get-fingerprint")
+
+    data_per_well = await access.get_rft_wells_realization_data_async(
+        well_names=well_names,
+        response_name=response_name,
+        timestamps_utc_ms=timestamps_utc_ms,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-data")
+
     ret_data: list[schemas.RftRealizationData] = []
-    for item in data:
-        ret_data.append(
-            schemas.RftRealizationData(
-                well_name=item.well_name,
-                realization=item.realization,
-                timestamp_utc_ms=item.timestamp_utc_ms,
-                depth_arr=item.depth_arr,
-                value_arr=item.value_arr,
-            )
-        )
+    for data in data_per_well.values():
+        ret_data.extend(converters.to_api_realization_data(data))
+    perf_metrics.record_lap("convert")
+
+    LOGGER.debug(f"Got RFT data for {len(data_per_well)} wells in: {perf_metrics.to_string()}")
 
     return ret_data
 
@@ -89,3 +124,15 @@ async def get_rft_observations(
     observations = await access.get_rft_observations_async()
 
     return converters.to_api_rft_observations(observations)
+
+
+async def _create_rft_access_with_fingerprint_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> RftAccess:
+    # The fingerprint enables caching of the ensemble wide RFT tables, which are shared between wells
+    fingerprinter = get_sumo_fingerprinter_for_user(authenticated_user=authenticated_user, cache_ttl_s=5 * 60)
+    ensemble_fp = await fingerprinter.get_or_calc_ensemble_fp_async(case_uuid, ensemble_name)
+
+    return RftAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fingerprint=ensemble_fp
+    )
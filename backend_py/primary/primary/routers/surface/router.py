@@ -4,6 +4,7 @@ from typing import Annotated, List, Optional, Literal
 
 import xtgeo
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, Body, status
+from fastapi.responses import StreamingResponse
 
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_core_utils.type_utils import expect_type
@@ -291,6 +292,7 @@ async def get_statistical_surface_data_hybrid(
     data_format: Annotated[Literal["float", "png"], Query(description="Format of binary data in the response")] = "float",
     resample_to: Annotated[schemas.SurfaceDef | None, Depends(dependencies.get_resample_to_param_from_keyval_str)] = None,
     delete_task: Annotated[bool, Query(description="If true, deletes the server-side task metadata for this surface address")] = False,
+    long_poll_timeout_s: Annotated[float, Query(ge=0, le=60, description="If larger than 0, the server holds the request for up to this many seconds waiting for the task to complete")] = 0,
     # fmt:on
 ) -> (
     LroSuccessResp[schemas.SurfaceDataFloat | schemas.SurfaceDataPng]
@@ -339,8 +341,8 @@ async def get_statistical_surface_data_hybrid(
         perf_metrics.record_lap("submit")
 
     try:
-        maybe_xtgeo_surf = await access.poll_statistical_surface_calculation_task_async(
-            sumo_task_id=task_meta.task_id, timeout_s=0
+        maybe_xtgeo_surf = await task_helpers.poll_stat_surf_task_async(
+            access, task_tracker, task_meta, long_poll_timeout_s
         )
         perf_metrics.record_lap("poll")
 
@@ -371,6 +373,41 @@ async def get_statistical_surface_data_hybrid(
         raise
 
 
+@router.get("/statistical_surface_task_status_sse", response_class=StreamingResponse)
+async def get_statistical_surface_task_status_sse(
+    # fmt:off
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    surf_addr_str: Annotated[str, Query(description="Surface address string, supported address type is *STAT*")],
+    max_duration_s: Annotated[float, Query(ge=1, le=600, description="Maximum duration of the stream in seconds")] = 300,
+    # fmt:on
+) -> StreamingResponse:
+    """
+    Server-sent event stream with the status of the task backing a statistical surface.
+
+    The task must already have been submitted through the *statistical_surface_data_hybrid* endpoint.
+    Emits *LroInProgressResp* events while the task is running and ends with either a *LroCompletedResp* event,
+    after which the result can be fetched from the hybrid endpoint, or a *LroFailureResp* event.
+    """
+    addr = decode_surf_addr_str(surf_addr_str)
+    if not isinstance(addr, StatisticalSurfaceAddress):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Endpoint only supports address type STAT")
+
+    access = SurfaceAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), addr.case_uuid, addr.ensemble_name
+    )
+    task_tracker = get_task_meta_tracker_for_user(authenticated_user)
+
+    task_fp = await task_helpers.determine_surf_task_fingerprint_async(authenticated_user, addr)
+    task_meta = await task_tracker.get_task_meta_by_fingerprint_async(task_fp)
+    if not task_meta:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No task found for surface address")
+
+    event_generator = task_helpers.generate_stat_surf_task_status_events_async(
+        access, task_tracker, task_meta, max_duration_s
+    )
+    return StreamingResponse(event_generator, media_type="text/event-stream", headers={"X-Accel-Buffering": "no"})
+
+
 @router.post("/get_surface_intersection")
 async def post_get_surface_intersection(
     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
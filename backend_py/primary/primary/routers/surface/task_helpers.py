@@ -1,14 +1,19 @@
+import asyncio
 import logging
 import time
 from hashlib import sha256
+from typing import AsyncIterator, Literal
 
+import xtgeo
+
+from webviz_core_utils.exponential_backoff_timer import ExponentialBackoffTimer
 from webviz_services.sumo_access.sumo_fingerprinter import get_sumo_fingerprinter_for_user
 from webviz_services.sumo_access.surface_access import ExpectedError, InProgress, SurfaceAccess
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.utils.statistic_function import StatisticFunction
 from webviz_services.utils.task_meta_tracker import TaskMeta, TaskMetaTracker
 
-from .._shared.long_running_operations import LroFailureResp, LroInProgressResp
+from .._shared.long_running_operations import LroCompletedResp, LroFailureResp, LroInProgressResp
 from .surface_address import StatisticalSurfaceAddress
 
 LOGGER = logging.getLogger(__name__)
@@ -57,6 +62,83 @@ async def submit_and_track_stat_surf_task_async(
     return task_meta
 
 
+async def poll_stat_surf_task_async(
+    access: SurfaceAccess, task_tracker: TaskMetaTracker, task_meta: TaskMeta, long_poll_timeout_s: float
+) -> xtgeo.RegularSurface | InProgress | ExpectedError:
+    """
+    Poll the Sumo task backing a statistical surface, holding on for up to long_poll_timeout_s seconds waiting for
+    it to finish. Use a long_poll_timeout_s of 0 to do a single poll.
+
+    While waiting we re-poll Sumo with exponential backoff, but wake up early if some other worker observes that the
+    task has finished and signals it through the task tracker. Conversely, when we observe that the task has
+    finished, the outcome is recorded in the tracker so that any other waiters get notified.
+    """
+    backoff_timer = ExponentialBackoffTimer(initial_delay_s=1, max_delay_s=10, max_total_duration_s=long_poll_timeout_s)
+    outcome_was_signalled = False
+
+    while True:
+        poll_res = await access.poll_statistical_surface_calculation_task_async(
+            sumo_task_id=task_meta.task_id, timeout_s=0
+        )
+        if not isinstance(poll_res, InProgress):
+            final_outcome: Literal["success", "failure"] = (
+                "failure" if isinstance(poll_res, ExpectedError) else "success"
+            )
+            if task_meta.final_outcome != final_outcome:
+                await task_tracker.set_final_outcome_async(task_meta.task_id, final_outcome)
+            return poll_res
+
+        next_delay_s = backoff_timer.next_delay_s()
+        if next_delay_s is None:
+            return poll_res
+
+        # If an outcome has already been signalled, but Sumo still reports the task as running, waiting on the
+        # tracker would return immediately, so fall back to a plain sleep to avoid hammering Sumo.
+        if outcome_was_signalled:
+            await asyncio.sleep(next_delay_s)
+        else:
+            signalled_outcome = await task_tracker.wait_for_final_outcome_async(task_meta.task_id, next_delay_s)
+            outcome_was_signalled = signalled_outcome is not None
+
+
+async def generate_stat_surf_task_status_events_async(
+    access: SurfaceAccess, task_tracker: TaskMetaTracker, task_meta: TaskMeta, max_duration_s: float
+) -> AsyncIterator[str]:
+    """
+    Generate a stream of server-sent events with the status of the Sumo task backing a statistical surface.
+
+    Emits a LroInProgressResp event for every poll while the task is running, and terminates with either a
+    LroCompletedResp or a LroFailureResp event. If max_duration_s expires before the task finishes, the stream ends
+    after the last in-progress event and the client is expected to reconnect.
+    """
+    backoff_timer = ExponentialBackoffTimer(initial_delay_s=1, max_delay_s=10, max_total_duration_s=max_duration_s)
+    outcome_was_signalled = False
+
+    while True:
+        task_status = await access.poll_statistical_surface_calculation_task_status_async(task_meta.task_id)
+        if task_status == "succeeded":
+            await task_tracker.set_final_outcome_async(task_meta.task_id, "success")
+            yield _to_sse_event_str(LroCompletedResp(task_id=task_meta.task_id))
+            return
+        if task_status == "failed":
+            await task_tracker.set_final_outcome_async(task_meta.task_id, "failure")
+            err_msg = f"Statistical surface aggregation job failed ({task_meta.task_id=})"
+            yield _to_sse_event_str(make_lro_failure_resp(ExpectedError(message=err_msg)))
+            return
+
+        yield _to_sse_event_str(make_lro_in_progress_resp(task_meta, False, task_status))
+
+        next_delay_s = backoff_timer.next_delay_s()
+        if next_delay_s is None:
+            return
+
+        if outcome_was_signalled:
+            await asyncio.sleep(next_delay_s)
+        else:
+            signalled_outcome = await task_tracker.wait_for_final_outcome_async(task_meta.task_id, next_delay_s)
+            outcome_was_signalled = signalled_outcome is not None
+
+
 def make_lro_in_progress_resp(
     task_meta: TaskMeta, task_just_submitted: bool, prog_obj_from_access: InProgress
 ) -> LroInProgressResp:
@@ -71,3 +153,7 @@ def make_lro_in_progress_resp(
 
 def make_lro_failure_resp(err_obj_from_access: ExpectedError) -> LroFailureResp:
     return LroFailureResp(error_message=err_obj_from_access.message)
+
+
+def _to_sse_event_str(lro_resp: LroInProgressResp | LroFailureResp | LroCompletedResp) -> str:
+    return f"event: {lro_resp.response_type}\ndata: {lro_resp.model_dump_json()}\n\n"
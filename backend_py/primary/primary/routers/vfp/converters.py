@@ -1,3 +1,6 @@
+from typing import Any
+
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32
 from webviz_services.sumo_access.vfp_types import VfpProdTable, VfpInjTable
 
 from . import schemas
@@ -8,41 +11,64 @@ def to_api_table_definitions(
 ) -> schemas.VfpProdTable | schemas.VfpInjTable:
     """Converts the vfp table definitions from the sumo service to the API format"""
     if isinstance(vfp_table, VfpProdTable):
-        return schemas.VfpProdTable(
-            tableNumber=vfp_table.table_number,
-            datum=vfp_table.datum,
-            thpType=vfp_table.thp_type,
-            wfrType=vfp_table.wfr_type,
-            gfrType=vfp_table.gfr_type,
-            alqType=vfp_table.alq_type,
-            flowRateType=vfp_table.flow_rate_type,
-            unitType=vfp_table.unit_type,
-            tabType=vfp_table.tab_type,
-            thpValues=vfp_table.thp_values,
-            wfrValues=vfp_table.wfr_values,
-            gfrValues=vfp_table.gfr_values,
-            alqValues=vfp_table.alq_values,
-            flowRateValues=vfp_table.flow_rate_values,
-            bhpValues=vfp_table.bhp_values,
-            flowRateUnit=vfp_table.flow_rate_unit,
-            thpUnit=vfp_table.thp_unit,
-            wfrUnit=vfp_table.wfr_unit,
-            gfrUnit=vfp_table.gfr_unit,
-            alqUnit=vfp_table.alq_unit,
-            bhpUnit=vfp_table.bhp_unit,
+        return schemas.VfpProdTable(**_get_prod_table_meta(vfp_table), bhpValues=vfp_table.bhp_values.tolist())
+    if isinstance(vfp_table, VfpInjTable):
+        return schemas.VfpInjTable(**_get_inj_table_meta(vfp_table), bhpValues=vfp_table.bhp_values.tolist())
+    raise ValueError("Unhandled VFP table type when converting to schema")
+
+
+def to_api_table_definitions_b64(
+    vfp_table: VfpProdTable | VfpInjTable,
+) -> schemas.VfpProdTableB64 | schemas.VfpInjTableB64:
+    """Converts the vfp table definitions from the sumo service to the API format, with BHP values as base64 array"""
+    if isinstance(vfp_table, VfpProdTable):
+        return schemas.VfpProdTableB64(
+            **_get_prod_table_meta(vfp_table),
+            bhpValuesB64arr=b64_encode_float_array_as_float32(vfp_table.bhp_values),
         )
     if isinstance(vfp_table, VfpInjTable):
-        return schemas.VfpInjTable(
-            tableNumber=vfp_table.table_number,
-            datum=vfp_table.datum,
-            flowRateType=vfp_table.flow_rate_type,
-            unitType=vfp_table.unit_type,
-            tabType=vfp_table.tab_type,
-            thpValues=vfp_table.thp_values,
-            flowRateValues=vfp_table.flow_rate_values,
-            bhpValues=vfp_table.bhp_values,
-            flowRateUnit=vfp_table.flow_rate_unit,
-            thpUnit=vfp_table.thp_unit,
-            bhpUnit=vfp_table.bhp_unit,
+        return schemas.VfpInjTableB64(
+            **_get_inj_table_meta(vfp_table),
+            bhpValuesB64arr=b64_encode_float_array_as_float32(vfp_table.bhp_values),
         )
     raise ValueError("Unhandled VFP table type when converting to schema")
+
+
+def _get_prod_table_meta(vfp_table: VfpProdTable) -> dict[str, Any]:
+    return {
+        "tableNumber": vfp_table.table_number,
+        "datum": vfp_table.datum,
+        "thpType": vfp_table.thp_type,
+        "wfrType": vfp_table.wfr_type,
+        "gfrType": vfp_table.gfr_type,
+        "alqType": vfp_table.alq_type,
+        "flowRateType": vfp_table.flow_rate_type,
+        "unitType": vfp_table.unit_type,
+        "tabType": vfp_table.tab_type,
+        "thpValues": vfp_table.thp_values.tolist(),
+        "wfrValues": vfp_table.wfr_values.tolist(),
+        "gfrValues": vfp_table.gfr_values.tolist(),
+        "alqValues": vfp_table.alq_values.tolist(),
+        "flowRateValues": vfp_table.flow_rate_values.tolist(),
+        "flowRateUnit": vfp_table.flow_rate_unit,
+        "thpUnit": vfp_table.thp_unit,
+        "wfrUnit": vfp_table.wfr_unit,
+        "gfrUnit": vfp_table.gfr_unit,
+        "alqUnit": vfp_table.alq_unit,
+        "bhpUnit": vfp_table.bhp_unit,
+    }
+
+
+def _get_inj_table_meta(vfp_table: VfpInjTable) -> dict[str, Any]:
+    return {
+        "tableNumber": vfp_table.table_number,
+        "datum": vfp_table.datum,
+        "flowRateType": vfp_table.flow_rate_type,
+        "unitType": vfp_table.unit_type,
+        "tabType": vfp_table.tab_type,
+        "thpValues": vfp_table.thp_values.tolist(),
+        "flowRateValues": vfp_table.flow_rate_values.tolist(),
+        "flowRateUnit": vfp_table.flow_rate_unit,
+        "thpUnit": vfp_table.thp_unit,
+        "bhpUnit": vfp_table.bhp_unit,
+    }
@@ -1,4 +1,5 @@
 import logging
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Query, Response
 
@@ -51,9 +52,10 @@ async def get_vfp_table(
     case_uuid: str = Query(description="Sumo case uuid"),
     ensemble_name: str = Query(description="Ensemble name"),
     realization: int = Query(description="Realization"),
-    vfp_table_name: str = Query(description="VFP table name")
+    vfp_table_name: str = Query(description="VFP table name"),
+    data_format: Literal["json", "b64"] = Query("json", description="Encoding of the BHP values in the response"),
     # fmt:on
-) -> schemas.VfpProdTable | schemas.VfpInjTable:
+) -> schemas.VfpProdTable | schemas.VfpInjTable | schemas.VfpProdTableB64 | schemas.VfpInjTableB64:
     """
     Get the VFP table for a given ensemble, realization and table name.
     """
@@ -67,6 +69,14 @@ async def get_vfp_table(
     )
 
     perf_metrics.record_lap("get-vfp-table")
+
+    api_table: schemas.VfpProdTable | schemas.VfpInjTable | schemas.VfpProdTableB64 | schemas.VfpInjTableB64
+    if data_format == "b64":
+        api_table = converters.to_api_table_definitions_b64(vfp_table)
+    else:
+        api_table = converters.to_api_table_definitions(vfp_table)
+
+    perf_metrics.record_lap("convert")
     LOGGER.info(f"VFP table loaded in: {perf_metrics.to_string()}")
 
-    return converters.to_api_table_definitions(vfp_table)
+    return api_table
@@ -3,6 +3,7 @@ from typing import Literal
 
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray
 from webviz_services.sumo_access.vfp_types import THP, WFR, GFR, ALQ, FlowRateType, UnitType, TabType
 
 
@@ -42,3 +43,39 @@ class VfpProdTable(VfpTableBase):
 
 class VfpInjTable(VfpTableBase):
     vfpType: Literal[VfpType.INJ] = VfpType.INJ
+
+
+class VfpTableB64Base(BaseModel):
+    """Same as VfpTableBase, but with the (potentially large) BHP values encoded as a base64 array"""
+
+    format: Literal["b64"] = "b64"
+    vfpType: Literal[VfpType.INJ, VfpType.PROD]
+    tableNumber: int
+    datum: float
+    flowRateType: FlowRateType
+    unitType: UnitType
+    tabType: TabType
+    thpValues: list[float]
+    flowRateValues: list[float]
+    bhpValuesB64arr: B64FloatArray
+    flowRateUnit: str
+    thpUnit: str
+    bhpUnit: str
+
+
+class VfpProdTableB64(VfpTableB64Base):
+    vfpType: Literal[VfpType.PROD] = VfpType.PROD
+    thpType: THP
+    wfrType: WFR
+    gfrType: GFR
+    alqType: ALQ
+    wfrValues: list[float]
+    gfrValues: list[float]
+    alqValues: list[float]
+    wfrUnit: str
+    gfrUnit: str
+    alqUnit: str
+
+
+class VfpInjTableB64(VfpTableB64Base):
+    vfpType: Literal[VfpType.INJ] = VfpType.INJ
@@ -1,6 +1,10 @@
+import numpy as np
+
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_uint_array_as_uint32
 from webviz_services.smda_access.types import (
     WellboreHeader,
     WellboreTrajectory,
+    WellboreTrajectoriesColumnar,
     WellborePick,
     StratigraphicColumn,
     WellboreGeoHeader,
@@ -90,6 +94,26 @@ def convert_well_trajectory_to_schema(
     )
 
 
+def convert_well_trajectories_columnar_to_schema_b64(
+    trajectories: WellboreTrajectoriesColumnar,
+) -> schemas.WellboreTrajectoriesB64:
+    # Whole meter origins keep the float32 offsets well within millimeter precision for field sized extents
+    easting_origin = float(np.floor(trajectories.easting_arr.min())) if trajectories.easting_arr.size > 0 else 0.0
+    northing_origin = float(np.floor(trajectories.northing_arr.min())) if trajectories.northing_arr.size > 0 else 0.0
+
+    return schemas.WellboreTrajectoriesB64(
+        wellboreUuids=trajectories.wellbore_uuids,
+        uniqueWellboreIdentifiers=trajectories.unique_wellbore_identifiers,
+        startIndicesB64arr=b64_encode_uint_array_as_uint32(trajectories.start_indices),
+        eastingOrigin=easting_origin,
+        northingOrigin=northing_origin,
+        tvdMslB64arr=b64_encode_float_array_as_float32(trajectories.tvd_msl_arr),
+        mdB64arr=b64_encode_float_array_as_float32(trajectories.md_arr),
+        eastingB64arr=b64_encode_float_array_as_float32(trajectories.easting_arr - easting_origin),
+        northingB64arr=b64_encode_float_array_as_float32(trajectories.northing_arr - northing_origin),
+    )
+
+
 def convert_field_perforations_to_schema(
     perforations: list[WellborePerforation],
 ) -> list[schemas.WellborePerforations]:
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from webviz_core_utils.ttl_cache import TtlCache
+
+from webviz_services.smda_access import SmdaAccess
+from webviz_services.smda_access import GeologyAccess as SmdaGeologyAccess
+from webviz_services.service_exceptions import NoDataError, Service, ServiceLayerException, ServiceTimeoutError
+from webviz_services.ssdl_access.well_access import WellAccess as SsdlWellAccess
+from webviz_services.ssdl_access.drogon import DrogonWellAccess
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+from primary.utils.drogon import is_drogon_identifier
+
+from . import schemas
+from . import converters
+
+LOGGER = logging.getLogger(__name__)
+
+# Max time to wait for a single log curve header source. Sources that fail or time out are left out of the response.
+LOG_CURVE_HEADER_SOURCE_TIMEOUT_S = 15
+
+# Log curve headers keyed by (user id, wellbore uuid, source). Keyed per user since access to wellbore data in SMDA and
+# SSDL may differ between users.
+_LOG_CURVE_HEADERS_CACHE: TtlCache[
+    tuple[str, str, schemas.WellLogCurveSourceEnum], list[schemas.WellboreLogCurveHeader]
+] = TtlCache(max_entries=2000, ttl_s=10 * 60)
+
+
+@dataclass(frozen=True)
+class LogCurveHeadersResult:
+    headers_per_wellbore: dict[str, list[schemas.WellboreLogCurveHeader]]
+    # Sources that failed or timed out per wellbore, empty if all sources were fetched
+    failed_sources_per_wellbore: dict[str, list[schemas.WellLogCurveSourceEnum]]
+
+    @property
+    def is_partial(self) -> bool:
+        return any(self.failed_sources_per_wellbore.values())
+
+
+async def get_log_curve_headers_for_wellbores_async(
+    authenticated_user: AuthenticatedUser, wellbore_uuids: list[str], sources: list[schemas.WellLogCurveSourceEnum]
+) -> LogCurveHeadersResult:
+    """
+    Fetch the headers from all sources for all wellbores concurrently.
+
+    Sources that fail or time out are logged and left out, giving partial results, and are listed per wellbore in the
+    result. An error is only raised if every single source fails.
+    """
+    # Keep the order of the sources fixed, independent of the order in the query
+    ordered_sources = [source for source in schemas.WellLogCurveSourceEnum if source in sources]
+    unique_wellbore_uuids = list(dict.fromkeys(wellbore_uuids))
+
+    wellbore_source_pairs = [(uuid, source) for uuid in unique_wellbore_uuids for source in ordered_sources]
+    results = await asyncio.gather(
+        *[
+            _get_cached_headers_from_source_async(authenticated_user, wellbore_uuid, source)
+            for wellbore_uuid, source in wellbore_source_pairs
+        ],
+        return_exceptions=True,
+    )
+
+    headers_per_wellbore: dict[str, list[schemas.WellboreLogCurveHeader]] = {uuid: [] for uuid in unique_wellbore_uuids}
+    failed_sources_per_wellbore: dict[str, list[schemas.WellLogCurveSourceEnum]] = {
+        uuid: [] for uuid in unique_wellbore_uuids
+    }
+    errors: list[ServiceLayerException] = []
+    for (wellbore_uuid, source), result in zip(wellbore_source_pairs, results):
+        if isinstance(result, ServiceLayerException):
+            LOGGER.warning(f"Leaving out log curve headers from {source.value} for {wellbore_uuid=}: {result}")
+            failed_sources_per_wellbore[wellbore_uuid].append(source)
+            errors.append(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            headers_per_wellbore[wellbore_uuid].extend(result)
+
+    if errors and len(errors) == len(results):
+        raise errors[0]
+
+    return LogCurveHeadersResult(
+        headers_per_wellbore=headers_per_wellbore, failed_sources_per_wellbore=failed_sources_per_wellbore
+    )
+
+
+async def _get_cached_headers_from_source_async(
+    authenticated_user: AuthenticatedUser, wellbore_uuid: str, source: schemas.WellLogCurveSourceEnum
+) -> list[schemas.WellboreLogCurveHeader]:
+    async def _get_headers_async() -> list[schemas.WellboreLogCurveHeader]:
+        if source == schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG:
+            return await _get_headers_from_ssdl_well_log_async(authenticated_user, wellbore_uuid)
+        if source == schemas.WellLogCurveSourceEnum.SMDA_GEOLOGY:
+            return await _get_headers_from_smda_geology_async(authenticated_user, wellbore_uuid)
+        if source == schemas.WellLogCurveSourceEnum.SMDA_STRATIGRAPHY:
+            return await _get_headers_from_smda_stratigraghpy_async(authenticated_user, wellbore_uuid)
+        return await _get_headers_from_smda_survey_async(authenticated_user, wellbore_uuid)
+
+    cache_key = (authenticated_user.get_user_id(), wellbore_uuid, source)
+    try:
+        # The fetch itself is shielded by the cache, so a source that times out still completes and is cached for
+        # the next request
+        async with asyncio.timeout(LOG_CURVE_HEADER_SOURCE_TIMEOUT_S):
+            return await _LOG_CURVE_HEADERS_CACHE.get_or_compute_async(cache_key, _get_headers_async)
+    except TimeoutError as exc:
+        service = Service.SSDL if source == schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG else Service.SMDA
+        raise ServiceTimeoutError(
+            f"Timed out after {LOG_CURVE_HEADER_SOURCE_TIMEOUT_S}s fetching log curve headers for {wellbore_uuid=}",
+            service,
+        ) from exc
+
+
+async def _get_headers_from_ssdl_well_log_async(
+    authenticated_user: AuthenticatedUser, wellbore_uuid: str
+) -> list[schemas.WellboreLogCurveHeader]:
+    well_access_cls = DrogonWellAccess if is_drogon_identifier(wellbore_uuid=wellbore_uuid) else SsdlWellAccess
+    well_access = well_access_cls(authenticated_user.get_ssdl_access_token())
+
+    headers = await well_access.get_log_curve_headers_for_wellbore_async(wellbore_uuid)
+
+    # Missing log name implies garbage data, so we drop them
+    valid_headers = filter(lambda header: header.log_name is not None, headers)
+    return [converters.convert_wellbore_log_curve_header_to_schema(head) for head in valid_headers]
+
+
+async def _get_headers_from_smda_geology_async(
+    authenticated_user: AuthenticatedUser, wellbore_uuid: str
+) -> list[schemas.WellboreLogCurveHeader]:
+    if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
+        return []
+
+    geol_access = SmdaGeologyAccess(authenticated_user.get_smda_access_token())
+
+    try:
+        geo_headers = await geol_access.get_wellbore_geology_headers_async(wellbore_uuid)
+    except NoDataError:
+        geo_headers = []
+
+    return [converters.convert_wellbore_geo_header_to_well_log_header(header) for header in geo_headers]
+
+
+async def _get_headers_from_smda_stratigraghpy_async(
+    authenticated_user: AuthenticatedUser, wellbore_uuid: str
+) -> list[schemas.WellboreLogCurveHeader]:
+    if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
+        return []
+
+    strat_access = SmdaAccess(authenticated_user.get_smda_access_token())
+
+    try:
+        strat_columns = await strat_access.get_stratigraphic_columns_for_wellbore_async(wellbore_uuid)
+    except NoDataError:
+        strat_columns = []
+
+    return [converters.convert_strat_column_to_well_log_header(col) for col in strat_columns if col.strat_column_type]
+
+
+async def _get_headers_from_smda_survey_async(
+    authenticated_user: AuthenticatedUser, wellbore_uuid: str
+) -> list[schemas.WellboreLogCurveHeader]:
+    if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
+        return []
+
+    survey_access = SmdaAccess(authenticated_user.get_smda_access_token())
+
+    try:
+        survey_headers = await survey_access.get_survey_headers_for_wellbore_async(wellbore_uuid)
+    except NoDataError:
+        return []
+
+    # Unsure if there can ever be more than one; will make more robust handling when implementing the data provider framework, but for now we just take the first (most recent one)
+    log_headers = converters.convert_survey_header_to_well_log_headers(survey_headers[0])
+
+    return log_headers
@@ -6,17 +6,21 @@ from fastapi import APIRouter, Depends, Query
 from webviz_services.smda_access.drogon import DrogonSmdaAccess
 from webviz_services.smda_access import SmdaAccess
 from webviz_services.smda_access import GeologyAccess as SmdaGeologyAccess
+from webviz_services.smda_access.smda_field_cache import SmdaFieldCacheFactory
+from webviz_services.smda_access.types import BoundingBox2D
 from webviz_services.service_exceptions import NoDataError, Service
 from webviz_services.ssdl_access.well_access import WellAccess as SsdlWellAccess
 from webviz_services.ssdl_access.drogon import DrogonWellAccess
+from webviz_services.ssdl_access.ssdl_field_cache import SsdlFieldCacheFactory
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
-from primary.middleware.cache_control_middleware import cache_time, custom_cache_time, CacheTime
+from primary.middleware.cache_control_middleware import cache_time, custom_cache_time, set_cache_time, CacheTime
 from primary.utils.drogon import is_drogon_identifier
 
 from . import schemas
 from . import converters
+from . import log_curve_headers
 
 LOGGER = logging.getLogger(__name__)
 
@@ -38,7 +42,10 @@ async def get_drilled_wellbore_headers(
         # Handle DROGON
         well_access = DrogonSmdaAccess()
     else:
-        well_access = SmdaAccess(authenticated_user.get_smda_access_token())
+        well_access = SmdaAccess(
+            authenticated_user.get_smda_access_token(),
+            field_cache=SmdaFieldCacheFactory.get_instance().get_field_cache_for_user(authenticated_user),
+        )
 
     wellbore_headers = await well_access.get_wellbore_headers_async(field_identifier)
 
@@ -56,10 +63,12 @@ async def get_field_perforations(
     if is_drogon_identifier(field_identifier=field_identifier):
         return []
         # Only fetch completions for non-DROGON fields
-    well_access_ssdl = SsdlWellAccess(authenticated_user.get_ssdl_access_token())
+    well_access_ssdl = SsdlWellAccess(
+        authenticated_user.get_ssdl_access_token(),
+        field_cache=SsdlFieldCacheFactory.get_instance().get_field_cache_for_user(authenticated_user),
+    )
 
-    fields_info = await well_access_ssdl.get_fields_async()
-    field_uuid = next((field.field_uuid for field in fields_info if field.field_identifier == field_identifier), None)
+    field_uuid = await well_access_ssdl.get_field_uuid_async(field_identifier)
 
     if not field_uuid:
         raise NoDataError(f"Field not found: {field_identifier}", Service.SSDL)
@@ -79,10 +88,12 @@ async def get_field_screens(
     if is_drogon_identifier(field_identifier=field_identifier):
         return []
         # Only fetch screens for non-DROGON fields
-    well_access_ssdl = SsdlWellAccess(authenticated_user.get_ssdl_access_token())
+    well_access_ssdl = SsdlWellAccess(
+        authenticated_user.get_ssdl_access_token(),
+        field_cache=SsdlFieldCacheFactory.get_instance().get_field_cache_for_user(authenticated_user),
+    )
 
-    fields_info = await well_access_ssdl.get_fields_async()
-    field_uuid = next((field.field_uuid for field in fields_info if field.field_identifier == field_identifier), None)
+    field_uuid = await well_access_ssdl.get_field_uuid_async(field_identifier)
 
     if not field_uuid:
         raise NoDataError(f"Field not found: {field_identifier}", Service.SSDL)
@@ -107,7 +118,10 @@ async def get_well_trajectories(
         # Handle DROGON
         well_access = DrogonSmdaAccess()
     else:
-        well_access = SmdaAccess(authenticated_user.get_smda_access_token())
+        well_access = SmdaAccess(
+            authenticated_user.get_smda_access_token(),
+            field_cache=SmdaFieldCacheFactory.get_instance().get_field_cache_for_user(authenticated_user),
+        )
 
     wellbore_trajectories = await well_access.get_wellbore_trajectories_async(
         field_identifier=field_identifier,
@@ -120,6 +134,40 @@ async def get_well_trajectories(
     ]
 
 
+@router.get("/well_trajectories_b64/")
+@custom_cache_time(max_age_s=3600 * 24 * 7, stale_while_revalidate_s=3600 * 24 * 7 * 10)
+async def get_well_trajectories_b64(
+    # fmt:off
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    field_identifier: str = Query(description="Official field identifier"),
+    wellbore_uuids: List[str] | None = Query(None, description="Optional subset of wellbore uuids"),
+    bbox: List[float] | None = Query(None, min_length=4, max_length=4, description="Optional bounding box [min_x, min_y, max_x, max_y], only wellbores passing through it are returned"),
+    # fmt:on
+) -> schemas.WellboreTrajectoriesB64:
+    """Get trajectories for wellbores in a given field as concatenated arrays.
+
+    Same data as the well_trajectories endpoint, but in a columnar form that is far cheaper to produce and transfer
+    for fields with thousands of wellbores.
+    """
+    well_access: Union[SmdaAccess, DrogonSmdaAccess]
+    if is_drogon_identifier(field_identifier=field_identifier):
+        # Handle DROGON
+        well_access = DrogonSmdaAccess()
+    else:
+        well_access = SmdaAccess(
+            authenticated_user.get_smda_access_token(),
+            field_cache=SmdaFieldCacheFactory.get_instance().get_field_cache_for_user(authenticated_user),
+        )
+
+    trajectories = await well_access.get_wellbore_trajectories_columnar_async(
+        field_identifier=field_identifier,
+        wellbore_uuids=wellbore_uuids,
+        bbox=BoundingBox2D(min_x=bbox[0], min_y=bbox[1], max_x=bbox[2], max_y=bbox[3]) if bbox else None,
+    )
+
+    return converters.convert_well_trajectories_columnar_to_schema_b64(trajectories)
+
+
 @router.get("/wellbore_pick_identifiers/")
 @cache_time(CacheTime.NORMAL)
 async def get_wellbore_pick_identifiers(
@@ -164,7 +212,10 @@ async def get_wellbore_picks_for_pick_identifier(
         well_access = DrogonSmdaAccess()
 
     else:
-        well_access = SmdaAccess(authenticated_user.get_smda_access_token())
+        well_access = SmdaAccess(
+            authenticated_user.get_smda_access_token(),
+            field_cache=SmdaFieldCacheFactory.get_instance().get_field_cache_for_user(authenticated_user),
+        )
 
     wellbore_picks = await well_access.get_wellbore_picks_for_pick_identifier_async(
         field_identifier=field_identifier,
@@ -286,7 +337,6 @@ async def get_wellbore_perforations(
 
 
 @router.get("/wellbore_log_curve_headers/")
-@cache_time(CacheTime.NORMAL)
 async def get_wellbore_log_curve_headers(
     # fmt:off
     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
@@ -300,87 +350,47 @@ async def get_wellbore_log_curve_headers(
     """
     Get all log curve headers for a single well bore.
     Logs are available from multiple sources, which can be specificed by the "sources" parameter.
+    The sources are fetched concurrently, and sources that fail or time out are left out of the response.
+    Such partial responses are not cached.
     """
+    headers_result = await log_curve_headers.get_log_curve_headers_for_wellbores_async(
+        authenticated_user, [wellbore_uuid], sources
+    )
 
-    curve_headers = []
-
-    if schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG in sources:
-        curve_headers += await _get_headers_from_ssdl_well_log_async(authenticated_user, wellbore_uuid)
-
-    if schemas.WellLogCurveSourceEnum.SMDA_GEOLOGY in sources:
-        curve_headers += await _get_headers_from_smda_geology_async(authenticated_user, wellbore_uuid)
-
-    if schemas.WellLogCurveSourceEnum.SMDA_STRATIGRAPHY in sources:
-        curve_headers += await _get_headers_from_smda_stratigraghpy_async(authenticated_user, wellbore_uuid)
-
-    if schemas.WellLogCurveSourceEnum.SMDA_SURVEY in sources:
-        curve_headers += await _get_headers_from_smda_survey_async(authenticated_user, wellbore_uuid)
-
-    return curve_headers
-
-
-async def _get_headers_from_ssdl_well_log_async(
-    authenticated_user: AuthenticatedUser, wellbore_uuid: str
-) -> list[schemas.WellboreLogCurveHeader]:
-    well_access_cls = DrogonWellAccess if is_drogon_identifier(wellbore_uuid=wellbore_uuid) else SsdlWellAccess
-    well_access = well_access_cls(authenticated_user.get_ssdl_access_token())
-
-    headers = await well_access.get_log_curve_headers_for_wellbore_async(wellbore_uuid)
-
-    # Missing log name implies garbage data, so we drop them
-    valid_headers = filter(lambda header: header.log_name is not None, headers)
-    return [converters.convert_wellbore_log_curve_header_to_schema(head) for head in valid_headers]
-
-
-async def _get_headers_from_smda_geology_async(
-    authenticated_user: AuthenticatedUser, wellbore_uuid: str
-) -> list[schemas.WellboreLogCurveHeader]:
-    if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
-        return []
-
-    geol_access = SmdaGeologyAccess(authenticated_user.get_smda_access_token())
-
-    try:
-        geo_headers = await geol_access.get_wellbore_geology_headers_async(wellbore_uuid)
-    except NoDataError:
-        geo_headers = []
-
-    return [converters.convert_wellbore_geo_header_to_well_log_header(header) for header in geo_headers]
-
-
-async def _get_headers_from_smda_stratigraghpy_async(
-    authenticated_user: AuthenticatedUser, wellbore_uuid: str
-) -> list[schemas.WellboreLogCurveHeader]:
-    if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
-        return []
-
-    strat_access = SmdaAccess(authenticated_user.get_smda_access_token())
-
-    try:
-        strat_columns = await strat_access.get_stratigraphic_columns_for_wellbore_async(wellbore_uuid)
-    except NoDataError:
-        strat_columns = []
-
-    return [converters.convert_strat_column_to_well_log_header(col) for col in strat_columns if col.strat_column_type]
-
-
-async def _get_headers_from_smda_survey_async(
-    authenticated_user: AuthenticatedUser, wellbore_uuid: str
-) -> list[schemas.WellboreLogCurveHeader]:
-    if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
-        return []
-
-    survey_access = SmdaAccess(authenticated_user.get_smda_access_token())
+    if not headers_result.is_partial:
+        set_cache_time(CacheTime.NORMAL)
+    return headers_result.headers_per_wellbore[wellbore_uuid]
 
-    try:
-        survey_headers = await survey_access.get_survey_headers_for_wellbore_async(wellbore_uuid)
-    except NoDataError:
-        return []
 
-    # Unsure if there can ever be more than one; will make more robust handling when implementing the data provider framework, but for now we just take the first (most recent one)
-    log_headers = converters.convert_survey_header_to_well_log_headers(survey_headers[0])
+@router.get("/wellbore_log_curve_headers_for_wellbores/")
+async def get_wellbore_log_curve_headers_for_wellbores(
+    # fmt:off
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    wellbore_uuids: List[str] = Query(description="Wellbore uuids"),
+    sources: List[schemas.WellLogCurveSourceEnum] = Query(
+       description="Sources to fetch well-logs from. ",
+       default=[schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG]
+    )
+    # fmt:on
+) -> List[schemas.WellboreLogCurveHeadersForWellbore]:
+    """
+    Get all log curve headers for multiple well bores, see the wellbore_log_curve_headers endpoint.
+    Sources that failed or timed out are listed per well bore, and such partial responses are not cached.
+    """
+    headers_result = await log_curve_headers.get_log_curve_headers_for_wellbores_async(
+        authenticated_user, wellbore_uuids, sources
+    )
 
-    return log_headers
+    if not headers_result.is_partial:
+        set_cache_time(CacheTime.NORMAL)
+    return [
+        schemas.WellboreLogCurveHeadersForWellbore(
+            wellboreUuid=wellbore_uuid,
+            curveHeaders=curve_headers,
+            failedSources=headers_result.failed_sources_per_wellbore[wellbore_uuid],
+        )
+        for wellbore_uuid, curve_headers in headers_result.headers_per_wellbore.items()
+    ]
 
 
 @router.get("/log_curve_data/")
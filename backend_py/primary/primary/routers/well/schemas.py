@@ -2,6 +2,8 @@ from enum import Enum
 from typing import List, Optional, TypeAlias
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray, B64UintArray
+
 
 class WellboreHeader(BaseModel):
     wellboreUuid: str
@@ -34,6 +36,26 @@ class WellboreTrajectory(BaseModel):
     northingArr: List[float]
 
 
+class WellboreTrajectoriesB64(BaseModel):
+    """
+    Trajectories for multiple wellbores as concatenated float32 sample arrays.
+
+    The samples of trajectory i are found in the range [startIndices[i], startIndices[i + 1]), with the last
+    trajectory running to the end of the arrays. Since float32 lacks the precision needed for UTM coordinates,
+    easting and northing are given relative to eastingOrigin and northingOrigin.
+    """
+
+    wellboreUuids: List[str]
+    uniqueWellboreIdentifiers: List[str]
+    startIndicesB64arr: B64UintArray
+    eastingOrigin: float
+    northingOrigin: float
+    tvdMslB64arr: B64FloatArray
+    mdB64arr: B64FloatArray
+    eastingB64arr: B64FloatArray
+    northingB64arr: B64FloatArray
+
+
 class StratigraphicColumn(BaseModel):
     """
     Stratigraphic column from SMDA
@@ -144,6 +166,13 @@ class WellboreLogCurveHeader(BaseModel):
     curveUnit: str | None
 
 
+class WellboreLogCurveHeadersForWellbore(BaseModel):
+    wellboreUuid: str
+    curveHeaders: List[WellboreLogCurveHeader]
+    # Sources that failed or timed out, and whose headers are therefore missing from curveHeaders
+    failedSources: List[WellLogCurveSourceEnum]
+
+
 RgbArray: TypeAlias = tuple[int, int, int]
 
 
@@ -19,7 +19,7 @@ import sys
 import time
 
 from primary import config
-from primary.auth.auth_helper import _TokenEntry, _UserAuthInfo
+from primary.auth.user_auth_info import TokenEntry, UserAuthInfo
 from primary.middleware.encrypted_redis_session_store import EncryptedRedisSessionStore
 from webviz_services.sumo_access.sumo_client_factory import SENTINEL_ACCESS_TOKEN_FOR_TESTING
 
@@ -27,20 +27,20 @@ from webviz_services.sumo_access.sumo_client_factory import SENTINEL_ACCESS_TOKE
 _COOKIE_NAME = "session"
 
 
-def _build_user_auth_info() -> _UserAuthInfo:
+def _build_user_auth_info() -> UserAuthInfo:
     expires_at = int(time.time()) + 30 * 24 * 3600  # 30 days
-    return _UserAuthInfo(
+    return UserAuthInfo(
         user_id="e2e-test-user",
         user_name="e2e-test-user@webviz.test",
         user_identity_expires_at=expires_at,
         access_tokens={
-            "sumo": _TokenEntry(token=SENTINEL_ACCESS_TOKEN_FOR_TESTING, expires_at=expires_at),
+            "sumo": TokenEntry(token=SENTINEL_ACCESS_TOKEN_FOR_TESTING, expires_at=expires_at),
         },
         earliest_expiry_time=expires_at,
     )
 
 
-def _build_session_payload(user_auth_info: _UserAuthInfo) -> bytes:
+def _build_session_payload(user_auth_info: UserAuthInfo) -> bytes:
     # Mirrors what starsessions' JsonSerializer would write for a session
     now = time.time()
     session_dict = {
@@ -0,0 +1,206 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument, protected-access
+import asyncio
+import json
+import threading
+
+import msal
+import pytest
+from fastapi import Request
+
+from primary.auth import user_auth_info
+from primary.auth.user_auth_info import RefreshResult, UserAuthInfo
+
+
+def _make_token_cache(home_account_id: str) -> msal.SerializableTokenCache:
+    token_cache = msal.SerializableTokenCache()
+    account = {
+        "home_account_id": home_account_id,
+        "environment": "login.microsoftonline.com",
+        "realm": "tenant",
+        "local_account_id": home_account_id,
+        "username": f"{home_account_id}@example.com",
+        "authority_type": "MSSTS",
+    }
+    token_cache.deserialize(json.dumps({"Account": {f"{home_account_id}-key": account}}))
+    return token_cache
+
+
+def _make_user_auth_info(user_id: str) -> UserAuthInfo:
+    return UserAuthInfo(
+        user_id=user_id,
+        user_name=f"{user_id}@example.com",
+        user_identity_expires_at=2000000000,
+        access_tokens={},
+        earliest_expiry_time=2000000000,
+    )
+
+
+class _FakeIdentityProvider:
+    """
+    Stand-in for the blocking msal calls, which keeps each refresh waiting until released by the test
+    """
+
+    def __init__(self) -> None:
+        self.num_refreshes = 0
+        self.should_fail = False
+        self._release_event = threading.Event()
+
+    def release(self) -> None:
+        self._release_event.set()
+
+    def acquire_user_auth_info(
+        self, token_cache: msal.SerializableTokenCache, _curr_auth_info: UserAuthInfo | None
+    ) -> UserAuthInfo | None:
+        self.num_refreshes += 1
+        if not self._release_event.wait(timeout=5):
+            raise TimeoutError("Refresh was never released")
+        if self.should_fail:
+            raise RuntimeError("Identity provider failure")
+
+        token_cache.has_state_changed = True
+        return _make_user_auth_info(f"user_{self.num_refreshes}")
+
+
+@pytest.fixture
+def identity_provider() -> _FakeIdentityProvider:
+    return _FakeIdentityProvider()
+
+
+async def _start_refreshes_async(
+    identity_provider: _FakeIdentityProvider, token_caches: list[msal.SerializableTokenCache]
+) -> list[asyncio.Task[RefreshResult | None]]:
+    tasks = [
+        asyncio.create_task(
+            user_auth_info.refresh_user_auth_info_async(token_cache, None, identity_provider.acquire_user_auth_info)
+        )
+        for token_cache in token_caches
+    ]
+
+    # Let all the requests start or join a refresh before it is released
+    await asyncio.sleep(0.05)
+    return tasks
+
+
+async def test_concurrent_refreshes_for_same_account_are_shared(identity_provider: _FakeIdentityProvider) -> None:
+    token_caches = [_make_token_cache("account_a") for _ in range(3)]
+    tasks = await _start_refreshes_async(identity_provider, token_caches)
+    assert user_auth_info._IN_FLIGHT_REFRESHES.is_in_flight("account_a")
+
+    identity_provider.release()
+    results = await asyncio.gather(*tasks)
+
+    assert identity_provider.num_refreshes == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] is not None and results[0].account_key == "account_a"
+    assert len(user_auth_info._IN_FLIGHT_REFRESHES) == 0
+
+    # Every waiter uses the same account, so all of them may store the refreshed token cache
+    for token_cache in token_caches:
+        assert results[0].get_serialized_token_cache_for(token_cache) == results[0].serialized_token_cache
+
+
+async def test_concurrent_refreshes_for_different_accounts_are_not_shared(
+    identity_provider: _FakeIdentityProvider,
+) -> None:
+    tasks = await _start_refreshes_async(
+        identity_provider, [_make_token_cache("account_a"), _make_token_cache("account_b")]
+    )
+
+    identity_provider.release()
+    result_a, result_b = await asyncio.gather(*tasks)
+
+    assert identity_provider.num_refreshes == 2
+    assert result_a is not None and result_b is not None
+    assert result_a.account_key == "account_a"
+    assert result_b.account_key == "account_b"
+
+
+async def test_failed_refresh_is_propagated_to_waiters_and_not_kept(identity_provider: _FakeIdentityProvider) -> None:
+    identity_provider.should_fail = True
+    tasks = await _start_refreshes_async(identity_provider, [_make_token_cache("account_a") for _ in range(3)])
+
+    identity_provider.release()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert identity_provider.num_refreshes == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(user_auth_info._IN_FLIGHT_REFRESHES) == 0
+
+    # The failure is not kept, so the next request refreshes again
+    identity_provider.should_fail = False
+    result = await user_auth_info.refresh_user_auth_info_async(
+        _make_token_cache("account_a"), None, identity_provider.acquire_user_auth_info
+    )
+    assert identity_provider.num_refreshes == 2
+    assert result is not None and result.user_auth_info.user_id == "user_2"
+
+
+def test_token_cache_is_only_stored_for_same_account() -> None:
+    result = RefreshResult(
+        account_key="account_a",
+        user_auth_info=_make_user_auth_info("user_a"),
+        serialized_token_cache="serialized-token-cache-of-account-a",
+    )
+
+    assert (
+        result.get_serialized_token_cache_for(_make_token_cache("account_a")) == "serialized-token-cache-of-account-a"
+    )
+    assert result.get_serialized_token_cache_for(_make_token_cache("account_b")) is None
+    assert result.get_serialized_token_cache_for(msal.SerializableTokenCache()) is None
+
+
+def _make_request(session: dict) -> Request:
+    return Request({"type": "http", "session": session})
+
+
+@pytest.fixture
+def user_auth_info_cache() -> None:
+    user_auth_info._USER_AUTH_INFO_CACHE.clear()
+
+
+def test_cached_user_auth_info_is_reused(user_auth_info_cache: None) -> None:
+    session = {"user_auth_info": _make_user_auth_info("user_a").model_dump_json()}
+
+    first_auth_info = user_auth_info.load_user_auth_info_from_session(_make_request(session))
+    second_auth_info = user_auth_info.load_user_auth_info_from_session(_make_request(session))
+
+    assert first_auth_info is not None and first_auth_info.user_id == "user_a"
+    assert second_auth_info is first_auth_info
+
+
+def test_cached_user_auth_info_is_replaced_after_save(user_auth_info_cache: None) -> None:
+    session = {"user_auth_info": _make_user_auth_info("user_a").model_dump_json()}
+    old_auth_info = user_auth_info.load_user_auth_info_from_session(_make_request(session))
+
+    new_auth_info = _make_user_auth_info("user_a").model_copy(update={"earliest_expiry_time": 2100000000})
+    user_auth_info.save_user_auth_info_in_session(_make_request(session), new_auth_info)
+
+    loaded_auth_info = user_auth_info.load_user_auth_info_from_session(_make_request(session))
+    assert loaded_auth_info is new_auth_info
+    assert loaded_auth_info is not old_auth_info
+    assert session["user_auth_info"] == new_auth_info.model_dump_json()
+
+
+def test_invalid_user_auth_info_is_not_cached(user_auth_info_cache: None) -> None:
+    session = {"user_auth_info": '{"user_id": "user_a"}'}
+
+    assert user_auth_info.load_user_auth_info_from_session(_make_request(session)) is None
+    assert len(user_auth_info._USER_AUTH_INFO_CACHE) == 0
+
+
+def test_authenticated_user_in_request_state_is_shared_within_request() -> None:
+    scope = {"type": "http", "session": {}}
+    assert user_auth_info.get_authenticated_user_from_request_state(Request(scope)) is None
+
+    authenticated_user = _make_user_auth_info("user_a").to_authenticated_user()
+    user_auth_info.store_authenticated_user_in_request_state(Request(scope), authenticated_user)
+
+    # FastAPI creates new Request objects for the same scope, which must all see the stored user
+    assert user_auth_info.get_authenticated_user_from_request_state(Request(scope)) is authenticated_user
+
+
+def test_unexpected_object_in_request_state_is_ignored() -> None:
+    request = _make_request({})
+    request.state.authenticated_user_obj = "not a user"
+
+    assert user_auth_info.get_authenticated_user_from_request_state(request) is None
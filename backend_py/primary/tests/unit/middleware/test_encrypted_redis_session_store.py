@@ -0,0 +1,99 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import json
+
+import pytest
+from cryptography.fernet import Fernet
+from fakeredis import FakeAsyncRedis
+
+from primary.middleware import encrypted_redis_session_store
+from primary.middleware.encrypted_redis_session_store import EncryptedRedisSessionStore
+
+FERNET_KEY = Fernet.generate_key()
+PREFIX = "session:"
+
+
+class _CountingFernet(Fernet):
+    num_encrypts = 0
+    num_decrypts = 0
+
+    def encrypt(self, data: bytes) -> bytes:
+        _CountingFernet.num_encrypts += 1
+        return super().encrypt(data)
+
+    def decrypt(self, token: bytes | str, ttl: int | None = None) -> bytes:
+        _CountingFernet.num_decrypts += 1
+        return super().decrypt(token, ttl)
+
+
+@pytest.fixture
+def redis_client() -> FakeAsyncRedis:
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch, redis_client: FakeAsyncRedis) -> EncryptedRedisSessionStore:
+    _CountingFernet.num_encrypts = 0
+    _CountingFernet.num_decrypts = 0
+    monkeypatch.setattr(encrypted_redis_session_store, "Fernet", _CountingFernet)
+    monkeypatch.setattr(encrypted_redis_session_store.Redis, "from_url", lambda url: redis_client)
+    return EncryptedRedisSessionStore(fernet_key=FERNET_KEY, redis_url="redis://unused", prefix=PREFIX)
+
+
+def _make_session_data(tokens: str, last_access: float) -> bytes:
+    metadata = {"lifetime": 0, "created": 1.0, "last_access": last_access}
+    return json.dumps({"user_auth_info": tokens, "__metadata__": metadata}).encode()
+
+
+async def test_unchanged_payload_is_decrypted_once(store: EncryptedRedisSessionStore) -> None:
+    data = _make_session_data("tokens", last_access=1.0)
+    await store.write("sid", data, lifetime=0, ttl=0)
+
+    # Simulate a fresh process, where the payload must be decrypted once
+    store2 = EncryptedRedisSessionStore(fernet_key=FERNET_KEY, redis_url="redis://unused", prefix=PREFIX)
+    assert await store2.read("sid", lifetime=0) == data
+    assert await store2.read("sid", lifetime=0) == data
+    assert _CountingFernet.num_decrypts == 1
+
+
+async def test_payload_changed_by_other_instance_is_decrypted(store: EncryptedRedisSessionStore) -> None:
+    other_instance = EncryptedRedisSessionStore(fernet_key=FERNET_KEY, redis_url="redis://unused", prefix=PREFIX)
+
+    await store.write("sid", _make_session_data("old tokens", last_access=1.0), lifetime=0, ttl=0)
+    assert json.loads(await store.read("sid", lifetime=0))["user_auth_info"] == "old tokens"
+
+    await other_instance.write("sid", _make_session_data("new tokens", last_access=2.0), lifetime=0, ttl=0)
+    assert json.loads(await store.read("sid", lifetime=0))["user_auth_info"] == "new tokens"
+
+
+async def test_write_of_unchanged_session_is_suppressed(
+    store: EncryptedRedisSessionStore, redis_client: FakeAsyncRedis
+) -> None:
+    await redis_client.set(
+        PREFIX + "sid", Fernet(FERNET_KEY).encrypt(_make_session_data("tokens", last_access=1.0)), ex=100
+    )
+    await store.read("sid", lifetime=0)
+    stored_payload = await redis_client.get(PREFIX + "sid")
+
+    # Only the last access time differs, the expiry is refreshed instead of re-writing the payload
+    await store.write("sid", _make_session_data("tokens", last_access=2.0), lifetime=0, ttl=0)
+    await store.write("sid", _make_session_data("tokens", last_access=3.0), lifetime=0, ttl=0)
+
+    assert _CountingFernet.num_encrypts == 0
+    assert await redis_client.get(PREFIX + "sid") == stored_payload
+    assert await redis_client.ttl(PREFIX + "sid") > 100
+
+    await store.write("sid", _make_session_data("new tokens", last_access=4.0), lifetime=0, ttl=0)
+    assert _CountingFernet.num_encrypts == 1
+    assert json.loads(await store.read("sid", lifetime=0))["user_auth_info"] == "new tokens"
+
+
+async def test_removed_session_is_not_served_from_cache(store: EncryptedRedisSessionStore) -> None:
+    data = _make_session_data("tokens", last_access=1.0)
+    await store.write("sid", data, lifetime=0, ttl=0)
+    await store.remove("sid")
+
+    assert await store.read("sid", lifetime=0) == b""
+
+    # Writing the same session again must recreate it, not be suppressed
+    await store.write("sid", data, lifetime=0, ttl=0)
+    assert await store.read("sid", lifetime=0) == data
@@ -0,0 +1,66 @@
+# pylint: disable=async-suffix, protected-access
+import hashlib
+import json
+import os
+
+import pytest
+from webviz_services.service_exceptions import ServiceRequestError
+
+from primary.persistence import _utils
+from primary.persistence._utils import (
+    compress_and_validate_content_async,
+    compress_content_string,
+    decompress_content_string,
+    hash_session_content_string,
+)
+
+
+def test_compressed_content_round_trips() -> None:
+    content = json.dumps({"modules": [{"id": i, "name": f"Module æøå {i}"} for i in range(1000)]})
+
+    stored_content = compress_content_string(content)
+
+    assert stored_content.startswith("gzip+b64:")
+    assert len(stored_content) < len(content)
+    assert decompress_content_string(stored_content) == content
+
+
+def test_uncompressed_legacy_content_is_returned_as_is() -> None:
+    content = '{"dashboards": []}'
+
+    assert decompress_content_string(content) == content
+
+
+def test_compression_is_deterministic() -> None:
+    content = json.dumps({"a": list(range(100))})
+
+    assert compress_content_string(content) == compress_content_string(content)
+
+
+def test_content_hash_matches_sha256_hex_of_utf8_bytes() -> None:
+    content = '{"title": "Ærlig talt"}'
+
+    assert hash_session_content_string(content) == hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+async def test_compress_and_validate_returns_compressed_content() -> None:
+    content = json.dumps({"modules": list(range(1000))})
+
+    stored_content = await compress_and_validate_content_async(content, "session")
+
+    assert stored_content == compress_content_string(content)
+
+
+async def test_compress_and_validate_rejects_too_large_uncompressed_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_utils, "_MAX_UNCOMPRESSED_CONTENT_SIZE_BYTES", 10)
+
+    with pytest.raises(ServiceRequestError, match="^Snapshot content size"):
+        await compress_and_validate_content_async("x" * 11, "snapshot")
+
+
+async def test_compress_and_validate_rejects_too_large_compressed_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_utils, "_MAX_CONTENT_SIZE_BYTES", 100)
+
+    # Random content does not compress, so the stored content exceeds the limit
+    with pytest.raises(ServiceRequestError, match="^Compressed session content size"):
+        await compress_and_validate_content_async(os.urandom(100).hex(), "session")
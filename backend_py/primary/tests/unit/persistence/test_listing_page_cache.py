@@ -0,0 +1,140 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument
+import asyncio
+
+import pytest
+from azure.core.async_paging import AsyncItemPaged, AsyncList
+
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.listing_page_cache import ListingPageCache, PersistenceListing
+from primary.persistence.session_store.documents import SessionDocument
+from primary.persistence.session_store.session_store import SessionStore
+
+
+class _PageQuery:
+    def __init__(self) -> None:
+        self.num_calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> tuple[list[str], str | None]:
+        self.num_calls += 1
+        await self.release.wait()
+        return [f"item-{self.num_calls}"], "next"
+
+
+@pytest.fixture
+def cache() -> ListingPageCache:
+    return ListingPageCache()
+
+
+async def _get_page(
+    cache: ListingPageCache,
+    query: _PageQuery,
+    user_id: str = "user-a",
+    page_token: str | None = None,
+    listing: PersistenceListing = PersistenceListing.SESSIONS,
+) -> tuple[list[str], str | None]:
+    params: list[dict[str, object]] = [{"name": "@owner_id", "value": user_id}]
+    return await cache.get_or_query_page_async(user_id, listing, "SELECT * FROM c", params, 10, page_token, query)
+
+
+async def test_pages_are_cached_per_page_token(cache: ListingPageCache) -> None:
+    query = _PageQuery()
+
+    first = await _get_page(cache, query)
+    assert await _get_page(cache, query) == first
+    assert query.num_calls == 1
+
+    await _get_page(cache, query, page_token="next")
+    assert query.num_calls == 2
+
+
+async def test_invalidation_only_affects_the_given_user(cache: ListingPageCache) -> None:
+    query = _PageQuery()
+    await _get_page(cache, query, user_id="user-a")
+    await _get_page(cache, query, user_id="user-b")
+
+    cache.invalidate("user-a", PersistenceListing.SESSIONS)
+    cache.invalidate("user-b", PersistenceListing.SNAPSHOTS)
+
+    await _get_page(cache, query, user_id="user-a")
+    await _get_page(cache, query, user_id="user-b")
+    assert query.num_calls == 3
+
+
+async def test_invalidation_for_all_users(cache: ListingPageCache) -> None:
+    query = _PageQuery()
+    listing = PersistenceListing.SNAPSHOT_ACCESS_LOGS
+    await _get_page(cache, query, user_id="user-a", listing=listing)
+    await _get_page(cache, query, user_id="user-b", listing=listing)
+
+    cache.invalidate_for_all_users(listing)
+
+    await _get_page(cache, query, user_id="user-a", listing=listing)
+    await _get_page(cache, query, user_id="user-b", listing=listing)
+    assert query.num_calls == 4
+
+
+async def test_page_queried_during_invalidation_is_not_served_afterwards(cache: ListingPageCache) -> None:
+    query = _PageQuery()
+    query.release.clear()
+
+    in_flight = asyncio.create_task(_get_page(cache, query))
+    await asyncio.sleep(0)
+    cache.invalidate("user-a", PersistenceListing.SESSIONS)
+    query.release.set()
+    assert await in_flight == (["item-1"], "next")
+
+    assert await _get_page(cache, query) == (["item-2"], "next")
+
+
+class _FakeSessionContainerProxy:
+    """In-memory stand-in for the session container proxy, counting the listing queries"""
+
+    def __init__(self) -> None:
+        self.documents: list[dict] = []
+        self.num_queries = 0
+
+    def query_items(self, query: str, parameters: list[dict] | None, max_item_count: int | None) -> AsyncItemPaged:
+        assert query.startswith("SELECT c.id, c.owner_id, c.metadata FROM c")
+        self.num_queries += 1
+        owner_id = next(param["value"] for param in parameters or [] if param["name"] == "@owner_id")
+        items = [
+            {"id": doc["id"], "owner_id": doc["owner_id"], "metadata": doc["metadata"]}
+            for doc in self.documents
+            if doc["owner_id"] == owner_id
+        ]
+
+        async def get_next(_continuation_token: str | None) -> list[dict]:
+            return items
+
+        async def extract_data(page_items: list[dict]) -> tuple[str | None, AsyncList]:
+            return None, AsyncList(page_items)
+
+        return AsyncItemPaged(get_next, extract_data)
+
+    async def create_item(self, body: dict) -> dict:
+        self.documents.append(body)
+        return body
+
+
+async def test_session_listing_is_served_from_cache_until_a_session_is_created(cache: ListingPageCache) -> None:
+    proxy = _FakeSessionContainerProxy()
+    container = CosmosContainer("persistence", "sessions", proxy, SessionDocument)  # type: ignore[arg-type]
+    store = SessionStore("user-a", container, listing_page_cache=cache)
+
+    await store.create_async("First", None, "{}")
+    items, _ = await store.get_many_async()
+    assert [item.metadata.title for item in items] == ["First"]
+
+    await store.get_many_async()
+    assert proxy.num_queries == 1
+
+    await store.create_async("Second", None, "{}")
+    items, _ = await store.get_many_async()
+    assert [item.metadata.title for item in items] == ["First", "Second"]
+    assert proxy.num_queries == 2
+
+    # Other users are not served the cached page
+    other_items, _ = await SessionStore("user-b", container, listing_page_cache=cache).get_many_async()
+    assert not other_items
@@ -0,0 +1,133 @@
+# pylint: disable=async-suffix, redefined-outer-name
+from typing import AsyncIterator
+
+import pytest
+from azure.cosmos import exceptions
+
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.snapshot_store.documents import SnapshotAccessLogDocument
+from primary.persistence.tasks.mark_logs_deleted_task import mark_logs_deleted_async
+
+
+class _FakeAccessLogContainerProxy:
+    """
+    In-memory stand-in for the access log container proxy. Supports the unmarked logs query of the task and
+    transactional batches of patch operations.
+    """
+
+    def __init__(self) -> None:
+        self.documents: dict[tuple[str, str], dict] = {}
+        self.batch_sizes: list[int] = []
+        self.failures_left_by_partition: dict[str, int] = {}
+
+    def add_log(self, visitor_id: str, snapshot_id: str, log_id: str | None = None, deleted: bool = False) -> None:
+        log_id = log_id or f"{visitor_id}__{snapshot_id}"
+        document = {"id": log_id, "visitor_id": visitor_id, "snapshot_id": snapshot_id}
+        if deleted:
+            document["snapshot_deleted"] = True
+        self.documents[(log_id, visitor_id)] = document
+
+    def query_items(self, query: str, parameters: list[dict]) -> AsyncIterator[dict]:
+        assert query.startswith("SELECT c.id, c.visitor_id FROM c WHERE c.snapshot_id = @sid")
+        snapshot_id = parameters[0]["value"]
+        rows = [
+            {"id": doc["id"], "visitor_id": doc["visitor_id"]}
+            for doc in self.documents.values()
+            if doc["snapshot_id"] == snapshot_id and doc.get("snapshot_deleted") is not True
+        ]
+
+        async def iterate() -> AsyncIterator[dict]:
+            for row in rows:
+                yield row
+
+        return iterate()
+
+    async def execute_item_batch(self, batch_operations: list[tuple], partition_key: str) -> list[dict]:
+        assert len(batch_operations) <= 100
+
+        if self.failures_left_by_partition.get(partition_key, 0) > 0:
+            self.failures_left_by_partition[partition_key] -= 1
+            raise exceptions.CosmosBatchOperationError(
+                error_index=0, headers={}, status_code=429, message="Too many requests", operation_responses=[]
+            )
+
+        self.batch_sizes.append(len(batch_operations))
+        for operation_type, (item_id, patch_operations) in batch_operations:
+            assert operation_type == "patch"
+            document = self.documents[(item_id, partition_key)]
+            for operation in patch_operations:
+                document[operation["path"].strip("/")] = operation["value"]
+
+        return []
+
+    def count_marked(self, snapshot_id: str) -> int:
+        return sum(
+            1 for doc in self.documents.values() if doc["snapshot_id"] == snapshot_id and doc.get("snapshot_deleted")
+        )
+
+
+@pytest.fixture
+def proxy() -> _FakeAccessLogContainerProxy:
+    return _FakeAccessLogContainerProxy()
+
+
+def _make_container(proxy: _FakeAccessLogContainerProxy) -> CosmosContainer[SnapshotAccessLogDocument]:
+    return CosmosContainer(
+        "persistence", "snapshot_access_logs", proxy, SnapshotAccessLogDocument  # type: ignore[arg-type]
+    )
+
+
+async def test_logs_are_patched_in_batches_per_partition(proxy: _FakeAccessLogContainerProxy) -> None:
+    for i in range(150):
+        proxy.add_log("user-a", "snap-1", log_id=f"log-{i}")
+    proxy.add_log("user-b", "snap-1")
+    proxy.add_log("user-c", "snap-1")
+    proxy.add_log("user-a", "snap-2")
+
+    progress = await mark_logs_deleted_async(_make_container(proxy), "snap-1")
+
+    assert progress.num_marked == 152
+    assert progress.num_remaining == 0
+    assert progress.num_rounds == 1
+    assert sorted(proxy.batch_sizes) == [1, 1, 50, 100]
+    assert proxy.count_marked("snap-1") == 152
+    assert proxy.count_marked("snap-2") == 0
+
+
+async def test_failed_batches_are_retried_in_next_round(proxy: _FakeAccessLogContainerProxy) -> None:
+    proxy.add_log("user-a", "snap-1")
+    proxy.add_log("user-b", "snap-1")
+    proxy.failures_left_by_partition["user-b"] = 2
+
+    progress = await mark_logs_deleted_async(_make_container(proxy), "snap-1", initial_backoff_s=0)
+
+    assert progress.num_rounds == 3
+    assert progress.num_remaining == 0
+    assert proxy.count_marked("snap-1") == 2
+
+    # Logs marked in the first round are not patched again
+    assert proxy.batch_sizes == [1, 1]
+
+
+async def test_retries_are_bounded(proxy: _FakeAccessLogContainerProxy) -> None:
+    proxy.add_log("user-a", "snap-1")
+    proxy.add_log("user-b", "snap-1")
+    proxy.failures_left_by_partition["user-b"] = 100
+
+    progress = await mark_logs_deleted_async(_make_container(proxy), "snap-1", max_rounds=3, initial_backoff_s=0)
+
+    assert progress.num_rounds == 3
+    assert progress.num_marked == 1
+    assert progress.num_remaining == 1
+    assert proxy.failures_left_by_partition["user-b"] == 97
+
+
+async def test_rerun_resumes_from_already_marked_logs(proxy: _FakeAccessLogContainerProxy) -> None:
+    for i in range(10):
+        proxy.add_log(f"user-{i}", "snap-1", deleted=i < 7)
+
+    progress = await mark_logs_deleted_async(_make_container(proxy), "snap-1")
+
+    assert progress.num_marked == 3
+    assert proxy.batch_sizes == [1, 1, 1]
+    assert proxy.count_marked("snap-1") == 10
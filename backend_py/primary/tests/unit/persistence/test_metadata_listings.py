@@ -0,0 +1,106 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import re
+from datetime import datetime, timezone
+
+import pytest
+from azure.core.async_paging import AsyncItemPaged, AsyncList
+
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.session_store.documents import SessionDocument, SessionMetadata
+from primary.persistence.session_store.session_store import SessionStore
+from primary.persistence.snapshot_store.documents import SnapshotDocument, SnapshotMetadata
+from primary.persistence.snapshot_store.snapshot_store import SnapshotStore
+
+
+class _FakeContainerProxy:
+    """
+    In-memory stand-in for a Cosmos container proxy. Supports projections of top level fields, filtering on
+    owner_id and paging by continuation token, which is all the listing queries need.
+    """
+
+    def __init__(self, documents: list[dict]) -> None:
+        self.documents = documents
+        self.queries: list[str] = []
+
+    def query_items(self, query: str, parameters: list[dict] | None, max_item_count: int | None) -> AsyncItemPaged:
+        self.queries.append(query)
+
+        select_match = re.match(r"SELECT (.+?) FROM c", query)
+        assert select_match is not None
+        selected = select_match.group(1)
+
+        owner_id = next(param["value"] for param in parameters or [] if param["name"] == "@owner_id")
+        items = [doc for doc in self.documents if doc["owner_id"] == owner_id]
+        if selected != "*":
+            fields = [field.strip().removeprefix("c.") for field in selected.split(",")]
+            items = [{field: item[field] for field in fields} for item in items]
+
+        page_size = max_item_count or len(items)
+
+        async def get_next(continuation_token: str | None) -> tuple[list[dict], str | None]:
+            start = int(continuation_token or 0)
+            end = start + page_size
+            return items[start:end], str(end) if end < len(items) else None
+
+        async def extract_data(response: tuple[list[dict], str | None]) -> tuple[str | None, AsyncList]:
+            page_items, next_token = response
+            return next_token, AsyncList(page_items)
+
+        return AsyncItemPaged(get_next, extract_data)
+
+
+def _make_session_dict(session_id: str, owner_id: str) -> dict:
+    now = datetime.now(timezone.utc)
+    metadata = SessionMetadata(
+        title=f"Session {session_id}",
+        description=None,
+        created_at=now,
+        updated_at=now,
+        content_hash="hash",
+        version=1,
+    )
+    document = SessionDocument(id=session_id, owner_id=owner_id, metadata=metadata, content="x" * 10_000)
+    return document.model_dump(by_alias=True, mode="json")
+
+
+def _make_snapshot_dict(snapshot_id: str, owner_id: str) -> dict:
+    metadata = SnapshotMetadata(
+        title=f"Snapshot {snapshot_id}", created_at=datetime.now(timezone.utc), content_hash="hash"
+    )
+    document = SnapshotDocument(id=snapshot_id, owner_id=owner_id, metadata=metadata, content="x" * 10_000)
+    return document.model_dump(by_alias=True, mode="json")
+
+
+@pytest.fixture
+def session_proxy() -> _FakeContainerProxy:
+    documents = [_make_session_dict(f"s{i}", "user-a") for i in range(5)] + [_make_session_dict("other", "user-b")]
+    return _FakeContainerProxy(documents)
+
+
+async def test_session_listing_pages_metadata_without_content(session_proxy: _FakeContainerProxy) -> None:
+    container = CosmosContainer("persistence", "sessions", session_proxy, SessionDocument)  # type: ignore[arg-type]
+    store = SessionStore("user-a", container)
+
+    first_page, token = await store.get_many_async(page_size=3)
+    second_page, last_token = await store.get_many_async(page_token=token, page_size=3)
+
+    assert [item.id for item in first_page + second_page] == ["s0", "s1", "s2", "s3", "s4"]
+    assert last_token is None
+    assert not any(isinstance(item, SessionDocument) for item in first_page + second_page)
+    assert first_page[0].metadata.title == "Session s0"
+
+    # The content must not be part of the query
+    assert all(query.startswith("SELECT c.id, c.owner_id, c.metadata FROM c") for query in session_proxy.queries)
+
+
+async def test_snapshot_listing_pages_metadata_without_content() -> None:
+    proxy = _FakeContainerProxy([_make_snapshot_dict(f"p{i}", "user-a") for i in range(3)])
+    container = CosmosContainer("persistence", "snapshots", proxy, SnapshotDocument)  # type: ignore[arg-type]
+    store = SnapshotStore("user-a", container)
+
+    items, token = await store.get_many_async(page_size=10)
+
+    assert [item.id for item in items] == ["p0", "p1", "p2"]
+    assert token is None
+    assert not any(isinstance(item, SnapshotDocument) for item in items)
+    assert all("content" not in query and "*" not in query for query in proxy.queries)
@@ -0,0 +1,122 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import copy
+import re
+from datetime import datetime, timezone
+
+import pytest
+from azure.cosmos import exceptions
+from webviz_services.service_exceptions import ServiceRequestError
+
+from primary.persistence._utils import decompress_content_string, hash_session_content_string
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.session_store.documents import SessionDocument, SessionMetadata
+from primary.persistence.session_store.session_store import SessionStore
+
+
+class _FakePatchingContainerProxy:
+    """In-memory stand-in for a Cosmos container proxy, supporting the patch operations used by the session store"""
+
+    def __init__(self) -> None:
+        self.documents: dict[tuple[str, str], dict] = {}
+        self.num_reads = 0
+
+    async def read_item(self, item: str, partition_key: str) -> dict:
+        self.num_reads += 1
+        return copy.deepcopy(self._get_document(item, partition_key))
+
+    async def patch_item(
+        self, item: str, partition_key: str, patch_operations: list[dict], filter_predicate: str | None = None
+    ) -> dict:
+        document = self._get_document(item, partition_key)
+
+        if filter_predicate is not None:
+            match = re.fullmatch(r"FROM c WHERE c\.metadata\.version = (\d+)", filter_predicate)
+            assert match is not None
+            if document["metadata"]["version"] != int(match.group(1)):
+                raise exceptions.CosmosHttpResponseError(status_code=412, message="Precondition failed")
+
+        for operation in patch_operations:
+            *parent_keys, key = operation["path"].strip("/").split("/")
+            parent = document
+            for parent_key in parent_keys:
+                parent = parent[parent_key]
+
+            if operation["op"] == "set":
+                parent[key] = operation["value"]
+            elif operation["op"] == "incr":
+                parent[key] += operation["value"]
+            else:
+                raise NotImplementedError(operation["op"])
+
+        return copy.deepcopy(document)
+
+    def _get_document(self, item: str, partition_key: str) -> dict:
+        document = self.documents.get((item, partition_key))
+        if document is None:
+            raise exceptions.CosmosHttpResponseError(status_code=404, message="Not found")
+        return document
+
+
+@pytest.fixture
+def proxy() -> _FakePatchingContainerProxy:
+    proxy = _FakePatchingContainerProxy()
+
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    metadata = SessionMetadata(
+        title="Title",
+        description="Description",
+        created_at=created_at,
+        updated_at=created_at,
+        content_hash=hash_session_content_string("{}"),
+        version=1,
+    )
+    document = SessionDocument(id="session", owner_id="user-a", metadata=metadata, content="{}")
+    proxy.documents[("session", "user-a")] = document.model_dump(by_alias=True, mode="json")
+    return proxy
+
+
+def _make_store(proxy: _FakePatchingContainerProxy, user_id: str) -> SessionStore:
+    container = CosmosContainer("persistence", "sessions", proxy, SessionDocument)  # type: ignore[arg-type]
+    return SessionStore(user_id, container)
+
+
+async def test_update_patches_fields_without_reading(proxy: _FakePatchingContainerProxy) -> None:
+    store = _make_store(proxy, "user-a")
+
+    updated = await store.update_async("session", title="New Title", content='{"a": 1}')
+
+    assert proxy.num_reads == 0
+    assert updated.metadata.title == "New Title"
+    assert updated.metadata.description == "Description"
+    assert updated.metadata.version == 2
+    assert updated.metadata.content_hash == hash_session_content_string('{"a": 1}')
+    assert updated.metadata.updated_at > updated.metadata.created_at
+    assert updated.content == '{"a": 1}'
+
+    # The stored lowercase fields used for sorting and filtering follow the patched title
+    assert proxy.documents[("session", "user-a")]["metadata"]["title__lower"] == "new title"
+
+    # The content is stored compressed, but served uncompressed
+    assert proxy.documents[("session", "user-a")]["content"] != '{"a": 1}'
+    assert (await store.get_async("session")).content == '{"a": 1}'
+
+
+async def test_update_with_stale_expected_version_is_rejected(proxy: _FakePatchingContainerProxy) -> None:
+    store = _make_store(proxy, "user-a")
+
+    await store.update_async("session", content='{"a": 1}', expected_version=1)
+    with pytest.raises(ServiceRequestError, match="has been modified since version 1"):
+        await store.update_async("session", content='{"a": 2}', expected_version=1)
+
+    stored = proxy.documents[("session", "user-a")]
+    assert decompress_content_string(stored["content"]) == '{"a": 1}'
+    assert stored["metadata"]["version"] == 2
+
+
+async def test_update_of_other_users_session_fails(proxy: _FakePatchingContainerProxy) -> None:
+    store = _make_store(proxy, "user-b")
+
+    with pytest.raises(ServiceRequestError, match="Resource not found"):
+        await store.update_async("session", title="Hijacked")
+
+    assert proxy.documents[("session", "user-a")]["metadata"]["title"] == "Title"
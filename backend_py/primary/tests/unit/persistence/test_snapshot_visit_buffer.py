@@ -0,0 +1,99 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from primary.persistence.snapshot_store.snapshot_visit_buffer import PendingSnapshotVisits, SnapshotVisitBuffer
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _FakeAccessLogWriter:
+    def __init__(self) -> None:
+        self.written: list[tuple[str, str, PendingSnapshotVisits]] = []
+        self.num_failures_left = 0
+
+    async def apply_visits_async(self, visitor_id: str, snapshot_id: str, pending: PendingSnapshotVisits) -> None:
+        await asyncio.sleep(0)
+        if self.num_failures_left > 0:
+            self.num_failures_left -= 1
+            raise RuntimeError("Cosmos is throttling")
+        self.written.append((visitor_id, snapshot_id, pending))
+
+
+@pytest.fixture
+def writer() -> _FakeAccessLogWriter:
+    return _FakeAccessLogWriter()
+
+
+async def test_visits_are_coalesced_per_visitor_and_snapshot(writer: _FakeAccessLogWriter) -> None:
+    buffer = SnapshotVisitBuffer(writer.apply_visits_async)
+    for i in range(5):
+        buffer.record_visit("user-a", "snap-1", "owner", T0 + timedelta(seconds=i))
+    buffer.record_visit("user-b", "snap-1", "owner", T0)
+
+    assert await buffer.flush_async() == 2
+    assert buffer.get_pending_count() == 0
+
+    written = {(visitor_id, snapshot_id): pending for visitor_id, snapshot_id, pending in writer.written}
+    assert written[("user-a", "snap-1")].visits == 5
+    assert written[("user-a", "snap-1")].first_visited_at == T0
+    assert written[("user-a", "snap-1")].last_visited_at == T0 + timedelta(seconds=4)
+    assert written[("user-b", "snap-1")].visits == 1
+
+
+async def test_flush_for_visitor_leaves_other_visitors_pending(writer: _FakeAccessLogWriter) -> None:
+    buffer = SnapshotVisitBuffer(writer.apply_visits_async)
+    buffer.record_visit("user-a", "snap-1", "owner", T0)
+    buffer.record_visit("user-b", "snap-1", "owner", T0)
+
+    assert await buffer.flush_async(visitor_id="user-a") == 1
+    assert [visitor_id for visitor_id, _, _ in writer.written] == ["user-a"]
+    assert buffer.get_pending_count() == 1
+
+
+async def test_failed_flush_is_retried_with_visits_recorded_meanwhile(writer: _FakeAccessLogWriter) -> None:
+    buffer = SnapshotVisitBuffer(writer.apply_visits_async, max_flush_attempts=3)
+    buffer.record_visit("user-a", "snap-1", "owner", T0)
+    writer.num_failures_left = 1
+
+    assert await buffer.flush_async() == 0
+    buffer.record_visit("user-a", "snap-1", "owner", T0 + timedelta(seconds=1))
+
+    assert await buffer.flush_async() == 1
+    assert writer.written[0][2].visits == 2
+
+
+async def test_visits_are_dropped_after_max_flush_attempts(writer: _FakeAccessLogWriter) -> None:
+    buffer = SnapshotVisitBuffer(writer.apply_visits_async, max_flush_attempts=2)
+    buffer.record_visit("user-a", "snap-1", "owner", T0)
+    writer.num_failures_left = 2
+
+    await buffer.flush_async()
+    await buffer.flush_async()
+
+    assert buffer.get_pending_count() == 0
+    assert not writer.written
+
+
+async def test_discarded_visits_are_not_written(writer: _FakeAccessLogWriter) -> None:
+    buffer = SnapshotVisitBuffer(writer.apply_visits_async)
+    buffer.record_visit("user-a", "snap-1", "owner", T0)
+    buffer.discard("user-a", "snap-1")
+
+    assert await buffer.flush_async() == 0
+    assert not writer.written
+
+
+async def test_pending_visits_are_flushed_periodically_and_on_stop(writer: _FakeAccessLogWriter) -> None:
+    buffer = SnapshotVisitBuffer(writer.apply_visits_async, flush_interval_s=0.01)
+    buffer.start()
+
+    buffer.record_visit("user-a", "snap-1", "owner", T0)
+    await asyncio.sleep(0.05)
+    assert len(writer.written) == 1
+
+    buffer.record_visit("user-a", "snap-2", "owner", T0)
+    await buffer.stop_async()
+    assert [snapshot_id for _, snapshot_id, _ in writer.written] == ["snap-1", "snap-2"]
@@ -0,0 +1,41 @@
+import numpy as np
+
+from webviz_core_utils.b64 import b64_decode_float_array, b64_decode_uint_array
+from webviz_services.sumo_access.polygons_types import PolygonData
+
+from primary.routers.polygons.converters import to_api_polygons_data_b64
+
+
+def test_to_api_polygons_data_b64_concatenates_polygons() -> None:
+    polygons = [
+        PolygonData(
+            x_arr=np.array([456000.125, 456001.25]),
+            y_arr=np.array([6780000.5, 6780001.5]),
+            z_arr=np.array([1500.0, 1501.0]),
+            poly_id=1,
+            name="A",
+        ),
+        PolygonData(
+            x_arr=np.array([456010.0, 456011.0, 456012.0]),
+            y_arr=np.array([6780010.0, 6780011.0, 6780012.0]),
+            z_arr=np.array([1600.0, 1601.0, 1602.0]),
+            poly_id="fault_2",
+            name="B",
+        ),
+    ]
+
+    polygons_data = to_api_polygons_data_b64(polygons)
+
+    assert polygons_data.format == "b64"
+    assert polygons_data.poly_ids == [1, "fault_2"]
+    assert polygons_data.names == ["A", "B"]
+    assert b64_decode_uint_array(polygons_data.poly_start_indices_b64arr).tolist() == [0, 2]
+    # UTM coordinates must round-trip exactly
+    assert b64_decode_float_array(polygons_data.x_b64arr).tolist() == [
+        456000.125,
+        456001.25,
+        456010.0,
+        456011.0,
+        456012.0,
+    ]
+    assert b64_decode_float_array(polygons_data.y_b64arr).tolist()[1] == 6780001.5
@@ -0,0 +1,39 @@
+import numpy as np
+import pyarrow as pa
+
+from webviz_core_utils.b64 import b64_decode_float_array
+
+from primary.routers.pvt.converters import pvt_dataframe_to_api_data, pvt_dataframe_to_api_data_b64
+
+
+def _make_pvt_table() -> pa.Table:
+    return pa.table(
+        {
+            "KEYWORD": ["PVTO", "PVTO", "PVDG", "PVDG", "PVTW", "UNKNOWN"],
+            "PVTNUM": [1, 1, 1, 1, 1, 1],
+            "RS": [50.0, 100.0, None, None, None, 1.0],
+            "PRESSURE": [100.0, 200.0, 100.0, 200.0, 250.0, 1.0],
+            "VOLUMEFACTOR": [1.2, 1.3, 0.01, 0.005, 1.02, 1.0],
+            "VISCOSITY": [1.5, 1.1, 0.01, 0.02, 0.3, 1.0],
+            "DENSITY": [800.0, 790.0, 80.0, 160.0, 1000.0, 1.0],
+        }
+    )
+
+
+def test_pvt_b64_data_matches_json_data() -> None:
+    json_data = pvt_dataframe_to_api_data(_make_pvt_table())
+    b64_data = pvt_dataframe_to_api_data_b64(_make_pvt_table())
+
+    assert [(data.name, data.pvtnum) for data in json_data] == [
+        ("Oil (PVTO)", 1),
+        ("Gas (PVDG)", 1),
+        ("Water (PVTW)", 1),
+    ]
+    assert [(data.name, data.phase, data.pvtnum, data.pressure_unit) for data in b64_data] == [
+        (data.name, data.phase, data.pvtnum, data.pressure_unit) for data in json_data
+    ]
+    for json_item, b64_item in zip(json_data, b64_data, strict=True):
+        assert b64_item.format == "b64"
+        np.testing.assert_allclose(b64_decode_float_array(b64_item.ratio_b64arr), json_item.ratio, rtol=1e-7)
+        np.testing.assert_allclose(b64_decode_float_array(b64_item.pressure_b64arr), json_item.pressure, rtol=1e-7)
+        np.testing.assert_allclose(b64_decode_float_array(b64_item.density_b64arr), json_item.density, rtol=1e-7)
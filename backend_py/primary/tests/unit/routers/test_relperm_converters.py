@@ -1,5 +1,13 @@
-from primary.routers.relperm.converters import to_api_realization_data_response
-from webviz_services.sumo_access.relperm_types import RelpermCurveData, RelpermRealizationData
+import numpy as np
+
+from webviz_core_utils.b64 import b64_decode_float_array, b64_decode_uint_array
+from webviz_services.sumo_access.relperm_types import (
+    RelpermCurveData,
+    RelpermRealizationData,
+    RelpermSatnumCurveArrays,
+)
+
+from primary.routers.relperm.converters import to_api_realization_data_response, to_api_realization_data_response_b64
 
 
 def test_to_api_realization_data_response_shares_saturation_values_by_satnum() -> None:
@@ -51,3 +59,30 @@ def test_to_api_realization_data_response_shares_saturation_values_by_satnum() -
             "curve_data": [{"curve_name": "KRW", "curve_values": [0.0, 0.3, 0.8]}],
         },
     ]
+
+
+def test_to_api_realization_data_response_b64_encodes_curve_matrices() -> None:
+    curve_values = np.array([[[0.0, 0.4, 1.0], [0.0, 0.5, 1.0]], [[1.0, 0.6, 0.0], [1.0, 0.5, 0.0]]])
+    response = to_api_realization_data_response_b64(
+        [
+            RelpermSatnumCurveArrays(
+                satnum=1,
+                saturation_name="SW",
+                saturation_values=np.array([0.0, 0.5, 1.0]),
+                realizations=np.array([3, 7]),
+                curve_names=["KRW", "KROW"],
+                curve_values=curve_values,
+            )
+        ]
+    )
+
+    assert response.format == "b64"
+    assert response.saturation_name == "SW"
+    satnum_data = response.satnum_data[0]
+    assert satnum_data.satnum == 1
+    assert b64_decode_float_array(satnum_data.saturation_values_b64arr).tolist() == [0.0, 0.5, 1.0]
+    assert b64_decode_uint_array(satnum_data.realizations_b64arr).tolist() == [3, 7]
+    assert [curve.curve_name for curve in satnum_data.curve_values] == ["KRW", "KROW"]
+    for curve_index, curve in enumerate(satnum_data.curve_values):
+        decoded_values = b64_decode_float_array(curve.values_b64arr).reshape(2, 3)
+        np.testing.assert_allclose(decoded_values, curve_values[curve_index], rtol=1e-7)
@@ -0,0 +1,216 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import asyncio
+from typing import Literal
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from webviz_core_utils.exponential_backoff_timer import ExponentialBackoffTimer
+from webviz_services.sumo_access.surface_access import ExpectedError, InProgress, SurfaceAccess
+from webviz_services.utils.task_meta_tracker import TaskMeta, TaskMetaTracker
+
+from primary.routers.surface import task_helpers
+
+_SURFACE = object()
+
+
+class _FakeSurfaceAccess:
+    """Stands in for the polling methods of SurfaceAccess, reporting the task as running until it is finished"""
+
+    def __init__(self) -> None:
+        self.outcome: Literal["success", "failure"] | None = None
+        self.num_polls = 0
+
+    async def poll_statistical_surface_calculation_task_async(
+        self, sumo_task_id: str, timeout_s: float
+    ) -> object | InProgress | ExpectedError:
+        # pylint: disable=unused-argument
+        self.num_polls += 1
+        if self.outcome == "success":
+            return _SURFACE
+        if self.outcome == "failure":
+            return ExpectedError(message="failed")
+        return InProgress(progress_message="running")
+
+    async def poll_statistical_surface_calculation_task_status_async(
+        self, sumo_task_id: str
+    ) -> Literal["succeeded", "failed"] | InProgress:
+        # pylint: disable=unused-argument
+        self.num_polls += 1
+        if self.outcome == "success":
+            return "succeeded"
+        if self.outcome == "failure":
+            return "failed"
+        return InProgress(progress_message="running")
+
+    def as_surface_access(self) -> SurfaceAccess:
+        return self  # type: ignore[return-value]
+
+
+@pytest.fixture
+def redis_client() -> FakeAsyncRedis:
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+async def tracker_and_task_meta(redis_client: FakeAsyncRedis) -> tuple[TaskMetaTracker, TaskMeta]:
+    tracker = TaskMetaTracker("user1", redis_client)
+    task_meta = await tracker.register_task_async("sumo_task", "task1", 100, None, None)
+    return tracker, task_meta
+
+
+def _use_fixed_backoff_delay(monkeypatch: pytest.MonkeyPatch, delay_s: float) -> None:
+    def make_timer(initial_delay_s: float, max_delay_s: float, max_total_duration_s: float) -> ExponentialBackoffTimer:
+        # pylint: disable=unused-argument
+        return ExponentialBackoffTimer(
+            initial_delay_s=delay_s, max_delay_s=delay_s, max_total_duration_s=max_total_duration_s, jitter=None
+        )
+
+    monkeypatch.setattr(task_helpers, "ExponentialBackoffTimer", make_timer)
+
+
+async def _wait_for_subscribers_async(redis_client: FakeAsyncRedis, task_id: str) -> None:
+    channel = f"task_meta_tracker:user:{{user1}}:task_done:{task_id}"
+    while (await redis_client.pubsub_numsub(channel))[0][1] == 0:
+        await asyncio.sleep(0.01)
+
+
+async def test_poll_records_outcome_when_task_completes(
+    tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta],
+) -> None:
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+    access.outcome = "success"
+
+    res = await task_helpers.poll_stat_surf_task_async(access.as_surface_access(), tracker, task_meta, 0)
+
+    assert res is _SURFACE
+    assert access.num_polls == 1
+    fetched = await tracker.get_task_meta_async("task1")
+    assert fetched is not None and fetched.final_outcome == "success"
+
+
+async def test_poll_is_woken_when_another_worker_signals_completion(
+    monkeypatch: pytest.MonkeyPatch,
+    redis_client: FakeAsyncRedis,
+    tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta],
+) -> None:
+    # With a backoff delay this long, the poll can only finish in time if it is woken by the signal
+    _use_fixed_backoff_delay(monkeypatch, 60)
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+
+    poll_task = asyncio.create_task(
+        task_helpers.poll_stat_surf_task_async(access.as_surface_access(), tracker, task_meta, 120)
+    )
+    await _wait_for_subscribers_async(redis_client, "task1")
+    access.outcome = "success"
+    await tracker.set_final_outcome_async("task1", "success")
+
+    assert await asyncio.wait_for(poll_task, timeout=5) is _SURFACE
+    assert access.num_polls == 2
+
+
+async def test_poll_returns_in_progress_when_long_poll_times_out(
+    monkeypatch: pytest.MonkeyPatch,
+    tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta],
+) -> None:
+    _use_fixed_backoff_delay(monkeypatch, 0.05)
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+
+    res = await task_helpers.poll_stat_surf_task_async(access.as_surface_access(), tracker, task_meta, 0.2)
+
+    assert isinstance(res, InProgress)
+    assert access.num_polls > 1
+    fetched = await tracker.get_task_meta_async("task1")
+    assert fetched is not None and fetched.final_outcome is None
+
+
+async def test_status_events_end_with_completed_event(
+    monkeypatch: pytest.MonkeyPatch,
+    tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta],
+) -> None:
+    _use_fixed_backoff_delay(monkeypatch, 0.01)
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+
+    events: list[str] = []
+    async for event in task_helpers.generate_stat_surf_task_status_events_async(
+        access.as_surface_access(), tracker, task_meta, 60
+    ):
+        events.append(event)
+        if len(events) == 2:
+            access.outcome = "success"
+
+    assert [event.split("\n")[0] for event in events] == [
+        "event: LroInProgressResp",
+        "event: LroInProgressResp",
+        "event: LroCompletedResp",
+    ]
+    fetched = await tracker.get_task_meta_async("task1")
+    assert fetched is not None and fetched.final_outcome == "success"
+
+
+async def test_status_events_end_with_failure_event(tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta]) -> None:
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+    access.outcome = "failure"
+
+    events = [
+        event
+        async for event in task_helpers.generate_stat_surf_task_status_events_async(
+            access.as_surface_access(), tracker, task_meta, 60
+        )
+    ]
+
+    assert len(events) == 1
+    assert events[0].startswith("event: LroFailureResp\n")
+    fetched = await tracker.get_task_meta_async("task1")
+    assert fetched is not None and fetched.final_outcome == "failure"
+
+
+async def test_status_events_stop_without_terminal_event_when_duration_expires(
+    monkeypatch: pytest.MonkeyPatch,
+    tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta],
+) -> None:
+    _use_fixed_backoff_delay(monkeypatch, 0.05)
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+
+    events = [
+        event
+        async for event in task_helpers.generate_stat_surf_task_status_events_async(
+            access.as_surface_access(), tracker, task_meta, 0.2
+        )
+    ]
+
+    assert len(events) > 1
+    assert all(event.startswith("event: LroInProgressResp\n") for event in events)
+
+
+async def test_status_events_stop_polling_when_client_disconnects(
+    monkeypatch: pytest.MonkeyPatch,
+    redis_client: FakeAsyncRedis,
+    tracker_and_task_meta: tuple[TaskMetaTracker, TaskMeta],
+) -> None:
+    _use_fixed_backoff_delay(monkeypatch, 60)
+    tracker, task_meta = tracker_and_task_meta
+    access = _FakeSurfaceAccess()
+
+    event_generator = task_helpers.generate_stat_surf_task_status_events_async(
+        access.as_surface_access(), tracker, task_meta, 120
+    )
+    assert (await anext(event_generator)).startswith("event: LroInProgressResp\n")
+
+    # On disconnect the response streaming task gets cancelled while the generator is waiting for the next poll
+    next_event_task = asyncio.create_task(anext(event_generator))
+    await _wait_for_subscribers_async(redis_client, "task1")
+    next_event_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await next_event_task
+    await event_generator.aclose()
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(event_generator)
+    assert access.num_polls == 1
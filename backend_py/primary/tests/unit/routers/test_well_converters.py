@@ -0,0 +1,32 @@
+import numpy as np
+
+from webviz_core_utils.b64 import b64_decode_float_array, b64_decode_uint_array
+from webviz_services.smda_access.types import WellboreTrajectoriesColumnar
+
+from primary.routers.well.converters import convert_well_trajectories_columnar_to_schema_b64
+
+
+def test_trajectory_coordinates_are_encoded_relative_to_origin() -> None:
+    trajectories = WellboreTrajectoriesColumnar(
+        wellbore_uuids=["a", "b"],
+        unique_wellbore_identifiers=["A", "B"],
+        start_indices=np.array([0, 2], dtype=np.uint32),
+        tvd_msl_arr=np.array([0.0, 1500.25, 0.0]),
+        md_arr=np.array([0.0, 1600.5, 0.0]),
+        easting_arr=np.array([456000.125, 456100.375, 457000.5]),
+        northing_arr=np.array([6780000.5, 6780200.25, 6781000.75]),
+    )
+
+    api_trajectories = convert_well_trajectories_columnar_to_schema_b64(trajectories)
+
+    assert api_trajectories.wellboreUuids == ["a", "b"]
+    assert b64_decode_uint_array(api_trajectories.startIndicesB64arr).tolist() == [0, 2]
+    assert api_trajectories.eastingOrigin == 456000.0
+    assert api_trajectories.northingOrigin == 6780000.0
+
+    easting_arr = b64_decode_float_array(api_trajectories.eastingB64arr)
+    assert easting_arr.dtype == np.float32
+    np.testing.assert_allclose(easting_arr + api_trajectories.eastingOrigin, trajectories.easting_arr, atol=1e-3)
+    northing_arr = b64_decode_float_array(api_trajectories.northingB64arr)
+    np.testing.assert_allclose(northing_arr + api_trajectories.northingOrigin, trajectories.northing_arr, atol=1e-3)
+    assert b64_decode_float_array(api_trajectories.mdB64arr).tolist() == [0.0, 1600.5, 0.0]
@@ -0,0 +1,141 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument, protected-access
+import asyncio
+
+import pytest
+
+from webviz_services.service_exceptions import Service, ServiceRequestError, ServiceTimeoutError
+
+from primary.routers.well import log_curve_headers
+from primary.routers.well import schemas
+
+Source = schemas.WellLogCurveSourceEnum
+
+
+class _FakeUser:
+    def get_user_id(self) -> str:
+        return "user_1"
+
+
+class _FakeSources:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.calls: list[tuple[str, str]] = []
+        self.delay_s_per_source: dict[Source, float] = {}
+        self.failing_sources: set[Source] = set()
+        # If set, every fetch waits until this many fetches have started
+        self.num_fetches_to_wait_for: int | None = None
+        self._num_started_fetches = 0
+        self._all_fetches_started = asyncio.Event()
+
+        for source, func_name in [
+            (Source.SSDL_WELL_LOG, "_get_headers_from_ssdl_well_log_async"),
+            (Source.SMDA_GEOLOGY, "_get_headers_from_smda_geology_async"),
+            (Source.SMDA_STRATIGRAPHY, "_get_headers_from_smda_stratigraghpy_async"),
+            (Source.SMDA_SURVEY, "_get_headers_from_smda_survey_async"),
+        ]:
+            monkeypatch.setattr(log_curve_headers, func_name, self._make_fetcher(source))
+
+    def _make_fetcher(self, source: Source):  # type: ignore[no-untyped-def]
+        async def _fetch_async(authenticated_user: _FakeUser, wellbore_uuid: str) -> list:
+            self.calls.append((wellbore_uuid, source.value))
+            self._num_started_fetches += 1
+            if self._num_started_fetches == self.num_fetches_to_wait_for:
+                self._all_fetches_started.set()
+            if self.num_fetches_to_wait_for is not None:
+                await self._all_fetches_started.wait()
+
+            await asyncio.sleep(self.delay_s_per_source.get(source, 0.01))
+            if source in self.failing_sources:
+                raise ServiceRequestError("Upstream failure", Service.SMDA)
+            return [
+                schemas.WellboreLogCurveHeader(
+                    source=source,
+                    curveType=schemas.WellLogCurveTypeEnum.CONTINUOUS,
+                    logName=wellbore_uuid,
+                    curveName=source.value,
+                    curveUnit=None,
+                )
+            ]
+
+        return _fetch_async
+
+
+@pytest.fixture
+def fake_sources(monkeypatch: pytest.MonkeyPatch) -> _FakeSources:
+    log_curve_headers._LOG_CURVE_HEADERS_CACHE.clear()
+    return _FakeSources(monkeypatch)
+
+
+async def _get_headers_result_async(
+    wellbore_uuids: list[str], sources: list[Source]
+) -> log_curve_headers.LogCurveHeadersResult:
+    return await log_curve_headers.get_log_curve_headers_for_wellbores_async(
+        _FakeUser(), wellbore_uuids, sources  # type: ignore[arg-type]
+    )
+
+
+def _curve_names_per_wellbore(headers_result: log_curve_headers.LogCurveHeadersResult) -> dict[str, list[str]]:
+    return {
+        uuid: [header.curveName for header in headers] for uuid, headers in headers_result.headers_per_wellbore.items()
+    }
+
+
+async def test_sources_are_fetched_concurrently_in_fixed_order(
+    fake_sources: _FakeSources, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Every fetch waits until all four have started, so any fetch that is not started concurrently with the others
+    # makes the waiting ones time out
+    monkeypatch.setattr(log_curve_headers, "LOG_CURVE_HEADER_SOURCE_TIMEOUT_S", 1)
+    fake_sources.num_fetches_to_wait_for = 4
+
+    headers_result = await _get_headers_result_async(["wb1", "wb2"], [Source.SMDA_SURVEY, Source.SSDL_WELL_LOG])
+
+    assert not headers_result.is_partial
+    assert _curve_names_per_wellbore(headers_result) == {
+        "wb1": ["ssdl.well_log", "smda.survey"],
+        "wb2": ["ssdl.well_log", "smda.survey"],
+    }
+
+
+async def test_headers_are_cached_per_wellbore_and_source(fake_sources: _FakeSources) -> None:
+    await _get_headers_result_async(["wb1"], [Source.SSDL_WELL_LOG])
+    await _get_headers_result_async(["wb1", "wb2"], [Source.SSDL_WELL_LOG, Source.SMDA_GEOLOGY])
+
+    assert sorted(fake_sources.calls) == [
+        ("wb1", "smda.geology"),
+        ("wb1", "ssdl.well_log"),
+        ("wb2", "smda.geology"),
+        ("wb2", "ssdl.well_log"),
+    ]
+
+
+async def test_failing_and_slow_sources_give_partial_results(
+    fake_sources: _FakeSources, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(log_curve_headers, "LOG_CURVE_HEADER_SOURCE_TIMEOUT_S", 0.05)
+    fake_sources.failing_sources = {Source.SMDA_GEOLOGY}
+    fake_sources.delay_s_per_source = {Source.SMDA_SURVEY: 0.1}
+
+    headers_result = await _get_headers_result_async(
+        ["wb1"], [Source.SSDL_WELL_LOG, Source.SMDA_GEOLOGY, Source.SMDA_STRATIGRAPHY, Source.SMDA_SURVEY]
+    )
+    assert _curve_names_per_wellbore(headers_result) == {"wb1": ["ssdl.well_log", "smda.stratigraphy"]}
+
+    # The failing and the slow source are reported, making the result partial
+    assert headers_result.is_partial
+    assert headers_result.failed_sources_per_wellbore == {"wb1": [Source.SMDA_GEOLOGY, Source.SMDA_SURVEY]}
+
+    # The slow source completes in the background and is served from the cache next time
+    await asyncio.sleep(0.1)
+    headers_result = await _get_headers_result_async(["wb1"], [Source.SMDA_SURVEY])
+    assert _curve_names_per_wellbore(headers_result) == {"wb1": ["smda.survey"]}
+    assert not headers_result.is_partial
+    assert fake_sources.calls.count(("wb1", "smda.survey")) == 1
+
+
+async def test_error_is_raised_if_all_sources_fail(fake_sources: _FakeSources, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(log_curve_headers, "LOG_CURVE_HEADER_SOURCE_TIMEOUT_S", 0.05)
+    fake_sources.failing_sources = {Source.SMDA_GEOLOGY}
+    fake_sources.delay_s_per_source = {Source.SMDA_SURVEY: 0.1}
+
+    with pytest.raises((ServiceRequestError, ServiceTimeoutError)):
+        await _get_headers_result_async(["wb1"], [Source.SMDA_GEOLOGY, Source.SMDA_SURVEY])
@@ -0,0 +1,148 @@
+# pylint: disable=async-suffix, redefined-outer-name, protected-access
+import asyncio
+import base64
+from collections import Counter
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from webviz_services.graph_access import graph_access
+from webviz_services.graph_access.graph_access import GraphApiAccess
+from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+
+_USERS = {
+    "id-a": {"id": "id-a", "displayName": "User A", "userPrincipalName": "a@example.com", "mail": "a@example.com"},
+    "id-b": {"id": "id-b", "displayName": "User B", "userPrincipalName": "b@example.com", "mail": "b@example.com"},
+}
+_PHOTOS = {"id-a": b"photo-of-a"}
+
+
+class _StandInGraphServer:
+    """Local stand-in for the parts of Microsoft Graph used by GraphApiAccess"""
+
+    def __init__(self) -> None:
+        self.requested_paths: Counter[str] = Counter()
+        self.num_batches = 0
+        self.throttled_user_ids: set[str] = set()
+        self.app = Starlette(
+            routes=[
+                Route("/v1.0/users/{user_id}", self._user_info_route),
+                Route("/v1.0/users/{user_id}/photo/$value", self._user_photo_route),
+                Route("/v1.0/$batch", self._batch_route, methods=["POST"]),
+            ]
+        )
+
+    def _get_user_info(self, user_id: str) -> tuple[int, dict | None]:
+        self.requested_paths[f"users/{user_id}"] += 1
+        if user_id in self.throttled_user_ids:
+            return 429, None
+        user = _USERS.get(user_id)
+        return (200, user) if user else (404, None)
+
+    def _get_user_photo(self, user_id: str) -> tuple[int, bytes | None]:
+        self.requested_paths[f"users/{user_id}/photo"] += 1
+        photo = _PHOTOS.get(user_id)
+        return (200, photo) if photo else (404, None)
+
+    async def _user_info_route(self, request: Request) -> Response:
+        status_code, body = self._get_user_info(request.path_params["user_id"])
+        return JSONResponse(body, status_code=status_code)
+
+    async def _user_photo_route(self, request: Request) -> Response:
+        status_code, body = self._get_user_photo(request.path_params["user_id"])
+        return Response(body, status_code=status_code, media_type="image/jpeg")
+
+    async def _batch_route(self, request: Request) -> Response:
+        self.num_batches += 1
+        batch_requests = (await request.json())["requests"]
+        assert len(batch_requests) <= 20
+
+        responses = []
+        for batch_request in batch_requests:
+            path_parts = batch_request["url"].strip("/").split("/")
+            if len(path_parts) == 2:
+                status_code, body = self._get_user_info(path_parts[1])
+            else:
+                status_code, photo = self._get_user_photo(path_parts[1])
+                body = base64.b64encode(photo).decode() if photo else None
+            responses.append({"id": batch_request["id"], "status": status_code, "body": body})
+
+        return JSONResponse({"responses": responses})
+
+
+@pytest.fixture
+async def graph_server(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[_StandInGraphServer]:
+    server = _StandInGraphServer()
+    graph_access._USER_INFO_CACHE.clear()
+    graph_access._USER_PHOTO_CACHE.clear()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app)) as client:
+        monkeypatch.setattr(HTTPX_ASYNC_CLIENT_WRAPPER, "_async_client", client)
+        yield server
+
+
+async def test_user_info_is_cached_by_case_insensitive_id(graph_server: _StandInGraphServer) -> None:
+    access = GraphApiAccess("token")
+
+    results = await asyncio.gather(*[access.get_user_info_async("id-a") for _ in range(5)])
+    assert all(result == _USERS["id-a"] for result in results)
+    assert await GraphApiAccess("other token").get_user_info_async("ID-A") == _USERS["id-a"]
+
+    assert graph_server.requested_paths["users/id-a"] == 1
+
+
+async def test_missing_photos_are_cached(graph_server: _StandInGraphServer) -> None:
+    access = GraphApiAccess("token")
+
+    assert await access.get_user_profile_photo_async("id-a") == base64.b64encode(b"photo-of-a").decode()
+    assert await access.get_user_profile_photo_async("id-b") is None
+    assert await access.get_user_profile_photo_async("id-b") is None
+
+    assert graph_server.requested_paths["users/id-a/photo"] == 1
+    assert graph_server.requested_paths["users/id-b/photo"] == 1
+
+
+async def test_throttled_lookups_are_not_cached(graph_server: _StandInGraphServer) -> None:
+    access = GraphApiAccess("token")
+    graph_server.throttled_user_ids.add("id-a")
+
+    assert await access.get_user_info_async("id-a") is None
+
+    graph_server.throttled_user_ids.clear()
+    assert await access.get_user_info_async("id-a") == _USERS["id-a"]
+
+
+async def test_many_users_are_looked_up_in_batches(graph_server: _StandInGraphServer) -> None:
+    access = GraphApiAccess("token")
+    await access.get_user_info_async("id-a")
+
+    user_ids = ["id-a", "id-b", "id-b", "unknown"] + [f"other-{i}" for i in range(25)]
+    user_infos = await access.get_user_infos_async(user_ids)
+
+    assert user_infos["id-a"] == _USERS["id-a"]
+    assert user_infos["id-b"] == _USERS["id-b"]
+    assert user_infos["unknown"] is None
+    assert list(user_infos) == list(dict.fromkeys(user_ids))
+
+    # The cached user is not looked up again, and the 27 others need two batches
+    assert graph_server.num_batches == 2
+    assert graph_server.requested_paths["users/id-a"] == 1
+    assert graph_server.requested_paths["users/id-b"] == 1
+
+    # Users found and not found are now served from the cache
+    await access.get_user_infos_async(["id-b", "unknown"])
+    assert graph_server.num_batches == 2
+
+
+async def test_many_photos_are_looked_up_in_batch(graph_server: _StandInGraphServer) -> None:
+    photos = await GraphApiAccess("token").get_user_profile_photos_async(["id-a", "id-b"])
+
+    assert photos == {"id-a": base64.b64encode(b"photo-of-a").decode(), "id-b": None}
+    assert graph_server.num_batches == 1
+    assert await GraphApiAccess("token").get_user_profile_photo_async("id-b") is None
+    assert graph_server.requested_paths["users/id-b/photo"] == 1
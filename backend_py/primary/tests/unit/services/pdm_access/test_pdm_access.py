@@ -0,0 +1,171 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument, protected-access
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from webviz_core_utils import ttl_cache
+from webviz_services.pdm_access import pdm_access
+from webviz_services.pdm_access.pdm_access import PDMAccess
+
+_WELLBORES = [("uuid-a", "NO 1/2-A-1"), ("uuid-b", "NO 1/2-B-2"), ("uuid-c", "NO 1/2-C-3")]
+_FIRST_DAY = date(2020, 1, 1)
+_NUM_DAYS = 60
+
+
+def _make_daily_rows() -> list[dict]:
+    rows = []
+    for day_index in range(_NUM_DAYS):
+        day = _FIRST_DAY + timedelta(days=day_index)
+        for well_index, (uuid, uwbi) in enumerate(_WELLBORES):
+            # Wellbore C only produces in the first ten days
+            if uuid == "uuid-c" and day_index >= 10:
+                continue
+            rows.append(
+                {
+                    "WB_UUID": uuid,
+                    "WELL_UUID": f"well-{uuid}",
+                    "WELL_UWI": uwbi[:-2],
+                    "WB_UWBI": uwbi,
+                    "PROD_DAY": f"{day.isoformat()}T00:00:00",
+                    "WB_OIL_VOL_SM3": float(100 * (well_index + 1) + day_index),
+                    "WB_GAS_VOL_SM3": float(1000 * (well_index + 1)),
+                    "WB_WATER_VOL_M3": None if day_index % 7 == 0 else 10.0,
+                }
+            )
+    return rows
+
+
+class _FakePdm:
+    def __init__(self) -> None:
+        self.rows = _make_daily_rows()
+        self.requested_ranges: list[str] = []
+
+    async def get_request_async(self, access_token: str, endpoint: str, params: dict) -> list[dict]:
+        day_range = params["PROD_DAY"]
+        self.requested_ranges.append(day_range)
+        first_day, last_day = day_range.removeprefix("RANGE(").removesuffix(")").split(" | ")
+        return [row for row in self.rows if first_day <= row["PROD_DAY"][:10] <= last_day]
+
+
+@pytest.fixture
+def fake_pdm(monkeypatch: pytest.MonkeyPatch) -> _FakePdm:
+    fake = _FakePdm()
+    monkeypatch.setattr(pdm_access, "pdm_get_request_async", fake.get_request_async)
+    pdm_access._DAILY_PRODUCTION_CACHE.clear()
+    return fake
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    # Only the clock of the cache is moved, the event loop keeps using the real one
+    clock = SimpleNamespace(now_s=0.0)
+    fake_time = SimpleNamespace(monotonic=lambda: clock.now_s)
+    monkeypatch.setattr(pdm_access, "time", fake_time)
+    monkeypatch.setattr(ttl_cache, "time", fake_time)
+    return clock
+
+
+def _expected_totals(rows: list[dict], start_date: str, end_date: str) -> dict[str, tuple[float, float, float]]:
+    totals: dict[str, tuple[float, float, float]] = {}
+    for row in rows:
+        if start_date <= row["PROD_DAY"][:10] < end_date:
+            oil, gas, water = totals.get(row["WB_UWBI"], (0.0, 0.0, 0.0))
+            totals[row["WB_UWBI"]] = (
+                oil + row["WB_OIL_VOL_SM3"],
+                gas + row["WB_GAS_VOL_SM3"],
+                water + (row["WB_WATER_VOL_M3"] or 0.0),
+            )
+    return totals
+
+
+async def _get_totals_async(access: PDMAccess, start_date: str, end_date: str) -> dict[str, tuple[float, float, float]]:
+    data = await access.get_per_well_total_production_in_time_interval_async("FIELD", start_date, end_date)
+    assert all((item.start_date, item.end_date) == (start_date, end_date) for item in data)
+    return {
+        item.wellbore_uwbi: (item.oil_production_sm3, item.gas_production_sm3, item.water_production_m3)
+        for item in data
+    }
+
+
+@pytest.mark.parametrize("user_id", [None, "user_1"])
+async def test_totals_match_sum_of_daily_volumes(fake_pdm: _FakePdm, user_id: str | None) -> None:
+    access = PDMAccess("token", user_id=user_id)
+
+    for start_date, end_date in [
+        ("2020-01-01", "2020-03-01"),
+        ("2020-01-15", "2020-02-10"),
+        ("2020-01-05", "2020-01-20"),
+    ]:
+        totals = await _get_totals_async(access, start_date, end_date)
+        assert totals == pytest.approx(_expected_totals(fake_pdm.rows, start_date, end_date))
+
+    # Wellbore C has no production in this interval, and is left out
+    assert list(await _get_totals_async(access, "2020-02-01", "2020-02-10")) == ["NO 1/2-A-1", "NO 1/2-B-2"]
+
+
+async def test_only_missing_days_are_fetched(fake_pdm: _FakePdm) -> None:
+    access = PDMAccess("token", user_id="user_1")
+
+    await _get_totals_async(access, "2020-01-10", "2020-01-20")
+    await _get_totals_async(access, "2020-01-12", "2020-01-18")
+    await _get_totals_async(access, "2020-01-05", "2020-01-25")
+
+    assert fake_pdm.requested_ranges == [
+        "RANGE(2020-01-10 | 2020-01-19)",
+        "RANGE(2020-01-05 | 2020-01-09)",
+        "RANGE(2020-01-20 | 2020-01-24)",
+    ]
+
+    # Other users do not share the cached days
+    await _get_totals_async(PDMAccess("token", user_id="user_2"), "2020-01-12", "2020-01-18")
+    assert fake_pdm.requested_ranges[-1] == "RANGE(2020-01-12 | 2020-01-17)"
+
+
+async def test_empty_interval_gives_no_data(fake_pdm: _FakePdm) -> None:
+    assert await _get_totals_async(PDMAccess("token", user_id="user_1"), "2020-01-10", "2020-01-10") == {}
+    assert not fake_pdm.requested_ranges
+
+
+async def test_cached_days_expire_after_ttl_when_table_is_extended(
+    fake_pdm: _FakePdm, fake_clock: SimpleNamespace
+) -> None:
+    access = PDMAccess("token", user_id="user_1")
+
+    await _get_totals_async(access, "2020-01-01", "2020-01-10")
+
+    # Extending the table does not postpone the expiry of the days fetched first
+    for day_index in range(1, 4):
+        fake_clock.now_s = day_index * 20 * 60 - 1
+        await _get_totals_async(access, "2020-01-01", f"2020-01-{10 + day_index}")
+
+    assert fake_pdm.requested_ranges == [
+        "RANGE(2020-01-01 | 2020-01-09)",
+        "RANGE(2020-01-10 | 2020-01-10)",
+        "RANGE(2020-01-11 | 2020-01-11)",
+        "RANGE(2020-01-12 | 2020-01-12)",
+    ]
+
+    fake_clock.now_s = pdm_access._DAILY_PRODUCTION_TTL_S
+    totals = await _get_totals_async(access, "2020-01-01", "2020-01-10")
+
+    assert fake_pdm.requested_ranges[-1] == "RANGE(2020-01-01 | 2020-01-09)"
+    assert totals == pytest.approx(_expected_totals(fake_pdm.rows, "2020-01-01", "2020-01-10"))
+
+
+async def test_days_apart_from_cached_days_replace_them(fake_pdm: _FakePdm) -> None:
+    access = PDMAccess("token", user_id="user_1")
+
+    await _get_totals_async(access, "2020-02-01", "2020-02-10")
+    totals = await _get_totals_async(access, "2020-01-01", "2020-01-05")
+
+    # The gap between the cached and the requested days is not fetched
+    assert fake_pdm.requested_ranges[-1] == "RANGE(2020-01-01 | 2020-01-04)"
+    assert totals == pytest.approx(_expected_totals(fake_pdm.rows, "2020-01-01", "2020-01-05"))
+
+    # Adjoining days still extend the cached days
+    await _get_totals_async(access, "2020-01-03", "2020-01-10")
+    assert fake_pdm.requested_ranges[-1] == "RANGE(2020-01-05 | 2020-01-09)"
+
+    await _get_totals_async(access, "2020-02-01", "2020-02-10")
+    assert fake_pdm.requested_ranges[-1] == "RANGE(2020-02-01 | 2020-02-09)"
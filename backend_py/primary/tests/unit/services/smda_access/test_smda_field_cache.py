@@ -0,0 +1,111 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from webviz_core_utils.single_flight import SingleFlight
+
+from webviz_services.smda_access.smda_field_cache import FetchedPayload, SmdaFieldCache
+
+
+class _FakeSmdaSource:
+    def __init__(self, payload: bytes, record_count: int) -> None:
+        self.payload = payload
+        self.record_count = record_count
+        self.num_counts = 0
+        self.num_fetches = 0
+
+    async def count_async(self) -> int:
+        self.num_counts += 1
+        return self.record_count
+
+    async def fetch_async(self) -> FetchedPayload:
+        self.num_fetches += 1
+        await asyncio.sleep(0)
+        return FetchedPayload(self.payload, self.record_count)
+
+
+@pytest.fixture
+def field_cache() -> SmdaFieldCache:
+    return SmdaFieldCache("user1", FakeAsyncRedis(decode_responses=False))
+
+
+async def test_entry_is_fetched_once_and_served_from_redis(field_cache: SmdaFieldCache) -> None:
+    source = _FakeSmdaSource(b"headers", 3)
+
+    assert await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async) == b"headers"
+    assert await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async) == b"headers"
+    assert source.num_fetches == 1
+    assert source.num_counts == 2
+
+
+async def test_entry_is_refetched_when_record_count_changes(field_cache: SmdaFieldCache) -> None:
+    source = _FakeSmdaSource(b"v1", 3)
+    await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async)
+
+    source.payload = b"v2"
+    source.record_count = 4
+    assert await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async) == b"v2"
+    assert source.num_fetches == 2
+
+
+async def test_concurrent_requests_share_one_fetch(field_cache: SmdaFieldCache) -> None:
+    source = _FakeSmdaSource(b"trajectories", 10)
+
+    results = await asyncio.gather(
+        *[field_cache.get_async("field:A:trajectories", source.count_async, source.fetch_async) for _ in range(5)]
+    )
+    assert results == [b"trajectories"] * 5
+    assert source.num_fetches == 1
+
+
+async def test_entries_and_fetches_are_not_shared_between_users() -> None:
+    redis_client = FakeAsyncRedis(decode_responses=False)
+    in_flight_fetches: SingleFlight[str, FetchedPayload] = SingleFlight()
+    field_cache1 = SmdaFieldCache("user1", redis_client, in_flight_fetches)
+    field_cache2 = SmdaFieldCache("user2", redis_client, in_flight_fetches)
+
+    # Same record count, but different records visible to each user
+    source1 = _FakeSmdaSource(b"headers seen by user1", 3)
+    source2 = _FakeSmdaSource(b"headers seen by user2", 3)
+
+    results = await asyncio.gather(
+        field_cache1.get_async("field:A:headers", source1.count_async, source1.fetch_async),
+        field_cache2.get_async("field:A:headers", source2.count_async, source2.fetch_async),
+    )
+    assert results == [b"headers seen by user1", b"headers seen by user2"]
+    assert await field_cache2.get_async("field:A:headers", source2.count_async, source2.fetch_async) == (
+        b"headers seen by user2"
+    )
+    assert source1.num_fetches == 1
+    assert source2.num_fetches == 1
+
+
+async def test_miss_without_fetch_on_miss_fills_cache_in_background(field_cache: SmdaFieldCache) -> None:
+    source = _FakeSmdaSource(b"trajectories", 10)
+
+    payload = await field_cache.get_async(
+        "field:A:trajectories", source.count_async, source.fetch_async, fetch_on_miss=False
+    )
+    assert payload is None
+
+    await asyncio.sleep(0.01)
+    payload = await field_cache.get_async(
+        "field:A:trajectories", source.count_async, source.fetch_async, fetch_on_miss=False
+    )
+    assert payload == b"trajectories"
+    assert source.num_fetches == 1
+
+
+async def test_stale_entry_is_served_and_refreshed_in_background() -> None:
+    field_cache = SmdaFieldCache("user1", FakeAsyncRedis(decode_responses=False), refresh_after_s=0)
+    source = _FakeSmdaSource(b"v1", 3)
+    await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async)
+
+    source.payload = b"v2"
+    assert await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async) == b"v1"
+
+    await asyncio.sleep(0.01)
+    assert source.num_fetches == 2
+    assert await field_cache.get_async("field:A:headers", source.count_async, source.fetch_async) == b"v2"
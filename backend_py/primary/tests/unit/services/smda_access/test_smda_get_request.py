@@ -0,0 +1,67 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument
+import pytest
+
+from webviz_services.smda_access import _smda_get_request
+from webviz_services.smda_access._smda_get_request import smda_get_request_async
+from webviz_services.service_exceptions import ServiceRequestError, Service
+
+
+class _FakeSmdaEndpoint:
+    """Serves records by `_page` number or by `_next` cursor, like the SMDA API"""
+
+    def __init__(self, num_records: int) -> None:
+        self.records = [{"id": i} for i in range(num_records)]
+        self.requested_params: list[dict] = []
+        self.failing_page: int | None = None
+
+    async def get_page_data_async(self, urlstring: str, params: dict, headers: dict, endpoint: str) -> dict:
+        self.requested_params.append(dict(params))
+        page_size = params["_items"]
+        if "_page" in params:
+            if params["_page"] == self.failing_page:
+                raise ServiceRequestError("[500] Cannot fetch data", Service.SMDA)
+            start = (params["_page"] - 1) * page_size
+        else:
+            start = int(params.get("_next", 0))
+
+        end = start + page_size
+        return {
+            "total": len(self.records),
+            "results": self.records[start:end],
+            "next": str(end) if end < len(self.records) else None,
+        }
+
+
+@pytest.fixture
+def fake_endpoint(monkeypatch: pytest.MonkeyPatch) -> _FakeSmdaEndpoint:
+    endpoint = _FakeSmdaEndpoint(num_records=25)
+    monkeypatch.setattr(_smda_get_request, "SMDA_PAGE_SIZE", 10)
+    monkeypatch.setattr(_smda_get_request, "_make_headers", lambda access_token: {})
+    monkeypatch.setattr(_smda_get_request, "_get_page_data_async", endpoint.get_page_data_async)
+    return endpoint
+
+
+async def test_sorted_request_fetches_remaining_pages_by_page_number(fake_endpoint: _FakeSmdaEndpoint) -> None:
+    results = await smda_get_request_async("token", "wellbore-survey-samples", {"_sort": "id"})
+
+    assert results == fake_endpoint.records
+    assert [params.get("_page") for params in fake_endpoint.requested_params] == [None, 2, 3]
+
+
+async def test_unsorted_request_uses_next_cursor(fake_endpoint: _FakeSmdaEndpoint) -> None:
+    results = await smda_get_request_async("token", "wellbore-survey-samples", {})
+
+    assert results == fake_endpoint.records
+    assert [params.get("_next") for params in fake_endpoint.requested_params] == [None, "10", "20"]
+
+
+async def test_failing_page_falls_back_to_next_cursor(fake_endpoint: _FakeSmdaEndpoint) -> None:
+    fake_endpoint.failing_page = 3
+
+    params = {"_sort": "id"}
+    results = await smda_get_request_async("token", "wellbore-survey-samples", params)
+
+    assert results == fake_endpoint.records
+    assert [params.get("_next") for params in fake_endpoint.requested_params[-2:]] == ["10", "20"]
+    # The caller's params are left untouched
+    assert params == {"_sort": "id"}
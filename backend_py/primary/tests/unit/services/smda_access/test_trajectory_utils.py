@@ -0,0 +1,65 @@
+import numpy as np
+
+from webviz_services.smda_access.trajectory_utils import (
+    create_survey_samples_df_from_trajectories,
+    create_wellbore_trajectories_columnar,
+    filter_survey_samples_df,
+)
+from webviz_services.smda_access.types import BoundingBox2D, WellboreTrajectory
+
+
+def _make_trajectory(uuid: str, easting_arr: list[float], northing_arr: list[float]) -> WellboreTrajectory:
+    num_samples = len(easting_arr)
+    return WellboreTrajectory(
+        wellbore_uuid=uuid,
+        unique_wellbore_identifier=f"NO 1/2-{uuid}",
+        tvd_msl_arr=[100.0 * i for i in range(num_samples)],
+        md_arr=[110.0 * i for i in range(num_samples)],
+        easting_arr=easting_arr,
+        northing_arr=northing_arr,
+    )
+
+
+TRAJECTORIES = [
+    _make_trajectory("a", [0.0, 10.0, 20.0], [0.0, 10.0, 20.0]),
+    _make_trajectory("b", [100.0, 110.0], [100.0, 110.0]),
+    _make_trajectory("c", [15.0, 200.0, 300.0, 400.0], [15.0, 200.0, 300.0, 400.0]),
+]
+
+
+def test_create_wellbore_trajectories_columnar() -> None:
+    samples_df = create_survey_samples_df_from_trajectories(TRAJECTORIES)
+    trajectories = create_wellbore_trajectories_columnar(samples_df)
+
+    assert trajectories.wellbore_uuids == ["a", "b", "c"]
+    assert trajectories.unique_wellbore_identifiers == ["NO 1/2-a", "NO 1/2-b", "NO 1/2-c"]
+    assert trajectories.start_indices.tolist() == [0, 3, 5]
+    assert trajectories.easting_arr.tolist() == [0.0, 10.0, 20.0, 100.0, 110.0, 15.0, 200.0, 300.0, 400.0]
+    assert trajectories.md_arr[3:5].tolist() == [0.0, 110.0]
+
+
+def test_bbox_filter_keeps_whole_wellbores_passing_through_the_box() -> None:
+    samples_df = create_survey_samples_df_from_trajectories(TRAJECTORIES)
+    bbox = BoundingBox2D(min_x=5.0, min_y=5.0, max_x=16.0, max_y=16.0)
+
+    trajectories = create_wellbore_trajectories_columnar(filter_survey_samples_df(samples_df, bbox=bbox))
+
+    assert trajectories.wellbore_uuids == ["a", "c"]
+    assert trajectories.start_indices.tolist() == [0, 3]
+    assert len(trajectories.northing_arr) == 7
+
+
+def test_uuid_and_bbox_filters_are_combined() -> None:
+    samples_df = create_survey_samples_df_from_trajectories(TRAJECTORIES)
+    bbox = BoundingBox2D(min_x=5.0, min_y=5.0, max_x=16.0, max_y=16.0)
+
+    filtered_df = filter_survey_samples_df(samples_df, wellbore_uuids=["b", "c"], bbox=bbox)
+    assert filtered_df["wellbore_uuid"].unique().to_list() == ["c"]
+
+
+def test_empty_input_gives_empty_arrays() -> None:
+    trajectories = create_wellbore_trajectories_columnar(create_survey_samples_df_from_trajectories([]))
+
+    assert trajectories.wellbore_uuids == []
+    assert trajectories.start_indices.dtype == np.uint32
+    assert trajectories.md_arr.size == 0
@@ -0,0 +1,94 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from webviz_core_utils.single_flight import SingleFlight
+
+from webviz_services.ssdl_access import well_access
+from webviz_services.ssdl_access.ssdl_field_cache import SsdlFieldCache
+from webviz_services.ssdl_access.well_access import WellAccess
+
+_FIELDS = [
+    {"field_uuid": "uuid-a", "field_identifier": "FIELD A", "country_identifier": "NO"},
+    {"field_uuid": "uuid-b", "field_identifier": "FIELD B", "country_identifier": "NO"},
+]
+
+_PERFORATION = {
+    "wellbore_uuid": "wb-1",
+    "wellbore_id": "NO 1/2-3",
+    "md_top": 1000.0,
+    "md_bottom": 1010.0,
+    "tvd_top": 900.0,
+    "tvd_bottom": 905.0,
+    "status": "Open",
+    "completion_mode": "Perforated",
+    "date_shot": None,
+    "date_closed": None,
+}
+
+
+class _FakeSsdl:
+    def __init__(self) -> None:
+        self.requested_endpoints: list[str] = []
+
+    async def get_request_async(self, access_token: str, endpoint: str, params: dict | None = None) -> list[dict]:
+        self.requested_endpoints.append(endpoint)
+        await asyncio.sleep(0)
+        if endpoint == "Field":
+            return _FIELDS
+        return [_PERFORATION]
+
+
+@pytest.fixture
+def fake_ssdl(monkeypatch: pytest.MonkeyPatch) -> _FakeSsdl:
+    fake = _FakeSsdl()
+    monkeypatch.setattr(well_access, "ssdl_get_request_async", fake.get_request_async)
+    well_access._FIELD_UUID_DIRECTORY_CACHE.clear()  # pylint: disable=protected-access
+    return fake
+
+
+async def test_field_uuid_lookups_share_one_field_request(fake_ssdl: _FakeSsdl) -> None:
+    assert await WellAccess("token_1").get_field_uuid_async("FIELD B") == "uuid-b"
+    assert await WellAccess("token_2").get_field_uuid_async("FIELD A") == "uuid-a"
+    assert await WellAccess("token_2").get_field_uuid_async("UNKNOWN") is None
+    assert fake_ssdl.requested_endpoints == ["Field"]
+
+
+async def test_field_perforations_are_fetched_once_per_field(fake_ssdl: _FakeSsdl) -> None:
+    field_cache = SsdlFieldCache("user1", FakeAsyncRedis(decode_responses=False))
+
+    results = await asyncio.gather(
+        *[WellAccess(f"token_{i}", field_cache).get_field_perforations_async("uuid-a") for i in range(3)]
+    )
+    results.append(await WellAccess("token_4", field_cache).get_field_perforations_async("uuid-a"))
+
+    assert all(len(perforations) == 1 and perforations[0].wellbore_uuid == "wb-1" for perforations in results)
+    assert fake_ssdl.requested_endpoints == ["Field/uuid-a/perforations"]
+
+    await WellAccess("token_1", field_cache).get_field_perforations_async("uuid-b")
+    assert fake_ssdl.requested_endpoints[-1] == "Field/uuid-b/perforations"
+
+
+async def test_field_perforations_are_not_shared_between_users(fake_ssdl: _FakeSsdl) -> None:
+    redis_client = FakeAsyncRedis(decode_responses=False)
+    in_flight_fetches: SingleFlight[str, bytes] = SingleFlight()
+
+    await asyncio.gather(
+        *[
+            WellAccess(
+                f"token_{user_id}", SsdlFieldCache(user_id, redis_client, in_flight_fetches)
+            ).get_field_perforations_async("uuid-a")
+            for user_id in ["user1", "user2"]
+        ]
+    )
+    await WellAccess("token_user2", SsdlFieldCache("user2", redis_client)).get_field_perforations_async("uuid-a")
+
+    assert fake_ssdl.requested_endpoints == ["Field/uuid-a/perforations"] * 2
+
+
+async def test_field_perforations_without_cache_are_fetched_every_time(fake_ssdl: _FakeSsdl) -> None:
+    await WellAccess("token").get_field_perforations_async("uuid-a")
+    await WellAccess("token").get_field_perforations_async("uuid-a")
+    assert fake_ssdl.requested_endpoints == ["Field/uuid-a/perforations"] * 2
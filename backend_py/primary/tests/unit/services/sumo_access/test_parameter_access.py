@@ -0,0 +1,121 @@
+# pylint: disable=async-suffix, protected-access
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from webviz_services.service_exceptions import InvalidDataError
+from webviz_services.sumo_access import parameter_access
+from webviz_services.sumo_access.parameter_access import (
+    ParameterAccess,
+    ParametersAndSensitivities,
+    ensemble_parameters_to_columnar,
+)
+from webviz_services.sumo_access.parameter_types import EnsembleParameter
+
+
+def _make_parameter_table() -> pa.Table:
+    def field(name: str, field_type: pa.DataType, distribution: str) -> pa.Field:
+        return pa.field(name, field_type, metadata={"distribution": distribution, "group": "GRP"})
+
+    schema = pa.schema(
+        [
+            pa.field("REAL", pa.int64()),
+            field("PORO", pa.float64(), "normal"),
+            field("PERM", pa.float64(), "logunif"),
+            field("SENSNAME", pa.string(), "raw"),
+            field("NFAULTS", pa.int64(), "dunif"),
+        ]
+    )
+    return pa.table(
+        {
+            "REAL": [0, 1, 3],
+            "PORO": [0.1, 0.2, 0.3],
+            "PERM": [100.0, 200.0, 300.0],
+            "SENSNAME": ["a", "b", "a"],
+            "NFAULTS": [2, 2, 2],
+        },
+        schema=schema,
+    )
+
+
+def test_parameters_to_columnar() -> None:
+    parameters = parameter_access._parameter_table_to_ensemble_parameters(_make_parameter_table())
+
+    columnar = ensemble_parameters_to_columnar(parameters)
+
+    assert columnar.realizations == [0, 1, 3]
+    assert columnar.names == ["PORO", "PERM", "SENSNAME", "NFAULTS"]
+    assert columnar.group_names == ["GRP"] * 4
+    assert columnar.is_logarithmic == [False, True, False, False]
+    assert columnar.is_discrete == [False, False, True, True]
+    assert columnar.is_constant == [False, False, False, True]
+    assert columnar.is_numerical == [True, True, False, True]
+
+    assert columnar.numerical_values.dtype == np.float32
+    np.testing.assert_allclose(
+        columnar.numerical_values, [[0.1, 0.2, 0.3], [100.0, 200.0, 300.0], [2, 2, 2]], rtol=1e-6
+    )
+    assert columnar.non_numerical_values == [["a", "b", "a"]]
+
+
+def test_parameters_with_different_realizations_are_rejected() -> None:
+    parameters = [
+        EnsembleParameter("A", False, False, False, True, realizations=[0, 1], values=[1.0, 2.0]),
+        EnsembleParameter("B", False, False, False, True, realizations=[0, 2], values=[1.0, 2.0]),
+    ]
+
+    with pytest.raises(InvalidDataError):
+        ensemble_parameters_to_columnar(parameters)
+
+
+def test_no_parameters_to_columnar() -> None:
+    columnar = ensemble_parameters_to_columnar([])
+
+    assert not columnar.names
+    assert columnar.numerical_values.shape == (0, 0)
+
+
+async def test_parameters_are_cached_per_fingerprint(monkeypatch: pytest.MonkeyPatch) -> None:
+    num_loads = 0
+
+    async def load_async(_self: ParameterAccess) -> ParametersAndSensitivities:
+        nonlocal num_loads
+        num_loads += 1
+        parameters = parameter_access._parameter_table_to_ensemble_parameters(_make_parameter_table())
+        return ParametersAndSensitivities(parameters=parameters, sensitivities=[])
+
+    monkeypatch.setattr(ParameterAccess, "_load_parameters_and_sensitivities_async", load_async)
+    parameter_access._PARAMETERS_AND_SENSITIVITIES_CACHE.clear()
+
+    def make_access(ensemble_fingerprint: str | None) -> ParameterAccess:
+        return ParameterAccess(
+            sumo_client=object(), case_uuid="case", ensemble_name="ens", ensemble_fingerprint=ensemble_fingerprint  # type: ignore[arg-type]
+        )
+
+    first = await make_access("fp1").get_parameters_and_sensitivities_async()
+    assert await make_access("fp1").get_parameters_and_sensitivities_async() is first
+    columnar = await make_access("fp1").get_parameters_and_sensitivities_columnar_async()
+    assert columnar.parameters.names == [parameter.name for parameter in first.parameters]
+    assert num_loads == 1
+
+    # A new fingerprint means the ensemble has changed, and without one nothing is cached
+    await make_access("fp2").get_parameters_and_sensitivities_columnar_async()
+    assert num_loads == 2
+    await make_access(None).get_parameters_and_sensitivities_async()
+    await make_access(None).get_parameters_and_sensitivities_async()
+    assert num_loads == 4
+
+
+def test_parameters_cache_is_bounded_by_estimated_size() -> None:
+    parameters = parameter_access._parameter_table_to_ensemble_parameters(_make_parameter_table())
+    parameters_and_sensitivities = ParametersAndSensitivities(parameters=parameters, sensitivities=[])
+
+    # 4 parameters with 3 values and 3 realizations each
+    assert parameter_access._estimate_size_bytes(parameters_and_sensitivities) == 4 * (6 * 32 + 256)
+
+    large_parameters = [
+        EnsembleParameter(f"P{i}", False, False, False, True, realizations=list(range(1000)), values=[0.5] * 1000)
+        for i in range(2000)
+    ]
+    large_parameters_and_sensitivities = ParametersAndSensitivities(parameters=large_parameters, sensitivities=[])
+    assert parameter_access._estimate_size_bytes(large_parameters_and_sensitivities) > 100 * 1024 * 1024
@@ -1,3 +1,4 @@
+import numpy as np
 import polars as pl
 import pyarrow as pa
 import pytest
@@ -7,6 +8,7 @@ from webviz_services.sumo_access import _arrow_table_loader
 from webviz_services.sumo_access._arrow_table_loader import ArrowTableLoader
 from webviz_services.sumo_access.relperm_access import (
     RelpermFamily,
+    create_relperm_curve_arrays,
     create_relperm_realization_data,
     create_relperm_table_definition,
     extract_relperm_family,
@@ -144,6 +146,81 @@ def test_create_relperm_realization_data_interpolates_to_shared_saturation_axis(
     assert realization_data[1].curve_data[0].curve_values == [0.0, 0.25, 1.0]
 
 
+def test_create_relperm_realization_data_interpolates_unsorted_rows_per_satnum() -> None:
+    dataframe = pl.DataFrame(
+        {
+            "REAL": [1, 0, 1, 0, 0, 1, 0, 1, 0, 1],
+            "SATNUM": [1, 1, 1, 2, 1, 1, 2, 2, 2, 2],
+            "SW": [0.3, 0.9, 0.0, 0.5, 0.1, 1.0, 0.0, 0.2, 1.0, 1.0],
+            "KRW": [0.3, 0.9, 0.0, 5.0, 0.1, 1.0, 0.0, 2.0, 10.0, 9.0],
+            "KROW": [7, 1, 10, 5, 9, 0, 10, 8, 0, 0],
+        }
+    )
+
+    realization_data = create_relperm_realization_data(dataframe, "SW", ["KRW", "KROW"], [2, 1])
+
+    assert [(data.realization, data.satnum) for data in realization_data] == [(0, 1), (0, 2), (1, 1), (1, 2)]
+    # SATNUM 1 is limited to the overlap [0.1, 0.9] of the two realizations
+    assert realization_data[0].saturation_values == [0.1, 0.3, 0.9]
+    assert realization_data[0].curve_data[0].curve_values == [0.1, 0.1 + (0.3 - 0.1) / (0.9 - 0.1) * (0.9 - 0.1), 0.9]
+    assert realization_data[2].curve_data[0].curve_values == [
+        0.0 + (0.1 - 0.0) / (0.3 - 0.0) * 0.3,
+        0.3,
+        0.3 + (0.9 - 0.3) / (1.0 - 0.3) * 0.7,
+    ]
+    assert realization_data[2].curve_data[1].curve_values == [
+        10 + (0.1 - 0.0) / (0.3 - 0.0) * (7 - 10),
+        7.0,
+        7 + (0.9 - 0.3) / (1.0 - 0.3) * (0 - 7),
+    ]
+    # SATNUM 2 is limited to the overlap [0.2, 1.0]
+    assert realization_data[1].saturation_values == [0.2, 0.5, 1.0]
+    assert realization_data[1].curve_data[0].curve_values == [0.0 + (0.2 - 0.0) / (0.5 - 0.0) * 5.0, 5.0, 10.0]
+    assert realization_data[3].curve_data[0].curve_values == [2.0, 2.0 + (0.5 - 0.2) / (1.0 - 0.2) * (9.0 - 2.0), 9.0]
+
+
+def test_create_relperm_curve_arrays_matches_realization_data() -> None:
+    dataframe = pl.DataFrame(
+        {
+            "REAL": [1, 0, 1, 0, 0, 1, 0, 1, 0, 1],
+            "SATNUM": [1, 1, 1, 2, 1, 1, 2, 2, 2, 2],
+            "SW": [0.3, 0.9, 0.0, 0.5, 0.1, 1.0, 0.0, 0.2, 1.0, 1.0],
+            "KRW": [0.3, 0.9, 0.0, 5.0, 0.1, 1.0, 0.0, 2.0, 10.0, 9.0],
+            "KROW": [7, 1, 10, 5, 9, 0, 10, 8, 0, 0],
+        }
+    )
+
+    curve_arrays_by_satnum = create_relperm_curve_arrays(dataframe, "SW", ["KRW", "KROW"], [2, 1])
+    realization_data = create_relperm_realization_data(dataframe, "SW", ["KRW", "KROW"], [2, 1])
+
+    assert [curve_arrays.satnum for curve_arrays in curve_arrays_by_satnum] == [1, 2]
+    for curve_arrays in curve_arrays_by_satnum:
+        assert curve_arrays.curve_names == ["KRW", "KROW"]
+        assert curve_arrays.realizations.tolist() == [0, 1]
+        assert curve_arrays.curve_values.shape == (2, 2, len(curve_arrays.saturation_values))
+        for data in (data for data in realization_data if data.satnum == curve_arrays.satnum):
+            realization_index = data.realization
+            assert curve_arrays.saturation_values.tolist() == data.saturation_values
+            for curve_index, curve in enumerate(data.curve_data):
+                np.testing.assert_array_equal(
+                    curve_arrays.curve_values[curve_index, realization_index], curve.curve_values
+                )
+
+
+def test_create_relperm_realization_data_reports_first_invalid_partition() -> None:
+    dataframe = pl.DataFrame(
+        {
+            "REAL": [0, 0, 1, 1, 2, 2],
+            "SATNUM": [1, 1, 1, 1, 1, 1],
+            "SW": [0.0, 1.0, 0.0, 0.0, 0.0, float("inf")],
+            "KRW": [0.0, 0.1, 0.0, 0.1, 0.0, 0.1],
+        }
+    )
+
+    with pytest.raises(InvalidDataError, match="Duplicate saturation values found for realization=1"):
+        create_relperm_realization_data(dataframe, "SW", ["KRW"], [1])
+
+
 def test_create_relperm_realization_data_rejects_duplicate_saturation_values() -> None:
     dataframe = pl.DataFrame(
         {
@@ -0,0 +1,76 @@
+# pylint: disable=async-suffix, unused-argument, protected-access
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+
+from webviz_services.sumo_access import rft_access
+from webviz_services.sumo_access.rft_access import RftAccess, partition_table_by_well
+
+
+def _make_rft_table() -> pa.Table:
+    return pa.table(
+        {
+            "WELL": ["W2", "W1", "W2", "W1", "W1", "W3"],
+            "REAL": [0, 0, 0, 1, 0, 0],
+            "DATE": [datetime(2020, 1, 1)] * 6,
+            "DEPTH": [10.0, 1.0, 20.0, 1.5, 2.0, 100.0],
+            "PRESSURE": [200.0, 100.0, 210.0, 105.0, 110.0, 300.0],
+        }
+    )
+
+
+class _FakeArrowTableLoader:
+    num_loads = 0
+
+    def __init__(self, *_args: object) -> None:
+        pass
+
+    def require_standard_result(self, standard_result: str) -> None:
+        pass
+
+    async def get_aggregated_multiple_columns_async(self, column_names: list[str]) -> pa.Table:
+        _FakeArrowTableLoader.num_loads += 1
+        return _make_rft_table()
+
+
+def test_partition_table_by_well_preserves_row_order_within_wells() -> None:
+    table_per_well = partition_table_by_well(_make_rft_table())
+
+    assert list(table_per_well.keys()) == ["W1", "W2", "W3"]
+    assert table_per_well["W1"]["DEPTH"].to_pylist() == [1.0, 1.5, 2.0]
+    assert table_per_well["W2"]["DEPTH"].to_pylist() == [10.0, 20.0]
+    assert table_per_well["W3"]["DEPTH"].to_pylist() == [100.0]
+
+
+def test_size_of_partitioned_table_is_size_of_table() -> None:
+    table = _make_rft_table()
+    table_per_well = partition_table_by_well(table)
+
+    assert rft_access._get_size_bytes(table_per_well) == pytest.approx(table.nbytes, rel=0.1)
+    assert rft_access._get_size_bytes({}) == 0
+
+
+async def test_multiple_wells_are_served_from_one_cached_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rft_access, "ArrowTableLoader", _FakeArrowTableLoader)
+    _FakeArrowTableLoader.num_loads = 0
+
+    access = RftAccess(sumo_client=object(), case_uuid="case", ensemble_name="ens", ensemble_fingerprint="fp1")  # type: ignore[arg-type]
+    data_per_well = await access.get_rft_wells_realization_data_async(["W1", "W2", "UNKNOWN"], "PRESSURE", None, None)
+
+    assert data_per_well["UNKNOWN"] == []
+    w1_data = sorted(data_per_well["W1"], key=lambda data: data.realization)
+    assert [(data.realization, data.depth_arr, data.value_arr) for data in w1_data] == [
+        (0, [1.0, 2.0], [100.0, 110.0]),
+        (1, [1.5], [105.0]),
+    ]
+    assert [data.depth_arr for data in data_per_well["W2"]] == [[10.0, 20.0]]
+
+    w3_data = await access.get_rft_well_realization_data_async("W3", "PRESSURE", None, [0])
+    assert [data.value_arr for data in w3_data] == [[300.0]]
+    assert _FakeArrowTableLoader.num_loads == 1
+
+    # A new fingerprint means the ensemble has changed and the table must be reloaded
+    access = RftAccess(sumo_client=object(), case_uuid="case", ensemble_name="ens", ensemble_fingerprint="fp2")  # type: ignore[arg-type]
+    await access.get_rft_well_realization_data_async("W1", "PRESSURE", None, None)
+    assert _FakeArrowTableLoader.num_loads == 2
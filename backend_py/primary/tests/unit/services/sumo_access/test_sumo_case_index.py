@@ -0,0 +1,140 @@
+# pylint: disable=async-suffix, redefined-outer-name, unused-argument
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from webviz_services.sumo_access.sumo_case_index import CaseFilter, SumoCaseIndex
+from webviz_services.sumo_access.sumo_inspector import CaseInfo
+
+
+def _make_case(uuid: str, updated_at_utc_ms: int, name: str | None = None, user: str = "user_a") -> CaseInfo:
+    return CaseInfo(
+        uuid=uuid,
+        name=name or f"case_{uuid}",
+        status="keep",
+        user=user,
+        updated_at_utc_ms=updated_at_utc_ms,
+        description="",
+        model_name=None,
+        model_revision=None,
+        ensembles=[],
+    )
+
+
+class _FakeCaseSource:
+    def __init__(self, cases: list[CaseInfo]) -> None:
+        self.cases = {case.uuid: case for case in cases}
+        self.calls: list[str] = []
+
+    async def get_cases_async(self, asset_name: str, case_uuids: list[str] | None = None) -> list[CaseInfo]:
+        self.calls.append("get_cases" if case_uuids is None else f"get_cases:{sorted(case_uuids)}")
+        await asyncio.sleep(0)
+        if case_uuids is None:
+            return list(self.cases.values())
+        return [self.cases[uuid] for uuid in case_uuids if uuid in self.cases]
+
+    async def get_latest_cases_async(self, asset_name: str, max_case_count: int) -> list[CaseInfo]:
+        self.calls.append(f"get_latest_cases:{max_case_count}")
+        latest = sorted(self.cases.values(), key=lambda case: -case.updated_at_utc_ms)
+        return latest[:max_case_count]
+
+    async def get_case_uuids_updated_since_async(self, asset_name: str, since_utc_ms: int) -> list[str]:
+        self.calls.append(f"get_updated_since:{since_utc_ms}")
+        return [case.uuid for case in self.cases.values() if case.updated_at_utc_ms > since_utc_ms]
+
+
+@pytest.fixture
+def redis_client() -> FakeAsyncRedis:
+    return FakeAsyncRedis(decode_responses=True)
+
+
+def _make_index(redis_client: FakeAsyncRedis, source: _FakeCaseSource, **kwargs: float) -> SumoCaseIndex:
+    return SumoCaseIndex("user1", redis_client, source, timestamp_overlap_ms=0, **kwargs)  # type: ignore[arg-type]
+
+
+async def test_index_is_built_once_and_served_from_redis(redis_client: FakeAsyncRedis) -> None:
+    source = _FakeCaseSource([_make_case("a", 100), _make_case("b", 300), _make_case("c", 200)])
+    case_index = _make_index(redis_client, source)
+
+    cases = await case_index.get_cases_async("asset")
+    assert [case.uuid for case in cases] == ["b", "c", "a"]
+
+    cases = await case_index.get_cases_async("asset")
+    assert [case.uuid for case in cases] == ["b", "c", "a"]
+    assert source.calls == ["get_cases"]
+
+
+async def test_stale_index_is_refreshed_incrementally(redis_client: FakeAsyncRedis) -> None:
+    source = _FakeCaseSource([_make_case("a", 100), _make_case("b", 200)])
+    case_index = _make_index(redis_client, source, min_refresh_interval_s=0)
+
+    await case_index.get_cases_async("asset")
+
+    source.cases["c"] = _make_case("c", 400)
+    source.cases["a"] = _make_case("a", 300, name="renamed")
+    source.calls.clear()
+
+    cases = await case_index.get_cases_async("asset")
+    assert [(case.uuid, case.name) for case in cases] == [("c", "case_c"), ("a", "renamed"), ("b", "case_b")]
+    assert source.calls == ["get_updated_since:200", "get_cases:['a', 'c']"]
+
+    # The next refresh only looks for documents newer than the latest one seen so far
+    source.calls.clear()
+    await case_index.get_cases_async("asset")
+    assert source.calls == ["get_updated_since:400", "get_cases:[]"]
+
+
+async def test_index_is_rebuilt_to_pick_up_deleted_cases(redis_client: FakeAsyncRedis) -> None:
+    source = _FakeCaseSource([_make_case("a", 100), _make_case("b", 200)])
+    case_index = _make_index(redis_client, source, min_refresh_interval_s=0, full_rebuild_interval_s=0.01)
+
+    await case_index.get_cases_async("asset")
+    del source.cases["a"]
+    await asyncio.sleep(0.02)
+
+    cases = await case_index.get_cases_async("asset")
+    assert [case.uuid for case in cases] == ["b"]
+
+
+async def test_concurrent_requests_share_one_build(redis_client: FakeAsyncRedis) -> None:
+    source = _FakeCaseSource([_make_case("a", 100)])
+    case_index = _make_index(redis_client, source)
+
+    results = await asyncio.gather(*[case_index.get_cases_async("asset") for _ in range(5)])
+    assert all(len(cases) == 1 for cases in results)
+    assert source.calls == ["get_cases"]
+
+
+async def test_pages_are_filtered_and_sliced(redis_client: FakeAsyncRedis) -> None:
+    cases = [_make_case(f"{i:02}", i, user="user_a" if i % 2 == 0 else "user_b") for i in range(10)]
+    source = _FakeCaseSource(cases)
+    case_index = _make_index(redis_client, source)
+
+    await case_index.get_cases_async("asset")
+
+    page = await case_index.get_cases_page_async("asset", offset=1, limit=2, case_filter=CaseFilter(user="user_b"))
+    assert [case.uuid for case in page.cases] == ["07", "05"]
+    assert page.total_count == 5
+
+    page = await case_index.get_cases_page_async(
+        "asset", offset=0, limit=3, case_filter=CaseFilter(search_text="CASE_0")
+    )
+    assert [case.uuid for case in page.cases] == ["09", "08", "07"]
+    assert page.total_count == 10
+
+
+async def test_first_page_is_served_before_index_is_built(redis_client: FakeAsyncRedis) -> None:
+    source = _FakeCaseSource([_make_case("a", 100), _make_case("b", 300), _make_case("c", 200)])
+    case_index = _make_index(redis_client, source)
+
+    page = await case_index.get_cases_page_async("asset", offset=0, limit=2)
+    assert [case.uuid for case in page.cases] == ["b", "c"]
+    assert page.total_count is None
+    assert "get_latest_cases:2" in source.calls
+
+    # Let the background build complete, after which pages come from the index
+    await asyncio.sleep(0.01)
+    page = await case_index.get_cases_page_async("asset", offset=0, limit=2)
+    assert page.total_count == 3
+    assert source.calls.count("get_cases") == 1
@@ -0,0 +1,153 @@
+# pylint: disable=async-suffix
+import asyncio
+
+from webviz_services.sumo_access.sumo_fingerprint_warmer import SumoFingerprintWarmer
+from webviz_services.utils.authenticated_user import AuthenticatedUser, AccessTokens
+
+
+def _make_user(user_id: str) -> AuthenticatedUser:
+    access_tokens = AccessTokens(
+        graph_access_token=None,
+        sumo_access_token="dummy_token",
+        smda_access_token=None,
+        ssdl_access_token=None,
+        pdm_access_token=None,
+    )
+    return AuthenticatedUser(user_id=user_id, username=f"{user_id}@example.com", access_tokens=access_tokens)
+
+
+class _FakeFingerprintSource:
+    def __init__(self, fingerprints: list[str]) -> None:
+        self._fingerprints = fingerprints
+        self.num_calls = 0
+        self.max_concurrent_calls = 0
+        self._concurrent_calls = 0
+
+    async def refresh_fp_async(self) -> str:
+        self.num_calls += 1
+        self._concurrent_calls += 1
+        self.max_concurrent_calls = max(self.max_concurrent_calls, self._concurrent_calls)
+        await asyncio.sleep(0.01)
+        self._concurrent_calls -= 1
+        return self._fingerprints[min(self.num_calls, len(self._fingerprints)) - 1]
+
+
+async def test_only_fingerprints_about_to_expire_are_refreshed() -> None:
+    warmer = SumoFingerprintWarmer(max_jitter_s=0)
+    user = _make_user("user1")
+
+    expiring_src = _FakeFingerprintSource(["fp1"])
+    fresh_src = _FakeFingerprintSource(["fp2"])
+    warmer.register_access(user, "case", "ens_expiring", "fp1", 1, 100, expiring_src.refresh_fp_async)
+    warmer.register_access(user, "case", "ens_fresh", "fp2", 90, 100, fresh_src.refresh_fp_async)
+
+    assert await warmer.refresh_due_ensembles_async() == 1
+    assert expiring_src.num_calls == 1
+    assert fresh_src.num_calls == 0
+
+    # After the refresh the expiring fingerprint is fresh again
+    assert await warmer.refresh_due_ensembles_async() == 0
+
+
+async def test_refreshes_run_with_bounded_concurrency() -> None:
+    warmer = SumoFingerprintWarmer(max_concurrency=2, max_jitter_s=0)
+    user = _make_user("user1")
+
+    src = _FakeFingerprintSource(["fp"])
+    for i in range(6):
+        warmer.register_access(user, "case", f"ens{i}", "fp", 0, 100, src.refresh_fp_async)
+
+    assert await warmer.refresh_due_ensembles_async() == 6
+    assert src.max_concurrent_calls == 2
+
+
+async def test_overlapping_scans_skip_refreshes_in_progress() -> None:
+    warmer = SumoFingerprintWarmer(max_jitter_s=0)
+    user = _make_user("user1")
+
+    refresh_started = asyncio.Event()
+    release_refresh = asyncio.Event()
+    num_refreshes = 0
+
+    async def blocking_refresh_fp_async() -> str:
+        nonlocal num_refreshes
+        num_refreshes += 1
+        refresh_started.set()
+        await release_refresh.wait()
+        return "fp"
+
+    warmer.register_access(user, "case", "ens", "fp", 0, 100, blocking_refresh_fp_async)
+
+    first_scan = asyncio.create_task(warmer.refresh_due_ensembles_async())
+    await refresh_started.wait()
+
+    # The ensemble is still due, but its refresh is already in progress
+    assert await warmer.refresh_due_ensembles_async() == 0
+
+    release_refresh.set()
+    assert await first_scan == 1
+    assert num_refreshes == 1
+
+
+async def test_inactive_and_failing_ensembles_are_dropped() -> None:
+    warmer = SumoFingerprintWarmer(activity_window_s=0.05, max_jitter_s=0)
+    user = _make_user("user1")
+
+    async def failing_refresh_fp_async() -> str:
+        raise RuntimeError("Token expired")
+
+    warmer.register_access(user, "case", "ens_failing", "fp", 0, 100, failing_refresh_fp_async)
+    assert await warmer.refresh_due_ensembles_async() == 0
+    assert warmer.get_tracked_count() == 0
+
+    src = _FakeFingerprintSource(["fp"])
+    warmer.register_access(user, "case", "ens_inactive", "fp", 0, 100, src.refresh_fp_async)
+    await asyncio.sleep(0.1)
+    assert await warmer.refresh_due_ensembles_async() == 0
+    assert warmer.get_tracked_count() == 0
+    assert src.num_calls == 0
+
+
+async def test_number_of_tracked_ensembles_is_bounded() -> None:
+    warmer = SumoFingerprintWarmer(max_tracked_ensembles=3)
+    src = _FakeFingerprintSource(["fp"])
+
+    for i in range(5):
+        warmer.register_access(_make_user(f"user{i}"), "case", "ens", "fp", 100, 100, src.refresh_fp_async)
+
+    assert warmer.get_tracked_count() == 3
+
+
+async def test_changed_fingerprint_invokes_callbacks() -> None:
+    warmer = SumoFingerprintWarmer(max_jitter_s=0)
+    user = _make_user("user1")
+
+    changes: list[tuple[str, str, str, str]] = []
+
+    async def on_changed_async(changed_user: AuthenticatedUser, case_uuid: str, ensemble_name: str, fp: str) -> None:
+        changes.append((changed_user.get_user_id(), case_uuid, ensemble_name, fp))
+
+    warmer.add_fingerprint_changed_callback(on_changed_async)
+
+    src = _FakeFingerprintSource(["fp_old", "fp_new"])
+    warmer.register_access(user, "case", "ens", "fp_old", 0, 0.01, src.refresh_fp_async)
+
+    # First refresh returns the same fingerprint, second one a new fingerprint
+    await warmer.refresh_due_ensembles_async()
+    await asyncio.sleep(0.02)
+    await warmer.refresh_due_ensembles_async()
+    await asyncio.sleep(0)
+
+    assert changes == [("user1", "case", "ens", "fp_new")]
+
+
+async def test_start_and_stop() -> None:
+    warmer = SumoFingerprintWarmer(scan_interval_s=0.01, max_jitter_s=0)
+    src = _FakeFingerprintSource(["fp"])
+    warmer.register_access(_make_user("user1"), "case", "ens", "fp", 0, 100, src.refresh_fp_async)
+
+    warmer.start()
+    await asyncio.sleep(0.05)
+    await warmer.stop_async()
+
+    assert src.num_calls == 1
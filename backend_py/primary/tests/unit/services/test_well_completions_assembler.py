@@ -0,0 +1,55 @@
+# pylint: disable=async-suffix
+from datetime import datetime
+
+import pyarrow as pa
+
+from webviz_services.well_completions_assembler.well_completions_assembler import WellCompletionsAssembler
+
+
+class _FakeWellCompletionsAccess:
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table
+
+    async def get_well_completions_table_async(self) -> pa.Table:
+        return self._table
+
+
+def _make_completions_table() -> pa.Table:
+    date_1 = datetime(2020, 1, 1)
+    date_2 = datetime(2021, 1, 1)
+    return pa.table(
+        {
+            "WELL": ["W2", "W1", "W1", "W1", "W1", "W1", "W1"],
+            "ZONE": ["Z1", "Z2", "Z2", "Z1", "Z1", "Z1", "Z1"],
+            "DATE": [date_1, date_2, date_2, date_2, date_2, date_1, date_1],
+            "REAL": [0, 0, 1, 0, 1, 0, 1],
+            "OP/SH": ["OPEN", "SHUT", "SHUT", "OPEN", "SHUT", "OPEN", "OPEN"],
+            "KH": [10.0, 1.0, 3.0, 2.0, None, 100.005, 200.0],
+        }
+    )
+
+
+async def test_completions_are_aggregated_per_well_zone_and_date() -> None:
+    assembler = WellCompletionsAssembler(_FakeWellCompletionsAccess(_make_completions_table()))  # type: ignore[arg-type]
+    await assembler.fetch_and_initialize_well_completions_table_data_async(realizations=None)
+
+    data = assembler.create_well_completions_data()
+
+    assert data.sorted_completion_dates == ["2020-01-01", "2021-01-01"]
+    assert [zone.name for zone in data.zones] == ["Z1", "Z2"]
+    assert [well.name for well in data.wells] == ["W1", "W2"]
+
+    w1_completions = data.wells[0].completions
+    assert list(w1_completions) == ["Z1", "Z2"]
+    assert w1_completions["Z1"].sorted_completion_date_indices == [0, 1]
+    assert w1_completions["Z1"].open == [1.0, 0.5]
+    assert w1_completions["Z1"].shut == [0.0, 0.5]
+    assert w1_completions["Z1"].kh_mean == [round((100.005 + 200.0) / 2, 2), 2.0]
+    assert w1_completions["Z1"].kh_min == [100.0, 2.0]
+    assert w1_completions["Z1"].kh_max == [200.0, 2.0]
+    assert w1_completions["Z2"].sorted_completion_date_indices == [1]
+    assert w1_completions["Z2"].shut == [1.0]
+    assert w1_completions["Z2"].kh_mean == [2.0]
+
+    # Only one realization has the W2 completion, but the fractions are relative to all realizations
+    assert data.wells[1].completions["Z1"].open == [0.5]
@@ -0,0 +1,131 @@
+# pylint: disable=async-suffix, redefined-outer-name
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.crc import key_slot
+
+from webviz_services.utils.task_meta_tracker import TaskMetaTracker
+
+
+@pytest.fixture
+def redis_client() -> FakeAsyncRedis:
+    return FakeAsyncRedis(decode_responses=True)
+
+
+async def test_register_task_with_fingerprint_stores_task_and_mapping_with_ttl(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+
+    task_meta = await tracker.register_task_with_fingerprint_async(
+        task_system="sumo_task",
+        task_id="task1",
+        fingerprint="fp1",
+        ttl_s=100,
+        task_start_time_utc_s=123.5,
+        expected_store_key=None,
+    )
+    assert task_meta.task_id == "task1"
+
+    assert await tracker.get_task_id_by_fingerprint_async("fp1") == "task1"
+    assert await redis_client.ttl("task_meta_tracker:user:{user1}:task:task1") == 100
+    assert await redis_client.ttl("task_meta_tracker:user:{user1}:fingerprint_to_task_map:fp1") == 100
+
+    fetched = await tracker.get_task_meta_async("task1")
+    assert fetched is not None
+    assert fetched.task_system == "sumo_task"
+    assert fetched.start_time_utc_s == 123.5
+    assert fetched.expected_store_key is None
+    assert fetched.final_outcome is None
+
+
+async def test_register_existing_task_raises_and_leaves_state_untouched(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+
+    await tracker.register_task_async("sumo_task", "task1", 100, 1.0, "store_key")
+
+    with pytest.raises(ValueError):
+        await tracker.register_task_with_fingerprint_async("other_system", "task1", "fp1", 200, 2.0, None)
+
+    fetched = await tracker.get_task_meta_async("task1")
+    assert fetched is not None
+    assert fetched.task_system == "sumo_task"
+    assert fetched.expected_store_key == "store_key"
+    assert await tracker.get_task_id_by_fingerprint_async("fp1") is None
+
+
+async def test_get_task_meta_by_fingerprint(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+
+    assert await tracker.get_task_meta_by_fingerprint_async("fp1") is None
+
+    await tracker.register_task_with_fingerprint_async("sumo_task", "task1", "fp1", 100, 10.0, None)
+    await redis_client.hset("task_meta_tracker:user:{user1}:task:task1", "finalOutcome", "success")
+
+    fetched = await tracker.get_task_meta_by_fingerprint_async("fp1")
+    assert fetched is not None
+    assert fetched.task_id == "task1"
+    assert fetched.start_time_utc_s == 10.0
+    assert fetched.final_outcome == "success"
+
+    # Dangling mapping, the task itself has expired
+    await tracker.delete_task_async("task1")
+    assert await tracker.get_task_meta_by_fingerprint_async("fp1") is None
+
+
+async def test_delete_task_by_fingerprint_removes_both_entries(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+
+    assert await tracker.delete_task_by_fingerprint_async("fp1") is False
+
+    await tracker.register_task_with_fingerprint_async("sumo_task", "task1", "fp1", 100, None, None)
+    assert await tracker.delete_task_by_fingerprint_async("fp1") is True
+
+    assert await tracker.get_task_meta_async("task1") is None
+    assert await tracker.get_task_id_by_fingerprint_async("fp1") is None
+
+
+async def test_trackers_are_isolated_per_user_and_purge_only_affects_own_keys(redis_client: FakeAsyncRedis) -> None:
+    tracker1 = TaskMetaTracker("user1", redis_client)
+    tracker2 = TaskMetaTracker("user2", redis_client)
+
+    await tracker1.register_task_with_fingerprint_async("sumo_task", "task1", "fp", 100, None, None)
+    await tracker2.register_task_with_fingerprint_async("sumo_task", "task1", "fp", 100, None, None)
+
+    await tracker1.purge_all_task_meta_async()
+    assert await redis_client.pttl("task_meta_tracker:user:{user1}:task:task1") <= 1
+    assert await redis_client.ttl("task_meta_tracker:user:{user2}:task:task1") == 100
+
+
+async def test_wait_for_final_outcome_is_woken_by_set_final_outcome(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+    await tracker.register_task_async("sumo_task", "task1", 100, None, None)
+
+    wait_task = asyncio.create_task(tracker.wait_for_final_outcome_async("task1", timeout_s=5))
+    await asyncio.sleep(0.1)
+    assert await tracker.set_final_outcome_async("task1", "success") is True
+
+    assert await asyncio.wait_for(wait_task, timeout=1) == "success"
+
+    # Once the outcome has been recorded, waiting returns immediately
+    assert await tracker.wait_for_final_outcome_async("task1", timeout_s=5) == "success"
+
+
+async def test_wait_for_final_outcome_times_out_or_returns_none_for_unknown_task(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+
+    assert await tracker.wait_for_final_outcome_async("unknown", timeout_s=5) is None
+    assert await tracker.set_final_outcome_async("unknown", "failure") is False
+
+    await tracker.register_task_async("sumo_task", "task1", 100, None, None)
+    assert await tracker.wait_for_final_outcome_async("task1", timeout_s=0.2) is None
+
+
+async def test_all_keys_for_user_map_to_same_cluster_hash_slot(redis_client: FakeAsyncRedis) -> None:
+    tracker = TaskMetaTracker("user1", redis_client)
+
+    await tracker.register_task_with_fingerprint_async("sumo_task", "task1", "fp1", 100, None, None)
+    await tracker.register_task_async("sumo_task", "task2", 100, None, None)
+
+    keys = [key async for key in redis_client.scan_iter(match="*")]
+    assert len(keys) == 3
+    assert len({key_slot(key.encode()) for key in keys}) == 1
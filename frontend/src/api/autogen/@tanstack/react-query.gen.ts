@@ -21,6 +21,7 @@ import {
     getAliveProtected,
     getAssetInfos,
     getCases,
+    getCasesPage,
     getDeltaEnsembleRealizationsVectorData,
     getDeltaEnsembleStatisticalVectorData,
     getDeltaEnsembleVectorList,
@@ -41,6 +42,7 @@ import {
     getMisfitSurfaceData,
     getObservedSurfacesMetadata,
     getParametersAndSensitivities,
+    getParametersAndSensitivitiesColumnar,
     getPolygonsData,
     getPolygonsDirectory,
     getProductionData,
@@ -53,6 +55,7 @@ import {
     getRelpermTableNames,
     getRftObservations,
     getRftRealizationData,
+    getRftRealizationDataForWells,
     getRftTableDefinition,
     getSeismicCubeMetaList,
     getSeismicSlices,
@@ -63,18 +66,21 @@ import {
     getSnapshotAccessLogs,
     getSnapshotsMetadata,
     getStatisticalSurfaceDataHybrid,
+    getStatisticalSurfaceTaskStatusSse,
     getStatisticalVectorData,
     getStatisticalVectorDataPerSensitivity,
     getSummaryObservations,
     getSurfaceData,
     getUserInfo,
     getUserPhoto,
+    getUsers,
     getVectorList,
     getVfpTable,
     getVfpTableNames,
     getWellboreCasings,
     getWellboreCompletions,
     getWellboreLogCurveHeaders,
+    getWellboreLogCurveHeadersForWellbores,
     getWellborePerforations,
     getWellborePickIdentifiers,
     getWellborePicksForPickIdentifier,
@@ -82,6 +88,7 @@ import {
     getWellboreStratigraphicColumns,
     getWellCompletionsData,
     getWellTrajectories,
+    getWellTrajectoriesB64,
     loginRoute,
     type Options,
     postGetAggregatedPerRealizationInplaceTableData,
@@ -118,6 +125,9 @@ import type {
     GetAssetInfosResponse_api,
     GetCasesData_api,
     GetCasesError_api,
+    GetCasesPageData_api,
+    GetCasesPageError_api,
+    GetCasesPageResponse_api,
     GetCasesResponse_api,
     GetDeltaEnsembleRealizationsVectorDataData_api,
     GetDeltaEnsembleRealizationsVectorDataError_api,
@@ -175,6 +185,9 @@ import type {
     GetObservedSurfacesMetadataData_api,
     GetObservedSurfacesMetadataError_api,
     GetObservedSurfacesMetadataResponse_api,
+    GetParametersAndSensitivitiesColumnarData_api,
+    GetParametersAndSensitivitiesColumnarError_api,
+    GetParametersAndSensitivitiesColumnarResponse_api,
     GetParametersAndSensitivitiesData_api,
     GetParametersAndSensitivitiesError_api,
     GetParametersAndSensitivitiesResponse_api,
@@ -213,6 +226,9 @@ import type {
     GetRftObservationsResponse_api,
     GetRftRealizationDataData_api,
     GetRftRealizationDataError_api,
+    GetRftRealizationDataForWellsData_api,
+    GetRftRealizationDataForWellsError_api,
+    GetRftRealizationDataForWellsResponse_api,
     GetRftRealizationDataResponse_api,
     GetRftTableDefinitionData_api,
     GetRftTableDefinitionError_api,
@@ -244,6 +260,8 @@ import type {
     GetStatisticalSurfaceDataHybridData_api,
     GetStatisticalSurfaceDataHybridError_api,
     GetStatisticalSurfaceDataHybridResponse_api,
+    GetStatisticalSurfaceTaskStatusSseData_api,
+    GetStatisticalSurfaceTaskStatusSseError_api,
     GetStatisticalVectorDataData_api,
     GetStatisticalVectorDataError_api,
     GetStatisticalVectorDataPerSensitivityData_api,
@@ -262,6 +280,9 @@ import type {
     GetUserPhotoData_api,
     GetUserPhotoError_api,
     GetUserPhotoResponse_api,
+    GetUsersData_api,
+    GetUsersError_api,
+    GetUsersResponse_api,
     GetVectorListData_api,
     GetVectorListError_api,
     GetVectorListResponse_api,
@@ -279,6 +300,9 @@ import type {
     GetWellboreCompletionsResponse_api,
     GetWellboreLogCurveHeadersData_api,
     GetWellboreLogCurveHeadersError_api,
+    GetWellboreLogCurveHeadersForWellboresData_api,
+    GetWellboreLogCurveHeadersForWellboresError_api,
+    GetWellboreLogCurveHeadersForWellboresResponse_api,
     GetWellboreLogCurveHeadersResponse_api,
     GetWellborePerforationsData_api,
     GetWellborePerforationsError_api,
@@ -298,6 +322,9 @@ import type {
     GetWellCompletionsDataData_api,
     GetWellCompletionsDataError_api,
     GetWellCompletionsDataResponse_api,
+    GetWellTrajectoriesB64Data_api,
+    GetWellTrajectoriesB64Error_api,
+    GetWellTrajectoriesB64Response_api,
     GetWellTrajectoriesData_api,
     GetWellTrajectoriesError_api,
     GetWellTrajectoriesResponse_api,
@@ -455,6 +482,108 @@ export const getCasesOptions = (options: Options<GetCasesData_api>) =>
         queryKey: getCasesQueryKey(options),
     });
 
+export const getCasesPageQueryKey = (options: Options<GetCasesPageData_api>) => createQueryKey("getCasesPage", options);
+
+/**
+ * Get Cases Page
+ *
+ * Get a page of the cases for specified asset, sorted with the most recently updated case first
+ */
+export const getCasesPageOptions = (options: Options<GetCasesPageData_api>) =>
+    queryOptions<
+        GetCasesPageResponse_api,
+        AxiosError<GetCasesPageError_api>,
+        GetCasesPageResponse_api,
+        ReturnType<typeof getCasesPageQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getCasesPage({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getCasesPageQueryKey(options),
+    });
+
+const createInfiniteParams = <K extends Pick<QueryKey<Options>[0], "body" | "headers" | "path" | "query">>(
+    queryKey: QueryKey<Options>,
+    page: K,
+) => {
+    const params = { ...queryKey[0] };
+    if (page.body) {
+        params.body = {
+            ...(queryKey[0].body as any),
+            ...(page.body as any),
+        };
+    }
+    if (page.headers) {
+        params.headers = {
+            ...queryKey[0].headers,
+            ...page.headers,
+        };
+    }
+    if (page.path) {
+        params.path = {
+            ...(queryKey[0].path as any),
+            ...(page.path as any),
+        };
+    }
+    if (page.query) {
+        params.query = {
+            ...(queryKey[0].query as any),
+            ...(page.query as any),
+        };
+    }
+    return params as unknown as typeof page;
+};
+
+export const getCasesPageInfiniteQueryKey = (
+    options: Options<GetCasesPageData_api>,
+): QueryKey<Options<GetCasesPageData_api>> => createQueryKey("getCasesPage", options, true);
+
+/**
+ * Get Cases Page
+ *
+ * Get a page of the cases for specified asset, sorted with the most recently updated case first
+ */
+export const getCasesPageInfiniteOptions = (options: Options<GetCasesPageData_api>) => {
+    const opts = infiniteQueryOptions<
+        GetCasesPageResponse_api,
+        AxiosError<GetCasesPageError_api>,
+        InfiniteData<GetCasesPageResponse_api>,
+        QueryKey<Options<GetCasesPageData_api>>,
+        number | Pick<QueryKey<Options<GetCasesPageData_api>>[0], "body" | "headers" | "path" | "query">
+    >(
+        // @ts-ignore
+        {
+            queryFn: async ({ pageParam, queryKey, signal }) => {
+                // @ts-ignore
+                const page: Pick<QueryKey<Options<GetCasesPageData_api>>[0], "body" | "headers" | "path" | "query"> =
+                    typeof pageParam === "object"
+                        ? pageParam
+                        : {
+                              query: {
+                                  offset: pageParam,
+                              },
+                          };
+                const params = createInfiniteParams(queryKey, page);
+                const { data } = await getCasesPage({
+                    ...options,
+                    ...params,
+                    signal,
+                    throwOnError: true,
+                });
+                return data;
+            },
+            queryKey: getCasesPageInfiniteQueryKey(options),
+        },
+    );
+    return opts as Omit<typeof opts, "initialData">;
+};
+
 export const getEnsembleDetailsQueryKey = (options: Options<GetEnsembleDetailsData_api>) =>
     createQueryKey("getEnsembleDetails", options);
 
@@ -1144,6 +1273,40 @@ export const getStatisticalSurfaceDataHybridOptions = (options: Options<GetStati
         queryKey: getStatisticalSurfaceDataHybridQueryKey(options),
     });
 
+export const getStatisticalSurfaceTaskStatusSseQueryKey = (
+    options: Options<GetStatisticalSurfaceTaskStatusSseData_api>,
+) => createQueryKey("getStatisticalSurfaceTaskStatusSse", options);
+
+/**
+ * Get Statistical Surface Task Status Sse
+ *
+ * Server-sent event stream with the status of the task backing a statistical surface.
+ *
+ * The task must already have been submitted through the *statistical_surface_data_hybrid* endpoint.
+ * Emits *LroInProgressResp* events while the task is running and ends with either a *LroCompletedResp* event,
+ * after which the result can be fetched from the hybrid endpoint, or a *LroFailureResp* event.
+ */
+export const getStatisticalSurfaceTaskStatusSseOptions = (
+    options: Options<GetStatisticalSurfaceTaskStatusSseData_api>,
+) =>
+    queryOptions<
+        unknown,
+        AxiosError<GetStatisticalSurfaceTaskStatusSseError_api>,
+        unknown,
+        ReturnType<typeof getStatisticalSurfaceTaskStatusSseQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getStatisticalSurfaceTaskStatusSse({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getStatisticalSurfaceTaskStatusSseQueryKey(options),
+    });
+
 export const postGetSurfaceIntersectionQueryKey = (options: Options<PostGetSurfaceIntersectionData_api>) =>
     createQueryKey("postGetSurfaceIntersection", options);
 
@@ -1333,6 +1496,37 @@ export const getParametersAndSensitivitiesOptions = (options: Options<GetParamet
         queryKey: getParametersAndSensitivitiesQueryKey(options),
     });
 
+export const getParametersAndSensitivitiesColumnarQueryKey = (
+    options: Options<GetParametersAndSensitivitiesColumnarData_api>,
+) => createQueryKey("getParametersAndSensitivitiesColumnar", options);
+
+/**
+ * Get Parameters And Sensitivities Columnar
+ *
+ * Get the same parameters and sensitivities as /parameters_and_sensitivities/, but with the parameters in columnar
+ * form, which is considerably smaller and faster to produce for ensembles with many parameters
+ */
+export const getParametersAndSensitivitiesColumnarOptions = (
+    options: Options<GetParametersAndSensitivitiesColumnarData_api>,
+) =>
+    queryOptions<
+        GetParametersAndSensitivitiesColumnarResponse_api,
+        AxiosError<GetParametersAndSensitivitiesColumnarError_api>,
+        GetParametersAndSensitivitiesColumnarResponse_api,
+        ReturnType<typeof getParametersAndSensitivitiesColumnarQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getParametersAndSensitivitiesColumnar({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getParametersAndSensitivitiesColumnarQueryKey(options),
+    });
+
 export const getGridModelsInfoQueryKey = (options: Options<GetGridModelsInfoData_api>) =>
     createQueryKey("getGridModelsInfo", options);
 
@@ -1712,6 +1906,36 @@ export const getWellTrajectoriesOptions = (options: Options<GetWellTrajectoriesD
         queryKey: getWellTrajectoriesQueryKey(options),
     });
 
+export const getWellTrajectoriesB64QueryKey = (options: Options<GetWellTrajectoriesB64Data_api>) =>
+    createQueryKey("getWellTrajectoriesB64", options);
+
+/**
+ * Get Well Trajectories B64
+ *
+ * Get trajectories for wellbores in a given field as concatenated arrays.
+ *
+ * Same data as the well_trajectories endpoint, but in a columnar form that is far cheaper to produce and transfer
+ * for fields with thousands of wellbores.
+ */
+export const getWellTrajectoriesB64Options = (options: Options<GetWellTrajectoriesB64Data_api>) =>
+    queryOptions<
+        GetWellTrajectoriesB64Response_api,
+        AxiosError<GetWellTrajectoriesB64Error_api>,
+        GetWellTrajectoriesB64Response_api,
+        ReturnType<typeof getWellTrajectoriesB64QueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getWellTrajectoriesB64({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getWellTrajectoriesB64QueryKey(options),
+    });
+
 export const getWellborePickIdentifiersQueryKey = (options: Options<GetWellborePickIdentifiersData_api>) =>
     createQueryKey("getWellborePickIdentifiers", options);
 
@@ -1913,6 +2137,8 @@ export const getWellboreLogCurveHeadersQueryKey = (options: Options<GetWellboreL
  *
  * Get all log curve headers for a single well bore.
  * Logs are available from multiple sources, which can be specificed by the "sources" parameter.
+ * The sources are fetched concurrently, and sources that fail or time out are left out of the response.
+ * Such partial responses are not cached.
  */
 export const getWellboreLogCurveHeadersOptions = (options: Options<GetWellboreLogCurveHeadersData_api>) =>
     queryOptions<
@@ -1933,6 +2159,37 @@ export const getWellboreLogCurveHeadersOptions = (options: Options<GetWellboreLo
         queryKey: getWellboreLogCurveHeadersQueryKey(options),
     });
 
+export const getWellboreLogCurveHeadersForWellboresQueryKey = (
+    options: Options<GetWellboreLogCurveHeadersForWellboresData_api>,
+) => createQueryKey("getWellboreLogCurveHeadersForWellbores", options);
+
+/**
+ * Get Wellbore Log Curve Headers For Wellbores
+ *
+ * Get all log curve headers for multiple well bores, see the wellbore_log_curve_headers endpoint.
+ * Sources that failed or timed out are listed per well bore, and such partial responses are not cached.
+ */
+export const getWellboreLogCurveHeadersForWellboresOptions = (
+    options: Options<GetWellboreLogCurveHeadersForWellboresData_api>,
+) =>
+    queryOptions<
+        GetWellboreLogCurveHeadersForWellboresResponse_api,
+        AxiosError<GetWellboreLogCurveHeadersForWellboresError_api>,
+        GetWellboreLogCurveHeadersForWellboresResponse_api,
+        ReturnType<typeof getWellboreLogCurveHeadersForWellboresQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getWellboreLogCurveHeadersForWellbores({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getWellboreLogCurveHeadersForWellboresQueryKey(options),
+    });
+
 export const getLogCurveDataQueryKey = (options: Options<GetLogCurveDataData_api>) =>
     createQueryKey("getLogCurveData", options);
 
@@ -2184,6 +2441,35 @@ export const getUserPhotoOptions = (options: Options<GetUserPhotoData_api>) =>
         queryKey: getUserPhotoQueryKey(options),
     });
 
+export const getUsersQueryKey = (options: Options<GetUsersData_api>) => createQueryKey("getUsers", options);
+
+/**
+ * Get Users
+ *
+ * Get info, and optionally avatars, for several users in one request.
+ *
+ * Users that are not cached are looked up in batches, and each user is only looked up once even if given several
+ * times. Users that are not found have no user info or avatar in the result.
+ */
+export const getUsersOptions = (options: Options<GetUsersData_api>) =>
+    queryOptions<
+        GetUsersResponse_api,
+        AxiosError<GetUsersError_api>,
+        GetUsersResponse_api,
+        ReturnType<typeof getUsersQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getUsers({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getUsersQueryKey(options),
+    });
+
 export const getSummaryObservationsQueryKey = (options: Options<GetSummaryObservationsData_api>) =>
     createQueryKey("getSummaryObservations", options);
 
@@ -2340,6 +2626,33 @@ export const getRftRealizationDataOptions = (options: Options<GetRftRealizationD
         queryKey: getRftRealizationDataQueryKey(options),
     });
 
+export const getRftRealizationDataForWellsQueryKey = (options: Options<GetRftRealizationDataForWellsData_api>) =>
+    createQueryKey("getRftRealizationDataForWells", options);
+
+/**
+ * Get Rft Realization Data For Wells
+ *
+ * Get a list of RFT data per realization, for multiple wells and a given response.
+ */
+export const getRftRealizationDataForWellsOptions = (options: Options<GetRftRealizationDataForWellsData_api>) =>
+    queryOptions<
+        GetRftRealizationDataForWellsResponse_api,
+        AxiosError<GetRftRealizationDataForWellsError_api>,
+        GetRftRealizationDataForWellsResponse_api,
+        ReturnType<typeof getRftRealizationDataForWellsQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getRftRealizationDataForWells({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getRftRealizationDataForWellsQueryKey(options),
+    });
+
 export const getRftObservationsQueryKey = (options: Options<GetRftObservationsData_api>) =>
     createQueryKey("getRftObservations", options);
 
@@ -2455,38 +2768,6 @@ export const getSessionsMetadataOptions = (options?: Options<GetSessionsMetadata
         queryKey: getSessionsMetadataQueryKey(options),
     });
 
-const createInfiniteParams = <K extends Pick<QueryKey<Options>[0], "body" | "headers" | "path" | "query">>(
-    queryKey: QueryKey<Options>,
-    page: K,
-) => {
-    const params = { ...queryKey[0] };
-    if (page.body) {
-        params.body = {
-            ...(queryKey[0].body as any),
-            ...(page.body as any),
-        };
-    }
-    if (page.headers) {
-        params.headers = {
-            ...queryKey[0].headers,
-            ...page.headers,
-        };
-    }
-    if (page.path) {
-        params.path = {
-            ...(queryKey[0].path as any),
-            ...(page.path as any),
-        };
-    }
-    if (page.query) {
-        params.query = {
-            ...(queryKey[0].query as any),
-            ...(page.query as any),
-        };
-    }
-    return params as unknown as typeof page;
-};
-
 export const getSessionsMetadataInfiniteQueryKey = (
     options?: Options<GetSessionsMetadataData_api>,
 ): QueryKey<Options<GetSessionsMetadataData_api>> => createQueryKey("getSessionsMetadata", options, true);
@@ -2700,6 +2981,9 @@ export const getSessionOptions = (options: Options<GetSessionData_api>) =>
  *
  * All fields are optional - only provided fields will be updated.
  *
+ * Set **expectedVersion** to the version the update is based on to have it rejected if the session has been
+ * updated by someone else in the meantime.
+ *
  * The system automatically:
  * - Updates the `updated_at` timestamp
  * - Increments the version number
@@ -3110,6 +3394,8 @@ export const getSnapshotQueryKey = (options: Options<GetSnapshotData_api>) => cr
  * - Creates an access log entry if this is your first visit
  *
  * This allows you to see your viewing history in `/persistence/snapshot_access_logs`.
+ * Visits are buffered and written to the access log in the background, repeated visits within a few seconds are
+ * written as one update.
  *
  * Any user with the snapshot ID can access snapshots (they are shareable).
  */
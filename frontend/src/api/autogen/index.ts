@@ -19,6 +19,10 @@ export {
     getAssetInfosOptions,
     getAssetInfosQueryKey,
     getCasesOptions,
+    getCasesPageInfiniteOptions,
+    getCasesPageInfiniteQueryKey,
+    getCasesPageOptions,
+    getCasesPageQueryKey,
     getCasesQueryKey,
     getDeltaEnsembleRealizationsVectorDataOptions,
     getDeltaEnsembleRealizationsVectorDataQueryKey,
@@ -58,6 +62,8 @@ export {
     getMisfitSurfaceDataQueryKey,
     getObservedSurfacesMetadataOptions,
     getObservedSurfacesMetadataQueryKey,
+    getParametersAndSensitivitiesColumnarOptions,
+    getParametersAndSensitivitiesColumnarQueryKey,
     getParametersAndSensitivitiesOptions,
     getParametersAndSensitivitiesQueryKey,
     getPolygonsDataOptions,
@@ -82,6 +88,8 @@ export {
     getRelpermTableNamesQueryKey,
     getRftObservationsOptions,
     getRftObservationsQueryKey,
+    getRftRealizationDataForWellsOptions,
+    getRftRealizationDataForWellsQueryKey,
     getRftRealizationDataOptions,
     getRftRealizationDataQueryKey,
     getRftTableDefinitionOptions,
@@ -110,6 +118,8 @@ export {
     getSnapshotsMetadataQueryKey,
     getStatisticalSurfaceDataHybridOptions,
     getStatisticalSurfaceDataHybridQueryKey,
+    getStatisticalSurfaceTaskStatusSseOptions,
+    getStatisticalSurfaceTaskStatusSseQueryKey,
     getStatisticalVectorDataOptions,
     getStatisticalVectorDataPerSensitivityOptions,
     getStatisticalVectorDataPerSensitivityQueryKey,
@@ -122,6 +132,8 @@ export {
     getUserInfoQueryKey,
     getUserPhotoOptions,
     getUserPhotoQueryKey,
+    getUsersOptions,
+    getUsersQueryKey,
     getVectorListOptions,
     getVectorListQueryKey,
     getVfpTableNamesOptions,
@@ -132,6 +144,8 @@ export {
     getWellboreCasingsQueryKey,
     getWellboreCompletionsOptions,
     getWellboreCompletionsQueryKey,
+    getWellboreLogCurveHeadersForWellboresOptions,
+    getWellboreLogCurveHeadersForWellboresQueryKey,
     getWellboreLogCurveHeadersOptions,
     getWellboreLogCurveHeadersQueryKey,
     getWellborePerforationsOptions,
@@ -146,6 +160,8 @@ export {
     getWellboreStratigraphicColumnsQueryKey,
     getWellCompletionsDataOptions,
     getWellCompletionsDataQueryKey,
+    getWellTrajectoriesB64Options,
+    getWellTrajectoriesB64QueryKey,
     getWellTrajectoriesOptions,
     getWellTrajectoriesQueryKey,
     loginRouteOptions,
@@ -194,6 +210,7 @@ export {
     getAliveProtected,
     getAssetInfos,
     getCases,
+    getCasesPage,
     getDeltaEnsembleRealizationsVectorData,
     getDeltaEnsembleStatisticalVectorData,
     getDeltaEnsembleVectorList,
@@ -214,6 +231,7 @@ export {
     getMisfitSurfaceData,
     getObservedSurfacesMetadata,
     getParametersAndSensitivities,
+    getParametersAndSensitivitiesColumnar,
     getPolygonsData,
     getPolygonsDirectory,
     getProductionData,
@@ -226,6 +244,7 @@ export {
     getRelpermTableNames,
     getRftObservations,
     getRftRealizationData,
+    getRftRealizationDataForWells,
     getRftTableDefinition,
     getSeismicCubeMetaList,
     getSeismicSlices,
@@ -236,18 +255,21 @@ export {
     getSnapshotAccessLogs,
     getSnapshotsMetadata,
     getStatisticalSurfaceDataHybrid,
+    getStatisticalSurfaceTaskStatusSse,
     getStatisticalVectorData,
     getStatisticalVectorDataPerSensitivity,
     getSummaryObservations,
     getSurfaceData,
     getUserInfo,
     getUserPhoto,
+    getUsers,
     getVectorList,
     getVfpTable,
     getVfpTableNames,
     getWellboreCasings,
     getWellboreCompletions,
     getWellboreLogCurveHeaders,
+    getWellboreLogCurveHeadersForWellbores,
     getWellborePerforations,
     getWellborePickIdentifiers,
     getWellborePicksForPickIdentifier,
@@ -255,6 +277,7 @@ export {
     getWellboreStratigraphicColumns,
     getWellCompletionsData,
     getWellTrajectories,
+    getWellTrajectoriesB64,
     loginRoute,
     type Options,
     postGetAggregatedPerRealizationInplaceTableData,
@@ -286,6 +309,7 @@ export {
     type BoundingBox2d_api,
     type BoundingBox3d_api,
     type CaseInfo_api,
+    type CasePage_api,
     type ClientOptions,
     type Completions_api,
     type CreateSessionData_api,
@@ -319,6 +343,8 @@ export {
     type EnsembleInfo_api,
     type EnsembleParameter_api,
     type EnsembleParametersAndSensitivities_api,
+    type EnsembleParametersAndSensitivitiesColumnar_api,
+    type EnsembleParametersColumnar_api,
     type EnsembleSensitivity_api,
     type EnsembleSensitivityCase_api,
     type FenceMeshSection_api,
@@ -342,6 +368,11 @@ export {
     type GetCasesData_api,
     type GetCasesError_api,
     type GetCasesErrors_api,
+    type GetCasesPageData_api,
+    type GetCasesPageError_api,
+    type GetCasesPageErrors_api,
+    type GetCasesPageResponse_api,
+    type GetCasesPageResponses_api,
     type GetCasesResponse_api,
     type GetCasesResponses_api,
     type GetDeltaEnsembleRealizationsVectorDataData_api,
@@ -437,6 +468,11 @@ export {
     type GetObservedSurfacesMetadataErrors_api,
     type GetObservedSurfacesMetadataResponse_api,
     type GetObservedSurfacesMetadataResponses_api,
+    type GetParametersAndSensitivitiesColumnarData_api,
+    type GetParametersAndSensitivitiesColumnarError_api,
+    type GetParametersAndSensitivitiesColumnarErrors_api,
+    type GetParametersAndSensitivitiesColumnarResponse_api,
+    type GetParametersAndSensitivitiesColumnarResponses_api,
     type GetParametersAndSensitivitiesData_api,
     type GetParametersAndSensitivitiesError_api,
     type GetParametersAndSensitivitiesErrors_api,
@@ -500,6 +536,11 @@ export {
     type GetRftRealizationDataData_api,
     type GetRftRealizationDataError_api,
     type GetRftRealizationDataErrors_api,
+    type GetRftRealizationDataForWellsData_api,
+    type GetRftRealizationDataForWellsError_api,
+    type GetRftRealizationDataForWellsErrors_api,
+    type GetRftRealizationDataForWellsResponse_api,
+    type GetRftRealizationDataForWellsResponses_api,
     type GetRftRealizationDataResponse_api,
     type GetRftRealizationDataResponses_api,
     type GetRftTableDefinitionData_api,
@@ -552,6 +593,10 @@ export {
     type GetStatisticalSurfaceDataHybridErrors_api,
     type GetStatisticalSurfaceDataHybridResponse_api,
     type GetStatisticalSurfaceDataHybridResponses_api,
+    type GetStatisticalSurfaceTaskStatusSseData_api,
+    type GetStatisticalSurfaceTaskStatusSseError_api,
+    type GetStatisticalSurfaceTaskStatusSseErrors_api,
+    type GetStatisticalSurfaceTaskStatusSseResponses_api,
     type GetStatisticalVectorDataData_api,
     type GetStatisticalVectorDataError_api,
     type GetStatisticalVectorDataErrors_api,
@@ -582,6 +627,11 @@ export {
     type GetUserPhotoErrors_api,
     type GetUserPhotoResponse_api,
     type GetUserPhotoResponses_api,
+    type GetUsersData_api,
+    type GetUsersError_api,
+    type GetUsersErrors_api,
+    type GetUsersResponse_api,
+    type GetUsersResponses_api,
     type GetVectorListData_api,
     type GetVectorListError_api,
     type GetVectorListErrors_api,
@@ -610,6 +660,11 @@ export {
     type GetWellboreLogCurveHeadersData_api,
     type GetWellboreLogCurveHeadersError_api,
     type GetWellboreLogCurveHeadersErrors_api,
+    type GetWellboreLogCurveHeadersForWellboresData_api,
+    type GetWellboreLogCurveHeadersForWellboresError_api,
+    type GetWellboreLogCurveHeadersForWellboresErrors_api,
+    type GetWellboreLogCurveHeadersForWellboresResponse_api,
+    type GetWellboreLogCurveHeadersForWellboresResponses_api,
     type GetWellboreLogCurveHeadersResponse_api,
     type GetWellboreLogCurveHeadersResponses_api,
     type GetWellborePerforationsData_api,
@@ -642,6 +697,11 @@ export {
     type GetWellCompletionsDataErrors_api,
     type GetWellCompletionsDataResponse_api,
     type GetWellCompletionsDataResponses_api,
+    type GetWellTrajectoriesB64Data_api,
+    type GetWellTrajectoriesB64Error_api,
+    type GetWellTrajectoriesB64Errors_api,
+    type GetWellTrajectoriesB64Response_api,
+    type GetWellTrajectoriesB64Responses_api,
     type GetWellTrajectoriesData_api,
     type GetWellTrajectoriesError_api,
     type GetWellTrajectoriesErrors_api,
@@ -649,6 +709,7 @@ export {
     type GetWellTrajectoriesResponses_api,
     GFR_api,
     type GraphUser_api,
+    type GraphUserLookup_api,
     type GraphUserPhoto_api,
     type Grid3dDimensions_api,
     type Grid3dGeometry_api,
@@ -683,6 +744,7 @@ export {
     type PointSetXY_api,
     type PolygonData_api,
     PolygonsAttributeType_api,
+    type PolygonsDataB64_api,
     type PolygonsMeta_api,
     type PolylineIntersection_api,
     type PostGetAggregatedPerRealizationInplaceTableDataData_api,
@@ -729,9 +791,13 @@ export {
     type PostRefreshFingerprintsForEnsemblesResponse_api,
     type PostRefreshFingerprintsForEnsemblesResponses_api,
     type PvtData_api,
+    type PvtDataB64_api,
     type RelpermCurveData_api,
+    type RelpermCurveValuesB64_api,
     type RelpermRealizationData_api,
     type RelpermRealizationDataResponse_api,
+    type RelpermRealizationDataResponseB64_api,
+    type RelpermSatnumDataB64_api,
     type RelpermSaturationAxis_api,
     type RelpermSaturationValues_api,
     type RelpermTableDefinition_api,
@@ -795,16 +861,20 @@ export {
     type VectorStatisticData_api,
     type VectorStatisticSensitivityData_api,
     type VfpInjTable_api,
+    type VfpInjTableB64_api,
     type VfpProdTable_api,
+    type VfpProdTableB64_api,
     type WellboreCasing_api,
     type WellboreCompletion_api,
     type WellboreCompletions_api,
     type WellboreHeader_api,
     type WellboreLogCurveData_api,
     type WellboreLogCurveHeader_api,
+    type WellboreLogCurveHeadersForWellbore_api,
     type WellborePerforation_api,
     type WellborePerforations_api,
     type WellborePick_api,
+    type WellboreTrajectoriesB64_api,
     type WellboreTrajectory_api,
     type WellCompletionsData_api,
     type WellCompletionsUnitInfo_api,
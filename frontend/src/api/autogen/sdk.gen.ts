@@ -28,6 +28,9 @@ import type {
     GetAssetInfosResponses_api,
     GetCasesData_api,
     GetCasesErrors_api,
+    GetCasesPageData_api,
+    GetCasesPageErrors_api,
+    GetCasesPageResponses_api,
     GetCasesResponses_api,
     GetDeltaEnsembleRealizationsVectorDataData_api,
     GetDeltaEnsembleRealizationsVectorDataErrors_api,
@@ -85,6 +88,9 @@ import type {
     GetObservedSurfacesMetadataData_api,
     GetObservedSurfacesMetadataErrors_api,
     GetObservedSurfacesMetadataResponses_api,
+    GetParametersAndSensitivitiesColumnarData_api,
+    GetParametersAndSensitivitiesColumnarErrors_api,
+    GetParametersAndSensitivitiesColumnarResponses_api,
     GetParametersAndSensitivitiesData_api,
     GetParametersAndSensitivitiesErrors_api,
     GetParametersAndSensitivitiesResponses_api,
@@ -123,6 +129,9 @@ import type {
     GetRftObservationsResponses_api,
     GetRftRealizationDataData_api,
     GetRftRealizationDataErrors_api,
+    GetRftRealizationDataForWellsData_api,
+    GetRftRealizationDataForWellsErrors_api,
+    GetRftRealizationDataForWellsResponses_api,
     GetRftRealizationDataResponses_api,
     GetRftTableDefinitionData_api,
     GetRftTableDefinitionErrors_api,
@@ -154,6 +163,9 @@ import type {
     GetStatisticalSurfaceDataHybridData_api,
     GetStatisticalSurfaceDataHybridErrors_api,
     GetStatisticalSurfaceDataHybridResponses_api,
+    GetStatisticalSurfaceTaskStatusSseData_api,
+    GetStatisticalSurfaceTaskStatusSseErrors_api,
+    GetStatisticalSurfaceTaskStatusSseResponses_api,
     GetStatisticalVectorDataData_api,
     GetStatisticalVectorDataErrors_api,
     GetStatisticalVectorDataPerSensitivityData_api,
@@ -172,6 +184,9 @@ import type {
     GetUserPhotoData_api,
     GetUserPhotoErrors_api,
     GetUserPhotoResponses_api,
+    GetUsersData_api,
+    GetUsersErrors_api,
+    GetUsersResponses_api,
     GetVectorListData_api,
     GetVectorListErrors_api,
     GetVectorListResponses_api,
@@ -189,6 +204,9 @@ import type {
     GetWellboreCompletionsResponses_api,
     GetWellboreLogCurveHeadersData_api,
     GetWellboreLogCurveHeadersErrors_api,
+    GetWellboreLogCurveHeadersForWellboresData_api,
+    GetWellboreLogCurveHeadersForWellboresErrors_api,
+    GetWellboreLogCurveHeadersForWellboresResponses_api,
     GetWellboreLogCurveHeadersResponses_api,
     GetWellborePerforationsData_api,
     GetWellborePerforationsErrors_api,
@@ -208,6 +226,9 @@ import type {
     GetWellCompletionsDataData_api,
     GetWellCompletionsDataErrors_api,
     GetWellCompletionsDataResponses_api,
+    GetWellTrajectoriesB64Data_api,
+    GetWellTrajectoriesB64Errors_api,
+    GetWellTrajectoriesB64Responses_api,
     GetWellTrajectoriesData_api,
     GetWellTrajectoriesErrors_api,
     GetWellTrajectoriesResponses_api,
@@ -307,6 +328,20 @@ export const getCases = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Cases Page
+ *
+ * Get a page of the cases for specified asset, sorted with the most recently updated case first
+ */
+export const getCasesPage = <ThrowOnError extends boolean = false>(
+    options: Options<GetCasesPageData_api, ThrowOnError>,
+): RequestResult<GetCasesPageResponses_api, GetCasesPageErrors_api, ThrowOnError> =>
+    (options.client ?? client).get<GetCasesPageResponses_api, GetCasesPageErrors_api, ThrowOnError>({
+        responseType: "json",
+        url: "/cases_page",
+        ...options,
+    });
+
 /**
  * Get Ensemble Details
  *
@@ -715,6 +750,32 @@ export const getStatisticalSurfaceDataHybrid = <ThrowOnError extends boolean = f
         ...options,
     });
 
+/**
+ * Get Statistical Surface Task Status Sse
+ *
+ * Server-sent event stream with the status of the task backing a statistical surface.
+ *
+ * The task must already have been submitted through the *statistical_surface_data_hybrid* endpoint.
+ * Emits *LroInProgressResp* events while the task is running and ends with either a *LroCompletedResp* event,
+ * after which the result can be fetched from the hybrid endpoint, or a *LroFailureResp* event.
+ */
+export const getStatisticalSurfaceTaskStatusSse = <ThrowOnError extends boolean = false>(
+    options: Options<GetStatisticalSurfaceTaskStatusSseData_api, ThrowOnError>,
+): RequestResult<
+    GetStatisticalSurfaceTaskStatusSseResponses_api,
+    GetStatisticalSurfaceTaskStatusSseErrors_api,
+    ThrowOnError
+> =>
+    (options.client ?? client).get<
+        GetStatisticalSurfaceTaskStatusSseResponses_api,
+        GetStatisticalSurfaceTaskStatusSseErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/surface/statistical_surface_task_status_sse",
+        ...options,
+    });
+
 /**
  * Post Get Surface Intersection
  *
@@ -800,6 +861,29 @@ export const getParametersAndSensitivities = <ThrowOnError extends boolean = fal
         ...options,
     });
 
+/**
+ * Get Parameters And Sensitivities Columnar
+ *
+ * Get the same parameters and sensitivities as /parameters_and_sensitivities/, but with the parameters in columnar
+ * form, which is considerably smaller and faster to produce for ensembles with many parameters
+ */
+export const getParametersAndSensitivitiesColumnar = <ThrowOnError extends boolean = false>(
+    options: Options<GetParametersAndSensitivitiesColumnarData_api, ThrowOnError>,
+): RequestResult<
+    GetParametersAndSensitivitiesColumnarResponses_api,
+    GetParametersAndSensitivitiesColumnarErrors_api,
+    ThrowOnError
+> =>
+    (options.client ?? client).get<
+        GetParametersAndSensitivitiesColumnarResponses_api,
+        GetParametersAndSensitivitiesColumnarErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/parameters/parameters_and_sensitivities_columnar/",
+        ...options,
+    });
+
 /**
  * Get Grid Models Info
  *
@@ -999,6 +1083,25 @@ export const getWellTrajectories = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Well Trajectories B64
+ *
+ * Get trajectories for wellbores in a given field as concatenated arrays.
+ *
+ * Same data as the well_trajectories endpoint, but in a columnar form that is far cheaper to produce and transfer
+ * for fields with thousands of wellbores.
+ */
+export const getWellTrajectoriesB64 = <ThrowOnError extends boolean = false>(
+    options: Options<GetWellTrajectoriesB64Data_api, ThrowOnError>,
+): RequestResult<GetWellTrajectoriesB64Responses_api, GetWellTrajectoriesB64Errors_api, ThrowOnError> =>
+    (options.client ?? client).get<GetWellTrajectoriesB64Responses_api, GetWellTrajectoriesB64Errors_api, ThrowOnError>(
+        {
+            responseType: "json",
+            url: "/well/well_trajectories_b64/",
+            ...options,
+        },
+    );
+
 /**
  * Get Wellbore Pick Identifiers
  *
@@ -1135,6 +1238,8 @@ export const getWellborePerforations = <ThrowOnError extends boolean = false>(
  *
  * Get all log curve headers for a single well bore.
  * Logs are available from multiple sources, which can be specificed by the "sources" parameter.
+ * The sources are fetched concurrently, and sources that fail or time out are left out of the response.
+ * Such partial responses are not cached.
  */
 export const getWellboreLogCurveHeaders = <ThrowOnError extends boolean = false>(
     options: Options<GetWellboreLogCurveHeadersData_api, ThrowOnError>,
@@ -1149,6 +1254,29 @@ export const getWellboreLogCurveHeaders = <ThrowOnError extends boolean = false>
         ...options,
     });
 
+/**
+ * Get Wellbore Log Curve Headers For Wellbores
+ *
+ * Get all log curve headers for multiple well bores, see the wellbore_log_curve_headers endpoint.
+ * Sources that failed or timed out are listed per well bore, and such partial responses are not cached.
+ */
+export const getWellboreLogCurveHeadersForWellbores = <ThrowOnError extends boolean = false>(
+    options: Options<GetWellboreLogCurveHeadersForWellboresData_api, ThrowOnError>,
+): RequestResult<
+    GetWellboreLogCurveHeadersForWellboresResponses_api,
+    GetWellboreLogCurveHeadersForWellboresErrors_api,
+    ThrowOnError
+> =>
+    (options.client ?? client).get<
+        GetWellboreLogCurveHeadersForWellboresResponses_api,
+        GetWellboreLogCurveHeadersForWellboresErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/well/wellbore_log_curve_headers_for_wellbores/",
+        ...options,
+    });
+
 /**
  * Get Log Curve Data
  *
@@ -1269,6 +1397,23 @@ export const getUserPhoto = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Users
+ *
+ * Get info, and optionally avatars, for several users in one request.
+ *
+ * Users that are not cached are looked up in batches, and each user is only looked up once even if given several
+ * times. Users that are not found have no user info or avatar in the result.
+ */
+export const getUsers = <ThrowOnError extends boolean = false>(
+    options: Options<GetUsersData_api, ThrowOnError>,
+): RequestResult<GetUsersResponses_api, GetUsersErrors_api, ThrowOnError> =>
+    (options.client ?? client).get<GetUsersResponses_api, GetUsersErrors_api, ThrowOnError>({
+        responseType: "json",
+        url: "/graph/users/",
+        ...options,
+    });
+
 /**
  * Get Summary Observations
  *
@@ -1357,6 +1502,24 @@ export const getRftRealizationData = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Rft Realization Data For Wells
+ *
+ * Get a list of RFT data per realization, for multiple wells and a given response.
+ */
+export const getRftRealizationDataForWells = <ThrowOnError extends boolean = false>(
+    options: Options<GetRftRealizationDataForWellsData_api, ThrowOnError>,
+): RequestResult<GetRftRealizationDataForWellsResponses_api, GetRftRealizationDataForWellsErrors_api, ThrowOnError> =>
+    (options.client ?? client).get<
+        GetRftRealizationDataForWellsResponses_api,
+        GetRftRealizationDataForWellsErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/rft/rft_realization_data_for_wells",
+        ...options,
+    });
+
 /**
  * Get Rft Observations
  *
@@ -1505,6 +1668,9 @@ export const getSession = <ThrowOnError extends boolean = false>(
  *
  * All fields are optional - only provided fields will be updated.
  *
+ * Set **expectedVersion** to the version the update is based on to have it rejected if the session has been
+ * updated by someone else in the meantime.
+ *
  * The system automatically:
  * - Updates the `updated_at` timestamp
  * - Increments the version number
@@ -1678,6 +1844,8 @@ export const deleteSnapshot = <ThrowOnError extends boolean = false>(
  * - Creates an access log entry if this is your first visit
  *
  * This allows you to see your viewing history in `/persistence/snapshot_access_logs`.
+ * Visits are buffered and written to the access log in the background, repeated visits within a few seconds are
+ * written as one update.
  *
  * Any user with the snapshot ID can access snapshots (they are shareable).
  */
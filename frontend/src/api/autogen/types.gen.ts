@@ -218,6 +218,20 @@ export type CaseInfo_api = {
     ensembles: Array<EnsembleInfo_api>;
 };
 
+/**
+ * CasePage
+ */
+export type CasePage_api = {
+    /**
+     * Cases
+     */
+    cases: Array<CaseInfo_api>;
+    /**
+     * Totalcount
+     */
+    totalCount: number | null;
+};
+
 /**
  * Completions
  */
@@ -436,6 +450,73 @@ export type EnsembleParametersAndSensitivities_api = {
     nonStandardParametersWarning?: string | null;
 };
 
+/**
+ * EnsembleParametersAndSensitivitiesColumnar
+ *
+ * Description/data for all parameters, in columnar form, and sensitivities in an ensemble
+ */
+export type EnsembleParametersAndSensitivitiesColumnar_api = {
+    parameters: EnsembleParametersColumnar_api;
+    /**
+     * Sensitivities
+     */
+    sensitivities: Array<EnsembleSensitivity_api>;
+    /**
+     * Nonstandardparameterswarning
+     */
+    nonStandardParametersWarning?: string | null;
+};
+
+/**
+ * EnsembleParametersColumnar
+ *
+ * Description/data for all parameters in an ensemble, in columnar form
+ *
+ * The per-parameter arrays are all in the same parameter order. The values of the numerical parameters are given
+ * as a base64 encoded float32 matrix, stored row by row with one row per numerical parameter and one column per
+ * realization. The values of the other parameters are given as one array per parameter. Both are in the same order
+ * as the parameters.
+ */
+export type EnsembleParametersColumnar_api = {
+    /**
+     * Realizations
+     */
+    realizations: Array<number>;
+    /**
+     * Names
+     */
+    names: Array<string>;
+    /**
+     * Groupnames
+     */
+    groupNames: Array<string | null>;
+    /**
+     * Descriptivenames
+     */
+    descriptiveNames: Array<string | null>;
+    /**
+     * Islogarithmic
+     */
+    isLogarithmic: Array<boolean>;
+    /**
+     * Isdiscrete
+     */
+    isDiscrete: Array<boolean>;
+    /**
+     * Isconstant
+     */
+    isConstant: Array<boolean>;
+    /**
+     * Isnumerical
+     */
+    isNumerical: Array<boolean>;
+    numericalValues_b64arr: B64FloatArray_api;
+    /**
+     * Nonnumericalvalues
+     */
+    nonNumericalValues: Array<Array<string>>;
+};
+
 /**
  * EnsembleSensitivity
  *
@@ -646,6 +727,21 @@ export type GraphUser_api = {
     email: string;
 };
 
+/**
+ * GraphUserLookup
+ */
+export type GraphUserLookup_api = {
+    /**
+     * User Id Or Email
+     */
+    user_id_or_email: string;
+    user?: GraphUser_api | null;
+    /**
+     * Avatar B64Str
+     */
+    avatar_b64str?: string | null;
+};
+
 /**
  * GraphUserPhoto
  */
@@ -1197,6 +1293,34 @@ export enum PolygonsAttributeType_api {
     NAMED_AREA = "named_area",
 }
 
+/**
+ * PolygonsDataB64
+ *
+ * All polygons in a set as columnar arrays.
+ *
+ * The coordinates of all polygons are concatenated into the x, y and z arrays. The coordinates of polygon i are found
+ * in the range [poly_start_indices[i], poly_start_indices[i + 1]), with the last polygon running to the end of the
+ * arrays. The coordinates are float64 since float32 lacks the precision needed for UTM coordinates.
+ */
+export type PolygonsDataB64_api = {
+    /**
+     * Format
+     */
+    format?: "b64";
+    x_b64arr: B64FloatArray_api;
+    y_b64arr: B64FloatArray_api;
+    z_b64arr: B64FloatArray_api;
+    poly_start_indices_b64arr: B64UintArray_api;
+    /**
+     * Poly Ids
+     */
+    poly_ids: Array<number | string>;
+    /**
+     * Names
+     */
+    names: Array<string>;
+};
+
 /**
  * PolygonsMeta
  */
@@ -1305,6 +1429,53 @@ export type PvtData_api = {
     ratio_unit: string;
 };
 
+/**
+ * PvtDataB64
+ */
+export type PvtDataB64_api = {
+    /**
+     * Format
+     */
+    format?: "b64";
+    /**
+     * Name
+     */
+    name: string;
+    /**
+     * Phase
+     */
+    phase: string;
+    /**
+     * Pvtnum
+     */
+    pvtnum: number;
+    ratio_b64arr: B64FloatArray_api;
+    pressure_b64arr: B64FloatArray_api;
+    volumefactor_b64arr: B64FloatArray_api;
+    viscosity_b64arr: B64FloatArray_api;
+    density_b64arr: B64FloatArray_api;
+    /**
+     * Pressure Unit
+     */
+    pressure_unit: string;
+    /**
+     * Volumefactor Unit
+     */
+    volumefactor_unit: string;
+    /**
+     * Viscosity Unit
+     */
+    viscosity_unit: string;
+    /**
+     * Density Unit
+     */
+    density_unit: string;
+    /**
+     * Ratio Unit
+     */
+    ratio_unit: string;
+};
+
 /**
  * RelpermCurveData
  */
@@ -1319,6 +1490,20 @@ export type RelpermCurveData_api = {
     curve_values: Array<number>;
 };
 
+/**
+ * RelpermCurveValuesB64
+ *
+ * Values of one curve for all realizations of a SATNUM, as a row-major matrix with one row per realization
+ * and one column per saturation value.
+ */
+export type RelpermCurveValuesB64_api = {
+    /**
+     * Curve Name
+     */
+    curve_name: string;
+    values_b64arr: B64FloatArray_api;
+};
+
 /**
  * RelpermRealizationData
  */
@@ -1355,6 +1540,40 @@ export type RelpermRealizationDataResponse_api = {
     realization_data: Array<RelpermRealizationData_api>;
 };
 
+/**
+ * RelpermRealizationDataResponseB64
+ */
+export type RelpermRealizationDataResponseB64_api = {
+    /**
+     * Format
+     */
+    format?: "b64";
+    /**
+     * Saturation Name
+     */
+    saturation_name: string;
+    /**
+     * Satnum Data
+     */
+    satnum_data: Array<RelpermSatnumDataB64_api>;
+};
+
+/**
+ * RelpermSatnumDataB64
+ */
+export type RelpermSatnumDataB64_api = {
+    /**
+     * Satnum
+     */
+    satnum: number;
+    saturation_values_b64arr: B64FloatArray_api;
+    realizations_b64arr: B64UintArray_api;
+    /**
+     * Curve Values
+     */
+    curve_values: Array<RelpermCurveValuesB64_api>;
+};
+
 /**
  * RelpermSaturationAxis
  */
@@ -1875,6 +2094,10 @@ export type SessionUpdate_api = {
      * Content
      */
     content?: string | null;
+    /**
+     * Expectedversion
+     */
+    expectedVersion?: number | null;
 };
 
 /**
@@ -2614,6 +2837,52 @@ export type VfpInjTable_api = {
     bhpUnit: string;
 };
 
+/**
+ * VfpInjTableB64
+ */
+export type VfpInjTableB64_api = {
+    /**
+     * Format
+     */
+    format?: "b64";
+    /**
+     * Vfptype
+     */
+    vfpType?: "INJ";
+    /**
+     * Tablenumber
+     */
+    tableNumber: number;
+    /**
+     * Datum
+     */
+    datum: number;
+    flowRateType: FlowRateType_api;
+    unitType: UnitType_api;
+    tabType: TabType_api;
+    /**
+     * Thpvalues
+     */
+    thpValues: Array<number>;
+    /**
+     * Flowratevalues
+     */
+    flowRateValues: Array<number>;
+    bhpValuesB64arr: B64FloatArray_api;
+    /**
+     * Flowrateunit
+     */
+    flowRateUnit: string;
+    /**
+     * Thpunit
+     */
+    thpUnit: string;
+    /**
+     * Bhpunit
+     */
+    bhpUnit: string;
+};
+
 /**
  * VfpProdTable
  */
@@ -2687,6 +2956,80 @@ export type VfpProdTable_api = {
     alqUnit: string;
 };
 
+/**
+ * VfpProdTableB64
+ */
+export type VfpProdTableB64_api = {
+    /**
+     * Format
+     */
+    format?: "b64";
+    /**
+     * Vfptype
+     */
+    vfpType?: "PROD";
+    /**
+     * Tablenumber
+     */
+    tableNumber: number;
+    /**
+     * Datum
+     */
+    datum: number;
+    flowRateType: FlowRateType_api;
+    unitType: UnitType_api;
+    tabType: TabType_api;
+    /**
+     * Thpvalues
+     */
+    thpValues: Array<number>;
+    /**
+     * Flowratevalues
+     */
+    flowRateValues: Array<number>;
+    bhpValuesB64arr: B64FloatArray_api;
+    /**
+     * Flowrateunit
+     */
+    flowRateUnit: string;
+    /**
+     * Thpunit
+     */
+    thpUnit: string;
+    /**
+     * Bhpunit
+     */
+    bhpUnit: string;
+    thpType: THP_api;
+    wfrType: WFR_api;
+    gfrType: GFR_api;
+    alqType: ALQ_api;
+    /**
+     * Wfrvalues
+     */
+    wfrValues: Array<number>;
+    /**
+     * Gfrvalues
+     */
+    gfrValues: Array<number>;
+    /**
+     * Alqvalues
+     */
+    alqValues: Array<number>;
+    /**
+     * Wfrunit
+     */
+    wfrUnit: string;
+    /**
+     * Gfrunit
+     */
+    gfrUnit: string;
+    /**
+     * Alqunit
+     */
+    alqUnit: string;
+};
+
 /**
  * WFR
  */
@@ -3220,6 +3563,24 @@ export type WellboreLogCurveHeader_api = {
     curveUnit: string | null;
 };
 
+/**
+ * WellboreLogCurveHeadersForWellbore
+ */
+export type WellboreLogCurveHeadersForWellbore_api = {
+    /**
+     * Wellboreuuid
+     */
+    wellboreUuid: string;
+    /**
+     * Curveheaders
+     */
+    curveHeaders: Array<WellboreLogCurveHeader_api>;
+    /**
+     * Failedsources
+     */
+    failedSources: Array<WellLogCurveSourceEnum_api>;
+};
+
 /**
  * WellborePerforation
  *
@@ -3342,6 +3703,39 @@ export type WellborePick_api = {
     obsNo: number;
 };
 
+/**
+ * WellboreTrajectoriesB64
+ *
+ * Trajectories for multiple wellbores as concatenated float32 sample arrays.
+ *
+ * The samples of trajectory i are found in the range [startIndices[i], startIndices[i + 1]), with the last
+ * trajectory running to the end of the arrays. Since float32 lacks the precision needed for UTM coordinates,
+ * easting and northing are given relative to eastingOrigin and northingOrigin.
+ */
+export type WellboreTrajectoriesB64_api = {
+    /**
+     * Wellboreuuids
+     */
+    wellboreUuids: Array<string>;
+    /**
+     * Uniquewellboreidentifiers
+     */
+    uniqueWellboreIdentifiers: Array<string>;
+    startIndicesB64arr: B64UintArray_api;
+    /**
+     * Eastingorigin
+     */
+    eastingOrigin: number;
+    /**
+     * Northingorigin
+     */
+    northingOrigin: number;
+    tvdMslB64arr: B64FloatArray_api;
+    mdB64arr: B64FloatArray_api;
+    eastingB64arr: B64FloatArray_api;
+    northingB64arr: B64FloatArray_api;
+};
+
 /**
  * WellboreTrajectory
  */
@@ -3410,9 +3804,44 @@ export type GetFieldIdentifiersResponses_api = {
     200: Array<FieldInfo_api>;
 };
 
-export type GetFieldIdentifiersResponse_api = GetFieldIdentifiersResponses_api[keyof GetFieldIdentifiersResponses_api];
+export type GetFieldIdentifiersResponse_api = GetFieldIdentifiersResponses_api[keyof GetFieldIdentifiersResponses_api];
+
+export type GetCasesData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Asset Name
+         *
+         * Asset name
+         */
+        asset_name: string;
+        zCacheBust?: string;
+    };
+    url: "/cases";
+};
+
+export type GetCasesErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetCasesError_api = GetCasesErrors_api[keyof GetCasesErrors_api];
+
+export type GetCasesResponses_api = {
+    /**
+     * Response Get Cases
+     *
+     * Successful Response
+     */
+    200: Array<CaseInfo_api>;
+};
+
+export type GetCasesResponse_api = GetCasesResponses_api[keyof GetCasesResponses_api];
 
-export type GetCasesData_api = {
+export type GetCasesPageData_api = {
     body?: never;
     path?: never;
     query: {
@@ -3422,30 +3851,58 @@ export type GetCasesData_api = {
          * Asset name
          */
         asset_name: string;
+        /**
+         * Offset
+         *
+         * Number of cases to skip
+         */
+        offset?: number;
+        /**
+         * Limit
+         *
+         * Maximum number of cases to return
+         */
+        limit?: number;
+        /**
+         * Search Text
+         *
+         * Only include cases where name, description, user or model name contains this text (case-insensitive)
+         */
+        search_text?: string | null;
+        /**
+         * User
+         *
+         * Only include cases created by this user
+         */
+        user?: string | null;
+        /**
+         * Status
+         *
+         * Only include cases with this status
+         */
+        status?: string | null;
         zCacheBust?: string;
     };
-    url: "/cases";
+    url: "/cases_page";
 };
 
-export type GetCasesErrors_api = {
+export type GetCasesPageErrors_api = {
     /**
      * Validation Error
      */
     422: HTTPValidationError_api;
 };
 
-export type GetCasesError_api = GetCasesErrors_api[keyof GetCasesErrors_api];
+export type GetCasesPageError_api = GetCasesPageErrors_api[keyof GetCasesPageErrors_api];
 
-export type GetCasesResponses_api = {
+export type GetCasesPageResponses_api = {
     /**
-     * Response Get Cases
-     *
      * Successful Response
      */
-    200: Array<CaseInfo_api>;
+    200: CasePage_api;
 };
 
-export type GetCasesResponse_api = GetCasesResponses_api[keyof GetCasesResponses_api];
+export type GetCasesPageResponse_api = GetCasesPageResponses_api[keyof GetCasesPageResponses_api];
 
 export type GetEnsembleDetailsData_api = {
     body?: never;
@@ -4380,6 +4837,12 @@ export type GetStatisticalSurfaceDataHybridData_api = {
          * If true, deletes the server-side task metadata for this surface address
          */
         delete_task?: boolean;
+        /**
+         * Long Poll Timeout S
+         *
+         * If larger than 0, the server holds the request for up to this many seconds waiting for the task to complete
+         */
+        long_poll_timeout_s?: number;
         /**
          * Resample To Def Str
          *
@@ -4417,6 +4880,44 @@ export type GetStatisticalSurfaceDataHybridResponses_api = {
 export type GetStatisticalSurfaceDataHybridResponse_api =
     GetStatisticalSurfaceDataHybridResponses_api[keyof GetStatisticalSurfaceDataHybridResponses_api];
 
+export type GetStatisticalSurfaceTaskStatusSseData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Surf Addr Str
+         *
+         * Surface address string, supported address type is *STAT*
+         */
+        surf_addr_str: string;
+        /**
+         * Max Duration S
+         *
+         * Maximum duration of the stream in seconds
+         */
+        max_duration_s?: number;
+        zCacheBust?: string;
+    };
+    url: "/surface/statistical_surface_task_status_sse";
+};
+
+export type GetStatisticalSurfaceTaskStatusSseErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetStatisticalSurfaceTaskStatusSseError_api =
+    GetStatisticalSurfaceTaskStatusSseErrors_api[keyof GetStatisticalSurfaceTaskStatusSseErrors_api];
+
+export type GetStatisticalSurfaceTaskStatusSseResponses_api = {
+    /**
+     * Successful Response
+     */
+    200: unknown;
+};
+
 export type PostGetSurfaceIntersectionData_api = {
     body: BodyPostGetSurfaceIntersection_api;
     path?: never;
@@ -4703,6 +5204,47 @@ export type GetParametersAndSensitivitiesResponses_api = {
 export type GetParametersAndSensitivitiesResponse_api =
     GetParametersAndSensitivitiesResponses_api[keyof GetParametersAndSensitivitiesResponses_api];
 
+export type GetParametersAndSensitivitiesColumnarData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        zCacheBust?: string;
+    };
+    url: "/parameters/parameters_and_sensitivities_columnar/";
+};
+
+export type GetParametersAndSensitivitiesColumnarErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetParametersAndSensitivitiesColumnarError_api =
+    GetParametersAndSensitivitiesColumnarErrors_api[keyof GetParametersAndSensitivitiesColumnarErrors_api];
+
+export type GetParametersAndSensitivitiesColumnarResponses_api = {
+    /**
+     * Successful Response
+     */
+    200: EnsembleParametersAndSensitivitiesColumnar_api;
+};
+
+export type GetParametersAndSensitivitiesColumnarResponse_api =
+    GetParametersAndSensitivitiesColumnarResponses_api[keyof GetParametersAndSensitivitiesColumnarResponses_api];
+
 export type GetGridModelsInfoData_api = {
     body?: never;
     path?: never;
@@ -5174,6 +5716,12 @@ export type GetPvtTableDataData_api = {
          * Realization number
          */
         realization: number;
+        /**
+         * Data Format
+         *
+         * Encoding of the numeric arrays in the response
+         */
+        data_format?: "json" | "b64";
         zCacheBust?: string;
     };
     url: "/pvt/pvt_table_data/";
@@ -5194,7 +5742,7 @@ export type GetPvtTableDataResponses_api = {
      *
      * Successful Response
      */
-    200: Array<PvtData_api>;
+    200: Array<PvtData_api> | Array<PvtDataB64_api>;
 };
 
 export type GetPvtTableDataResponse_api = GetPvtTableDataResponses_api[keyof GetPvtTableDataResponses_api];
@@ -5394,6 +5942,52 @@ export type GetWellTrajectoriesResponses_api = {
 
 export type GetWellTrajectoriesResponse_api = GetWellTrajectoriesResponses_api[keyof GetWellTrajectoriesResponses_api];
 
+export type GetWellTrajectoriesB64Data_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Field Identifier
+         *
+         * Official field identifier
+         */
+        field_identifier: string;
+        /**
+         * Wellbore Uuids
+         *
+         * Optional subset of wellbore uuids
+         */
+        wellbore_uuids?: Array<string> | null;
+        /**
+         * Bbox
+         *
+         * Optional bounding box [min_x, min_y, max_x, max_y], only wellbores passing through it are returned
+         */
+        bbox?: [number, number, number, number] | null;
+        zCacheBust?: string;
+    };
+    url: "/well/well_trajectories_b64/";
+};
+
+export type GetWellTrajectoriesB64Errors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetWellTrajectoriesB64Error_api = GetWellTrajectoriesB64Errors_api[keyof GetWellTrajectoriesB64Errors_api];
+
+export type GetWellTrajectoriesB64Responses_api = {
+    /**
+     * Successful Response
+     */
+    200: WellboreTrajectoriesB64_api;
+};
+
+export type GetWellTrajectoriesB64Response_api =
+    GetWellTrajectoriesB64Responses_api[keyof GetWellTrajectoriesB64Responses_api];
+
 export type GetWellborePickIdentifiersData_api = {
     body?: never;
     path?: never;
@@ -5705,6 +6299,49 @@ export type GetWellboreLogCurveHeadersResponses_api = {
 export type GetWellboreLogCurveHeadersResponse_api =
     GetWellboreLogCurveHeadersResponses_api[keyof GetWellboreLogCurveHeadersResponses_api];
 
+export type GetWellboreLogCurveHeadersForWellboresData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Wellbore Uuids
+         *
+         * Wellbore uuids
+         */
+        wellbore_uuids: Array<string>;
+        /**
+         * Sources
+         *
+         * Sources to fetch well-logs from.
+         */
+        sources?: Array<WellLogCurveSourceEnum_api>;
+        zCacheBust?: string;
+    };
+    url: "/well/wellbore_log_curve_headers_for_wellbores/";
+};
+
+export type GetWellboreLogCurveHeadersForWellboresErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetWellboreLogCurveHeadersForWellboresError_api =
+    GetWellboreLogCurveHeadersForWellboresErrors_api[keyof GetWellboreLogCurveHeadersForWellboresErrors_api];
+
+export type GetWellboreLogCurveHeadersForWellboresResponses_api = {
+    /**
+     * Response Get Wellbore Log Curve Headers For Wellbores
+     *
+     * Successful Response
+     */
+    200: Array<WellboreLogCurveHeadersForWellbore_api>;
+};
+
+export type GetWellboreLogCurveHeadersForWellboresResponse_api =
+    GetWellboreLogCurveHeadersForWellboresResponses_api[keyof GetWellboreLogCurveHeadersForWellboresResponses_api];
+
 export type GetLogCurveDataData_api = {
     body?: never;
     path?: never;
@@ -6014,6 +6651,12 @@ export type GetPolygonsDataData_api = {
          * Surface attribute
          */
         attribute: string;
+        /**
+         * Data Format
+         *
+         * Encoding of the polygon coordinates
+         */
+        data_format?: "json" | "b64";
         zCacheBust?: string;
     };
     url: "/polygons/polygons_data/";
@@ -6034,7 +6677,7 @@ export type GetPolygonsDataResponses_api = {
      *
      * Successful Response
      */
-    200: Array<PolygonData_api>;
+    200: Array<PolygonData_api> | PolygonsDataB64_api;
 };
 
 export type GetPolygonsDataResponse_api = GetPolygonsDataResponses_api[keyof GetPolygonsDataResponses_api];
@@ -6108,6 +6751,47 @@ export type GetUserPhotoResponses_api = {
 
 export type GetUserPhotoResponse_api = GetUserPhotoResponses_api[keyof GetUserPhotoResponses_api];
 
+export type GetUsersData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * User Ids Or Emails
+         *
+         * User emails or graph-ids, at most 100
+         */
+        user_ids_or_emails: Array<string>;
+        /**
+         * Include Photos
+         *
+         * Also get the avatars of the users
+         */
+        include_photos?: boolean;
+        zCacheBust?: string;
+    };
+    url: "/graph/users/";
+};
+
+export type GetUsersErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetUsersError_api = GetUsersErrors_api[keyof GetUsersErrors_api];
+
+export type GetUsersResponses_api = {
+    /**
+     * Response Get Users
+     *
+     * Successful Response
+     */
+    200: Array<GraphUserLookup_api>;
+};
+
+export type GetUsersResponse_api = GetUsersResponses_api[keyof GetUsersResponses_api];
+
 export type GetSummaryObservationsData_api = {
     body?: never;
     path?: never;
@@ -6285,6 +6969,12 @@ export type GetRelpermRealizationDataData_api = {
          * Optional list of realizations encoded as string to include. If not specified, all realizations will be included.
          */
         realizations_encoded_as_uint_list_str?: string | null;
+        /**
+         * Data Format
+         *
+         * Encoding of the numeric arrays in the response
+         */
+        data_format?: "json" | "b64";
         zCacheBust?: string;
     };
     url: "/relperm/realization_data";
@@ -6302,9 +6992,11 @@ export type GetRelpermRealizationDataError_api =
 
 export type GetRelpermRealizationDataResponses_api = {
     /**
+     * Response Get Relperm Realization Data
+     *
      * Successful Response
      */
-    200: RelpermRealizationDataResponse_api;
+    200: RelpermRealizationDataResponse_api | RelpermRealizationDataResponseB64_api;
 };
 
 export type GetRelpermRealizationDataResponse_api =
@@ -6416,6 +7108,73 @@ export type GetRftRealizationDataResponses_api = {
 export type GetRftRealizationDataResponse_api =
     GetRftRealizationDataResponses_api[keyof GetRftRealizationDataResponses_api];
 
+export type GetRftRealizationDataForWellsData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        /**
+         * Well Names
+         *
+         * Well names
+         */
+        well_names: Array<string>;
+        /**
+         * Response Name
+         *
+         * Response name
+         */
+        response_name: string;
+        /**
+         * Timestamps Utc Ms
+         *
+         * Timestamps utc ms
+         */
+        timestamps_utc_ms?: Array<number> | null;
+        /**
+         * Realizations Encoded As Uint List Str
+         *
+         * Optional list of realizations encoded as string to include. If not specified, all realizations will be included.
+         */
+        realizations_encoded_as_uint_list_str?: string | null;
+        zCacheBust?: string;
+    };
+    url: "/rft/rft_realization_data_for_wells";
+};
+
+export type GetRftRealizationDataForWellsErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetRftRealizationDataForWellsError_api =
+    GetRftRealizationDataForWellsErrors_api[keyof GetRftRealizationDataForWellsErrors_api];
+
+export type GetRftRealizationDataForWellsResponses_api = {
+    /**
+     * Response Get Rft Realization Data For Wells
+     *
+     * Successful Response
+     */
+    200: Array<RftRealizationData_api>;
+};
+
+export type GetRftRealizationDataForWellsResponse_api =
+    GetRftRealizationDataForWellsResponses_api[keyof GetRftRealizationDataForWellsResponses_api];
+
 export type GetRftObservationsData_api = {
     body?: never;
     path?: never;
@@ -6532,6 +7291,12 @@ export type GetVfpTableData_api = {
          * VFP table name
          */
         vfp_table_name: string;
+        /**
+         * Data Format
+         *
+         * Encoding of the BHP values in the response
+         */
+        data_format?: "json" | "b64";
         zCacheBust?: string;
     };
     url: "/vfp/vfp_table/";
@@ -6552,7 +7317,7 @@ export type GetVfpTableResponses_api = {
      *
      * Successful Response
      */
-    200: VfpProdTable_api | VfpInjTable_api;
+    200: VfpProdTable_api | VfpInjTable_api | VfpProdTableB64_api | VfpInjTableB64_api;
 };
 
 export type GetVfpTableResponse_api = GetVfpTableResponses_api[keyof GetVfpTableResponses_api];